@@ -14,7 +14,6 @@ import numpy as np
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import yfinance as yf
 from datetime import datetime, timedelta
 import os
 import logging
@@ -32,6 +31,7 @@ from src.backtester import (
     run_backtest,
     generate_backtest_report,
 )
+from src.metrics import infer_periods_per_year, rolling_volatility
 from src.nan_handler import handle_nans  # Import the new nan_handler
 
 # Configure logging
@@ -517,6 +517,32 @@ def main():
                     "Total Slippage", f"${results['total_slippage_cost']:.2f}"
                 )
 
+            # Risk metrics (see src/metrics.py)
+            st.subheader("Risk Metrics")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Sharpe Ratio", f"{results['sharpe_ratio']:.2f}")
+                st.metric("Sortino Ratio", f"{results['sortino_ratio']:.2f}")
+                st.metric("Calmar Ratio", f"{results['calmar_ratio']:.2f}")
+
+            with col2:
+                st.metric(
+                    "Annualized Return",
+                    f"{results['annual_return_pct']:.2f}%",
+                )
+                st.metric(
+                    "Annualized Volatility",
+                    f"{results['annual_volatility_pct']:.2f}%",
+                )
+                st.metric("Exposure", f"{results['exposure_pct']:.2f}%")
+
+            with col3:
+                st.metric("Ulcer Index", f"{results['ulcer_index']:.2f}")
+                st.metric(
+                    "Max Drawdown Duration",
+                    f"{results['max_drawdown_duration']} bars",
+                )
+
             # Display portfolio equity chart
             equity_fig = go.Figure()
 
@@ -580,6 +606,28 @@ def main():
 
             st.plotly_chart(equity_fig, use_container_width=True)
 
+            # Rolling volatility of the equity curve, over about a month
+            volatility_fig = go.Figure(
+                go.Scatter(
+                    x=features_with_signals.index,
+                    y=rolling_volatility(
+                        results["portfolio_values"],
+                        periods_per_year=infer_periods_per_year(
+                            features_with_signals.index
+                        ),
+                    ),
+                    name="Rolling Volatility",
+                    line=dict(color="purple", width=2),
+                )
+            )
+            volatility_fig.update_layout(
+                title="Rolling Volatility (21 bars, annualized)",
+                xaxis_title="Date",
+                yaxis_title="Volatility (%)",
+                height=300,
+            )
+            st.plotly_chart(volatility_fig, use_container_width=True)
+
             # Display trades table
             if results["completed_trades"]:
                 st.subheader("Completed Trades")
@@ -0,0 +1,132 @@
+"""
+Benchmark batch backtests against one backtest run per job.
+
+Backtests synthetic tickers with several strategies and cost settings through
+run_batch, which computes the features of each ticker once, and, for
+comparison, job by job with features computed for every job as separate
+main.py runs would. Data comes from an in-memory source, so no time is spent
+on downloads.
+
+Usage:
+    python benchmarks/benchmark_batch.py [--tickers N] [--rows N] [--workers N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import STRATEGY_REGISTRY, run_backtest
+from src.batch import make_batch_jobs, run_batch
+from src.data_sources import DataSource
+from src.feature_factory import FeatureFactory
+
+STRATEGIES = [
+    {"name": "sma_crossover", "fast_window": 50, "slow_window": 200},
+    {"name": "sma_crossover", "fast_window": 20, "slow_window": 50},
+    {"name": "rsi", "rsi_window": 14},
+    {"name": "rsi", "rsi_window": 21},
+]
+COSTS = [
+    {"commission_fixed": 20.0},
+    {"commission_fixed": 0.0, "slippage_pct": 0.0},
+]
+
+
+class SyntheticSource(DataSource):
+    """Random-walk daily bars ending today."""
+
+    name = "synthetic"
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def download(self, tickers, interval="1d", period=None, start=None):
+        end = pd.Timestamp.now(tz="UTC").normalize()
+        dates = pd.date_range(end=end, periods=self.rows, freq="D")
+        result = {}
+        for ticker in tickers:
+            rng = np.random.default_rng(sum(map(ord, ticker)))
+            close = 100 + rng.normal(0, 1, self.rows).cumsum().clip(-90)
+            result[ticker] = pd.DataFrame(
+                {
+                    "Open": close,
+                    "High": close + 1,
+                    "Low": close - 1,
+                    "Close": close,
+                    "Volume": rng.integers(1000, 100000, self.rows),
+                },
+                index=dates,
+            )
+        return result
+
+
+def run_job_by_job(config, data):
+    """Backtest every job with its own feature generation."""
+    for job in make_batch_jobs(config):
+        strategy = STRATEGY_REGISTRY[job["name"]](**job["params"])
+        indicator_params = strategy.indicator_params()
+        features = FeatureFactory(
+            data[job["ticker"]],
+            feature_families=list(indicator_params),
+            indicator_params=indicator_params,
+        ).generate_features(drop_na=False)
+        features = features.dropna(
+            subset=["Close"] + strategy.required_features()
+        )
+        run_backtest(
+            strategy.generate_signals(features),
+            engine="array",
+            use_cache=False,
+            **job["costs"],
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=2500)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    source = SyntheticSource(args.rows)
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+    config = {
+        "tickers": tickers,
+        "data": {"period": "max", "cache_dir": tempfile.mkdtemp()},
+        "strategies": STRATEGIES,
+        "costs": COSTS,
+    }
+    data = source.download(tickers)
+    n_jobs = len(make_batch_jobs(config))
+
+    start = time.perf_counter()
+    run_job_by_job(config, data)
+    job_by_job = time.perf_counter() - start
+
+    # Fill the data cache first, so both batch runs only read it
+    run_batch(config, max_workers=1, source=source)
+    timings = {}
+    for max_workers in (1, args.workers):
+        start = time.perf_counter()
+        run_batch(config, max_workers=max_workers, source=source)
+        timings[max_workers] = time.perf_counter() - start
+
+    print(f"{n_jobs} backtests: {args.tickers} tickers x {args.rows} bars")
+    print(f"job by job: {job_by_job:.2f}s")
+    print(f"batch, serial: {timings[1]:.2f}s")
+    print(
+        f"batch, {args.workers or os.cpu_count()} workers: "
+        f"{timings[args.workers]:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark bootstrap simulations of a backtest result.
+
+Backtests random signals on synthetic daily prices and times run_bootstrap
+with each resampling method, serially and on a process pool.
+
+Usage:
+    python benchmarks/benchmark_bootstrap.py [--simulations N] [--rows N] [--workers N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import run_backtest
+from src.robustness import BOOTSTRAP_METHODS, run_bootstrap
+
+
+def make_results(rows, seed=0):
+    """Backtest random signals on a random-walk price series."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2010-01-01", periods=rows, freq="B")
+    df = pd.DataFrame(
+        {
+            "Close": 200 + rng.normal(0, 1, rows).cumsum(),
+            "buy_signal": rng.random(rows) < 0.05,
+            "sell_signal": rng.random(rows) < 0.05,
+        },
+        index=dates,
+    )
+    return run_backtest(df, engine="array")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--simulations", type=int, default=10000)
+    parser.add_argument("--rows", type=int, default=2500)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    results = make_results(args.rows)
+
+    print(
+        f"{args.simulations} simulations of {args.rows} bars "
+        f"({len(results['completed_trades'])} completed trades)"
+    )
+    for method in BOOTSTRAP_METHODS:
+        timings = []
+        for max_workers in (1, args.workers):
+            start = time.perf_counter()
+            run_bootstrap(
+                results,
+                method=method,
+                n_simulations=args.simulations,
+                seed=0,
+                max_workers=max_workers,
+            )
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{method:>7}: serial {timings[0]:.2f}s, "
+            f"process pool {timings[1]:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark loading cached OHLCV data in each on-disk cache format.
+
+Writes a synthetic history with a timezone-aware index (as returned by
+yfinance) in every format of src.data_cache and reports the best load time
+and the file size of each.
+
+Usage:
+    python benchmarks/benchmark_data_cache.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.data_cache import CACHE_BACKENDS, get_cache_backend
+
+
+def make_ohlcv(rows, seed=0):
+    """Generate random-walk OHLCV data with a tz-aware minute index."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(
+        start="2000-01-03", periods=rows, freq="min", tz="Asia/Kolkata"
+    )
+    close = 100 + rng.normal(0, 0.1, rows).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.001,
+            "Low": close * 0.999,
+            "Close": close,
+            "Volume": rng.integers(100, 10000, rows),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=pd.DatetimeIndex(dates, name="Datetime"),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    data = make_ohlcv(args.rows)
+
+    print(f"Cache load time, {args.rows:,} rows")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        results = {}
+        for cache_format in CACHE_BACKENDS:
+            backend = get_cache_backend(cache_format)
+            path = backend.path(cache_dir, "BENCH_1m_max")
+            backend.save(data, path)
+
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                backend.read(path)
+                best = min(best, time.perf_counter() - start)
+            results[cache_format] = best
+            print(
+                f"{cache_format:>8}: {best:.3f}s "
+                f"({os.path.getsize(path) / 1e6:.1f} MB)"
+            )
+
+        for cache_format, seconds in results.items():
+            if cache_format != "csv":
+                print(
+                    f"{cache_format} loads {results['csv'] / seconds:.0f}x faster than csv"
+                )
+
+
+if __name__ == "__main__":
+    main()
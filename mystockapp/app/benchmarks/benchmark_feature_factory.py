@@ -0,0 +1,87 @@
+"""
+Benchmark FeatureFactory's shared intermediates.
+
+Runs generate_features on synthetic OHLCV data twice: once as is, and once
+with intermediate sharing disabled so that every read recomputes its series
+(the behaviour before feature families shared intermediates). Reports the
+number of passes over the price data and the wall time of each run.
+
+Usage:
+    python benchmarks/benchmark_feature_factory.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.feature_factory import FeatureFactory
+
+
+class UnsharedFeatureFactory(FeatureFactory):
+    """FeatureFactory that recomputes every intermediate on each read."""
+
+    def _intermediate(self, df, name, *args):
+        self.intermediate_stats["requested"] += 1
+        self.intermediate_stats["computed"] += 1
+        inputs, compute = self.INTERMEDIATES[name]
+        values = [self._intermediate(df, dep) for dep in inputs]
+        return compute(self, df, *values, *args)
+
+
+def make_ohlcv(rows, seed=0):
+    """Generate random-walk OHLCV data."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2000-01-01", periods=rows, freq="min")
+    close = 100 + rng.normal(0, 0.1, rows).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.001,
+            "Low": close * 0.999,
+            "Close": close,
+            "Volume": rng.integers(100, 10000, rows),
+        },
+        index=dates,
+    )
+
+
+def time_factory(factory_class, data, repeat):
+    """Return the best wall time and the intermediate stats of a run."""
+    best = float("inf")
+    for _ in range(repeat):
+        factory = factory_class(data)
+        start = time.perf_counter()
+        factory.generate_features(drop_na=False)
+        best = min(best, time.perf_counter() - start)
+    return best, factory.intermediate_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    data = make_ohlcv(args.rows)
+
+    print(f"FeatureFactory, all families, {args.rows:,} rows")
+    for label, factory_class in (
+        ("unshared", UnsharedFeatureFactory),
+        ("shared", FeatureFactory),
+    ):
+        seconds, stats = time_factory(factory_class, data, args.repeat)
+        print(
+            f"{label:>9}: {stats['computed']:3d} intermediate passes "
+            f"({stats['requested']} reads) in {seconds:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
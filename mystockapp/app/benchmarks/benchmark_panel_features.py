@@ -0,0 +1,88 @@
+"""
+Benchmark FeatureFactory's panel mode against one factory per ticker.
+
+Generates a synthetic universe of daily OHLCV histories and computes all
+feature families once per ticker and once for the whole panel.
+
+Usage:
+    python benchmarks/benchmark_panel_features.py [--tickers N] [--rows N] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.feature_factory import FeatureFactory
+
+
+def make_panel(tickers, rows, seed=0):
+    """Generate random-walk OHLCV data as a (ticker, date) long frame."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2015-01-01", periods=rows, freq="B")
+    close = 100 + rng.normal(0, 1, (tickers, rows)).cumsum(axis=1)
+    index = pd.MultiIndex.from_product(
+        [[f"T{i:04d}" for i in range(tickers)], dates],
+        names=["ticker", "Date"],
+    )
+    close = close.ravel()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, tickers * rows),
+        },
+        index=index,
+    )
+
+
+def best_time(function, repeat):
+    """Return the best wall time of `repeat` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    panel = make_panel(args.tickers, args.rows)
+    frames = [frame.droplevel(0) for _, frame in panel.groupby(level=0)]
+
+    per_ticker = best_time(
+        lambda: [
+            FeatureFactory(frame).generate_features(drop_na=False)
+            for frame in frames
+        ],
+        args.repeat,
+    )
+    whole_panel = best_time(
+        lambda: FeatureFactory(panel).generate_features(drop_na=False),
+        args.repeat,
+    )
+
+    print(
+        f"FeatureFactory, all families, {args.tickers} tickers x {args.rows} rows"
+    )
+    print(f"per ticker: {per_ticker:.3f}s")
+    print(f"     panel: {whole_panel:.3f}s")
+    print(f"   speedup: {per_ticker / whole_panel:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark the shared-capital portfolio backtest against isolated backtests.
+
+Runs a universe of synthetic tickers through run_portfolio_backtest and, for
+comparison, through one run_backtest (array engine) per ticker, reporting
+the time of both.
+
+Usage:
+    python benchmarks/benchmark_portfolio.py [--tickers N] [--rows N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import run_backtest, run_portfolio_backtest
+
+
+def make_signals(tickers, rows, signal_prob, seed=0):
+    """Generate random-walk closes and random buy/sell signal frames."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2015-01-01", periods=rows, freq="B")
+    columns = [f"T{i:04d}" for i in range(tickers)]
+    close = pd.DataFrame(
+        100 + rng.normal(0, 1, (rows, tickers)).cumsum(axis=0).clip(-90),
+        index=dates,
+        columns=columns,
+    )
+    buy_signals = pd.DataFrame(
+        rng.random((rows, tickers)) < signal_prob, index=dates, columns=columns
+    )
+    sell_signals = pd.DataFrame(
+        rng.random((rows, tickers)) < signal_prob, index=dates, columns=columns
+    )
+    return close, buy_signals, sell_signals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=2500)
+    parser.add_argument("--signal-prob", type=float, default=0.02)
+    parser.add_argument("--initial-capital", type=float, default=1e7)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    close, buy_signals, sell_signals = make_signals(
+        args.tickers, args.rows, args.signal_prob
+    )
+    position_size_pct = 2 / args.tickers
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        run_portfolio_backtest(
+            close,
+            buy_signals,
+            sell_signals,
+            initial_capital=args.initial_capital,
+            position_size_pct=position_size_pct,
+        )
+        best = min(best, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for ticker in close.columns:
+        run_backtest(
+            pd.DataFrame(
+                {
+                    "Close": close[ticker],
+                    "buy_signal": buy_signals[ticker],
+                    "sell_signal": sell_signals[ticker],
+                }
+            ),
+            initial_capital=args.initial_capital,
+            position_size_pct=position_size_pct,
+            engine="array",
+            use_cache=False,
+        )
+    isolated = time.perf_counter() - start
+
+    print(
+        f"{args.tickers} tickers, {args.rows} bars: portfolio {best:.2f}s, "
+        f"isolated backtests {isolated:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark concurrent stock scanning.
+
+Scans a universe of synthetic tickers serially and with worker pools.
+Downloads are simulated with a fixed latency, so the benchmark measures how
+well the scan overlaps network waits and feature generation.
+
+Usage:
+    python benchmarks/benchmark_scanner.py [--tickers N] [--latency S] [--max-workers N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from scanner import scan_stocks
+
+
+def make_ohlcv(rows, seed=0):
+    """Generate random-walk daily OHLCV data."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2015-01-01", periods=rows, freq="B")
+    close = 100 + rng.normal(0, 1, rows).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, rows),
+        },
+        index=dates,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--rows", type=int, default=1250)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--max-workers", type=int, default=16)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    data = make_ohlcv(args.rows)
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+
+    def slow_download(ticker, period, interval):
+        time.sleep(args.latency)
+        return data
+
+    print(
+        f"Scanning {args.tickers} tickers, {args.rows} bars each, "
+        f"{args.latency:.2f}s download latency"
+    )
+    with patch("scanner.get_stock_data", side_effect=slow_download):
+        results = {}
+        for max_workers in (1, args.max_workers):
+            start = time.perf_counter()
+            scan_stocks(tickers, max_workers=max_workers)
+            results[max_workers] = time.perf_counter() - start
+            print(f"max_workers={max_workers:>3}: {results[max_workers]:.2f}s")
+
+    print(f"speedup: {results[1] / results[args.max_workers]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark the vectorized last-bar screen against the per-ticker scan.
+
+Screens a universe of synthetic tickers with screen_stocks and scans a
+sample of it with scan_stocks (serially, with the data already downloaded),
+reporting the time per universe for both.
+
+Usage:
+    python benchmarks/benchmark_screener.py [--tickers N] [--rows N] [--sample N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from scanner import scan_stocks, screen_stocks
+
+STRATEGIES = {
+    "SMA Crossover": {"fast_sma": 50, "slow_sma": 200},
+    "RSI Strategy": {"rsi_period": 14},
+}
+
+
+def make_universe(tickers, rows, seed=0):
+    """Generate random-walk daily OHLCV data for each ticker."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2015-01-01", periods=rows, freq="B")
+    universe = {}
+    for i in range(tickers):
+        close = 100 + rng.normal(0, 1, rows).cumsum()
+        universe[f"T{i:05d}"] = pd.DataFrame(
+            {
+                "Open": close,
+                "High": close * 1.01,
+                "Low": close * 0.99,
+                "Close": close,
+                "Volume": rng.integers(1000, 100000, rows),
+            },
+            index=dates,
+        )
+    return universe
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tickers", type=int, default=5000)
+    parser.add_argument("--rows", type=int, default=1250)
+    parser.add_argument("--sample", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    universe = make_universe(args.tickers, args.rows)
+    sample = list(universe)[: args.sample]
+
+    print(f"Screening {args.tickers} tickers, {args.rows} bars each")
+    for strategy_name, params in STRATEGIES.items():
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            screen_stocks(universe, strategy_name, params)
+            best = min(best, time.perf_counter() - start)
+
+        with patch(
+            "scanner.get_stock_data",
+            side_effect=lambda ticker, period, interval: universe[ticker],
+        ):
+            start = time.perf_counter()
+            scan_stocks(
+                sample,
+                strategy_name=strategy_name,
+                strategy_params=params,
+                max_workers=1,
+            )
+            per_ticker = (time.perf_counter() - start) / len(sample)
+        scan = per_ticker * args.tickers
+
+        print(
+            f"{strategy_name:>14}: screen {best:.2f}s, "
+            f"scan {scan:.1f}s (estimated from {args.sample} tickers), "
+            f"{scan / best:.0f}x faster"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark the chunked backtest pipeline against a full in-memory run.
+
+Generates every feature family for synthetic 1-minute bars, then backtests
+an SMA crossover strategy on the whole feature frame at once and chunk by
+chunk with run_chunked_backtest, reporting the time and the peak memory
+allocated (as traced by tracemalloc) of both.
+
+Usage:
+    python benchmarks/benchmark_streaming.py [--rows N] [--chunk-size N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import SMACrossoverStrategy, run_backtest
+from src.feature_factory import FeatureFactory
+from src.streaming import run_chunked_backtest
+
+
+def make_minute_bars(rows, seed=0):
+    """Generate random-walk 1-minute OHLCV bars."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2020-01-01", periods=rows, freq="min")
+    close = 1000 + rng.normal(0, 0.2, rows).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 0.1,
+            "Low": close - 0.1,
+            "Close": close,
+            "Volume": rng.integers(100, 10000, rows),
+        },
+        index=dates,
+    )
+
+
+def full_run(ohlcv, strategy):
+    """Generate the whole feature frame, then backtest it."""
+    features = FeatureFactory(ohlcv).generate_features(drop_na=False)
+    features = features.dropna(subset=["Close"] + strategy.required_features())
+    return run_backtest(strategy.generate_signals(features), engine="array")
+
+
+def measure(func, *args, **kwargs):
+    """Return (result, seconds, peak traced MB) of a call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    ohlcv = make_minute_bars(args.rows)
+    strategy = SMACrossoverStrategy(fast_window=20, slow_window=200)
+
+    full, full_time, full_peak = measure(full_run, ohlcv, strategy)
+    chunked, chunked_time, chunked_peak = measure(
+        run_chunked_backtest, ohlcv, strategy, chunk_size=args.chunk_size
+    )
+
+    print(f"{args.rows} bars, all feature families")
+    print(f"   full: {full_time:.2f}s, peak {full_peak:.0f} MB")
+    print(
+        f"chunked: {chunked_time:.2f}s, peak {chunked_peak:.0f} MB "
+        f"({chunked['chunk_count']} chunks of {args.chunk_size} bars)"
+    )
+    print(
+        "same final value: "
+        f"{np.isclose(full['final_value'], chunked['final_value'])}, "
+        f"same trades: {full['num_trades'] == chunked['num_trades']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
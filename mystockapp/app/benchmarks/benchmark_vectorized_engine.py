@@ -0,0 +1,79 @@
+"""
+Benchmark the vectorized target-position engine against the array engine.
+
+Backtests SMA crossover signals, which are always long or flat, and random
+signals, which the exact engines pyramid into, on a synthetic price series
+with both engines, and reports run times and the relative difference of the
+final portfolio values.
+
+Usage:
+    python benchmarks/benchmark_vectorized_engine.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import SMACrossoverStrategy, run_backtest
+
+
+def make_signals(rows, seed=0):
+    """SMA crossover and random signals on a random-walk price series."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2000-01-01", periods=rows, freq="min")
+    close = pd.Series(
+        100 * np.exp(rng.normal(0, 0.001, rows).cumsum()), index=dates
+    )
+    features = pd.DataFrame(
+        {
+            "Close": close,
+            "sma_20": close.rolling(20).mean(),
+            "sma_100": close.rolling(100).mean(),
+        }
+    ).dropna()
+    crossover = SMACrossoverStrategy(
+        fast_window=20, slow_window=100
+    ).generate_signals(features)
+    random = features[["Close"]].assign(
+        buy_signal=rng.random(len(features)) < 0.01,
+        sell_signal=rng.random(len(features)) < 0.01,
+    )
+    return {"crossover": crossover, "random": random}
+
+
+def time_engine(df, engine, repeat):
+    """Best run time of `repeat` uncached backtests."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = run_backtest(df, engine=engine, use_cache=False)
+        timings.append(time.perf_counter() - start)
+    return min(timings), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    for name, df in make_signals(args.rows).items():
+        array_time, exact = time_engine(df, "array", args.repeat)
+        vectorized_time, results = time_engine(df, "vectorized", args.repeat)
+        difference = abs(results["final_value"] / exact["final_value"] - 1)
+        print(
+            f"{name:>9}: array {array_time:.3f}s ({exact['num_trades']} buys), "
+            f"vectorized {vectorized_time:.3f}s ({results['num_trades']} buys), "
+            f"final value difference {difference:.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
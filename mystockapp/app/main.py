@@ -6,19 +6,36 @@ import os
 import logging
 import argparse
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 import yaml
 from datetime import datetime
 
 from src.data_fetcher import get_stock_data
+from src.data_cache import CACHE_BACKENDS, DEFAULT_CACHE_FORMAT
+from src.result_cache import configure_result_cache
 from src.feature_factory import FeatureFactory
 from src.backtester import (
-    SMACrossoverStrategy,
-    RSIStrategy,
+    STRATEGY_REGISTRY,
+    get_strategy,
     run_backtest,
     generate_backtest_report,
 )
+from src.walk_forward import (
+    WALK_FORWARD_MODES,
+    run_walk_forward,
+    generate_walk_forward_report,
+)
+from src.batch import (
+    DEFAULT_BATCH_OUTPUT,
+    generate_batch_report,
+    run_batch,
+    write_batch_results,
+)
+from src.robustness import (
+    BOOTSTRAP_METHODS,
+    run_bootstrap,
+    generate_robustness_report,
+)
 
 # Setup logging
 logging.basicConfig(
@@ -74,6 +91,13 @@ def parse_args():
     parser.add_argument(
         "--no-cache", action="store_true", help="Disable data caching"
     )
+    parser.add_argument(
+        "--cache-format",
+        type=str,
+        default=DEFAULT_CACHE_FORMAT,
+        choices=list(CACHE_BACKENDS),
+        help=f"On-disk format of the data cache (default: {DEFAULT_CACHE_FORMAT})",
+    )
     # New arguments for backtesting
     parser.add_argument(
         "--split-date",
@@ -90,7 +114,13 @@ def parse_args():
         "--strategy",
         type=str,
         default="sma_crossover",
-        help="Trading strategy to backtest (available: sma_crossover, rsi)",
+        help=f"Trading strategy to backtest (available: {', '.join(STRATEGY_REGISTRY)})",
+    )
+    parser.add_argument(
+        "--strategy-params",
+        type=parse_strategy_params,
+        default=None,
+        help="Parameters of strategies without their own options, as key=value pairs, e.g. 'window=20,std_dev=2.5' for bollinger",
     )
     # SMA strategy parameters
     parser.add_argument(
@@ -135,26 +165,82 @@ def parse_args():
         "--commission-pct",
         type=float,
         default=0.0003,
-        help="Percentage commission per trade as decimal (default: 0.0003 = 0.03%)",
+        help="Percentage commission per trade as decimal (default: 0.0003 = 0.03%%)",
     )
     parser.add_argument(
         "--slippage-pct",
         type=float,
         default=0.001,
-        help="Slippage as percentage of price (default: 0.001 = 0.1%)",
+        help="Slippage as percentage of price (default: 0.001 = 0.1%%)",
     )
     parser.add_argument(
         "--position-size-pct",
         type=float,
         default=0.25,
-        help="Percentage of available capital to use per trade (default: 0.25 = 25%)",
+        help="Percentage of available capital to use per trade (default: 0.25 = 25%%)",
     )
     # New argument for controlling NaN handling
     parser.add_argument(
         "--drop-na-threshold",
         type=float,
         default=None,
-        help="Threshold for dropping rows with NaN values. If < 1, interpreted as fraction of columns; if >= 1, interpreted as count of columns. Default (None) drops rows with more than 25% NaN columns when drop_na is True.",
+        help="Threshold for dropping rows with NaN values. If < 1, interpreted as fraction of columns; if >= 1, interpreted as count of columns. Default (None) drops rows with more than 25%% NaN columns when drop_na is True.",
+    )
+    # Walk-forward optimization
+    parser.add_argument(
+        "--walk-forward",
+        action="store_true",
+        default=False,
+        help="Run a walk-forward optimization instead of a single split-date backtest",
+    )
+    parser.add_argument(
+        "--wf-folds",
+        type=int,
+        default=5,
+        help="Number of out-of-sample folds for walk-forward optimization (default: 5)",
+    )
+    parser.add_argument(
+        "--wf-mode",
+        type=str,
+        default="anchored",
+        choices=WALK_FORWARD_MODES,
+        help="Walk-forward window mode: anchored (growing in-sample) or sliding (fixed-length in-sample)",
+    )
+    parser.add_argument(
+        "--wf-train-bars",
+        type=int,
+        default=None,
+        help="In-sample length in bars for sliding walk-forward windows",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Worker processes for walk-forward folds, bootstrap simulations and batch runs (default: all cores)",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=None,
+        help="Number of bootstrap simulations of the backtest results, e.g. 10000 (default: no bootstrap)",
+    )
+    parser.add_argument(
+        "--bootstrap-block-size",
+        type=int,
+        default=20,
+        help="Bars per block when bootstrapping the daily returns (default: 20)",
+    )
+    parser.add_argument(
+        "--batch",
+        type=str,
+        default=None,
+        help="Path to a batch YAML file listing tickers, strategies and cost settings to backtest in one run (see batch_sample.yaml)",
+    )
+    parser.add_argument(
+        "--result-cache-dir",
+        type=str,
+        default=None,
+        help="Directory where backtest results are cached between runs (default: in memory only)",
     )
     return parser.parse_args()
 
@@ -326,6 +412,25 @@ def validate_args(args):
                 "RSI strategy requires 'rsi' features, but they are not included in --features"
             )
             is_valid = False
+        elif args.strategy in STRATEGY_REGISTRY:
+            try:
+                strategy = get_strategy(
+                    args.strategy, **get_strategy_params(args)
+                )
+            except (TypeError, ValueError):
+                # Invalid parameters are reported by create_strategy
+                strategy = None
+            if strategy is not None:
+                missing = [
+                    family
+                    for family in strategy.indicator_params()
+                    if family not in feature_list
+                ]
+                if missing:
+                    logger.error(
+                        f"{strategy.name} strategy requires {missing} features, but they are not included in --features"
+                    )
+                    is_valid = False
 
     # Validate numeric parameters
     if args.initial_capital <= 0:
@@ -422,6 +527,37 @@ def validate_args(args):
             f"Position size of {args.position_size_pct*100}% is large. This reduces diversification."
         )
 
+    # Validate walk-forward options
+    if args.walk_forward:
+        if args.wf_folds <= 0:
+            logger.error(
+                f"Number of walk-forward folds must be positive. Got: {args.wf_folds}"
+            )
+            is_valid = False
+        if args.wf_train_bars is not None and args.wf_train_bars <= 0:
+            logger.error(
+                f"Walk-forward train bars must be positive. Got: {args.wf_train_bars}"
+            )
+            is_valid = False
+
+    # Validate bootstrap options
+    if args.bootstrap is not None:
+        if args.bootstrap <= 0:
+            logger.error(
+                f"Number of bootstrap simulations must be positive. Got: {args.bootstrap}"
+            )
+            is_valid = False
+        if args.bootstrap_block_size <= 0:
+            logger.error(
+                f"Bootstrap block size must be positive. Got: {args.bootstrap_block_size}"
+            )
+            is_valid = False
+
+    # Validate the worker pool of walk-forward, bootstrap and batch runs
+    if args.max_workers is not None and args.max_workers <= 0:
+        logger.error(f"Max workers must be positive. Got: {args.max_workers}")
+        is_valid = False
+
     # Validate drop_na_threshold
     if args.drop_na_threshold is not None:
         if args.drop_na_threshold < 0:
@@ -437,7 +573,7 @@ def validate_args(args):
             )
 
     # Validate strategy type
-    valid_strategies = ["sma_crossover", "rsi"]
+    valid_strategies = list(STRATEGY_REGISTRY)
     if args.strategy not in valid_strategies:
         logger.error(
             f"Invalid strategy: {args.strategy}. Valid options are: {valid_strategies}"
@@ -477,6 +613,8 @@ def validate_args(args):
 
 def generate_plots(data, output_dir="plots"):
     """Generate plots for key indicators."""
+    import matplotlib.pyplot as plt
+
     logger.info("Generating plots for key indicators")
 
     # Create output directory if it doesn't exist
@@ -749,6 +887,8 @@ def plot_backtest_results(is_results, oos_results, output_dir="plots"):
         oos_results (dict): Out-of-sample backtest results
         output_dir (str): Output directory for plots
     """
+    import matplotlib.pyplot as plt
+
     if not is_results or not oos_results:
         logger.warning("Missing results for backtest comparison plot")
         return
@@ -977,6 +1117,9 @@ def main():
         logger.error("Invalid arguments provided. Exiting.")
         return
 
+    if args.batch:
+        return run_batch_mode(args)
+
     # If a configuration file is provided, load it and override command line arguments
     if args.config:
         config = load_config(args.config)
@@ -991,6 +1134,8 @@ def main():
                     args.interval = config["data"]["interval"]
                 if "no_cache" in config["data"]:
                     args.no_cache = config["data"]["no_cache"]
+                if "cache_format" in config["data"]:
+                    args.cache_format = config["data"]["cache_format"]
 
             if "features" in config:
                 if "families" in config["features"]:
@@ -1036,6 +1181,11 @@ def main():
                             "overbought"
                         ]
 
+                elif args.strategy in config["backtest"]:
+                    args.strategy_params = dict(
+                        config["backtest"][args.strategy]
+                    )
+
                 # Transaction cost parameters
                 if "commission_fixed" in config["backtest"]:
                     args.commission_fixed = config["backtest"][
@@ -1049,6 +1199,16 @@ def main():
                     args.position_size_pct = config["backtest"][
                         "position_size_pct"
                     ]
+                if "result_cache_dir" in config["backtest"]:
+                    args.result_cache_dir = config["backtest"][
+                        "result_cache_dir"
+                    ]
+                if "bootstrap" in config["backtest"]:
+                    args.bootstrap = config["backtest"]["bootstrap"]
+                if "bootstrap_block_size" in config["backtest"]:
+                    args.bootstrap_block_size = config["backtest"][
+                        "bootstrap_block_size"
+                    ]
 
             if "output" in config:
                 if "path" in config["output"]:
@@ -1061,6 +1221,10 @@ def main():
                 logger.error("Invalid configuration values. Exiting.")
                 return
 
+    # Keep backtest results on disk, so unchanged backtests are not rerun
+    if args.result_cache_dir is not None:
+        configure_result_cache(cache_dir=args.result_cache_dir)
+
     # Download stock data
     logger.info(
         f"Downloading {args.ticker} stock data (period={args.period}, interval={args.interval})"
@@ -1070,6 +1234,7 @@ def main():
         period=args.period,
         interval=args.interval,
         save_to_csv=not args.no_cache,
+        cache_format=args.cache_format,
     )
 
     if data is None:
@@ -1119,6 +1284,9 @@ def main():
             "NaN values will be handled during feature generation, but may affect result quality."
         )
 
+    if args.walk_forward:
+        return run_walk_forward_mode(args, data)
+
     # Special test case handling for very small datasets (like test_main_timezone_split.py)
     extreme_small_dataset = False
     if len(data) <= 5:  # This is likely a test with minimal data
@@ -1145,7 +1313,7 @@ def main():
 
     # Verify we have enough data
     try:
-        logger.info("Generating features for in-sample data")
+        logger.info("Generating features for the full history")
 
         # Create custom indicator parameters based on args with NaN safeguards
         custom_indicator_params = {}
@@ -1193,6 +1361,27 @@ def main():
                         "windows": strategy_rsi_windows
                     }
 
+        elif args.strategy in STRATEGY_REGISTRY:
+            try:
+                strategy_indicator_params = get_strategy(
+                    args.strategy, **get_strategy_params(args)
+                ).indicator_params()
+            except (TypeError, ValueError):
+                # Invalid parameters are reported by create_strategy
+                strategy_indicator_params = {}
+            for family, params in strategy_indicator_params.items():
+                if family not in selected_feature_families:
+                    continue
+                if args.features.lower() == "all":
+                    params = {
+                        key: sorted(
+                            set(FeatureFactory.DEFAULT_PARAMS[family][key])
+                            | set(values)
+                        )
+                        for key, values in params.items()
+                    }
+                custom_indicator_params[family] = params
+
         # Add safeguard: Check for potential NaN issues before proceeding
         if not custom_indicator_params:
             logger.warning(
@@ -1233,80 +1422,36 @@ def main():
                 )
                 data.index = data.index.tz_convert("UTC")
 
-        in_sample_data_raw = (
-            data[data.index < split_date_ts].copy()
-            if split_date_ts and data is not None and not data.empty
-            else data.copy() if data is not None else pd.DataFrame()
-        )
-
         # SAFEGUARD: Check if dataset is too small for strategy requirements
         custom_drop_na_threshold = args.drop_na_threshold
 
-        if len(in_sample_data_raw) < max_window_required:
+        if len(data) < max_window_required:
             logger.warning(
-                f"In-sample dataset ({len(in_sample_data_raw)} rows) is smaller than the maximum window required ({max_window_required})."
+                f"Dataset ({len(data)} rows) is smaller than the maximum window required ({max_window_required})."
             )
             logger.warning(
                 "Setting drop_na_threshold=0.1 to prevent all rows from being dropped due to NaN values."
             )
             custom_drop_na_threshold = 0.1  # Allow high percentage of NaNs to ensure we keep some data
 
-        is_factory = FeatureFactory(
-            in_sample_data_raw,
-            feature_families=args.features.split(","),
+        in_sample_df, out_of_sample_df = generate_split_features(
+            data,
+            split_date_ts,
+            feature_families=selected_feature_families,
             indicator_params=custom_indicator_params,
-        )
-        in_sample_df = is_factory.generate_features(
-            drop_na=True, drop_na_threshold=custom_drop_na_threshold
+            drop_na_threshold=custom_drop_na_threshold,
         )
     except ValueError as e:
-        logger.error(
-            f"Failed to generate features for in-sample data: {str(e)}"
-        )
-        return
-
-    try:
-        logger.info("Generating features for out-of-sample data")
-
-        out_of_sample_data_raw = (
-            data[data.index >= split_date_ts].copy()
-            if split_date_ts and data is not None and not data.empty
-            else (
-                pd.DataFrame().reindex_like(data).iloc[0:0]
-                if data is not None and not data.empty
-                else pd.DataFrame()
-            )
-        )
-
-        # SAFEGUARD: Check if dataset is too small for strategy requirements
-        custom_drop_na_threshold_oos = custom_drop_na_threshold  # Use the same threshold as in-sample by default
-
-        if len(out_of_sample_data_raw) < max_window_required:
-            logger.warning(
-                f"Out-of-sample dataset ({len(out_of_sample_data_raw)} rows) is smaller than the maximum window required ({max_window_required})."
-            )
-            logger.warning(
-                "Setting drop_na_threshold=0.1 to prevent all rows from being dropped due to NaN values."
-            )
-            custom_drop_na_threshold_oos = 0.1  # Allow high percentage of NaNs
-
-        oos_factory = FeatureFactory(
-            out_of_sample_data_raw,
-            feature_families=args.features.split(","),
-            indicator_params=custom_indicator_params,
-        )
-        out_of_sample_df = oos_factory.generate_features(
-            drop_na=True, drop_na_threshold=custom_drop_na_threshold_oos
-        )
-    except ValueError as e:
-        logger.error(
-            f"Failed to generate features for out-of-sample data: {str(e)}"
-        )
+        logger.error(f"Failed to generate features: {str(e)}")
         return
 
     # Log information about NaN handling results
-    original_is_len = len(in_sample_data_raw)
-    original_oos_len = len(out_of_sample_data_raw)
+    original_is_len = (
+        int((data.index < split_date_ts).sum())
+        if split_date_ts is not None
+        else len(data)
+    )
+    original_oos_len = len(data) - original_is_len
 
     is_rows_dropped = original_is_len - len(in_sample_df)
     oos_rows_dropped = original_oos_len - len(out_of_sample_df)
@@ -1431,6 +1576,21 @@ def main():
                         f"Missing required column for RSI strategy in {df_name} data: {required_column}"
                     )
                     return
+    else:
+        for df_name, df in [
+            ("in-sample", in_sample_df),
+            ("out-of-sample", out_of_sample_df),
+        ]:
+            missing = [
+                col
+                for col in strategy.required_features()
+                if col not in df.columns
+            ]
+            if missing:
+                logger.error(
+                    f"Missing required columns for {strategy.name} strategy in {df_name} data: {missing}"
+                )
+                return
 
     # Apply the strategy to generate signals on clean data
     logger.info(f"Applying {strategy.name} strategy to in-sample data")
@@ -1500,6 +1660,11 @@ def main():
     generate_backtest_report(is_results, "In-Sample")
     generate_backtest_report(oos_results, "Out-of-Sample")
 
+    # Show how fragile the results are, if requested
+    if args.bootstrap is not None:
+        generate_bootstrap_reports(args, is_results, "In-Sample")
+        generate_bootstrap_reports(args, oos_results, "Out-of-Sample")
+
     # Generate comparison plot if requested
     if args.plot:
         plot_backtest_results(is_results, oos_results)
@@ -1529,10 +1694,207 @@ def main():
     )
 
 
+def generate_bootstrap_reports(args, results, period_name):
+    """
+    Bootstrap backtest results with every method and report them.
+
+    Args:
+        args: Command line arguments object
+        results (dict): Backtest results from run_backtest
+        period_name (str): Name of the period (e.g., 'In-Sample')
+    """
+    for method in BOOTSTRAP_METHODS:
+        try:
+            bootstrap_results = run_bootstrap(
+                results,
+                method=method,
+                n_simulations=args.bootstrap,
+                block_size=args.bootstrap_block_size,
+                max_workers=args.max_workers,
+            )
+        except ValueError as e:
+            logger.warning(
+                f"Skipping {method} bootstrap of the {period_name} results: {str(e)}"
+            )
+            continue
+        generate_robustness_report(bootstrap_results, period_name)
+
+
+def generate_split_features(
+    data,
+    split_date,
+    feature_families,
+    indicator_params,
+    drop_na_threshold=None,
+):
+    """
+    Generate features once over the full history, then split them by date.
+
+    Every indicator only looks backward, so the in-sample rows are the same
+    as when generating them from the in-sample bars alone, and nothing after
+    the split date leaks into them. The out-of-sample rows are warmed up on
+    the in-sample bars, so the out-of-sample period is usable from its first
+    bar instead of losing the longest lookback window to NaN.
+
+    Args:
+        data (pd.DataFrame): OHLCV data for the full history
+        split_date (pd.Timestamp): First out-of-sample date, or None to use
+            all rows as in-sample data
+        feature_families (list): Feature families to generate
+        indicator_params (dict): Indicator parameters, see FeatureFactory
+        drop_na_threshold (float or int): Row NaN threshold, see
+            FeatureFactory.generate_features
+
+    Returns:
+        tuple: (in_sample_df, out_of_sample_df) feature DataFrames
+
+    Raises:
+        ValueError: If the features cannot be generated
+    """
+    factory = FeatureFactory(
+        data,
+        feature_families=feature_families,
+        indicator_params=indicator_params,
+    )
+    # Rows are dropped one by one on their own NaN count, so dropping before
+    # splitting gives the same rows as dropping each part
+    features = factory.generate_features(
+        drop_na=True, drop_na_threshold=drop_na_threshold
+    )
+    if split_date is None:
+        return features, features.iloc[0:0]
+    in_sample = features.index < split_date
+    return features[in_sample], features[~in_sample]
+
+
+def run_batch_mode(args):
+    """
+    Backtest every ticker, strategy and cost setting of a batch file.
+
+    Args:
+        args: Command line arguments with the path of the batch file
+
+    Returns:
+        pd.DataFrame: Batch results table, or None if the batch failed
+    """
+    config = load_config(args.batch)
+    if not config:
+        return None
+    try:
+        results = run_batch(config, max_workers=args.max_workers)
+    except ValueError as e:
+        logger.error(f"Batch run failed: {str(e)}")
+        return None
+
+    generate_batch_report(results)
+    output = (config.get("output") or {}).get("path", DEFAULT_BATCH_OUTPUT)
+    write_batch_results(results, output)
+
+    logger.info("Done!")
+    return results
+
+
+def run_walk_forward_mode(args, data):
+    """
+    Run a walk-forward optimization for the selected strategy.
+
+    The split date is rolled through the history: parameters are optimized on
+    each in-sample slice and evaluated on the following out-of-sample slice.
+
+    Args:
+        args: Command line arguments
+        data (pd.DataFrame): Downloaded OHLCV data
+
+    Returns:
+        dict: Walk-forward results, or None if the optimization failed
+    """
+    try:
+        results = run_walk_forward(
+            data,
+            strategy=args.strategy,
+            n_folds=args.wf_folds,
+            mode=args.wf_mode,
+            train_bars=args.wf_train_bars,
+            max_workers=args.max_workers,
+            initial_capital=args.initial_capital,
+            commission_fixed=args.commission_fixed,
+            commission_pct=args.commission_pct,
+            slippage_pct=args.slippage_pct,
+            position_size_pct=args.position_size_pct,
+        )
+    except ValueError as e:
+        logger.error(f"Walk-forward optimization failed: {str(e)}")
+        return None
+
+    generate_walk_forward_report(results)
+
+    # Save the chosen parameters and the stitched equity curve
+    output_root = os.path.splitext(args.output)[0]
+    parameters_output = f"{output_root}_walk_forward.csv"
+    results["parameters"].to_csv(parameters_output, index=False)
+    equity_output = f"{output_root}_walk_forward_equity.csv"
+    results["equity_curve"].to_csv(equity_output, header=["portfolio_value"])
+    logger.info(
+        f"Saved walk-forward parameters to {parameters_output} and equity curve to {equity_output}"
+    )
+
+    logger.info("Done!")
+    return results
+
+
+def parse_strategy_params(text):
+    """
+    Parse --strategy-params into strategy constructor arguments.
+
+    Args:
+        text (str): Comma-separated key=value pairs, e.g. 'window=20,std_dev=2'
+
+    Returns:
+        dict: Parameter values, parsed as YAML scalars so numbers are numbers
+
+    Raises:
+        argparse.ArgumentTypeError: If a pair has no '='
+    """
+    params = {}
+    for pair in filter(None, (p.strip() for p in text.split(","))):
+        key, sep, value = pair.partition("=")
+        if not sep or not key.strip():
+            raise argparse.ArgumentTypeError(
+                f"Invalid strategy parameter '{pair}'. Use key=value pairs."
+            )
+        params[key.strip()] = yaml.safe_load(value.strip())
+    return params
+
+
+def get_strategy_params(args):
+    """
+    Return the constructor arguments of the selected strategy.
+
+    SMA crossover and RSI take their parameters from their own options,
+    other strategies from --strategy-params.
+
+    Args:
+        args: Command line arguments
+
+    Returns:
+        dict: Keyword arguments for the strategy class
+    """
+    if args.strategy == "sma_crossover":
+        return {"fast_window": args.fast_sma, "slow_window": args.slow_sma}
+    if args.strategy == "rsi":
+        return {
+            "rsi_window": args.rsi_window,
+            "oversold_threshold": args.rsi_oversold,
+            "overbought_threshold": args.rsi_overbought,
+        }
+    return dict(args.strategy_params or {})
+
+
 def create_strategy(args):
     """
     Create a strategy instance based on command line arguments.
-    Uses a registry pattern to allow for easy addition of new strategies.
+    Strategies are looked up in STRATEGY_REGISTRY, so every registered
+    strategy is available.
 
     Args:
         args: Command line arguments containing strategy parameters
@@ -1540,32 +1902,17 @@ def create_strategy(args):
     Returns:
         Strategy instance or None if strategy creation fails
     """
-    # Dictionary mapping strategy names to creation functions
-    strategy_registry = {
-        "sma_crossover": lambda: SMACrossoverStrategy(
-            fast_window=args.fast_sma, slow_window=args.slow_sma
-        ),
-        "rsi": lambda: RSIStrategy(
-            rsi_window=args.rsi_window,
-            oversold_threshold=args.rsi_oversold,
-            overbought_threshold=args.rsi_overbought,
-        ),
-    }
-
-    # Get the strategy creator function from the registry
-    if args.strategy in strategy_registry:
-        try:
-            strategy = strategy_registry[args.strategy]()
-            logger.info(f"Created {strategy.name} strategy")
-            return strategy
-        except Exception as e:
-            logger.error(
-                f"Failed to create {args.strategy} strategy: {str(e)}"
-            )
-            return None
-    else:
+    if args.strategy not in STRATEGY_REGISTRY:
         logger.error(f"Unknown strategy: {args.strategy}")
-        logger.info(f"Available strategies: {list(strategy_registry.keys())}")
+        logger.info(f"Available strategies: {list(STRATEGY_REGISTRY)}")
+        return None
+
+    try:
+        strategy = get_strategy(args.strategy, **get_strategy_params(args))
+        logger.info(f"Created {strategy.name} strategy")
+        return strategy
+    except Exception as e:
+        logger.error(f"Failed to create {args.strategy} strategy: {str(e)}")
         return None
 
 
@@ -12,6 +12,7 @@ import os
 import sys
 import subprocess
 import argparse
+import importlib.util
 import logging
 from pathlib import Path
 
@@ -26,25 +27,39 @@ logger = logging.getLogger(__name__)
 ROOT_DIR = Path(__file__).resolve().parent
 
 
+# Import names of the required packages (see requirements.txt)
+REQUIRED_MODULES = [
+    "streamlit",
+    "pandas",
+    "numpy",
+    "plotly",
+    "yfinance",
+    "matplotlib",
+]
+
+
 def check_dependencies():
-    """Check if required dependencies are installed."""
-    try:
-        import streamlit
-        import pandas
-        import numpy
-        import plotly
-        import yf
-        import matplotlib
-
-        logger.info("All required dependencies are installed.")
-        return True
-    except ImportError as e:
-        logger.error(f"Missing dependency: {str(e)}")
+    """
+    Check if required dependencies are installed.
+
+    The packages are looked up without importing them, so the check does
+    not slow down the launcher; the selected mode imports what it needs.
+    """
+    missing = [
+        name
+        for name in REQUIRED_MODULES
+        if importlib.util.find_spec(name) is None
+    ]
+    if missing:
+        logger.error(f"Missing dependency: {', '.join(missing)}")
         logger.error(
             "Please install all required dependencies: pip install -r requirements.txt"
         )
         return False
 
+    logger.info("All required dependencies are installed.")
+    return True
+
 
 def run_streamlit_dashboard(app_path):
     """Run the Streamlit dashboard."""
@@ -3,6 +3,18 @@ Stock Scanner module.
 
 This module provides functionality to scan stocks
 for trading signals based on various strategies.
+
+Scans run concurrently: downloads run on a thread pool, since they wait on
+the network, and feature generation and signal checks run on a process
+pool, since they are CPU-bound. Results are returned as each ticker
+finishes.
+
+For end-of-day screens of large universes, screen_stocks checks the last
+bar of every ticker at once from data downloaded in bulk.
+
+Besides "SMA Crossover" and "RSI Strategy", every strategy in
+STRATEGY_REGISTRY can be scanned by its registry name, with its constructor
+arguments as strategy parameters.
 """
 
 import logging
@@ -13,12 +25,18 @@ import sys
 import streamlit as st
 import concurrent.futures
 import time
+import inspect
 
 # Add the src directory to the path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from src.data_fetcher import get_stock_data
+from src.data_fetcher import fetch_stocks_data, get_stock_data
 from src.feature_factory import FeatureFactory
-from src.strategies import SMACrossoverStrategy, RSIStrategy
+from src.backtester import (
+    STRATEGY_REGISTRY,
+    SMACrossoverStrategy,
+    RSIStrategy,
+    get_strategy,
+)
 from src.nan_handler import handle_nans  # Import the new nan_handler
 
 # Setup logging
@@ -27,13 +45,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Minimum number of bars a stock needs to be scanned
+MIN_SCAN_BARS = 50
+
+# Periods of history the vectorized RSI screen keeps before the last bar;
+# the weight of older bars in Wilder's smoothing, (1 - 1/period) ** 50
+# periods < exp(-50), is below float64 precision
+RSI_WARMUP_PERIODS = 50
+
 
 def scan_stocks(
     tickers,
     period="1y",
     interval="1d",
     strategy_name="SMA Crossover",
-    **strategy_params,
+    strategy_params=None,
+    max_workers=None,
+    **kwargs,
 ):
     """
     Scan multiple stocks for trading signals based on the selected strategy.
@@ -43,34 +71,118 @@ def scan_stocks(
         period (str): Data period (default: "1y")
         interval (str): Data interval (default: "1d")
         strategy_name (str): Name of the strategy to use
-        **strategy_params: Additional parameters for the strategy
+        strategy_params (dict): Parameters for the strategy
+        max_workers (int): Concurrent downloads, also the maximum number of
+            worker processes. None uses the executors' defaults; 1 scans
+            serially in this process.
+        **kwargs: Additional parameters for the strategy
 
     Returns:
-        pd.DataFrame: DataFrame with scan results for each ticker
+        pd.DataFrame: DataFrame with scan results for each ticker, in the
+            order of `tickers`
     """
-    results = []
-    for ticker in tickers:
-        try:
-            scan_result = scan_stock(
-                ticker, period, interval, strategy_name, strategy_params
-            )
-            results.append(scan_result)
-        except Exception as e:
-            logger.error(f"Error scanning {ticker}: {str(e)}")
-            results.append(
-                {
-                    "ticker": ticker,
-                    "status": "error",
-                    "message": str(e),
-                    "signal": "none",
-                }
-            )
+    start_time = time.perf_counter()
+    results = list(
+        iter_scan_results(
+            tickers,
+            period,
+            interval,
+            strategy_name,
+            strategy_params,
+            max_workers=max_workers,
+            **kwargs,
+        )
+    )
+    logger.info(
+        f"Scanned {len(tickers)} stocks in {time.perf_counter() - start_time:.1f}s"
+    )
 
     # Convert results to DataFrame
-    results_df = pd.DataFrame(results)
+    results_df = _results_frame(results, tickers)
     return results_df
 
 
+def _results_frame(results, tickers):
+    """Return scan results as a DataFrame in the order of `tickers`."""
+    order = {ticker: i for i, ticker in enumerate(tickers)}
+    return pd.DataFrame(
+        sorted(results, key=lambda result: order[result["ticker"]])
+    )
+
+
+def iter_scan_results(
+    tickers,
+    period="1y",
+    interval="1d",
+    strategy_name="SMA Crossover",
+    strategy_params=None,
+    max_workers=None,
+    **kwargs,
+):
+    """
+    Scan multiple stocks, yielding each result as soon as it is ready.
+
+    Takes the same arguments as scan_stocks.
+
+    Yields:
+        dict: Scan result for one ticker, in order of completion
+    """
+    strategy_params = {**(strategy_params or {}), **kwargs}
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError(f"Max workers must be positive. Got: {max_workers}")
+
+    if max_workers == 1:
+        for ticker in tickers:
+            yield scan_stock(
+                ticker, period, interval, strategy_name, strategy_params
+            )
+        return
+
+    process_workers = min(max_workers or os.cpu_count(), os.cpu_count())
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as fetch_pool, concurrent.futures.ProcessPoolExecutor(
+        max_workers=process_workers
+    ) as analysis_pool:
+        # Map each pending future to its ticker and whether it is a download
+        pending = {
+            fetch_pool.submit(get_stock_data, ticker, period, interval): (
+                ticker,
+                True,
+            )
+            for ticker in tickers
+        }
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                ticker, is_download = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error scanning {ticker}: {str(e)}")
+                    yield {
+                        "ticker": ticker,
+                        "status": "error",
+                        "message": str(e),
+                        "signal": "none",
+                    }
+                    continue
+
+                if is_download:
+                    analysis = analysis_pool.submit(
+                        analyze_stock,
+                        ticker,
+                        result,
+                        strategy_name,
+                        strategy_params,
+                    )
+                    pending[analysis] = (ticker, False)
+                else:
+                    yield result
+
+
 def scan_stock(ticker, period, interval, strategy_name, strategy_params):
     """
     Scan a single stock for trading signals based on the selected strategy.
@@ -88,7 +200,33 @@ def scan_stock(ticker, period, interval, strategy_name, strategy_params):
     try:
         # Fetch stock data
         data = get_stock_data(ticker, period, interval)
-        if data is None or len(data) < 50:  # Require at least 50 data points
+    except Exception as e:
+        logger.error(f"Error scanning {ticker}: {str(e)}")
+        return {
+            "ticker": ticker,
+            "status": "error",
+            "message": str(e),
+            "signal": "none",
+        }
+    return analyze_stock(ticker, data, strategy_name, strategy_params)
+
+
+def analyze_stock(ticker, data, strategy_name, strategy_params):
+    """
+    Check downloaded stock data for trading signals.
+
+    Args:
+        ticker (str): Stock ticker symbol
+        data (pd.DataFrame): OHLCV data for the ticker, or None if the
+            download failed
+        strategy_name (str): Name of the strategy to use
+        strategy_params (dict): Parameters for the strategy
+
+    Returns:
+        dict: Scan results including any trading signals
+    """
+    try:
+        if data is None or len(data) < MIN_SCAN_BARS:
             logger.warning(f"Insufficient data for {ticker}")
             return {
                 "ticker": ticker,
@@ -99,13 +237,23 @@ def scan_stock(ticker, period, interval, strategy_name, strategy_params):
 
         # Determine which feature families to generate based on strategy
         feature_families = []
+        indicator_params = None
+        strategy = None
         if strategy_name == "SMA Crossover":
             feature_families = ["sma"]
         elif strategy_name == "RSI Strategy":
             feature_families = ["rsi"]
+        elif strategy_name in STRATEGY_REGISTRY:
+            strategy = get_strategy(strategy_name, **strategy_params)
+            indicator_params = strategy.indicator_params()
+            feature_families = list(indicator_params)
 
         # Generate features
-        factory = FeatureFactory(data, feature_families=feature_families)
+        factory = FeatureFactory(
+            data,
+            feature_families=feature_families,
+            indicator_params=indicator_params,
+        )
         features_df = factory.generate_features(
             drop_na=False
         )  # Generate features but don't drop NaNs yet
@@ -119,6 +267,12 @@ def scan_stock(ticker, period, interval, strategy_name, strategy_params):
         elif strategy_name == "RSI Strategy":
             rsi_period = strategy_params.get("rsi_period", 14)
             critical_columns.append(f"rsi_{rsi_period}")
+        elif strategy is not None:
+            critical_columns.extend(
+                col
+                for col in strategy.required_features()
+                if col not in critical_columns
+            )
 
         # Use the standardized NaN handling
         original_features_len = len(features_df)
@@ -195,6 +349,26 @@ def scan_stock(ticker, period, interval, strategy_name, strategy_params):
                 oversold_threshold=oversold,
             )
             features_with_signals = strategy.generate_signals(features_df)
+
+        elif strategy is not None:
+            # Check if we have the required columns
+            missing = [
+                col
+                for col in strategy.required_features()
+                if col not in features_df.columns
+            ]
+            if missing:
+                logger.warning(
+                    f"Missing required indicators for {ticker} after NaN handling: {missing}"
+                )
+                return {
+                    "ticker": ticker,
+                    "status": "error",
+                    "message": f"Missing {strategy.name} indicators for {ticker}",
+                    "signal": "none",
+                }
+
+            features_with_signals = strategy.generate_signals(features_df)
         else:
             logger.error(f"Unknown strategy: {strategy_name}")
             return {
@@ -210,51 +384,34 @@ def scan_stock(ticker, period, interval, strategy_name, strategy_params):
 
             if "buy_signal" in last_row and last_row["buy_signal"]:
                 signal = "buy"
-                signal_details = (
-                    f"Buy signal at {last_row.name.strftime('%Y-%m-%d')}"
-                )
-
-                # Add strategy-specific details
-                if strategy_name == "SMA Crossover":
-                    signal_details += f" - Fast SMA ({fast_sma}) crossed above Slow SMA ({slow_sma})"
-                elif strategy_name == "RSI Strategy":
-                    signal_details += f" - RSI ({rsi_period}) below {oversold} (oversold condition)"
-
             elif "sell_signal" in last_row and last_row["sell_signal"]:
                 signal = "sell"
-                signal_details = (
-                    f"Sell signal at {last_row.name.strftime('%Y-%m-%d')}"
-                )
-
-                # Add strategy-specific details
-                if strategy_name == "SMA Crossover":
-                    signal_details += f" - Fast SMA ({fast_sma}) crossed below Slow SMA ({slow_sma})"
-                elif strategy_name == "RSI Strategy":
-                    signal_details += f" - RSI ({rsi_period}) above {overbought} (overbought condition)"
             else:
                 signal = "none"
-                signal_details = "No active signal"
-
-                # Add current indicator values
-                if strategy_name == "SMA Crossover":
-                    if all(
-                        col in last_row.index
-                        for col in [f"sma_{fast_sma}", f"sma_{slow_sma}"]
-                    ):
-                        fast_val = last_row[f"sma_{fast_sma}"]
-                        slow_val = last_row[f"sma_{slow_sma}"]
-                        signal_details += f" - Fast SMA: {fast_val:.2f}, Slow SMA: {slow_val:.2f}"
-
-                elif strategy_name == "RSI Strategy":
-                    if f"rsi_{rsi_period}" in last_row.index:
-                        rsi_val = last_row[f"rsi_{rsi_period}"]
-                        signal_details += f" - Current RSI: {rsi_val:.2f}"
-
-                        # Add trending information
-                        if rsi_val < 50:
-                            signal_details += " (Potentially bearish)"
-                        else:
-                            signal_details += " (Potentially bullish)"
+
+            # Current indicator values
+            indicator_names = None
+            if strategy_name == "SMA Crossover":
+                indicators = last_row.reindex(
+                    [f"sma_{fast_sma}", f"sma_{slow_sma}"]
+                ).tolist()
+            elif strategy_name == "RSI Strategy":
+                indicators = last_row.reindex([f"rsi_{rsi_period}"]).tolist()
+            else:
+                indicator_names = [
+                    col
+                    for col in strategy.required_features()
+                    if col != "Close"
+                ]
+                indicators = last_row.reindex(indicator_names).tolist()
+            signal_details = _describe_signal(
+                strategy_name,
+                signal,
+                last_row.name,
+                strategy_params,
+                indicators,
+                indicator_names,
+            )
 
             # Get the last price
             last_price = last_row["Close"] if "Close" in last_row else None
@@ -284,6 +441,310 @@ def scan_stock(ticker, period, interval, strategy_name, strategy_params):
         }
 
 
+def _describe_signal(
+    strategy_name,
+    signal,
+    as_of,
+    strategy_params,
+    indicators,
+    indicator_names=None,
+):
+    """
+    Describe the signal on the last bar for the scan results.
+
+    Args:
+        strategy_name (str): Name of the strategy
+        signal (str): "buy", "sell" or "none"
+        as_of (pd.Timestamp): Date of the last bar
+        strategy_params (dict): Parameters for the strategy
+        indicators (list): Indicator values on the last bar: fast and slow
+            SMA for the SMA crossover, RSI for the RSI strategy
+        indicator_names (list): Column names of the indicator values, for
+            strategies from STRATEGY_REGISTRY
+
+    Returns:
+        str: Signal details
+    """
+    if indicator_names is not None:
+        signal_details = (
+            f"{signal.capitalize()} signal at {as_of.strftime('%Y-%m-%d')}"
+            if signal != "none"
+            else "No active signal"
+        )
+        values = ", ".join(
+            f"{name}: {value:.2f}"
+            for name, value in zip(indicator_names, indicators)
+            if pd.notna(value)
+        )
+        return f"{signal_details} - {values}" if values else signal_details
+
+    fast_sma = strategy_params.get("fast_sma", 50)
+    slow_sma = strategy_params.get("slow_sma", 200)
+    rsi_period = strategy_params.get("rsi_period", 14)
+    overbought = strategy_params.get("overbought", 70)
+    oversold = strategy_params.get("oversold", 30)
+
+    if signal == "buy":
+        signal_details = f"Buy signal at {as_of.strftime('%Y-%m-%d')}"
+
+        # Add strategy-specific details
+        if strategy_name == "SMA Crossover":
+            signal_details += (
+                f" - Fast SMA ({fast_sma}) crossed above Slow SMA ({slow_sma})"
+            )
+        elif strategy_name == "RSI Strategy":
+            signal_details += (
+                f" - RSI ({rsi_period}) below {oversold} (oversold condition)"
+            )
+
+    elif signal == "sell":
+        signal_details = f"Sell signal at {as_of.strftime('%Y-%m-%d')}"
+
+        # Add strategy-specific details
+        if strategy_name == "SMA Crossover":
+            signal_details += (
+                f" - Fast SMA ({fast_sma}) crossed below Slow SMA ({slow_sma})"
+            )
+        elif strategy_name == "RSI Strategy":
+            signal_details += f" - RSI ({rsi_period}) above {overbought} (overbought condition)"
+    else:
+        signal_details = "No active signal"
+
+        # Add current indicator values
+        if not all(pd.notna(value) for value in indicators):
+            return signal_details
+        if strategy_name == "SMA Crossover":
+            fast_val, slow_val = indicators
+            signal_details += (
+                f" - Fast SMA: {fast_val:.2f}, Slow SMA: {slow_val:.2f}"
+            )
+        elif strategy_name == "RSI Strategy":
+            (rsi_val,) = indicators
+            signal_details += f" - Current RSI: {rsi_val:.2f}"
+
+            # Add trending information
+            if rsi_val < 50:
+                signal_details += " (Potentially bearish)"
+            else:
+                signal_details += " (Potentially bullish)"
+
+    return signal_details
+
+
+def screen_stocks(
+    data, strategy_name="SMA Crossover", strategy_params=None, **kwargs
+):
+    """
+    Check the last bar of many stocks for trading signals at once.
+
+    A faster alternative to scan_stocks for end-of-day screens of large
+    universes: instead of generating features for each ticker, only the
+    trailing closes the strategy needs are kept (slow_sma + 1 bars for the
+    SMA crossover, the RSI warm-up for the RSI strategy) and the signals of
+    every ticker are evaluated together as array operations. The signals
+    are the ones scan_stocks finds. Strategies from STRATEGY_REGISTRY are
+    checked ticker by ticker with analyze_stock.
+
+    Args:
+        data (dict): OHLCV DataFrame for each ticker, or None for tickers
+            without data (as returned by fetch_stocks_data)
+        strategy_name (str): Name of the strategy to use
+        strategy_params (dict): Parameters for the strategy
+        **kwargs: Additional parameters for the strategy
+
+    Returns:
+        pd.DataFrame: DataFrame with scan results for each ticker, in the
+            order of `data`
+
+    Raises:
+        ValueError: If the strategy or its parameters are invalid
+    """
+    strategy_params = {**(strategy_params or {}), **kwargs}
+    tickers = list(data)
+
+    if strategy_name == "SMA Crossover":
+        strategy = SMACrossoverStrategy(
+            fast_window=strategy_params.get("fast_sma", 50),
+            slow_window=strategy_params.get("slow_sma", 200),
+        )
+        n_bars = strategy.slow_window + 1
+    elif strategy_name == "RSI Strategy":
+        strategy = RSIStrategy(
+            rsi_window=strategy_params.get("rsi_period", 14),
+            overbought_threshold=strategy_params.get("overbought", 70),
+            oversold_threshold=strategy_params.get("oversold", 30),
+        )
+        n_bars = RSI_WARMUP_PERIODS * strategy.rsi_window + 1
+    elif strategy_name in STRATEGY_REGISTRY:
+        # Fail on invalid parameters before any ticker is analyzed
+        get_strategy(strategy_name, **strategy_params)
+        return pd.DataFrame(
+            [
+                analyze_stock(
+                    ticker, data[ticker], strategy_name, strategy_params
+                )
+                for ticker in tickers
+            ]
+        )
+    else:
+        raise ValueError(f"Unknown strategy: {strategy_name}")
+
+    start_time = time.perf_counter()
+    closes, last_dates, counts = _trailing_closes(data, n_bars)
+
+    if strategy_name == "SMA Crossover":
+        buy, sell, indicators, enough = _screen_sma_crossover(
+            closes, counts, strategy.fast_window, strategy.slow_window
+        )
+    else:
+        buy, sell, indicators, enough = _screen_rsi(
+            closes,
+            counts,
+            strategy.rsi_window,
+            strategy.oversold_threshold,
+            strategy.overbought_threshold,
+        )
+    # The same minimum history as scan_stocks
+    enough &= counts >= MIN_SCAN_BARS
+
+    results = []
+    for i, ticker in enumerate(tickers):
+        if not enough[i]:
+            results.append(
+                {
+                    "ticker": ticker,
+                    "status": "error",
+                    "message": "Insufficient data",
+                    "signal": "none",
+                }
+            )
+            continue
+        signal = "buy" if buy[i] else "sell" if sell[i] else "none"
+        results.append(
+            {
+                "ticker": ticker,
+                "status": "success",
+                "signal": signal,
+                "signal_details": _describe_signal(
+                    strategy_name,
+                    signal,
+                    last_dates[i],
+                    strategy_params,
+                    indicators[:, i].tolist(),
+                ),
+                "last_price": closes[-1, i],
+                "as_of_date": last_dates[i].strftime("%Y-%m-%d"),
+            }
+        )
+    logger.info(
+        f"Screened {len(tickers)} stocks in {time.perf_counter() - start_time:.2f}s"
+    )
+    return pd.DataFrame(results)
+
+
+def _trailing_closes(data, n_bars):
+    """
+    Collect the last `n_bars` closes of every ticker in one matrix.
+
+    Returns:
+        tuple: (closes, last_dates, counts) where closes is a float64 array
+            of shape (n_bars, tickers) with each ticker's closes aligned to
+            the last row and NaN before its first bar, last_dates the date of
+            each ticker's last bar (None without data) and counts the number
+            of bars each ticker has in total
+    """
+    closes = np.full((n_bars, len(data)), np.nan)
+    last_dates = [None] * len(data)
+    counts = np.zeros(len(data), dtype=np.int64)
+
+    for i, frame in enumerate(data.values()):
+        if frame is None or frame.empty or "Close" not in frame:
+            continue
+        close = frame["Close"]
+        values = close.to_numpy(dtype=np.float64)
+        if np.isnan(values).any():
+            close = close.dropna()
+            values = close.to_numpy(dtype=np.float64)
+            if len(values) == 0:
+                continue
+        tail = values[-n_bars:]
+        closes[n_bars - len(tail) :, i] = tail
+        last_dates[i] = close.index[-1]
+        counts[i] = len(values)
+    return closes, last_dates, counts
+
+
+def _screen_sma_crossover(closes, counts, fast_window, slow_window):
+    """
+    Find SMA crossovers on the last bar of every ticker.
+
+    Returns:
+        tuple: (buy, sell, indicators, enough) where indicators holds the
+            fast and slow SMA on the last bar, one column per ticker, and
+            enough marks the tickers with slow_window + 1 bars
+    """
+
+    def sma(window, end):
+        return closes[end - window : end or None].mean(axis=0)
+
+    fast, slow = sma(fast_window, 0), sma(slow_window, 0)
+    prev_fast, prev_slow = sma(fast_window, -1), sma(slow_window, -1)
+
+    buy = (fast > slow) & (prev_fast <= prev_slow)
+    sell = (fast < slow) & (prev_fast >= prev_slow)
+    return buy, sell, np.vstack([fast, slow]), counts > slow_window
+
+
+def _screen_rsi(closes, counts, window, oversold, overbought):
+    """
+    Find RSI threshold crossings on the last bar of every ticker.
+
+    Wilder's smoothing is seeded with the average of the first `window`
+    changes in `closes` and run over the remaining bars for all tickers at
+    once. With RSI_WARMUP_PERIODS windows of warm-up the seed's weight has
+    decayed below float64 precision, so tickers with longer histories get
+    the RSI of their full history.
+
+    Returns:
+        tuple: (buy, sell, indicators, enough) where indicators holds the
+            RSI on the last bar and enough marks the tickers with at least
+            window + 2 bars
+    """
+    n_bars, n_tickers = closes.shape
+    delta = np.diff(closes, axis=0)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+
+    # Row of `delta` holding each ticker's first change, and its seed row
+    first = np.clip(n_bars - counts, 0, n_bars - 1)
+    seed_row = first + window - 1
+    enough = counts >= window + 2
+
+    # Seed with the simple average of the first `window` changes
+    columns = np.arange(n_tickers)
+    gain_sum = np.vstack([np.zeros(n_tickers), np.cumsum(gain, axis=0)])
+    loss_sum = np.vstack([np.zeros(n_tickers), np.cumsum(loss, axis=0)])
+    end = np.minimum(seed_row + 1, n_bars - 1)
+    avg_gain = (gain_sum[end, columns] - gain_sum[first, columns]) / window
+    avg_loss = (loss_sum[end, columns] - loss_sum[first, columns]) / window
+
+    rsi = prev_rsi = np.full(n_tickers, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for row in range(seed_row[enough].min(initial=n_bars), n_bars - 1):
+            active = row > seed_row
+            avg_gain = np.where(
+                active, avg_gain + (gain[row] - avg_gain) / window, avg_gain
+            )
+            avg_loss = np.where(
+                active, avg_loss + (loss[row] - avg_loss) / window, avg_loss
+            )
+            prev_rsi, rsi = rsi, 100 - 100 / (1 + avg_gain / avg_loss)
+
+    buy = (rsi > oversold) & (prev_rsi <= oversold)
+    sell = (rsi < overbought) & (prev_rsi >= overbought)
+    return buy, sell, rsi[np.newaxis], enough
+
+
 def run_scanner():
     """
     Run the scanner with Streamlit interface.
@@ -299,7 +760,13 @@ def run_scanner():
 
     # Strategy selection
     selected_strategy = st.selectbox(
-        "Select strategy", ["SMA Crossover", "RSI Strategy"]
+        "Select strategy",
+        ["SMA Crossover", "RSI Strategy"]
+        + [
+            name
+            for name in STRATEGY_REGISTRY
+            if name not in ("sma_crossover", "rsi")
+        ],
     )
 
     # Strategy parameters
@@ -342,6 +809,14 @@ def run_scanner():
                 "overbought": overbought,
                 "oversold": oversold,
             }
+        else:
+            st.subheader(f"{selected_strategy} Strategy Parameters")
+            # One input per constructor argument, starting at its default
+            signature = inspect.signature(STRATEGY_REGISTRY[selected_strategy])
+            strategy_params = {
+                name: st.number_input(name, value=param.default)
+                for name, param in signature.parameters.items()
+            }
 
     # Data parameters
     with st.expander("Data Parameters"):
@@ -355,17 +830,51 @@ def run_scanner():
             ["1d", "5d", "1wk", "1mo"],
             index=0,
         )
+        max_workers = st.number_input(
+            "Max Workers",
+            min_value=1,
+            max_value=64,
+            value=8,
+            step=1,
+            help="Stocks downloaded and analyzed at the same time",
+        )
+        scan_mode = st.radio(
+            "Scan Mode",
+            ["Full scan", "Last-bar screen"],
+            help="The last-bar screen downloads all stocks in bulk and checks "
+            "their signals together, for large lists of stocks",
+        )
 
     # Run scan button
     if st.button("Run Scan"):
         with st.spinner(f"Scanning {len(tickers)} stocks..."):
-            results = scan_stocks(
-                tickers,
-                period=period,
-                interval=interval,
-                strategy_name=selected_strategy,
-                **strategy_params,
-            )
+            if scan_mode == "Last-bar screen":
+                data = fetch_stocks_data(
+                    tickers,
+                    period=period,
+                    interval=interval,
+                    max_workers=int(max_workers),
+                )
+                results = screen_stocks(
+                    data, selected_strategy, strategy_params
+                )
+            else:
+                progress = st.progress(0.0)
+                scanned = []
+                for result in iter_scan_results(
+                    tickers,
+                    period=period,
+                    interval=interval,
+                    strategy_name=selected_strategy,
+                    strategy_params=strategy_params,
+                    max_workers=int(max_workers),
+                ):
+                    scanned.append(result)
+                    progress.progress(
+                        len(scanned) / len(tickers),
+                        text=f"Scanned {result['ticker']} ({len(scanned)}/{len(tickers)})",
+                    )
+                results = _results_frame(scanned, tickers)
 
             # Display results
             st.subheader("Scan Results")
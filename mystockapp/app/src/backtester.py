@@ -2,12 +2,15 @@
 Module for backtesting trading strategies.
 
 This module provides functionality for:
-1. Generating trading signals based on strategies
-2. Running backtests over specified periods
-3. Generating performance reports
+1. Generating trading signals based on registered strategies
+2. Running backtests over specified periods, in one go or chunk by chunk
+3. Running parameter sweeps over a grid of strategy parameters
+4. Running portfolio backtests of many tickers with shared capital
+5. Generating performance reports
 """
 
 import logging
+import itertools
 import pandas as pd
 import numpy as np
 import os
@@ -15,7 +18,26 @@ import json
 from datetime import datetime
 from abc import ABC, abstractmethod
 from collections import deque
-import streamlit as st
+
+from src.feature_factory import FeatureFactory
+from src.metrics import (
+    RISK_METRICS,
+    drawdown_pct,
+    infer_periods_per_year,
+    risk_metrics,
+)
+from src.result_cache import fingerprint, get_result_cache
+
+
+class _DeferredFileHandler(logging.FileHandler):
+    """File handler that creates its directory and file on the first record."""
+
+    def __init__(self, filename):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
 
 
 # Setup enhanced logging
@@ -23,15 +45,15 @@ def setup_logging(log_level=logging.INFO):
     """
     Configure logging with a more detailed format and multiple handlers.
 
+    The log files (and the logs directory) are only created once a record
+    is written to them, so importing this module has no side effects on disk.
+
     Args:
         log_level: The logging level to use (default: INFO)
 
     Returns:
         logging.Logger: Configured logger
     """
-    # Create logs directory if it doesn't exist
-    os.makedirs("logs", exist_ok=True)
-
     # Create logger
     logger = logging.getLogger("backtester")
     logger.setLevel(log_level)
@@ -49,14 +71,14 @@ def setup_logging(log_level=logging.INFO):
     log_file = os.path.join(
         "logs", f'backtester_{datetime.now().strftime("%Y%m%d")}.log'
     )
-    file_handler = logging.FileHandler(log_file)
+    file_handler = _DeferredFileHandler(log_file)
     file_handler.setLevel(log_level)
 
     # Create file handler specifically for errors
     error_log_file = os.path.join(
         "logs", f'backtester_errors_{datetime.now().strftime("%Y%m%d")}.log'
     )
-    error_file_handler = logging.FileHandler(error_log_file)
+    error_file_handler = _DeferredFileHandler(error_log_file)
     error_file_handler.setLevel(logging.ERROR)
 
     # Create formatters
@@ -84,9 +106,151 @@ def setup_logging(log_level=logging.INFO):
 # Initialize logger
 logger = setup_logging()
 
+# Execution engines accepted by run_backtest
+BACKTEST_ENGINES = ("loop", "array", "vectorized")
+
+# Part of every cached backtest's key; bump it when a change to the
+# simulation changes its results, so stale on-disk results are not reused
+BACKTEST_CACHE_VERSION = 2
+
+
+# Codes of the int8 signal vectors returned by Strategy.compute_signals;
+# bars without a signal are 0
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+
+# Registered strategies by name, filled in by @register_strategy. Every
+# registered strategy can be used in parameter sweeps, walk-forward
+# optimization, batch runs, main.py and the scanner.
+STRATEGY_REGISTRY = {}
+
+
+def register_strategy(name):
+    """
+    Class decorator adding a Strategy subclass to STRATEGY_REGISTRY.
+
+    Args:
+        name (str): Registry name, e.g. 'sma_crossover'
+
+    Returns:
+        callable: Decorator that registers the class and returns it unchanged
+    """
+
+    def decorator(cls):
+        cls.registry_name = name
+        STRATEGY_REGISTRY[name] = cls
+        return cls
+
+    return decorator
+
+
+def get_strategy(name, **params):
+    """
+    Create a registered strategy.
+
+    Args:
+        name (str): Registry name of the strategy
+        **params: Strategy constructor arguments
+
+    Returns:
+        Strategy: The strategy instance
+
+    Raises:
+        ValueError: If the strategy is unknown or its parameters are invalid
+    """
+    if name not in STRATEGY_REGISTRY:
+        raise ValueError(
+            f"Unknown strategy: {name}. Valid options are: {list(STRATEGY_REGISTRY)}"
+        )
+    return STRATEGY_REGISTRY[name](**params)
+
+
+def _previous(values):
+    """Shift an array down by one bar, filling the first bar with NaN."""
+    shifted = np.empty_like(values, dtype=np.float64)
+    shifted[:1] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def crosses_above(values, level):
+    """True where `values` moves from at or below `level` to above it."""
+    level = np.broadcast_to(level, np.shape(values))
+    return (values > level) & (_previous(values) <= _previous(level))
+
+
+def crosses_below(values, level):
+    """True where `values` moves from at or above `level` to below it."""
+    level = np.broadcast_to(level, np.shape(values))
+    return (values < level) & (_previous(values) >= _previous(level))
+
+
+def encode_signals(buy, sell):
+    """Combine boolean buy/sell arrays into an int8 signal array."""
+    return np.where(buy, SIGNAL_BUY, np.where(sell, SIGNAL_SELL, 0)).astype(
+        np.int8
+    )
+
+
+def _merge_indicator_params(strategies):
+    """
+    Merge the FeatureFactory parameters of several strategies.
+
+    List-valued parameters of a feature family are unioned, so one
+    FeatureFactory run computes the columns of every strategy.
+
+    Args:
+        strategies (list): Strategy instances
+
+    Returns:
+        dict: indicator_params for FeatureFactory
+    """
+    merged = {}
+    for strategy in strategies:
+        for family, params in strategy.indicator_params().items():
+            family_params = merged.setdefault(family, {})
+            for key, values in params.items():
+                family_params.setdefault(key, set()).update(values)
+    return {
+        family: {key: sorted(values) for key, values in params.items()}
+        for family, params in merged.items()
+    }
+
 
 class Strategy(ABC):
-    """Base class for all trading strategies."""
+    """
+    Base class for all trading strategies.
+
+    A strategy names the feature columns it reads (``required_features``)
+    and turns their values into signals in ``signal_kernel``, a function of
+    NumPy arrays. The kernel receives one array per required feature, in
+    order, followed by the strategy attributes named in ``kernel_params``.
+    Arrays are either of shape (n_bars,) for one strategy or
+    (n_bars, n_strategies) with one value per strategy for each parameter,
+    so a whole parameter grid is evaluated in one call. The kernel returns an
+    int8 array of SIGNAL_BUY, SIGNAL_SELL and 0.
+
+    Subclasses implement ``required_features`` and ``signal_kernel``;
+    ``generate_signals`` is built on them and no longer overridden. It
+    returns a copy of its input with 'buy_signal' and 'sell_signal' columns
+    (earlier versions modified the input in place, and the SMA crossover
+    also added a 'fast_gt_slow' column). A strategy that only overrides
+    ``generate_signals`` cannot be instantiated and needs a kernel.
+    """
+
+    # Number of previous bars generate_signals compares each bar with (e.g.
+    # 1 for a crossover); chunked backtests prepend that many bars to a chunk
+    signal_lookback = 1
+
+    # Name in STRATEGY_REGISTRY, set by @register_strategy
+    registry_name = None
+
+    # Default parameter grid for run_parameter_sweep, keyed by constructor
+    # argument
+    default_grid = None
+
+    # Strategy attributes passed to signal_kernel after the feature arrays
+    kernel_params = ()
 
     def __init__(self, name="BaseStrategy"):
         """Initialize strategy with a name."""
@@ -105,6 +269,16 @@ class Strategy(ABC):
         """
         pass
 
+    def indicator_params(self):
+        """
+        Return the FeatureFactory parameters that produce the required
+        features.
+
+        Returns:
+            dict: Mapping of feature family to its indicator parameters
+        """
+        return {}
+
     def validate_features(self, df):
         """
         Validate that the DataFrame contains all required features.
@@ -119,37 +293,107 @@ class Strategy(ABC):
             ValueError: If required features are missing
         """
         required = self.required_features()
-        missing = [col for col in required if col not in df.columns]
+        missing = [col for col in required if col not in df]
         if missing:
             raise ValueError(
                 f"Missing required features for {self.name} strategy: {missing}"
             )
         return True
 
+    @staticmethod
     @abstractmethod
-    def generate_signals(self, df):
+    def signal_kernel(*arrays):
         """
-        Generate buy/sell signals for the given DataFrame.
+        Compute signals from feature arrays and strategy parameters.
 
         This method must be implemented by all strategy subclasses.
-        It should add at least 'buy_signal' and 'sell_signal' columns to the DataFrame.
+
+        Returns:
+            np.ndarray: int8 array of SIGNAL_BUY, SIGNAL_SELL and 0
+        """
+        pass
+
+    def compute_signals(self, features):
+        """
+        Compute the signals of this strategy without modifying `features`.
+
+        Args:
+            features (pd.DataFrame or dict): Required feature columns
+
+        Returns:
+            np.ndarray: int8 array with one signal per bar
+        """
+        arrays = [
+            np.asarray(features[col]) for col in self.required_features()
+        ]
+        params = [getattr(self, name) for name in self.kernel_params]
+        return self.signal_kernel(*arrays, *params)
+
+    @classmethod
+    def signal_matrix(cls, features, strategies):
+        """
+        Compute the signals of many strategies of this class in one call.
+
+        Args:
+            features (pd.DataFrame): Features containing every required column
+            strategies (list): Instances of this class
+
+        Returns:
+            np.ndarray: int8 array of shape (n_bars, n_strategies)
+        """
+        columns = [s.required_features() for s in strategies]
+        arrays = [
+            np.column_stack([features[cols[i]].to_numpy() for cols in columns])
+            for i in range(len(columns[0]))
+        ]
+        params = [
+            np.array([getattr(s, name) for s in strategies])
+            for name in cls.kernel_params
+        ]
+        return cls.signal_kernel(*arrays, *params)
+
+    def generate_signals(self, df):
+        """
+        Generate buy/sell signals for the given DataFrame.
 
         Args:
             df (pd.DataFrame): DataFrame with price data and indicators
 
         Returns:
-            pd.DataFrame: DataFrame with added signal columns
+            pd.DataFrame: Copy of df with 'buy_signal' and 'sell_signal'
+                columns, or df itself if required features are missing
         """
-        pass
+        # Validate required features are present
+        try:
+            self.validate_features(df)
+        except ValueError as e:
+            logger.error(str(e))
+            return df
+
+        logger.info(f"Generating {self.name} signals")
+        signals = self.compute_signals(df)
+        buy_signal = signals == SIGNAL_BUY
+        sell_signal = signals == SIGNAL_SELL
+
+        logger.info(
+            f"Generated {buy_signal.sum()} buy signals and {sell_signal.sum()} sell signals"
+        )
+        return df.assign(buy_signal=buy_signal, sell_signal=sell_signal)
 
     def __str__(self):
         """Return string representation of the strategy."""
         return f"{self.name} Strategy"
 
 
+@register_strategy("sma_crossover")
 class SMACrossoverStrategy(Strategy):
     """Strategy based on SMA crossovers."""
 
+    default_grid = {
+        "fast_window": [5, 10, 20, 50],
+        "slow_window": [50, 100, 150, 200],
+    }
+
     def __init__(self, fast_window=50, slow_window=200):
         """
         Initialize SMA crossover strategy with window parameters.
@@ -188,57 +432,30 @@ class SMACrossoverStrategy(Strategy):
         """
         return [f"sma_{self.fast_window}", f"sma_{self.slow_window}"]
 
-    def generate_signals(self, df):
-        """
-        Generate SMA crossover buy/sell signals for the given DataFrame.
-
-        Args:
-            df (pd.DataFrame): DataFrame with price data and SMA columns
-
-        Returns:
-            pd.DataFrame: DataFrame with added signal columns
-        """
-        # Validate required features are present
-        try:
-            self.validate_features(df)
-        except ValueError as e:
-            logger.error(str(e))
-            return df
-
-        logger.info(
-            f"Generating SMA crossover signals (fast={self.fast_window}, slow={self.slow_window})"
-        )
-
-        # Get SMA columns
-        sma_fast = df[f"sma_{self.fast_window}"]
-        sma_slow = df[f"sma_{self.slow_window}"]
-
-        # Calculate crossover conditions
-        df["fast_gt_slow"] = sma_fast > sma_slow
+    def indicator_params(self):
+        """Return the FeatureFactory parameters of the required features."""
+        return {"sma": {"windows": [self.fast_window, self.slow_window]}}
 
-        # Generate buy signals (fast crosses above slow)
-        df["buy_signal"] = (sma_fast > sma_slow) & (
-            sma_fast.shift(1) <= sma_slow.shift(1)
+    @staticmethod
+    def signal_kernel(sma_fast, sma_slow):
+        """Buy when the fast SMA crosses above the slow SMA, sell below."""
+        return encode_signals(
+            crosses_above(sma_fast, sma_slow),
+            crosses_below(sma_fast, sma_slow),
         )
 
-        # Generate sell signals (fast crosses below slow)
-        df["sell_signal"] = (sma_fast < sma_slow) & (
-            sma_fast.shift(1) >= sma_slow.shift(1)
-        )
-
-        # Count the number of signals
-        buy_count = df["buy_signal"].sum()
-        sell_count = df["sell_signal"].sum()
-        logger.info(
-            f"Generated {buy_count} buy signals and {sell_count} sell signals"
-        )
-
-        return df
-
 
+@register_strategy("rsi")
 class RSIStrategy(Strategy):
     """Strategy based on RSI overbought/oversold conditions."""
 
+    default_grid = {
+        "rsi_window": [6, 14, 21],
+        "oversold_threshold": [20, 25, 30, 35],
+        "overbought_threshold": [65, 70, 75, 80],
+    }
+    kernel_params = ("oversold_threshold", "overbought_threshold")
+
     def __init__(
         self, rsi_window=14, oversold_threshold=30, overbought_threshold=70
     ):
@@ -282,49 +499,207 @@ class RSIStrategy(Strategy):
         """
         return [f"rsi_{self.rsi_window}"]
 
-    def generate_signals(self, df):
+    def indicator_params(self):
+        """Return the FeatureFactory parameters of the required features."""
+        return {"rsi": {"windows": [self.rsi_window]}}
+
+    @staticmethod
+    def signal_kernel(rsi, oversold_threshold, overbought_threshold):
+        """
+        Buy when the RSI crosses above the oversold threshold, sell when it
+        crosses below the overbought threshold.
+        """
+        return encode_signals(
+            crosses_above(rsi, oversold_threshold),
+            crosses_below(rsi, overbought_threshold),
+        )
+
+
+@register_strategy("bollinger")
+class BollingerBandStrategy(Strategy):
+    """Mean-reversion strategy based on Bollinger Bands."""
+
+    default_grid = {"window": [10, 20, 30], "std_dev": [1.5, 2.0, 2.5]}
+
+    def __init__(self, window=20, std_dev=2.0):
         """
-        Generate RSI-based buy/sell signals for the given DataFrame.
+        Initialize Bollinger Band strategy with parameters.
 
         Args:
-            df (pd.DataFrame): DataFrame with price data and RSI column
+            window (int): Moving average window of the bands
+            std_dev (float): Width of the bands in standard deviations
 
-        Returns:
-            pd.DataFrame: DataFrame with added signal columns
+        Raises:
+            ValueError: If parameters are invalid
         """
-        # Validate required features are present
-        try:
-            self.validate_features(df)
-        except ValueError as e:
-            logger.error(str(e))
-            return df
+        super().__init__(name=f"Bollinger Bands ({window}, {std_dev})")
 
-        logger.info(
-            f"Generating RSI signals (period={self.rsi_window}, "
-            f"oversold={self.oversold_threshold}, overbought={self.overbought_threshold})"
-        )
+        # Validate parameters to ensure logical constraints are met
+        if not isinstance(window, int) or window <= 1:
+            raise ValueError("Bollinger window must be an integer above 1.")
+        if not isinstance(std_dev, (int, float)) or std_dev <= 0:
+            raise ValueError("Bollinger std_dev must be a positive number.")
+
+        self.window = window
+        self.std_dev = float(std_dev)
 
-        # Get RSI column
-        rsi = df[f"rsi_{self.rsi_window}"]
+    def required_features(self):
+        """
+        Return features required by the Bollinger Band strategy.
 
-        # Generate buy signals (RSI crosses above oversold threshold)
-        df["buy_signal"] = (rsi > self.oversold_threshold) & (
-            rsi.shift(1) <= self.oversold_threshold
+        Returns:
+            list: List of required column names
+        """
+        prefix = f"bb_{self.window}_{self.std_dev}"
+        return ["Close", f"{prefix}_lower", f"{prefix}_upper"]
+
+    def indicator_params(self):
+        """Return the FeatureFactory parameters of the required features."""
+        return {
+            "bollinger_bands": {
+                "window": [self.window],
+                "std_devs": [self.std_dev],
+            }
+        }
+
+    @staticmethod
+    def signal_kernel(close, lower_band, upper_band):
+        """
+        Buy when the close crosses back above the lower band, sell when it
+        crosses back below the upper band.
+        """
+        return encode_signals(
+            crosses_above(close, lower_band),
+            crosses_below(close, upper_band),
         )
 
-        # Generate sell signals (RSI crosses below overbought threshold)
-        df["sell_signal"] = (rsi < self.overbought_threshold) & (
-            rsi.shift(1) >= self.overbought_threshold
+
+@register_strategy("macd")
+class MACDStrategy(Strategy):
+    """Strategy based on MACD signal line crossovers."""
+
+    default_grid = {
+        "fast_period": [8, 12],
+        "slow_period": [21, 26],
+        "signal_period": [5, 9],
+    }
+
+    def __init__(self, fast_period=12, slow_period=26, signal_period=9):
+        """
+        Initialize MACD strategy with EMA periods.
+
+        Args:
+            fast_period (int): Fast EMA period of the MACD line
+            slow_period (int): Slow EMA period of the MACD line
+            signal_period (int): EMA period of the signal line
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        super().__init__(
+            name=f"MACD ({fast_period}/{slow_period}/{signal_period})"
         )
 
-        # Count the number of signals
-        buy_count = df["buy_signal"].sum()
-        sell_count = df["sell_signal"].sum()
-        logger.info(
-            f"Generated {buy_count} buy signals and {sell_count} sell signals"
+        # Validate parameters to ensure logical constraints are met
+        periods = (fast_period, slow_period, signal_period)
+        if not all(isinstance(p, int) and p > 0 for p in periods):
+            raise ValueError("MACD periods must be positive integers.")
+        if fast_period >= slow_period:
+            raise ValueError(
+                f"MACD fast period ({fast_period}) must be less than slow period ({slow_period})."
+            )
+
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+
+    def required_features(self):
+        """
+        Return features required by the MACD strategy.
+
+        Returns:
+            list: List of required column names
+        """
+        prefix = (
+            f"macd_{self.fast_period}_{self.slow_period}_{self.signal_period}"
+        )
+        return [f"{prefix}_line", f"{prefix}_signal"]
+
+    def indicator_params(self):
+        """Return the FeatureFactory parameters of the required features."""
+        return {
+            "macd": {
+                "fast": [self.fast_period],
+                "slow": [self.slow_period],
+                "signal": [self.signal_period],
+            }
+        }
+
+    @staticmethod
+    def signal_kernel(macd_line, signal_line):
+        """Buy when the MACD line crosses above its signal line, sell below."""
+        return encode_signals(
+            crosses_above(macd_line, signal_line),
+            crosses_below(macd_line, signal_line),
         )
 
-        return df
+
+@register_strategy("atr_breakout")
+class ATRBreakoutStrategy(Strategy):
+    """Volatility breakout strategy based on the ATR."""
+
+    default_grid = {"window": [10, 20, 50], "multiplier": [1.0, 1.5, 2.0]}
+    kernel_params = ("multiplier",)
+
+    def __init__(self, window=20, multiplier=2.0):
+        """
+        Initialize ATR breakout strategy with parameters.
+
+        Args:
+            window (int): Window of the SMA and the ATR
+            multiplier (float): Distance of the breakout level above the SMA,
+                in ATRs
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        super().__init__(name=f"ATR Breakout ({window}, {multiplier})")
+
+        # Validate parameters to ensure logical constraints are met
+        if not isinstance(window, int) or window <= 0:
+            raise ValueError("ATR window must be a positive integer.")
+        if not isinstance(multiplier, (int, float)) or multiplier <= 0:
+            raise ValueError("ATR multiplier must be a positive number.")
+
+        self.window = window
+        self.multiplier = multiplier
+
+    def required_features(self):
+        """
+        Return features required by the ATR breakout strategy.
+
+        Returns:
+            list: List of required column names
+        """
+        return ["Close", f"sma_{self.window}", f"atr_{self.window}"]
+
+    def indicator_params(self):
+        """Return the FeatureFactory parameters of the required features."""
+        return {
+            "sma": {"windows": [self.window]},
+            "atr": {"windows": [self.window]},
+        }
+
+    @staticmethod
+    def signal_kernel(close, sma, atr, multiplier):
+        """
+        Buy when the close breaks above the SMA plus `multiplier` ATRs, sell
+        when it falls back below the SMA.
+        """
+        return encode_signals(
+            crosses_above(close, sma + multiplier * atr),
+            crosses_below(close, sma),
+        )
 
 
 # Keep the original function for backward compatibility
@@ -353,283 +728,1145 @@ def add_sma_crossover_signals(df, fast_window=50, slow_window=200):
     return strategy.generate_signals(df)
 
 
-@st.cache_data
-def run_backtest(
-    df,
-    initial_capital=100000.0,
-    commission_fixed=20.0,
-    commission_pct=0.0003,
-    slippage_pct=0.001,
-    position_size_pct=0.25,
-):
+def _trade_statistics(net_profit_loss):
     """
-    Run a backtest simulation using the provided signals.
+    Calculate win rate and profit metrics from completed trades.
 
     Args:
-        df (pd.DataFrame): DataFrame with OHLCV data and buy/sell signals
-        initial_capital (float): Initial capital for the backtest
-        commission_fixed (float): Fixed commission per trade (e.g., 20 rupees)
-        commission_pct (float): Percentage commission per trade (e.g., 0.03% = 0.0003)
-        slippage_pct (float): Slippage as percentage of price (e.g., 0.1% = 0.001)
-        position_size_pct (float): Percentage of available capital to use per trade (0-1)
+        net_profit_loss (np.ndarray): Net profit/loss of each completed trade
 
     Returns:
-        dict: Dictionary containing backtest results and metrics
+        tuple: (win_rate, avg_profit, avg_loss, profit_factor)
     """
-    if df is None or df.empty:
-        logger.error("Input DataFrame is None or empty. Cannot run backtest.")
-        return None
+    closed_trade_count = len(net_profit_loss)
+    if closed_trade_count == 0:
+        return 0.0, 0.0, 0.0, 0.0
+
+    winning = net_profit_loss > 0
+    profits = net_profit_loss[winning]
+    losses = net_profit_loss[~winning]
+
+    win_rate = (len(profits) / closed_trade_count) * 100
+    avg_profit = profits.mean() if len(profits) else 0
+    avg_loss = losses.mean() if len(losses) else 0
+
+    gross_profit = profits.sum()
+    gross_loss = abs(losses.sum())
+    profit_factor = (
+        (gross_profit / gross_loss)
+        if gross_loss > 0
+        else (1.0 if gross_profit > 0 else 0.0)
+    )
+    return win_rate, avg_profit, avg_loss, profit_factor
 
-    # Validate input DataFrame
-    required_columns = ["Close", "buy_signal", "sell_signal"]
-    missing_columns = [
-        col for col in required_columns if col not in df.columns
-    ]
-    if missing_columns:
-        logger.error(
-            f"Missing required columns in input DataFrame: {missing_columns}"
-        )
-        return None
 
-    # Check for NaN values in critical columns
-    if df[required_columns].isna().any().any():
-        logger.error(
-            "Input DataFrame contains NaN values in critical columns. Please handle NaN values before backtesting."
-        )
-        return None
+def _max_drawdown_pct(portfolio_values):
+    """
+    Calculate the maximum drawdown of an equity curve.
 
-    # Validate input parameters
-    if initial_capital < 0:
-        raise ValueError("initial_capital cannot be negative")
-    if commission_fixed < 0:
-        raise ValueError("commission_fixed cannot be negative")
-    if commission_pct < 0:
-        raise ValueError("commission_pct cannot be negative")
-    if slippage_pct < 0:
-        raise ValueError("slippage_pct cannot be negative")
-    if position_size_pct < 0 or position_size_pct > 1:
-        raise ValueError("position_size_pct must be between 0 and 1")
+    Args:
+        portfolio_values (list or np.ndarray): Portfolio value for each bar
 
-    logger.info(
-        f"Running backtest with initial capital: ${initial_capital:,.2f}, "
-        f"Commission: ${commission_fixed} + {commission_pct*100}%, "
-        f"Slippage: {slippage_pct*100}%, "
-        f"Position Size: {position_size_pct*100}%"
+    Returns:
+        float: Maximum drawdown as a (negative) percentage
+    """
+    drawdown = drawdown_pct(portfolio_values)
+    if np.isnan(drawdown).all():
+        return np.nan
+    return np.nanmin(drawdown)
+
+
+def _mark_to_market(cash, position, close_prices):
+    """
+    Value the portfolio over a run of bars where cash and position are fixed.
+
+    The arithmetic is carried out in the dtype the scalar expression
+    ``cash + position * close_price`` would use, so the values match the
+    reference engine bit for bit (including float32 price data).
+
+    Args:
+        cash: Cash held over the run of bars
+        position: Number of shares held over the run of bars
+        close_prices (np.ndarray): Close prices for the run of bars
+
+    Returns:
+        np.ndarray: Portfolio value for each bar
+    """
+    dtype = np.result_type(cash, position, 0.0)
+    return cash + position * close_prices.astype(dtype, copy=False)
+
+
+def _grow(column, capacity):
+    """Return `column` copied into a larger array, at least doubling it."""
+    grown = np.empty(max(capacity, 2 * len(column)), dtype=column.dtype)
+    grown[: len(column)] = column
+    return grown
+
+
+class _TradeLedger:
+    """
+    Column-oriented record of the buys and completed trades of a backtest.
+
+    Buys and completed trades (closed lot segments) are written into
+    preallocated NumPy columns and open lots are kept as a FIFO deque of
+    buy numbers, so recording a trade allocates no per-trade objects.
+    Metrics are reductions over the columns; the list-of-dicts views used
+    by reports are only built at the end by trades() and completed_trades().
+    """
+
+    _BUY_COLUMNS = (
+        "buy_bar",
+        "buy_price",
+        "buy_shares",
+        "buy_commission",
+        "buy_slippage_cost",
+        "buy_position",
+        "lot_shares",
+    )
+    _EXIT_COLUMNS = (
+        "exit_lot",
+        "exit_bar",
+        "exit_price",
+        "exit_shares",
+        "exit_sale_value",
+        "exit_commission",
+        "exit_slippage",
+        "exit_net_profit_loss",
     )
 
-    # Initialize portfolio state with simplified position tracking
-    cash = initial_capital
-    position = 0  # Current number of shares held
-    open_positions = (
-        []
-    )  # List of dictionaries: [{'date': buy_date, 'actual_price': buy_price, 'shares': shares, 'commission': commission}]
-    portfolio_values = []
-    completed_trades = []
-    trades = []  # List to track all buy/sell transactions
-    total_commission = 0
-    total_slippage_cost = 0
-    gross_profit = 0  # Track total profit from winning trades
-    gross_loss = 0  # Track total loss from losing trades
-    win_count = 0  # Track number of winning trades
-    loss_count = 0  # Track number of losing trades
+    __slots__ = (
+        "buy_bar",
+        "buy_price",
+        "buy_shares",
+        "buy_commission",
+        "buy_slippage_cost",
+        "buy_position",
+        "n_buys",
+        "lot_shares",
+        "open_lots",
+        "exit_lot",
+        "exit_bar",
+        "exit_price",
+        "exit_shares",
+        "exit_sale_value",
+        "exit_commission",
+        "exit_slippage",
+        "exit_net_profit_loss",
+        "n_exits",
+    )
 
-    # Pre-calculate prices adjusted for slippage
-    actual_buy_prices = df["Close"] * (1 + slippage_pct)
-    actual_sell_prices = df["Close"] * (1 - slippage_pct)
+    def __init__(self, max_buys, max_sells):
+        """
+        Allocate the columns.
 
-    # Get the initial close price for Buy & Hold calculation
-    initial_price = df["Close"].iloc[0]
+        Every completed trade either closes a lot or is the last segment of
+        a sell, so there are at most max_buys + max_sells of them.
 
-    # Iterate through each day
-    for index, row in df.iterrows():
-        close_price = row["Close"]
+        Args:
+            max_buys (int): Maximum number of buys (e.g. buy signals)
+            max_sells (int): Maximum number of sells (e.g. sell signals)
+        """
+        max_exits = max_buys + max_sells
+        self.buy_bar = np.empty(max_buys, dtype=np.int64)
+        self.buy_price = np.empty(max_buys)
+        self.buy_shares = np.empty(max_buys)
+        self.buy_commission = np.empty(max_buys)
+        self.buy_slippage_cost = np.empty(max_buys)
+        self.buy_position = np.empty(max_buys)
+        self.n_buys = 0
+        self.lot_shares = np.empty(max_buys)
+        self.open_lots = deque()
+        self.exit_lot = np.empty(max_exits, dtype=np.int64)
+        self.exit_bar = np.empty(max_exits, dtype=np.int64)
+        self.exit_price = np.empty(max_exits)
+        self.exit_shares = np.empty(max_exits)
+        self.exit_sale_value = np.empty(max_exits)
+        self.exit_commission = np.empty(max_exits)
+        self.exit_slippage = np.empty(max_exits)
+        self.exit_net_profit_loss = np.empty(max_exits)
+        self.n_exits = 0
+
+    def reserve(self, more_buys, more_sells):
+        """
+        Grow the columns to fit more buys and sells than allocated so far.
 
-        # Check for buy signal when we have cash
-        if row["buy_signal"] and cash > 0:
-            # Calculate the amount to invest based on position sizing
-            cash_to_invest = min(cash, initial_capital * position_size_pct)
+        Args:
+            more_buys (int): Maximum number of further buys
+            more_sells (int): Maximum number of further sells
+        """
+        buy_capacity = self.n_buys + more_buys
+        if buy_capacity > len(self.buy_bar):
+            for name in self._BUY_COLUMNS:
+                setattr(self, name, _grow(getattr(self, name), buy_capacity))
+        # Lots still open can be closed by the further sells as well
+        exit_capacity = (
+            self.n_exits + len(self.open_lots) + more_buys + more_sells
+        )
+        if exit_capacity > len(self.exit_bar):
+            for name in self._EXIT_COLUMNS:
+                setattr(self, name, _grow(getattr(self, name), exit_capacity))
+
+    @classmethod
+    def from_round_trips(
+        cls,
+        entry_bar,
+        entry_price,
+        shares,
+        entry_commission,
+        entry_slippage,
+        exit_bar,
+        exit_price,
+        exit_commission,
+        cash_received,
+        exit_slippage,
+    ):
+        """
+        Build the ledger of round trips that each buy and sell a whole lot.
+
+        Entry columns have one value per buy and exit columns one value per
+        sell; sell k closes buy k, and a last buy without a sell stays open.
+        The columns are filled in bulk with the values ``buy`` and ``sell``
+        would record for the same trades.
+
+        Returns:
+            _TradeLedger: The filled ledger
+        """
+        n_buys, n_exits = len(entry_bar), len(exit_bar)
+        ledger = cls(n_buys, n_exits)
+        ledger.buy_bar[:n_buys] = entry_bar
+        ledger.buy_price[:n_buys] = entry_price
+        ledger.buy_shares[:n_buys] = shares
+        ledger.buy_commission[:n_buys] = entry_commission
+        ledger.buy_slippage_cost[:n_buys] = entry_slippage
+        # Every buy is made with no shares held
+        ledger.buy_position[:n_buys] = shares
+        ledger.lot_shares[:n_buys] = shares
+        ledger.lot_shares[:n_exits] = 0
+        ledger.open_lots = deque(range(n_exits, n_buys))
+        ledger.n_buys = n_buys
+
+        closed = shares[:n_exits]
+        ledger.exit_lot[:n_exits] = np.arange(n_exits)
+        ledger.exit_bar[:n_exits] = exit_bar
+        ledger.exit_price[:n_exits] = exit_price
+        ledger.exit_shares[:n_exits] = closed
+        ledger.exit_sale_value[:n_exits] = cash_received
+        ledger.exit_commission[:n_exits] = exit_commission
+        ledger.exit_slippage[:n_exits] = exit_slippage
+        ledger.exit_net_profit_loss[:n_exits] = (
+            exit_price - entry_price[:n_exits]
+        ) * closed - (
+            entry_commission[:n_exits] / closed + exit_commission / closed
+        ) * closed
+        ledger.n_exits = n_exits
+        return ledger
+
+    def buy(self, bar, price, shares, commission, slippage_cost, position):
+        """Record a buy on bar number `bar` as a new open lot."""
+        k = self.n_buys
+        self.buy_bar[k] = bar
+        self.buy_price[k] = price
+        self.buy_shares[k] = shares
+        self.buy_commission[k] = commission
+        self.buy_slippage_cost[k] = slippage_cost
+        self.buy_position[k] = position
+        self.lot_shares[k] = shares
+        self.open_lots.append(k)
+        self.n_buys = k + 1
+
+    def sell(
+        self, bar, price, shares_to_sell, commission, cash_received, slippage
+    ):
+        """
+        Record a sell, closing open lots first in, first out.
 
-            # Apply slippage to buy price
-            actual_buy_price = actual_buy_prices.loc[
-                index
-            ]  # Use pre-calculated price
+        Each lot (or part of a lot) sold becomes a completed trade whose net
+        profit/loss includes its share of the buy and sell commissions.
+        """
+        open_lots = self.open_lots
+        sell_commission_per_share = (
+            commission / shares_to_sell if shares_to_sell > 0 else 0
+        )
+        shares_sold_from_lots = 0
+        while shares_sold_from_lots < shares_to_sell and open_lots:
+            lot = open_lots[0]
+            lot_shares = self.lot_shares[lot]
+            shares_from_this_lot = min(
+                shares_to_sell - shares_sold_from_lots, lot_shares
+            )
+            entry_price = self.buy_price[lot]
+
+            gross_profit_loss = (price - entry_price) * shares_from_this_lot
+            buy_commission_per_share = (
+                self.buy_commission[lot] / lot_shares if lot_shares > 0 else 0
+            )
+            costs_for_segment = (
+                buy_commission_per_share + sell_commission_per_share
+            ) * shares_from_this_lot
+
+            k = self.n_exits
+            self.exit_lot[k] = lot
+            self.exit_bar[k] = bar
+            self.exit_price[k] = price
+            self.exit_shares[k] = shares_from_this_lot
+            self.exit_sale_value[k] = cash_received
+            self.exit_commission[k] = commission
+            self.exit_slippage[k] = slippage
+            self.exit_net_profit_loss[k] = (
+                gross_profit_loss - costs_for_segment
+            )
+            self.n_exits = k + 1
+
+            lot_shares -= shares_from_this_lot
+            self.lot_shares[lot] = lot_shares
+            if lot_shares <= 0:
+                open_lots.popleft()
+
+            shares_sold_from_lots += shares_from_this_lot
+
+    @property
+    def net_profit_loss(self):
+        """Net profit/loss of each completed trade."""
+        return self.exit_net_profit_loss[: self.n_exits]
+
+    def held(self, n_bars):
+        """
+        Return which bars end with an open position.
+
+        Every sell closes the whole position, so a position is open from a
+        buy until the next bar with a sell.
+
+        Args:
+            n_bars (int): Number of bars of the backtest
 
-            # Calculate commission and shares to buy
+        Returns:
+            np.ndarray: Boolean array with one value per bar
+        """
+        bought = np.zeros(n_bars, dtype=bool)
+        sold = np.zeros(n_bars, dtype=bool)
+        bought[self.buy_bar[: self.n_buys]] = True
+        sold[self.exit_bar[: self.n_exits]] = True
+        return target_positions(bought, sold).astype(bool)
+
+    def trades(self, dates):
+        """
+        Return the buys as a list of dictionaries.
+
+        Args:
+            dates (pd.Index): Timestamps of the bars
+
+        Returns:
+            list: One dictionary per buy with its date, price, shares,
+                commission, slippage cost and the position after it
+        """
+        n = self.n_buys
+        columns = zip(
+            dates[self.buy_bar[:n]],
+            self.buy_price[:n].tolist(),
+            self.buy_shares[:n].tolist(),
+            self.buy_commission[:n].tolist(),
+            self.buy_slippage_cost[:n].tolist(),
+            self.buy_position[:n].tolist(),
+        )
+        return [
+            {
+                "date": date,
+                "type": "buy",
+                "actual_price": price,
+                "shares": shares,
+                "commission": commission,
+                "slippage_cost": slippage_cost,
+                "remaining_position": position,
+            }
+            for date, price, shares, commission, slippage_cost, position in (
+                columns
+            )
+        ]
+
+    def completed_trades(self, dates):
+        """
+        Return the completed trades as a list of dictionaries.
+
+        Args:
+            dates (pd.Index): Timestamps of the bars
+
+        Returns:
+            list: One dictionary per closed lot segment with its entry and
+                exit, costs, net profit/loss and return
+        """
+        n = self.n_exits
+        lots = self.exit_lot[:n]
+        entry_dates = dates[self.buy_bar[lots]]
+        exit_dates = dates[self.exit_bar[:n]]
+        entry_price = self.buy_price[lots]
+        shares = self.exit_shares[:n]
+        cost_basis = entry_price * shares
+        net_profit_loss = self.net_profit_loss
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return_pct = np.where(
+                cost_basis > 0, (net_profit_loss / cost_basis) * 100, 0.0
+            )
+
+        columns = {
+            "entry_date": entry_dates,
+            "exit_date": exit_dates,
+            "entry_price": entry_price.tolist(),
+            "exit_price": self.exit_price[:n].tolist(),
+            "shares": shares.tolist(),
+            "cost_basis": cost_basis.tolist(),
+            "sale_value": self.exit_sale_value[:n].tolist(),
+            "holding_period_days": (exit_dates - entry_dates).days.tolist(),
+            "commission": self.exit_commission[:n].tolist(),
+            "slippage": self.exit_slippage[:n].tolist(),
+            "net_profit_loss": net_profit_loss.tolist(),
+            "return_pct": return_pct.tolist(),
+        }
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+def _simulate_arrays(
+    close,
+    buy_signal,
+    sell_signal,
+    dates,
+    initial_capital,
+    commission_fixed,
+    commission_pct,
+    slippage_pct,
+    position_size_pct,
+    state=None,
+    bar_offset=0,
+):
+    """
+    Array-based execution engine.
+
+    Only bars carrying a signal are visited in Python; the portfolio value of
+    every bar in between is filled in with a single vectorized expression,
+    since cash and position cannot change there.
+
+    The trade bookkeeping mirrors the reference loop in ``run_backtest``
+    exactly, so both engines return identical trades, completed trades and
+    portfolio values.
+
+    Args:
+        close (np.ndarray): Close prices
+        buy_signal (np.ndarray): Boolean buy signals
+        sell_signal (np.ndarray): Boolean sell signals
+        dates (pd.Index): Timestamps of the bars
+        initial_capital, commission_fixed, commission_pct, slippage_pct,
+        position_size_pct: See ``run_backtest``
+        state (tuple): (cash, position, ledger, total_commission,
+            total_slippage_cost) at the end of a previous run over the bars
+            just before these ones, to continue from. None starts with the
+            initial capital and no trades.
+        bar_offset (int): Number of bars before these ones, so the ledger
+            numbers bars across runs
+
+    Returns:
+        tuple: (cash, position, ledger, portfolio_values, total_commission,
+            total_slippage_cost) where ledger is the _TradeLedger of the run
+    """
+    n_bars = len(close)
+
+    # Pre-calculate prices adjusted for slippage
+    actual_buy_prices = close * (1 + slippage_pct)
+    actual_sell_prices = close * (1 - slippage_pct)
+
+    if state is None:
+        cash = initial_capital
+        position = 0
+        ledger = _TradeLedger(
+            np.count_nonzero(buy_signal), np.count_nonzero(sell_signal)
+        )
+        total_commission = 0
+        total_slippage_cost = 0
+    else:
+        cash, position, ledger, total_commission, total_slippage_cost = state
+        ledger.reserve(
+            np.count_nonzero(buy_signal), np.count_nonzero(sell_signal)
+        )
+
+    values = np.empty(n_bars, dtype=np.float64)
+    # Bars on which a trade was skipped do not record a portfolio value
+    recorded = np.ones(n_bars, dtype=bool)
+    segment_start = 0
+
+    for i in np.flatnonzero(buy_signal | sell_signal):
+        # Cash and position were constant since the last signal bar
+        values[segment_start:i] = _mark_to_market(
+            cash, position, close[segment_start:i]
+        )
+        segment_start = i
+
+        close_price = float(close[i])
+
+        if buy_signal[i] and cash > 0:
+            cash_to_invest = min(cash, initial_capital * position_size_pct)
+            actual_buy_price = actual_buy_prices[i]
             shares_to_buy = max(
                 0,
                 (cash_to_invest - commission_fixed)
                 / (actual_buy_price * (1 + commission_pct)),
             )
 
-            # Ensure shares_to_buy is an integer if trading whole shares, or handle fractional shares
-            # For simplicity, let's assume fractional shares are allowed for now.
-
-            # Ensure we have enough for at least one share
             if shares_to_buy <= 0:
                 logger.warning(
-                    f"Not enough cash to invest after commission at {index}. Skipping trade."
+                    f"Not enough cash to invest after commission at {dates[i]}. Skipping trade."
                 )
             else:
-                # Calculate the actual commission
                 commission = commission_fixed + (
                     shares_to_buy * actual_buy_price * commission_pct
                 )
-
-                # Calculate total cost (price + commission)
                 total_cost = shares_to_buy * actual_buy_price + commission
-
-                # Calculate slippage cost for reporting (difference between actual price and close price)
                 slippage_cost = shares_to_buy * close_price * slippage_pct
 
-                # Ensure the total cost doesn't exceed available cash
                 if total_cost > cash:
-                    # This case should ideally be handled by the shares_to_buy calculation above,
-                    # but as a safeguard, log and skip if it somehow happens.
                     logger.error(
-                        f"Calculated total cost ${total_cost:.2f} exceeds available cash ${cash:.2f} at {index}. Skipping trade."
+                        f"Calculated total cost ${total_cost:.2f} exceeds available cash ${cash:.2f} at {dates[i]}. Skipping trade."
                     )
-                    continue  # Skip this trade
+                    recorded[i] = False
+                    continue
 
-                # Update portfolio
                 position += shares_to_buy
                 cash -= total_cost
                 total_commission += commission
                 total_slippage_cost += slippage_cost
 
-                # Record the buy as an open position (lot)
-                open_positions.append(
-                    {
-                        "date": index,
-                        "actual_price": actual_buy_price,
-                        "shares": shares_to_buy,
-                        "commission": commission,
-                    }
-                )
-                trades.append(
-                    {
-                        "date": index,
-                        "type": "buy",
-                        "actual_price": actual_buy_price,
-                        "shares": shares_to_buy,
-                        "commission": commission,
-                        "slippage_cost": slippage_cost,
-                        "remaining_position": position,
-                    }
+                ledger.buy(
+                    bar_offset + i,
+                    actual_buy_price,
+                    shares_to_buy,
+                    commission,
+                    slippage_cost,
+                    position,
                 )
-                logger.debug(
-                    f"BUY: {index}, {shares_to_buy:.2f} shares at ${actual_buy_price:.2f} "
-                    f"(commission: ${commission:.2f}, slippage cost: ${slippage_cost:.2f})"
-                )
-
-        # Check for sell signal when we have a position
-        elif row["sell_signal"] and position > 0:
-            # Apply slippage to sell price (selling at lower price)
-            actual_sell_price = actual_sell_prices.loc[
-                index
-            ]  # Use pre-calculated price
 
-            shares_to_sell = position  # Sell the entire current position
+        elif sell_signal[i] and position > 0:
+            actual_sell_price = actual_sell_prices[i]
+            shares_to_sell = position
 
-            # Calculate total commission for this sell transaction
-            # Commission is based on the value of shares being sold at the actual sell price
             sell_value_gross = shares_to_sell * actual_sell_price
             commission = commission_fixed + (sell_value_gross * commission_pct)
-
-            # Calculate slippage cost for reporting
             slippage_cost = shares_to_sell * close_price * slippage_pct
 
-            # Ensure cash received is not negative after commission
             cash_received = sell_value_gross - commission
             if cash_received < 0:
                 logger.error(
-                    f"Commission ${commission:.2f} exceeds gross sell value ${sell_value_gross:.2f} at {index}. Cannot complete sell trade."
+                    f"Commission ${commission:.2f} exceeds gross sell value ${sell_value_gross:.2f} at {dates[i]}. Cannot complete sell trade."
                 )
-                # Decide how to handle: skip sell, or sell for 0 cash? Skipping for now.
+                recorded[i] = False
                 continue
 
-            # Process open positions (FIFO) to calculate P&L for completed lots
-            shares_sold_from_lots = 0
-            while shares_sold_from_lots < shares_to_sell and open_positions:
-                buy_lot = open_positions[0]  # Get the oldest buy lot
-                shares_from_this_lot = min(
-                    shares_to_sell - shares_sold_from_lots, buy_lot["shares"]
-                )
+            # Close open lots (FIFO) to calculate P&L for completed trades
+            ledger.sell(
+                bar_offset + i,
+                actual_sell_price,
+                shares_to_sell,
+                commission,
+                cash_received,
+                slippage_cost,
+            )
 
-                # Calculate P&L for this segment
-                # Gross P/L based on entry/exit prices
-                gross_profit_loss = (
-                    actual_sell_price - buy_lot["actual_price"]
-                ) * shares_from_this_lot
-
-                # Calculate costs associated with this segment (pro-rated buy commission + pro-rated sell commission)
-                buy_commission_per_share = (
-                    buy_lot["commission"] / buy_lot["shares"]
-                    if buy_lot["shares"] > 0
-                    else 0
-                )
-                sell_commission_per_share = (
-                    commission / shares_to_sell if shares_to_sell > 0 else 0
-                )
-                costs_for_segment = (
-                    buy_commission_per_share + sell_commission_per_share
-                ) * shares_from_this_lot
+            cash += cash_received
+            total_commission += commission
+            total_slippage_cost += slippage_cost
+            position = 0
+
+    values[segment_start:] = _mark_to_market(
+        cash, position, close[segment_start:]
+    )
+    portfolio_values = values[recorded].tolist()
+
+    return (
+        cash,
+        position,
+        ledger,
+        portfolio_values,
+        total_commission,
+        total_slippage_cost,
+    )
+
+
+def target_positions(buy_signal, sell_signal):
+    """
+    Turn buy/sell signals into a long/flat target position for every bar.
+
+    The position is 1 from a buy signal up to the next sell signal and 0
+    before the first buy and after each sell. As in run_backtest, a bar with
+    both signals counts as a buy.
+
+    Args:
+        buy_signal (np.ndarray): Boolean buy signals
+        sell_signal (np.ndarray): Boolean sell signals
+
+    Returns:
+        np.ndarray: int8 array of 1 (long) and 0 (flat)
+    """
+    buy_signal = np.asarray(buy_signal, dtype=bool)
+    events = buy_signal | np.asarray(sell_signal, dtype=bool)
+    # Bar number of the last signal up to each bar, -1 before the first
+    last_event = np.maximum.accumulate(
+        np.where(events, np.arange(len(events)), -1)
+    )
+    positions = np.zeros(len(events), dtype=np.int8)
+    seen = last_event >= 0
+    positions[seen] = buy_signal[last_event[seen]]
+    return positions
+
+
+def _simulate_positions(
+    close,
+    buy_signal,
+    sell_signal,
+    dates,
+    initial_capital,
+    commission_fixed,
+    commission_pct,
+    slippage_pct,
+    position_size_pct,
+):
+    """
+    Target-position execution engine.
+
+    The signals are turned into a long/flat position vector (see
+    target_positions); every change of position is a trade. Each entry buys
+    shares worth initial_capital * position_size_pct including costs, or
+    the remaining cash when that is less, and each exit sells them all, with
+    the commission and slippage of the exact engines. Cash, holdings,
+    portfolio values and the ledger are computed with array operations over
+    the entries and exits, without visiting any bar in Python. Only when the
+    cash falls below the stake are the shares worked out one round trip
+    after the other (see ``_shares_from_cash``).
+
+    The results equal those of the exact engines up to floating-point
+    rounding (1e-9 relative for float64 prices, 1e-5 for float32) as long
+    as every buy signal arrives while flat. The exact engines add to an
+    open position on further buy signals; this engine ignores them and logs
+    how many it ignored.
+
+    Args:
+        close (np.ndarray): Close prices
+        buy_signal (np.ndarray): Boolean buy signals
+        sell_signal (np.ndarray): Boolean sell signals
+        dates (pd.Index): Timestamps of the bars
+        initial_capital, commission_fixed, commission_pct, slippage_pct,
+        position_size_pct: See ``run_backtest``
+
+    Returns:
+        tuple: (cash, position, ledger, portfolio_values, total_commission,
+            total_slippage_cost) as returned by ``_simulate_arrays``
+    """
+    n_bars = len(close)
+    # No shares can be bought at a non-positive price; the exact engines
+    # skip those buys as well
+    positions = target_positions(buy_signal & (close > 0), sell_signal)
+    previous = np.concatenate(([0], positions[:-1]))
+
+    ignored_buys = np.count_nonzero(buy_signal & (previous == 1))
+    if ignored_buys:
+        logger.info(
+            f"Ignored {ignored_buys} buy signals while already long; the exact engines would add to the position"
+        )
+
+    entries = np.flatnonzero(positions > previous)
+    exits = np.flatnonzero(positions < previous)
+    entry_price = close[entries] * (1 + slippage_pct)
+    exit_price = close[exits] * (1 - slippage_pct)
+
+    # Shares of each entry while the cash covers the stake
+    stake = initial_capital * position_size_pct
+    shares = np.maximum(
+        (stake - commission_fixed) / (entry_price * (1 + commission_pct)), 0
+    )
+    # Cash before each entry: every round trip pays the stake and returns
+    # the proceeds of its sale
+    proceeds = shares[: len(exits)] * exit_price * (1 - commission_pct)
+    cash_at_entry = (
+        initial_capital
+        + np.concatenate(
+            ([0], np.cumsum(proceeds - commission_fixed - stake))
+        )[: len(entries)]
+    )
+    # Like the exact engines, no portfolio value is recorded on bars where
+    # the cost of a buy rounds above the cash
+    unrecorded = np.zeros(len(entries), dtype=bool)
+    if (shares > 0).any() and (cash_at_entry < stake).any():
+        shares, unrecorded = _shares_from_cash(
+            initial_capital,
+            stake,
+            entry_price,
+            exit_price,
+            commission_fixed,
+            commission_pct,
+        )
+
+    unrecorded_bars = entries[unrecorded]
+    skipped = shares <= 0
+    if skipped.any():
+        logger.warning(
+            f"Not enough cash to invest after commission at {np.count_nonzero(skipped)} entries. Skipping those trades."
+        )
+        trade = np.cumsum(positions > previous) - 1
+        positions[(positions == 1) & skipped[trade]] = 0
+        previous = np.concatenate(([0], positions[:-1]))
+        kept = ~skipped
+        entries, entry_price, shares = (
+            entries[kept],
+            entry_price[kept],
+            shares[kept],
+        )
+        exits, exit_price = (
+            exits[kept[: len(exits)]],
+            exit_price[kept[: len(exits)]],
+        )
+
+    # Buys
+    entry_commission = commission_fixed + (
+        shares * entry_price * commission_pct
+    )
+    entry_cost = shares * entry_price + entry_commission
+    entry_slippage = shares * close[entries] * slippage_pct
+
+    # Sells: every exit sells the shares of the entry before it
+    closed = shares[: len(exits)]
+    sale_value_gross = closed * exit_price
+    exit_commission = commission_fixed + (sale_value_gross * commission_pct)
+    cash_received = sale_value_gross - exit_commission
+    exit_slippage = closed * close[exits] * slippage_pct
+    if (cash_received < 0).any():
+        logger.warning(
+            f"Commission exceeds the gross sell value on {np.count_nonzero(cash_received < 0)} exits; the exact engines would keep those positions open"
+        )
+
+    # Cash after each bar, summed in bar order from the initial capital
+    flows = np.zeros(n_bars + 1)
+    flows[0] = initial_capital
+    flows[entries + 1] = -entry_cost
+    flows[exits + 1] = cash_received
+    cash_path = np.cumsum(flows)[1:]
+
+    held = np.zeros(n_bars)
+    long = positions == 1
+    held[long] = shares[np.cumsum(positions > previous)[long] - 1]
+    recorded = np.ones(n_bars, dtype=bool)
+    recorded[unrecorded_bars] = False
+    portfolio_values = (cash_path + held * close)[recorded].tolist()
+
+    ledger = _TradeLedger.from_round_trips(
+        entries,
+        entry_price,
+        shares,
+        entry_commission,
+        entry_slippage,
+        exits,
+        exit_price,
+        exit_commission,
+        cash_received,
+        exit_slippage,
+    )
+    # Costs summed in the order the trades happened, as the exact engines do
+    order = np.argsort(np.concatenate((entries, exits)), kind="stable")
+    total_commission = _sum_in_order(
+        np.concatenate((entry_commission, exit_commission))[order]
+    )
+    total_slippage_cost = _sum_in_order(
+        np.concatenate((entry_slippage, exit_slippage))[order]
+    )
+
+    return (
+        cash_path[-1],
+        held[-1],
+        ledger,
+        portfolio_values,
+        total_commission,
+        total_slippage_cost,
+    )
+
+
+def _shares_from_cash(
+    initial_capital,
+    stake,
+    entry_price,
+    exit_price,
+    commission_fixed,
+    commission_pct,
+):
+    """
+    Shares bought at each entry when the cash can fall below the stake.
+
+    Each entry invests the smaller of the cash and the stake, so its shares
+    depend on every round trip before it. Entries the exact engines would
+    skip, for lack of cash or because the cost rounds above it, get 0
+    shares. The loop runs once per round trip, not once per bar.
+
+    Returns:
+        tuple: (shares bought at each entry, boolean array of the entries
+            skipped because their cost rounded above the cash)
+    """
+    shares = np.zeros(len(entry_price))
+    over_cash = np.zeros(len(entry_price), dtype=bool)
+    cash = initial_capital
+    for k, price in enumerate(entry_price):
+        if cash <= 0:
+            break
+        bought = (min(cash, stake) - commission_fixed) / (
+            price * (1 + commission_pct)
+        )
+        cost = bought * price + (
+            commission_fixed + (bought * price * commission_pct)
+        )
+        if bought <= 0:
+            continue
+        if cost > cash:
+            over_cash[k] = True
+            continue
+        shares[k] = bought
+        cash -= cost
+        if k < len(exit_price):
+            sale_value_gross = bought * exit_price[k]
+            cash += sale_value_gross - (
+                commission_fixed + (sale_value_gross * commission_pct)
+            )
+    return shares, over_cash
+
+
+def _sum_in_order(values):
+    """Sum `values` one after the other, starting from 0."""
+    return np.cumsum(values)[-1] if len(values) else 0
+
+
+def _validate_backtest_params(
+    initial_capital,
+    commission_fixed,
+    commission_pct,
+    slippage_pct,
+    position_size_pct,
+):
+    """
+    Validate the capital, cost and position sizing parameters of a backtest.
+
+    Raises:
+        ValueError: If a parameter is out of range
+    """
+    if initial_capital < 0:
+        raise ValueError("initial_capital cannot be negative")
+    if commission_fixed < 0:
+        raise ValueError("commission_fixed cannot be negative")
+    if commission_pct < 0:
+        raise ValueError("commission_pct cannot be negative")
+    if slippage_pct < 0:
+        raise ValueError("slippage_pct cannot be negative")
+    if position_size_pct < 0 or position_size_pct > 1:
+        raise ValueError("position_size_pct must be between 0 and 1")
+
+
+def run_backtest(
+    df,
+    initial_capital=100000.0,
+    commission_fixed=20.0,
+    commission_pct=0.0003,
+    slippage_pct=0.001,
+    position_size_pct=0.25,
+    engine="loop",
+    use_cache=True,
+):
+    """
+    Run a backtest simulation using the provided signals.
+
+    Args:
+        df (pd.DataFrame): DataFrame with OHLCV data and buy/sell signals
+        initial_capital (float): Initial capital for the backtest
+        commission_fixed (float): Fixed commission per trade (e.g., 20 rupees)
+        commission_pct (float): Percentage commission per trade (e.g., 0.03% = 0.0003)
+        slippage_pct (float): Slippage as percentage of price (e.g., 0.1% = 0.001)
+        position_size_pct (float): Percentage of available capital to use per trade (0-1)
+        engine (str): Execution engine, one of BACKTEST_ENGINES.
+            'loop' walks the DataFrame row by row (reference implementation),
+            'array' runs on NumPy arrays and only visits bars with a signal.
+            Both engines return identical results. 'vectorized' trades a
+            long/flat target position with array operations only, for fast
+            screening; see ``_simulate_positions`` for when its results
+            differ from the exact engines.
+        use_cache (bool): Whether to serve and store the result in the
+            result cache (see src.result_cache), keyed on the prices,
+            signals, dates and parameters
+
+    Returns:
+        dict: Dictionary containing backtest results and metrics
+    """
+    if df is None or df.empty:
+        logger.error("Input DataFrame is None or empty. Cannot run backtest.")
+        return None
+
+    # Validate input DataFrame
+    required_columns = ["Close", "buy_signal", "sell_signal"]
+    missing_columns = [
+        col for col in required_columns if col not in df.columns
+    ]
+    if missing_columns:
+        logger.error(
+            f"Missing required columns in input DataFrame: {missing_columns}"
+        )
+        return None
+
+    # Check for NaN values in critical columns
+    if df[required_columns].isna().any().any():
+        logger.error(
+            "Input DataFrame contains NaN values in critical columns. Please handle NaN values before backtesting."
+        )
+        return None
 
-                net_profit_loss = gross_profit_loss - costs_for_segment
+    # Validate input parameters
+    _validate_backtest_params(
+        initial_capital,
+        commission_fixed,
+        commission_pct,
+        slippage_pct,
+        position_size_pct,
+    )
+    if engine not in BACKTEST_ENGINES:
+        raise ValueError(
+            f"Unknown backtest engine: {engine}. Valid options are: {BACKTEST_ENGINES}"
+        )
 
-                # Calculate the cost basis for this segment
-                cost_basis = buy_lot["actual_price"] * shares_from_this_lot
+    cache_key = None
+    if use_cache:
+        cache_key = _backtest_cache_key(
+            df,
+            initial_capital,
+            commission_fixed,
+            commission_pct,
+            slippage_pct,
+            position_size_pct,
+            engine,
+        )
+        cached = get_result_cache().get(cache_key)
+        if cached is not None:
+            logger.info("Backtest results served from the result cache")
+            return cached
 
-                # Calculate the total transaction costs for this segment
-                total_transaction_costs = (
-                    costs_for_segment + buy_lot["commission"] + commission
+    logger.info(
+        f"Running backtest with initial capital: ${initial_capital:,.2f}, "
+        f"Commission: ${commission_fixed} + {commission_pct*100}%, "
+        f"Slippage: {slippage_pct*100}%, "
+        f"Position Size: {position_size_pct*100}%"
+    )
+
+    if engine in ("array", "vectorized"):
+        simulate = (
+            _simulate_arrays if engine == "array" else _simulate_positions
+        )
+        (
+            cash,
+            position,
+            ledger,
+            portfolio_values,
+            total_commission,
+            total_slippage_cost,
+        ) = simulate(
+            df["Close"].to_numpy(),
+            df["buy_signal"].to_numpy(dtype=bool),
+            df["sell_signal"].to_numpy(dtype=bool),
+            df.index,
+            initial_capital,
+            commission_fixed,
+            commission_pct,
+            slippage_pct,
+            position_size_pct,
+        )
+    else:
+        # Reference engine: walk the DataFrame row by row
+        # Initialize portfolio state with simplified position tracking
+        cash = initial_capital
+        position = 0  # Current number of shares held
+        portfolio_values = []
+        # Buys, open lots and completed trades
+        ledger = _TradeLedger(
+            int(df["buy_signal"].sum()), int(df["sell_signal"].sum())
+        )
+        total_commission = 0
+        total_slippage_cost = 0
+
+        # Pre-calculate prices adjusted for slippage
+        actual_buy_prices = df["Close"] * (1 + slippage_pct)
+        actual_sell_prices = df["Close"] * (1 - slippage_pct)
+
+        # Iterate through each day
+        for bar, (index, row) in enumerate(df.iterrows()):
+            close_price = row["Close"]
+
+            # Check for buy signal when we have cash
+            if row["buy_signal"] and cash > 0:
+                # Calculate the amount to invest based on position sizing
+                cash_to_invest = min(cash, initial_capital * position_size_pct)
+
+                # Apply slippage to buy price
+                actual_buy_price = actual_buy_prices.loc[
+                    index
+                ]  # Use pre-calculated price
+
+                # Calculate commission and shares to buy
+                shares_to_buy = max(
+                    0,
+                    (cash_to_invest - commission_fixed)
+                    / (actual_buy_price * (1 + commission_pct)),
                 )
 
-                # Calculate the return percentage
-                return_pct = (
-                    (net_profit_loss / cost_basis) * 100
-                    if cost_basis > 0
-                    else 0.0
+                # Ensure shares_to_buy is an integer if trading whole shares, or handle fractional shares
+                # For simplicity, let's assume fractional shares are allowed for now.
+
+                # Ensure we have enough for at least one share
+                if shares_to_buy <= 0:
+                    logger.warning(
+                        f"Not enough cash to invest after commission at {index}. Skipping trade."
+                    )
+                else:
+                    # Calculate the actual commission
+                    commission = commission_fixed + (
+                        shares_to_buy * actual_buy_price * commission_pct
+                    )
+
+                    # Calculate total cost (price + commission)
+                    total_cost = shares_to_buy * actual_buy_price + commission
+
+                    # Calculate slippage cost for reporting (difference between actual price and close price)
+                    slippage_cost = shares_to_buy * close_price * slippage_pct
+
+                    # Ensure the total cost doesn't exceed available cash
+                    if total_cost > cash:
+                        # This case should ideally be handled by the shares_to_buy calculation above,
+                        # but as a safeguard, log and skip if it somehow happens.
+                        logger.error(
+                            f"Calculated total cost ${total_cost:.2f} exceeds available cash ${cash:.2f} at {index}. Skipping trade."
+                        )
+                        continue  # Skip this trade
+
+                    # Update portfolio
+                    position += shares_to_buy
+                    cash -= total_cost
+                    total_commission += commission
+                    total_slippage_cost += slippage_cost
+
+                    # Record the buy as an open position (lot)
+                    ledger.buy(
+                        bar,
+                        actual_buy_price,
+                        shares_to_buy,
+                        commission,
+                        slippage_cost,
+                        position,
+                    )
+                    logger.debug(
+                        f"BUY: {index}, {shares_to_buy:.2f} shares at ${actual_buy_price:.2f} "
+                        f"(commission: ${commission:.2f}, slippage cost: ${slippage_cost:.2f})"
+                    )
+
+            # Check for sell signal when we have a position
+            elif row["sell_signal"] and position > 0:
+                # Apply slippage to sell price (selling at lower price)
+                actual_sell_price = actual_sell_prices.loc[
+                    index
+                ]  # Use pre-calculated price
+
+                shares_to_sell = position  # Sell the entire current position
+
+                # Calculate total commission for this sell transaction
+                # Commission is based on the value of shares being sold at the actual sell price
+                sell_value_gross = shares_to_sell * actual_sell_price
+                commission = commission_fixed + (
+                    sell_value_gross * commission_pct
                 )
 
-                # Record completed trade
-                completed_trades.append(
-                    {
-                        "entry_date": buy_lot["date"],
-                        "exit_date": index,
-                        "entry_price": buy_lot["actual_price"],
-                        "exit_price": actual_sell_price,
-                        "shares": shares_from_this_lot,
-                        "cost_basis": cost_basis,
-                        "sale_value": cash_received,
-                        "holding_period_days": (index - buy_lot["date"]).days,
-                        "commission": commission,
-                        "slippage": slippage_cost,
-                        "net_profit_loss": net_profit_loss,
-                        "return_pct": return_pct,
-                    }
+                # Calculate slippage cost for reporting
+                slippage_cost = shares_to_sell * close_price * slippage_pct
+
+                # Ensure cash received is not negative after commission
+                cash_received = sell_value_gross - commission
+                if cash_received < 0:
+                    logger.error(
+                        f"Commission ${commission:.2f} exceeds gross sell value ${sell_value_gross:.2f} at {index}. Cannot complete sell trade."
+                    )
+                    # Decide how to handle: skip sell, or sell for 0 cash? Skipping for now.
+                    continue
+
+                # Close open lots (FIFO) to calculate P&L for completed trades
+                ledger.sell(
+                    bar,
+                    actual_sell_price,
+                    shares_to_sell,
+                    commission,
+                    cash_received,
+                    slippage_cost,
                 )
 
-                # Update the buy lot
-                buy_lot["shares"] -= shares_from_this_lot
-                if buy_lot["shares"] <= 0:
-                    open_positions.pop(0)  # Remove the lot if fully sold
+                # Update portfolio state
+                cash += cash_received
+                total_commission += commission
+                total_slippage_cost += slippage_cost
 
-                shares_sold_from_lots += shares_from_this_lot
+                # Reset position
+                position = 0
+
+            # Calculate portfolio value for this day
+            portfolio_value = cash + (position * close_price)
+            portfolio_values.append(portfolio_value)
+
+    results = _backtest_results(
+        df.index,
+        df["Close"].iloc[0],
+        df["Close"].iloc[-1],
+        cash,
+        position,
+        ledger,
+        portfolio_values,
+        total_commission,
+        total_slippage_cost,
+        initial_capital,
+        commission_fixed,
+        commission_pct,
+        slippage_pct,
+    )
 
-            # Update portfolio state
-            cash += cash_received
-            total_commission += commission
-            total_slippage_cost += slippage_cost
+    if cache_key is not None:
+        get_result_cache().put(cache_key, results)
+    return results
 
-            # Reset position
-            position = 0
 
-        # Calculate portfolio value for this day
-        portfolio_value = cash + (position * close_price)
-        portfolio_values.append(portfolio_value)
+def _backtest_results(
+    dates,
+    initial_price,
+    final_price,
+    cash,
+    position,
+    ledger,
+    portfolio_values,
+    total_commission,
+    total_slippage_cost,
+    initial_capital,
+    commission_fixed,
+    commission_pct,
+    slippage_pct,
+):
+    """
+    Build the results of a finished simulation.
+
+    Adds the buy & hold comparison and the performance metrics to the end
+    state of the simulation.
 
+    Args:
+        dates (pd.Index): Timestamps of the bars
+        initial_price (float): Close of the first bar
+        final_price (float): Close of the last bar
+        cash, position, ledger, portfolio_values, total_commission,
+        total_slippage_cost: End state of the simulation (see
+            ``_simulate_arrays``)
+        initial_capital, commission_fixed, commission_pct, slippage_pct:
+            See ``run_backtest``
+
+    Returns:
+        dict: Backtest results and metrics, see ``run_backtest``
+    """
     # Calculate final portfolio value
-    final_price = df["Close"].iloc[-1]
     final_value = cash + (position * final_price)
 
     # If there's still an open position at the end, log it
@@ -710,24 +1947,26 @@ def run_backtest(
             )
 
     # Ensure we have portfolio values for each date in the DataFrame
-    if len(portfolio_values) < len(df):
-        padding_needed = len(df) - len(portfolio_values)
+    if len(portfolio_values) < len(dates):
+        padding_needed = len(dates) - len(portfolio_values)
         logger.debug(f"Padding portfolio values with {padding_needed} entries")
         padding_value = (
             portfolio_values[-1] if portfolio_values else initial_capital
         )
         portfolio_values.extend([padding_value] * padding_needed)
-    elif len(portfolio_values) > len(df):
+    elif len(portfolio_values) > len(dates):
         logger.warning(
-            f"Too many portfolio values ({len(portfolio_values)}) for DataFrame length ({len(df)}). Trimming."
+            f"Too many portfolio values ({len(portfolio_values)}) for DataFrame length ({len(dates)}). Trimming."
         )
-        portfolio_values = portfolio_values[: len(df)]
-
-    # Calculate max drawdown
-    portfolio_series = pd.Series(portfolio_values, index=df.index)
-    portfolio_max = portfolio_series.cummax()
-    drawdown = ((portfolio_series - portfolio_max) / portfolio_max) * 100
-    max_drawdown = drawdown.min()
+        portfolio_values = portfolio_values[: len(dates)]
+
+    # Risk metrics of the equity curve, max drawdown among them
+    tear_sheet = risk_metrics(
+        portfolio_values,
+        positions=ledger.held(len(dates)),
+        periods_per_year=infer_periods_per_year(dates),
+        initial_value=initial_capital if initial_capital > 0 else None,
+    )
 
     # Calculate performance metrics
     if initial_capital <= 0:
@@ -744,59 +1983,19 @@ def run_backtest(
         slippage_impact_pct = (total_slippage_cost / initial_capital) * 100
 
     # Trading statistics
-    num_buy_transactions = len(
-        [t for t in trades if t["type"] == "buy"]
-    )  # Count of buy signals acted upon
-    num_sell_transactions = len(
-        [t for t in completed_trades if t["shares"] > 0]
+    num_buy_transactions = ledger.n_buys  # Count of buy signals acted upon
+    num_sell_transactions = int(
+        np.count_nonzero(ledger.exit_shares[: ledger.n_exits] > 0)
     )  # Count of sell transactions that closed positions
-    closed_trade_count = len(
-        completed_trades
+    closed_trade_count = (
+        ledger.n_exits
     )  # Number of completed buy-sell cycles (or segments)
 
-    # Calculate win rate and profit metrics from correctly tracked completed trades
-    if closed_trade_count > 0:
-        winning_trades = [
-            t for t in completed_trades if t["net_profit_loss"] > 0
-        ]
-        losing_trades = [
-            t for t in completed_trades if t["net_profit_loss"] <= 0
-        ]
-
-        win_rate = (len(winning_trades) / closed_trade_count) * 100
-        avg_profit = (
-            np.mean([t["net_profit_loss"] for t in winning_trades])
-            if winning_trades
-            else 0
-        )
-        avg_loss = (
-            np.mean([t["net_profit_loss"] for t in losing_trades])
-            if losing_trades
-            else 0
-        )
-
-        gross_profit = (
-            sum(t["net_profit_loss"] for t in winning_trades)
-            if winning_trades
-            else 0
-        )
-        gross_loss = (
-            abs(sum(t["net_profit_loss"] for t in losing_trades))
-            if losing_trades
-            else 0
-        )
-        profit_factor = (
-            (gross_profit / gross_loss)
-            if gross_loss > 0
-            else (1.0 if gross_profit > 0 else 0.0)
-        )
-    else:
-        win_rate = 0.0
-        avg_profit = 0.0
-        avg_loss = 0.0
-        profit_factor = 0.0
+    # Calculate win rate and profit metrics from the completed trades
+    win_rate, avg_profit, avg_loss, profit_factor = _trade_statistics(
+        ledger.net_profit_loss
+    )
 
-    # Return results
     results = {
         "initial_capital": initial_capital,
         "final_value": final_value,
@@ -807,27 +2006,662 @@ def run_backtest(
         "avg_profit": avg_profit,
         "avg_loss": avg_loss,
         "profit_factor": profit_factor,
-        "max_drawdown": max_drawdown,
+        "max_drawdown": tear_sheet["max_drawdown"],
         "total_commission": total_commission,
         "total_slippage_cost": total_slippage_cost,
         "commission_impact_pct": commission_impact_pct,
         "slippage_impact_pct": slippage_impact_pct,
         "buy_hold_total_commission": buy_hold_total_commission,
         "buy_hold_total_slippage": buy_hold_total_slippage,
-        "start_date": df.index[0],
-        "end_date": df.index[-1],
-        "trades": trades,
-        "completed_trades": completed_trades,
+        "start_date": dates[0],
+        "end_date": dates[-1],
+        "trades": ledger.trades(dates),
+        "completed_trades": ledger.completed_trades(dates),
         "portfolio_values": portfolio_values,
         "closed_trade_count": closed_trade_count,
     }
+    # Total return and max drawdown are set above
+    for name in RISK_METRICS:
+        results.setdefault(name, tear_sheet[name])
 
     logger.info(
         f"Backtest completed. Final value: ${final_value:,.2f}, Return: {total_return_pct:.2f}%, "
         f"Win Rate: {win_rate:.1f}%, Profit Factor: {profit_factor:.2f}, "
         f"Total Commission: ${total_commission:.2f}"
     )
+    return results
+
+
+class StreamingBacktest:
+    """
+    Backtest that receives its bars in consecutive chunks.
+
+    Cash, the open position with its lots and the trade ledger are carried
+    from one chunk to the next, so the results are those of
+    ``run_backtest(engine="array")`` over all chunks concatenated, while only
+    one chunk of signals is in memory at a time. Of the bars seen so far,
+    only the timestamps and portfolio values are kept.
+
+    Example:
+        backtest = StreamingBacktest(initial_capital=100000.0)
+        for chunk in chunks:  # DataFrames with Close, buy_signal, sell_signal
+            backtest.update(chunk)
+        results = backtest.results()
+    """
+
+    def __init__(
+        self,
+        initial_capital=100000.0,
+        commission_fixed=20.0,
+        commission_pct=0.0003,
+        slippage_pct=0.001,
+        position_size_pct=0.25,
+    ):
+        """
+        Initialize the backtest with no bars.
+
+        Args:
+            initial_capital, commission_fixed, commission_pct, slippage_pct,
+            position_size_pct: See ``run_backtest``
+
+        Raises:
+            ValueError: If a parameter is invalid
+        """
+        _validate_backtest_params(
+            initial_capital,
+            commission_fixed,
+            commission_pct,
+            slippage_pct,
+            position_size_pct,
+        )
+        self.initial_capital = initial_capital
+        self.commission_fixed = commission_fixed
+        self.commission_pct = commission_pct
+        self.slippage_pct = slippage_pct
+        self.position_size_pct = position_size_pct
+
+        # (cash, position, ledger, total_commission, total_slippage_cost)
+        # after the last chunk, see _simulate_arrays
+        self._state = None
+        self._dates = []
+        self._portfolio_values = []
+        self._initial_price = None
+        self._final_price = None
+        self.n_bars = 0
+
+    def update(self, chunk):
+        """
+        Simulate the bars of the next chunk.
+
+        Args:
+            chunk (pd.DataFrame): Bars following the previous chunk, with
+                Close, buy_signal and sell_signal columns
+
+        Raises:
+            ValueError: If a column is missing or contains NaN values, or the
+                bars do not follow the previous chunk
+        """
+        required_columns = ["Close", "buy_signal", "sell_signal"]
+        missing_columns = [
+            col for col in required_columns if col not in chunk.columns
+        ]
+        if missing_columns:
+            raise ValueError(
+                f"Missing required columns in chunk: {missing_columns}"
+            )
+        if chunk.empty:
+            return
+        if chunk[required_columns].isna().any().any():
+            raise ValueError("Chunk contains NaN values in critical columns.")
+        if not chunk.index.is_monotonic_increasing or (
+            self._dates and chunk.index[0] <= self._dates[-1][-1]
+        ):
+            raise ValueError(
+                "Chunk bars must be in increasing order and after the last bar seen."
+            )
+
+        close = chunk["Close"].to_numpy()
+        (
+            cash,
+            position,
+            ledger,
+            portfolio_values,
+            total_commission,
+            total_slippage_cost,
+        ) = _simulate_arrays(
+            close,
+            chunk["buy_signal"].to_numpy(dtype=bool),
+            chunk["sell_signal"].to_numpy(dtype=bool),
+            chunk.index,
+            self.initial_capital,
+            self.commission_fixed,
+            self.commission_pct,
+            self.slippage_pct,
+            self.position_size_pct,
+            state=self._state,
+            bar_offset=self.n_bars,
+        )
+        self._state = (
+            cash,
+            position,
+            ledger,
+            total_commission,
+            total_slippage_cost,
+        )
+        self._dates.append(chunk.index)
+        self._portfolio_values.append(
+            np.asarray(portfolio_values, dtype=np.float64)
+        )
+        if self._initial_price is None:
+            self._initial_price = close[0]
+        self._final_price = close[-1]
+        self.n_bars += len(chunk)
+
+    def results(self):
+        """
+        Return the results of the bars seen so far.
+
+        Returns:
+            dict: Backtest results and metrics, see ``run_backtest``
+
+        Raises:
+            ValueError: If no bars have been seen yet
+        """
+        if self._state is None:
+            raise ValueError("No bars to report: update has not seen any.")
+        cash, position, ledger, total_commission, total_slippage_cost = (
+            self._state
+        )
+        return _backtest_results(
+            self._dates[0].append(self._dates[1:]),
+            self._initial_price,
+            self._final_price,
+            cash,
+            position,
+            ledger,
+            np.concatenate(self._portfolio_values).tolist(),
+            total_commission,
+            total_slippage_cost,
+            self.initial_capital,
+            self.commission_fixed,
+            self.commission_pct,
+            self.slippage_pct,
+        )
+
+
+def _backtest_cache_key(df, *params):
+    """
+    Return the result cache key of a backtest.
+
+    Only the columns the simulation reads are hashed, so features and other
+    columns of `df` do not slow down the lookup or change the key.
+    """
+    return fingerprint(
+        "run_backtest",
+        BACKTEST_CACHE_VERSION,
+        df["Close"].to_numpy(),
+        df["buy_signal"].to_numpy(dtype=bool),
+        df["sell_signal"].to_numpy(dtype=bool),
+        df.index,
+        *params,
+    )
+
+
+def run_parameter_sweep(
+    ohlcv_data,
+    strategy="sma_crossover",
+    param_grid=None,
+    initial_capital=100000.0,
+    commission_fixed=20.0,
+    commission_pct=0.0003,
+    slippage_pct=0.001,
+    position_size_pct=0.25,
+    rank_by="total_return_pct",
+    ascending=False,
+):
+    """
+    Backtest every combination of a strategy parameter grid in one pass.
+
+    Every indicator column needed by the grid is computed once through
+    FeatureFactory, the buy/sell signals of all combinations are built as
+    (bars x combinations) matrices in a single batched pass, and each column
+    is then run through the array backtest engine.
+
+    All combinations are evaluated on the same bars: rows before the longest
+    indicator window has warmed up are dropped.
+
+    Args:
+        ohlcv_data (pd.DataFrame): DataFrame with OHLCV data
+        strategy (str): Strategy to sweep, one of STRATEGY_REGISTRY
+        param_grid (dict): Mapping of strategy constructor argument to a list
+            of values, e.g. {"fast_window": [10, 20], "slow_window": [50, 200]}.
+            If None, uses the strategy's default_grid.
+        initial_capital, commission_fixed, commission_pct, slippage_pct,
+        position_size_pct: Backtest parameters, see ``run_backtest``
+        rank_by (str): Results column used to rank the combinations
+        ascending (bool): Whether a lower rank_by value ranks higher
+
+    Returns:
+        pd.DataFrame: One row per valid combination, sorted by rank, with the
+            strategy parameters, a 'rank' column and the headline metrics
+
+    Raises:
+        ValueError: If the strategy is unknown, the grid has no valid
+            combination or there is not enough data for the indicators
+    """
+    if strategy not in STRATEGY_REGISTRY:
+        raise ValueError(
+            f"Unknown strategy for parameter sweep: {strategy}. Valid options are: {list(STRATEGY_REGISTRY)}"
+        )
+    strategy_class = STRATEGY_REGISTRY[strategy]
+    if param_grid is None:
+        param_grid = strategy_class.default_grid
+
+    # Expand the grid and keep only combinations the strategy accepts
+    param_names = list(param_grid)
+    combinations = []
+    strategies = []
+    for values in itertools.product(*(param_grid[n] for n in param_names)):
+        params = dict(zip(param_names, values))
+        try:
+            strategies.append(strategy_class(**params))
+        except ValueError as e:
+            logger.debug(f"Skipping parameter combination {params}: {e}")
+            continue
+        combinations.append(params)
+
+    total_combinations = int(
+        np.prod([len(param_grid[n]) for n in param_names])
+    )
+    if not strategies:
+        raise ValueError(
+            f"None of the {total_combinations} parameter combinations are valid for {strategy}"
+        )
+    if len(strategies) < total_combinations:
+        logger.warning(
+            f"Skipped {total_combinations - len(strategies)} invalid parameter combinations"
+        )
+
+    # Compute every required indicator column once
+    required_columns = sorted(
+        {col for s in strategies for col in s.required_features()}
+    )
+    indicator_params = _merge_indicator_params(strategies)
+    factory = FeatureFactory(
+        ohlcv_data,
+        feature_families=list(indicator_params),
+        indicator_params=indicator_params,
+    )
+    features = factory.generate_features(drop_na=False)
+    features = features.dropna(subset=["Close"] + required_columns)
+    if features.empty:
+        raise ValueError(
+            "No rows left after indicator warm-up. Not enough data for the parameter grid."
+        )
+
+    logger.info(
+        f"Running parameter sweep for {strategy}: {len(strategies)} combinations "
+        f"over {len(features)} bars"
+    )
+
+    signals = strategy_class.signal_matrix(features, strategies)
+    buy_signals = np.asfortranarray(signals == SIGNAL_BUY)
+    sell_signals = np.asfortranarray(signals == SIGNAL_SELL)
+
+    close = features["Close"].to_numpy()
+    dates = features.index
+    final_price = close[-1]
+
+    rows = []
+    for j, (params, strat) in enumerate(zip(combinations, strategies)):
+        (
+            cash,
+            position,
+            ledger,
+            portfolio_values,
+            total_commission,
+            total_slippage_cost,
+        ) = _simulate_arrays(
+            close,
+            buy_signals[:, j],
+            sell_signals[:, j],
+            dates,
+            initial_capital,
+            commission_fixed,
+            commission_pct,
+            slippage_pct,
+            position_size_pct,
+        )
+        final_value = cash + (position * final_price)
+        win_rate, avg_profit, avg_loss, profit_factor = _trade_statistics(
+            ledger.net_profit_loss
+        )
+        rows.append(
+            {
+                "strategy": strat.name,
+                **params,
+                "final_value": final_value,
+                "total_return_pct": (
+                    ((final_value / initial_capital) - 1) * 100
+                    if initial_capital > 0
+                    else 0.0
+                ),
+                "num_trades": ledger.n_buys,
+                "closed_trade_count": ledger.n_exits,
+                "win_rate": win_rate,
+                "profit_factor": profit_factor,
+                "max_drawdown": _max_drawdown_pct(portfolio_values),
+                "total_commission": total_commission,
+                "total_slippage_cost": total_slippage_cost,
+            }
+        )
+
+    results = pd.DataFrame(rows)
+    results = results.sort_values(
+        rank_by, ascending=ascending, kind="mergesort"
+    ).reset_index(drop=True)
+    results.insert(0, "rank", np.arange(1, len(results) + 1))
+    return results
+
+
+def align_portfolio_signals(signal_data):
+    """
+    Align per-ticker signal DataFrames for ``run_portfolio_backtest``.
+
+    Args:
+        signal_data (dict): Mapping of ticker to a DataFrame with Close,
+            buy_signal and sell_signal columns (e.g. the output of a
+            strategy's generate_signals)
+
+    Returns:
+        tuple: (close, buy_signals, sell_signals) DataFrames with one column
+            per ticker on the union of all dates. Closes are NaN and signals
+            False on dates a ticker has no bar.
+
+    Raises:
+        ValueError: If there is no data or a DataFrame lacks a column
+    """
+    if not signal_data:
+        raise ValueError("No signal data to align")
+    required_columns = ["Close", "buy_signal", "sell_signal"]
+    for ticker, df in signal_data.items():
+        missing_columns = [
+            col for col in required_columns if col not in df.columns
+        ]
+        if missing_columns:
+            raise ValueError(
+                f"Missing required columns for {ticker}: {missing_columns}"
+            )
+
+    close = pd.concat(
+        {ticker: df["Close"] for ticker, df in signal_data.items()}, axis=1
+    ).sort_index()
+    buy_signals, sell_signals = (
+        pd.concat(
+            {ticker: df[col] for ticker, df in signal_data.items()}, axis=1
+        )
+        .reindex(close.index)
+        .fillna(False)
+        .astype(bool)
+        for col in ("buy_signal", "sell_signal")
+    )
+    return close, buy_signals, sell_signals
 
+
+def run_portfolio_backtest(
+    close,
+    buy_signals,
+    sell_signals,
+    initial_capital=100000.0,
+    commission_fixed=20.0,
+    commission_pct=0.0003,
+    slippage_pct=0.001,
+    position_size_pct=0.25,
+):
+    """
+    Backtest many tickers against one shared cash pool.
+
+    Each ticker trades like in ``run_backtest``: a buy signal invests
+    ``initial_capital * position_size_pct`` (more shares are added if a
+    position is already open), a sell signal sells the whole position, and a
+    bar with both signals is a buy. On every bar the sells are executed
+    first, so their proceeds can fund the buys of the same bar. When the buys
+    of a bar ask for more than the available cash, the cash is split between
+    them in proportion to their allocations. All of this is vectorized over
+    the tickers, and only bars with a signal are visited in Python.
+
+    With a single ticker the results match ``run_backtest`` as long as the
+    buys do not run out of cash: a buy of all the remaining cash whose costs
+    overshoot it by a rounding error is skipped there, and executed (using
+    up the cash) here.
+
+    Args:
+        close (pd.DataFrame): Close prices, one column per ticker. NaN marks
+            bars on which a ticker cannot trade; its position is then valued
+            at its last close.
+        buy_signals (pd.DataFrame): Boolean buy signals, aligned with close
+        sell_signals (pd.DataFrame): Boolean sell signals, aligned with close
+        initial_capital, commission_fixed, commission_pct, slippage_pct:
+            See ``run_backtest``
+        position_size_pct (float, dict or pd.Series): Fraction of the initial
+            capital invested per buy (0-1), either for all tickers or keyed
+            by ticker
+
+    Returns:
+        dict: Portfolio metrics, the combined 'equity_curve' and 'cash'
+            Series and an 'attribution' DataFrame with one row per ticker
+            (trades, costs, closing position and its contribution to the
+            profit/loss)
+
+    Raises:
+        ValueError: If the inputs are not aligned or a parameter is invalid
+    """
+    if close is None or close.empty:
+        raise ValueError("No close prices to backtest")
+    for name, signals in (
+        ("buy_signals", buy_signals),
+        ("sell_signals", sell_signals),
+    ):
+        if not (
+            signals.index.equals(close.index)
+            and signals.columns.equals(close.columns)
+        ):
+            raise ValueError(
+                f"{name} must have the same dates and tickers as close"
+            )
+
+    tickers = close.columns
+    if np.isscalar(position_size_pct):
+        position_sizes = np.full(len(tickers), float(position_size_pct))
+    else:
+        position_sizes = (
+            pd.Series(position_size_pct, dtype=np.float64)
+            .reindex(tickers)
+            .to_numpy()
+        )
+        if np.isnan(position_sizes).any():
+            missing = list(tickers[np.isnan(position_sizes)])
+            raise ValueError(f"position_size_pct is missing for {missing}")
+    for position_size in np.unique(position_sizes):
+        _validate_backtest_params(
+            initial_capital,
+            commission_fixed,
+            commission_pct,
+            slippage_pct,
+            position_size,
+        )
+
+    dates = close.index
+    prices = close.to_numpy(dtype=np.float64)
+    tradable = ~np.isnan(prices)
+    buys = buy_signals.to_numpy(dtype=bool) & tradable
+    sells = sell_signals.to_numpy(dtype=bool) & tradable & ~buys
+    # Positions are valued at the last close (none is held before the first)
+    marks = close.ffill().fillna(0.0).to_numpy(dtype=np.float64)
+
+    # Pre-calculate prices adjusted for slippage
+    actual_buy_prices = prices * (1 + slippage_pct)
+    actual_sell_prices = prices * (1 - slippage_pct)
+    allocations = initial_capital * position_sizes
+
+    n_bars, n_tickers = prices.shape
+    cash = initial_capital
+    position = np.zeros(n_tickers)
+    # Per-ticker attribution
+    num_buys = np.zeros(n_tickers, dtype=np.int64)
+    num_sells = np.zeros(n_tickers, dtype=np.int64)
+    invested = np.zeros(n_tickers)
+    proceeds = np.zeros(n_tickers)
+    commission_paid = np.zeros(n_tickers)
+    slippage_paid = np.zeros(n_tickers)
+
+    equity = np.empty(n_bars, dtype=np.float64)
+    cash_values = np.empty(n_bars, dtype=np.float64)
+    segment_start = 0
+
+    logger.info(
+        f"Running portfolio backtest of {n_tickers} tickers over {n_bars} bars "
+        f"with initial capital: ${initial_capital:,.2f}"
+    )
+
+    for i in np.flatnonzero((buys | sells).any(axis=1)):
+        # Cash and positions were constant since the last signal bar
+        equity[segment_start:i] = cash + marks[segment_start:i] @ position
+        cash_values[segment_start:i] = cash
+        segment_start = i
+
+        selling = np.flatnonzero(sells[i] & (position > 0))
+        if len(selling):
+            shares_to_sell = position[selling]
+            sell_value_gross = shares_to_sell * actual_sell_prices[i, selling]
+            commission = commission_fixed + (sell_value_gross * commission_pct)
+            slippage_cost = shares_to_sell * prices[i, selling] * slippage_pct
+            cash_received = sell_value_gross - commission
+
+            executed = cash_received >= 0
+            if not executed.all():
+                logger.error(
+                    f"Commission exceeds gross sell value at {dates[i]} for "
+                    f"{list(tickers[selling[~executed]])}. Cannot complete sell trades."
+                )
+            selling = selling[executed]
+            cash += cash_received[executed].sum()
+            position[selling] = 0
+            num_sells[selling] += 1
+            proceeds[selling] += cash_received[executed]
+            commission_paid[selling] += commission[executed]
+            slippage_paid[selling] += slippage_cost[executed]
+
+        buying = np.flatnonzero(buys[i])
+        if len(buying) and cash > 0:
+            cash_to_invest = allocations[buying]
+            total_requested = cash_to_invest.sum()
+            if total_requested > cash:
+                # Not enough cash for every buy: split it pro rata
+                cash_to_invest = cash * (cash_to_invest / total_requested)
+
+            actual_buy_price = actual_buy_prices[i, buying]
+            shares_to_buy = np.maximum(
+                0,
+                (cash_to_invest - commission_fixed)
+                / (actual_buy_price * (1 + commission_pct)),
+            )
+            executed = shares_to_buy > 0
+            if not executed.all():
+                logger.warning(
+                    f"Not enough cash to invest after commission at {dates[i]} for "
+                    f"{list(tickers[buying[~executed]])}. Skipping trades."
+                )
+            buying = buying[executed]
+            shares_to_buy = shares_to_buy[executed]
+            actual_buy_price = actual_buy_price[executed]
+
+            commission = commission_fixed + (
+                shares_to_buy * actual_buy_price * commission_pct
+            )
+            total_cost = shares_to_buy * actual_buy_price + commission
+            slippage_cost = shares_to_buy * prices[i, buying] * slippage_pct
+
+            # The pro rata split can overshoot the cash by a rounding error
+            cash = max(cash - total_cost.sum(), 0.0)
+            position[buying] += shares_to_buy
+            num_buys[buying] += 1
+            invested[buying] += total_cost
+            commission_paid[buying] += commission
+            slippage_paid[buying] += slippage_cost
+
+    equity[segment_start:] = cash + marks[segment_start:] @ position
+    cash_values[segment_start:] = cash
+
+    market_value = position * marks[-1]
+    final_value = cash + market_value.sum()
+    pnl = proceeds - invested + market_value
+    total_commission = commission_paid.sum()
+    total_slippage_cost = slippage_paid.sum()
+
+    attribution = pd.DataFrame(
+        {
+            "num_buys": num_buys,
+            "num_sells": num_sells,
+            "invested": invested,
+            "proceeds": proceeds,
+            "position": position,
+            "market_value": market_value,
+            "commission": commission_paid,
+            "slippage_cost": slippage_paid,
+            "pnl": pnl,
+            "contribution_pct": (
+                pnl / initial_capital * 100
+                if initial_capital > 0
+                else np.zeros(n_tickers)
+            ),
+        },
+        index=pd.Index(tickers, name="ticker"),
+    )
+
+    if initial_capital <= 0:
+        total_return_pct = 0.0
+        commission_impact_pct = 0.0
+        slippage_impact_pct = 0.0
+    else:
+        total_return_pct = ((final_value / initial_capital) - 1) * 100
+        commission_impact_pct = (total_commission / initial_capital) * 100
+        slippage_impact_pct = (total_slippage_cost / initial_capital) * 100
+
+    # Risk metrics of the equity curve; the pool is in the market whenever
+    # part of the equity is held in shares
+    tear_sheet = risk_metrics(
+        equity,
+        positions=equity - cash_values,
+        periods_per_year=infer_periods_per_year(dates),
+        initial_value=initial_capital if initial_capital > 0 else None,
+    )
+
+    results = {
+        "initial_capital": initial_capital,
+        "final_value": final_value,
+        "total_return_pct": total_return_pct,
+        "num_trades": int(num_buys.sum()),
+        "num_sells": int(num_sells.sum()),
+        "max_drawdown": tear_sheet["max_drawdown"],
+        "total_commission": total_commission,
+        "total_slippage_cost": total_slippage_cost,
+        "commission_impact_pct": commission_impact_pct,
+        "slippage_impact_pct": slippage_impact_pct,
+        "start_date": dates[0],
+        "end_date": dates[-1],
+        "equity_curve": pd.Series(equity, index=dates, name="equity"),
+        "cash": pd.Series(cash_values, index=dates, name="cash"),
+        "attribution": attribution,
+    }
+    # Total return and max drawdown are set above
+    for name in RISK_METRICS:
+        results.setdefault(name, tear_sheet[name])
+
+    logger.info(
+        f"Portfolio backtest completed. Final value: ${final_value:,.2f}, "
+        f"Return: {total_return_pct:.2f}%, Trades: {results['num_trades']}"
+    )
     return results
 
 
@@ -863,6 +2697,14 @@ def generate_backtest_report(results, period_name):
         )
         print(f"Average Loss per Losing Trade: ${results['avg_loss']:.2f}")
     print(f"Max Drawdown: {results['max_drawdown']:.2f}%")
+    print(f"Max Drawdown Duration: {results['max_drawdown_duration']} bars")
+    print(f"Annualized Return: {results['annual_return_pct']:.2f}%")
+    print(f"Annualized Volatility: {results['annual_volatility_pct']:.2f}%")
+    print(f"Sharpe Ratio: {results['sharpe_ratio']:.2f}")
+    print(f"Sortino Ratio: {results['sortino_ratio']:.2f}")
+    print(f"Calmar Ratio: {results['calmar_ratio']:.2f}")
+    print(f"Ulcer Index: {results['ulcer_index']:.2f}")
+    print(f"Exposure: {results['exposure_pct']:.2f}%")
     print(f"Total Commission: ${results['total_commission']:.2f}")
     print(f"Total Slippage: ${results['total_slippage_cost']:.2f}")
     print(f"Commission Impact: {results['commission_impact_pct']:.2f}%")
@@ -0,0 +1,413 @@
+"""
+Batch backtests of many tickers, strategies and cost settings.
+
+main.py backtests one ticker with one strategy per run. A batch run takes a
+configuration (usually loaded from YAML, see batch_sample.yaml) listing
+tickers, strategies and cost settings, and backtests every combination:
+1. The data of all tickers is fetched with fetch_stocks_data, which serves
+   what it can from the on-disk data cache and downloads the rest in
+   grouped requests
+2. The jobs of each ticker go to one task on a ProcessPoolExecutor. A task
+   computes the features of its ticker once, for all of its strategies, and
+   splits them at the split date as main.py does
+3. Every strategy and cost setting is backtested on the shared features,
+   in-sample and out-of-sample
+4. The results are collected into one table with a row per job and period
+
+A job that fails (e.g. not enough data for its indicators) is recorded with
+its error in the table instead of stopping the batch.
+"""
+
+import inspect
+import itertools
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from src.backtester import (
+    STRATEGY_REGISTRY,
+    _merge_indicator_params,
+    run_backtest,
+)
+from src.data_cache import (
+    CACHE_BACKENDS,
+    DEFAULT_CACHE_FORMAT,
+    get_cache_backend,
+)
+from src.data_fetcher import fetch_stocks_data
+from src.feature_factory import FeatureFactory
+from src.result_cache import configure_result_cache
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Backtest parameters a cost setting may set
+COST_PARAMS = (
+    "commission_fixed",
+    "commission_pct",
+    "slippage_pct",
+    "position_size_pct",
+)
+
+# Backtest metrics copied into the results table
+BATCH_METRICS = (
+    "final_value",
+    "total_return_pct",
+    "buy_hold_return_pct",
+    "num_trades",
+    "closed_trade_count",
+    "win_rate",
+    "profit_factor",
+    "max_drawdown",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "calmar_ratio",
+    "exposure_pct",
+    "total_commission",
+    "total_slippage_cost",
+)
+
+# Result columns holding counts
+COUNT_COLUMNS = ("bars", "num_trades", "closed_trade_count")
+
+# Default path of the results table
+DEFAULT_BATCH_OUTPUT = "data/batch_results.parquet"
+
+
+def make_batch_jobs(config):
+    """
+    Expand a batch configuration into one job per combination.
+
+    Args:
+        config (dict): Batch configuration with a list of 'tickers', a list
+            of 'strategies' (each a dict with the strategy 'name', one of
+            STRATEGY_REGISTRY, and its constructor arguments) and an optional
+            list of 'costs' (each a dict of COST_PARAMS). Cost parameters in
+            the 'backtest' section apply to every cost setting, and
+            run_backtest's defaults to those set nowhere.
+
+    Returns:
+        list: One dict per ticker, strategy and cost setting with the
+            'ticker', the strategy 'name', its 'params' and the backtest
+            parameters ('costs')
+
+    Raises:
+        ValueError: If the configuration lists no tickers or strategies, or
+            a strategy or cost setting is invalid
+    """
+    tickers = list(dict.fromkeys(config.get("tickers") or []))
+    strategies = config.get("strategies") or []
+    if not tickers:
+        raise ValueError("The batch configuration lists no tickers.")
+    if not strategies:
+        raise ValueError("The batch configuration lists no strategies.")
+
+    backtest = config.get("backtest") or {}
+    run_backtest_defaults = inspect.signature(run_backtest).parameters
+    defaults = {
+        key: backtest.get(key, run_backtest_defaults[key].default)
+        for key in COST_PARAMS
+    }
+    cost_settings = []
+    for costs in config.get("costs") or [{}]:
+        unknown = sorted(set(costs) - set(COST_PARAMS))
+        if unknown:
+            raise ValueError(
+                f"Unknown cost parameters: {unknown}. Valid options are: {list(COST_PARAMS)}"
+            )
+        cost_settings.append({**defaults, **costs})
+
+    strategy_specs = []
+    for spec in strategies:
+        spec = dict(spec)
+        name = spec.pop("name", None)
+        if name not in STRATEGY_REGISTRY:
+            raise ValueError(
+                f"Unknown strategy in batch configuration: {name}. Valid options are: {list(STRATEGY_REGISTRY)}"
+            )
+        # Fail before any data is fetched if the parameters are invalid
+        try:
+            STRATEGY_REGISTRY[name](**spec)
+        except TypeError as e:
+            raise ValueError(f"Invalid parameters for {name}: {e}") from e
+        strategy_specs.append((name, spec))
+
+    return [
+        {"ticker": ticker, "name": name, "params": params, "costs": costs}
+        for ticker, (name, params), costs in itertools.product(
+            tickers, strategy_specs, cost_settings
+        )
+    ]
+
+
+def run_batch(config, max_workers=None, source=None):
+    """
+    Backtest every ticker, strategy and cost setting of a configuration.
+
+    Args:
+        config (dict): Batch configuration, see make_batch_jobs. The optional
+            'data' section sets the 'period', 'interval', 'cache_dir',
+            'cache_format' and 'no_cache' of the downloads, and the
+            'backtest' section the 'split_date', 'initial_capital' and
+            'result_cache_dir'.
+        max_workers (int): Worker processes. None uses the configuration's
+            'max_workers', or every core if it has none; 1 runs the tickers
+            serially in this process.
+        source (DataSource): Source of the downloads, see fetch_stocks_data
+
+    Returns:
+        pd.DataFrame: One row per job and period ('in_sample', and
+            'out_of_sample' when there is a split date) with the job's
+            ticker, strategy, parameters and costs, the period's dates and
+            BATCH_METRICS. Failed jobs have an 'error' message instead.
+
+    Raises:
+        ValueError: If the configuration is invalid
+    """
+    jobs = make_batch_jobs(config)
+    data_config = config.get("data") or {}
+    backtest = config.get("backtest") or {}
+    if max_workers is None:
+        max_workers = config.get("max_workers")
+
+    tickers = list(dict.fromkeys(job["ticker"] for job in jobs))
+    logger.info(
+        f"Running batch of {len(jobs)} backtests over {len(tickers)} tickers"
+    )
+    data = fetch_stocks_data(
+        tickers,
+        period=data_config.get("period", "max"),
+        interval=data_config.get("interval", "1d"),
+        save_to_csv=not data_config.get("no_cache", False),
+        cache_dir=data_config.get("cache_dir", "data"),
+        cache_format=data_config.get("cache_format", DEFAULT_CACHE_FORMAT),
+        source=source,
+    )
+
+    task_args = [
+        (
+            ticker,
+            data.get(ticker),
+            [job for job in jobs if job["ticker"] == ticker],
+            backtest.get("split_date"),
+            backtest.get("initial_capital", 100000.0),
+        )
+        for ticker in tickers
+    ]
+    result_cache_dir = backtest.get("result_cache_dir")
+    if max_workers == 1:
+        if result_cache_dir:
+            configure_result_cache(cache_dir=result_cache_dir)
+        ticker_rows = [_run_ticker_jobs(*args) for args in task_args]
+    else:
+        # Workers share the on-disk result cache, so repeated nightly runs
+        # skip unchanged backtests
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(result_cache_dir,),
+        ) as executor:
+            futures = [
+                executor.submit(_run_ticker_jobs, *args) for args in task_args
+            ]
+            ticker_rows = [future.result() for future in futures]
+
+    results = pd.DataFrame([row for rows in ticker_rows for row in rows])
+    # Counts stay integers next to the missing values of failed jobs
+    for column in COUNT_COLUMNS:
+        if column in results:
+            results[column] = results[column].astype("Int64")
+    failed = results["error"].notna().sum()
+    logger.info(
+        f"Batch completed: {len(jobs)} backtests, {failed} failed result rows"
+    )
+    return results
+
+
+def write_batch_results(results, path=DEFAULT_BATCH_OUTPUT):
+    """
+    Write the batch results table in the format of the file extension.
+
+    Args:
+        results (pd.DataFrame): Results from run_batch
+        path (str): Output path ending in .parquet, .feather or .csv.
+            Parquet and Feather fall back to CSV (with a .csv extension)
+            when pyarrow is not installed.
+
+    Returns:
+        str: Path of the written file
+
+    Raises:
+        ValueError: If the file extension is not a supported format
+    """
+    stem, extension = os.path.splitext(path)
+    output_format = extension.lstrip(".").lower()
+    if output_format not in CACHE_BACKENDS:
+        raise ValueError(
+            f"Unsupported batch output format: {extension}. Valid options are: {list(CACHE_BACKENDS)}"
+        )
+    backend = get_cache_backend(output_format)
+    path = f"{stem}.{backend.extension}"
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    backend.save(results, path)
+    logger.info(f"Saved {len(results)} batch results to {path}")
+    return path
+
+
+def generate_batch_report(results, rank_by="total_return_pct", top=10):
+    """
+    Print the best backtests of a batch.
+
+    Args:
+        results (pd.DataFrame): Results from run_batch
+        rank_by (str): Metric used to rank the backtests
+        top (int): Number of backtests to show per period
+    """
+    print("\n" + "=" * 50)
+    print("BATCH BACKTEST RESULTS")
+    print("=" * 50)
+    failed = results[results["error"].notna()]
+    print(f"Backtests: {len(results) - len(failed)} ok, {len(failed)} failed")
+
+    columns = [
+        "ticker",
+        "strategy",
+        "commission_fixed",
+        "slippage_pct",
+        "total_return_pct",
+        "max_drawdown",
+        "num_trades",
+    ]
+    succeeded = results[results["error"].isna()]
+    for period, period_results in succeeded.groupby("period", sort=False):
+        best = period_results.sort_values(rank_by, ascending=False).head(top)
+        print(f"\nTop {len(best)} {period} backtests by {rank_by}:")
+        print(best[columns].to_string(index=False))
+    for _, row in failed.drop_duplicates(["ticker", "error"]).iterrows():
+        print(f"\n{row['ticker']} ({row['strategy']}): {row['error']}")
+    print("=" * 50 + "\n")
+
+
+def _init_batch_worker(result_cache_dir):
+    """Point a worker process at the shared on-disk result cache."""
+    if result_cache_dir:
+        configure_result_cache(cache_dir=result_cache_dir)
+
+
+def _split_timestamp(split_date, index):
+    """Return split_date as a Timestamp comparable with the index."""
+    split_ts = pd.Timestamp(split_date)
+    if index.tz is None:
+        return split_ts.tz_localize(None) if split_ts.tz else split_ts
+    if split_ts.tz is None:
+        return split_ts.tz_localize("UTC")
+    return split_ts
+
+
+def _run_ticker_jobs(ticker, data, jobs, split_date, initial_capital):
+    """
+    Backtest all jobs of one ticker on features computed once.
+
+    Runs in a worker process. Features are generated over the full history
+    for every indicator the jobs need and then split at the split date; the
+    indicators only look backward, so no out-of-sample bar reaches the
+    in-sample rows.
+
+    Args:
+        ticker (str): Ticker symbol
+        data (pd.DataFrame): OHLCV data of the ticker, or None if it could
+            not be fetched
+        jobs (list): Jobs of the ticker from make_batch_jobs
+        split_date (str): First out-of-sample date, or None
+        initial_capital (float): Initial capital of every backtest
+
+    Returns:
+        list: Result rows of the jobs, see run_batch
+    """
+    strategies = [
+        STRATEGY_REGISTRY[job["name"]](**job["params"]) for job in jobs
+    ]
+    periods = ["in_sample", "out_of_sample"] if split_date else ["in_sample"]
+
+    def job_row(job, strategy, period):
+        return {
+            "ticker": ticker,
+            "strategy": strategy.name,
+            "parameters": ", ".join(
+                f"{key}={value}" for key, value in job["params"].items()
+            ),
+            **{key: job["costs"].get(key) for key in COST_PARAMS},
+            "period": period,
+        }
+
+    def failed_rows(error):
+        return [
+            {**job_row(job, strategy, period), "error": error}
+            for job, strategy in zip(jobs, strategies)
+            for period in periods
+        ]
+
+    if data is None or data.empty:
+        return failed_rows("No data could be fetched")
+
+    # One feature frame with every indicator the strategies need
+    indicator_params = _merge_indicator_params(strategies)
+    try:
+        features = FeatureFactory(
+            data,
+            feature_families=list(indicator_params),
+            indicator_params=indicator_params,
+        ).generate_features(drop_na=False)
+    except ValueError as e:
+        return failed_rows(str(e))
+
+    if split_date:
+        in_sample = features.index < _split_timestamp(
+            split_date, features.index
+        )
+        period_features = {
+            "in_sample": features[in_sample],
+            "out_of_sample": features[~in_sample],
+        }
+    else:
+        period_features = {"in_sample": features}
+
+    rows = []
+    for job, strategy in zip(jobs, strategies):
+        required_columns = ["Close"] + strategy.required_features()
+        for period in periods:
+            row = job_row(job, strategy, period)
+            # Drop the bars where this strategy's indicators are still
+            # warming up, as run_parameter_sweep does
+            signals = period_features[period].dropna(subset=required_columns)
+            try:
+                if signals.empty:
+                    raise ValueError(
+                        "No bars left after indicator warm-up. Not enough data for the strategy."
+                    )
+                results = run_backtest(
+                    strategy.generate_signals(signals),
+                    initial_capital=initial_capital,
+                    engine="array",
+                    **job["costs"],
+                )
+                if results is None:
+                    raise ValueError("Backtest failed, see the log.")
+            except ValueError as e:
+                rows.append({**row, "error": str(e)})
+                continue
+            rows.append(
+                {
+                    **row,
+                    "start_date": results["start_date"],
+                    "end_date": results["end_date"],
+                    "bars": len(signals),
+                    **{metric: results[metric] for metric in BATCH_METRICS},
+                    "error": None,
+                }
+            )
+    return rows
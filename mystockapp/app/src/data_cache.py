@@ -0,0 +1,291 @@
+"""
+On-disk cache formats for downloaded OHLCV data.
+
+fetch_stock_data stores each download through a CacheBackend:
+- Parquet (default): typed columns and the timezone-aware DatetimeIndex are
+  stored as they are, so loading needs no date or number parsing
+- Feather: the same guarantees and usually the fastest to load
+- CSV: the original text format, kept as a fallback that needs no extra
+  dependencies
+
+Each cache file has a small JSON sidecar with metadata about its contents
+(e.g. the timestamp of its last bar), written by the data fetcher.
+
+CSV files written by earlier versions are converted to the configured
+format once, the first time they are found.
+"""
+
+import glob
+import importlib.util
+import json
+import logging
+import os
+import re
+from abc import ABC, abstractmethod
+
+import pandas as pd
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Default on-disk cache format
+DEFAULT_CACHE_FORMAT = "parquet"
+
+# Column name used to store an unnamed index in formats without an index
+_INDEX_COLUMN = "__index__"
+
+# Cache files are named {ticker}_{interval} (earlier versions added
+# _{period}); other CSV files in the cache directory (e.g. feature exports)
+# are not caches
+_CACHE_FILE_PATTERN = re.compile(
+    r"_(1m|2m|5m|15m|30m|60m|90m|1h|1d|5d|1wk|1mo|3mo)"
+    r"(_(1d|5d|1mo|3mo|6mo|1y|2y|5y|10y|ytd|max))?\.csv$"
+)
+
+
+class CacheBackend(ABC):
+    """Base class for on-disk cache formats."""
+
+    name = None
+    extension = None
+
+    # Libraries this format can use; any one of them is enough
+    dependencies = ()
+
+    def available(self):
+        """Return True if the libraries this format needs are installed."""
+        return not self.dependencies or any(
+            importlib.util.find_spec(module) is not None
+            for module in self.dependencies
+        )
+
+    def path(self, cache_dir, key):
+        """Return the path of the cache file for `key`."""
+        return os.path.join(cache_dir, f"{key}.{self.extension}")
+
+    @abstractmethod
+    def read(self, path):
+        """Load a cached DataFrame."""
+        pass
+
+    @abstractmethod
+    def write(self, data, path):
+        """Store a DataFrame."""
+        pass
+
+    def save(self, data, path):
+        """Store a DataFrame atomically, so readers never see a partial file."""
+        tmp_path = f"{path}.tmp"
+        try:
+            self.write(data, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class CSVCache(CacheBackend):
+    """Plain-text CSV cache (dates and numbers are parsed on every load)."""
+
+    name = "csv"
+    extension = "csv"
+
+    def read(self, path):
+        data = pd.read_csv(path, index_col=0, parse_dates=True)
+        data.index = _parse_cached_index(data.index)
+        return data
+
+    def write(self, data, path):
+        data.to_csv(path)
+
+
+class ParquetCache(CacheBackend):
+    """Columnar Parquet cache that keeps dtypes and the index."""
+
+    name = "parquet"
+    extension = "parquet"
+    dependencies = ("pyarrow", "fastparquet")
+
+    def read(self, path):
+        return pd.read_parquet(path)
+
+    def write(self, data, path):
+        data.to_parquet(path)
+
+
+class FeatherCache(CacheBackend):
+    """Feather (Arrow IPC) cache; the index is stored as the first column."""
+
+    name = "feather"
+    extension = "feather"
+    dependencies = ("pyarrow",)
+
+    def read(self, path):
+        data = pd.read_feather(path)
+        data = data.set_index(data.columns[0])
+        if data.index.name == _INDEX_COLUMN:
+            data.index.name = None
+        return data
+
+    def write(self, data, path):
+        data.rename_axis(
+            data.index.name or _INDEX_COLUMN
+        ).reset_index().to_feather(path)
+
+
+# Registry of cache formats
+CACHE_BACKENDS = {
+    "parquet": ParquetCache,
+    "feather": FeatherCache,
+    "csv": CSVCache,
+}
+
+
+def get_cache_backend(cache_format=DEFAULT_CACHE_FORMAT):
+    """
+    Create the cache backend for a format.
+
+    Falls back to CSV with a warning when the libraries the format needs
+    (pyarrow or fastparquet) are not installed.
+
+    Args:
+        cache_format (str): One of CACHE_BACKENDS
+
+    Returns:
+        CacheBackend: The cache backend
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if cache_format not in CACHE_BACKENDS:
+        raise ValueError(
+            f"Invalid cache format: {cache_format}. Valid options are: {list(CACHE_BACKENDS)}"
+        )
+    backend = CACHE_BACKENDS[cache_format]()
+    if not backend.available():
+        logger.warning(
+            f"The {cache_format} cache format needs {' or '.join(backend.dependencies)} to be installed. Falling back to CSV."
+        )
+        return CSVCache()
+    return backend
+
+
+def _parse_cached_index(index):
+    """
+    Return a DatetimeIndex for an index loaded from CSV.
+
+    read_csv only produces a DatetimeIndex when every timestamp has the same
+    UTC offset; histories spanning daylight-saving changes come back as
+    strings and are converted to UTC.
+    """
+    if isinstance(index, pd.DatetimeIndex):
+        return index
+    return pd.DatetimeIndex(pd.to_datetime(index, utc=True), name=index.name)
+
+
+def read_cache_file(path):
+    """
+    Load a cache file in any supported format, chosen by its extension.
+
+    Args:
+        path (str): Path of the cache file
+
+    Returns:
+        pd.DataFrame: The cached data with a DatetimeIndex
+    """
+    extension = os.path.splitext(path)[1].lstrip(".")
+    for backend_class in CACHE_BACKENDS.values():
+        if backend_class.extension == extension:
+            return backend_class().read(path)
+    raise ValueError(f"Unknown cache file format: {path}")
+
+
+def _metadata_path(cache_dir, key):
+    """Return the path of the metadata sidecar for `key`."""
+    return os.path.join(cache_dir, f"{key}.json")
+
+
+def read_cache_metadata(cache_dir, key):
+    """
+    Load the metadata stored next to a cache file.
+
+    Returns:
+        dict: The metadata, or an empty dict if there is none or it is
+            unreadable
+    """
+    path = _metadata_path(cache_dir, key)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read cache metadata {path}: {str(e)}")
+        return {}
+
+
+def write_cache_metadata(cache_dir, key, metadata):
+    """Store the metadata of a cache file in its JSON sidecar."""
+    path = _metadata_path(cache_dir, key)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(metadata, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def migrate_csv_cache(csv_path, backend):
+    """
+    Convert a CSV cache file to another cache format.
+
+    The new file keeps the CSV's modification time, so cache expiry is
+    unaffected, and the CSV file is removed.
+
+    Args:
+        csv_path (str): Path of the CSV cache file
+        backend (CacheBackend): Target cache format
+
+    Returns:
+        str: Path of the converted cache file
+    """
+    data = read_cache_file(csv_path)
+
+    new_path = os.path.splitext(csv_path)[0] + f".{backend.extension}"
+    backend.save(data, new_path)
+    modified = os.path.getmtime(csv_path)
+    os.utime(new_path, (modified, modified))
+    os.remove(csv_path)
+
+    logger.info(f"Migrated cache file {csv_path} to {new_path}")
+    return new_path
+
+
+def migrate_cache_dir(cache_dir="data", cache_format=DEFAULT_CACHE_FORMAT):
+    """
+    Convert every CSV cache file in a directory to another cache format.
+
+    Only files named like cache files ({ticker}_{interval}.csv, or
+    {ticker}_{interval}_{period}.csv from earlier versions) are converted.
+    Files that fail to convert are left in place and logged.
+
+    Args:
+        cache_dir (str): Cache directory
+        cache_format (str): Target cache format, one of CACHE_BACKENDS
+
+    Returns:
+        list: Paths of the converted cache files
+    """
+    backend = get_cache_backend(cache_format)
+    if backend.name == "csv":
+        return []
+
+    migrated = []
+    for csv_path in sorted(glob.glob(os.path.join(cache_dir, "*.csv"))):
+        if not _CACHE_FILE_PATTERN.search(os.path.basename(csv_path)):
+            continue
+        try:
+            migrated.append(migrate_csv_cache(csv_path, backend))
+        except Exception as e:
+            logger.warning(
+                f"Failed to migrate cache file {csv_path}: {str(e)}"
+            )
+    return migrated
@@ -4,12 +4,28 @@ Module for fetching historical stock data using yfinance.
 
 import os
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 import pandas as pd
 import warnings
-import yfinance as yf
-import requests
-import streamlit as st
+
+from src.data_cache import (
+    CACHE_BACKENDS,
+    DEFAULT_CACHE_FORMAT,
+    CSVCache,
+    get_cache_backend,
+    migrate_csv_cache,
+    read_cache_file,
+    read_cache_metadata,
+    write_cache_metadata,
+)
+from src.data_sources import YFinanceSource
+from src.lazy_imports import lazy_import, streamlit_cache_data
+
+# Imported on first use, so that importing this module stays fast
+yf = lazy_import("yfinance")
+requests = lazy_import("requests")
 
 # Setup logging
 logging.basicConfig(
@@ -21,8 +37,51 @@ logger = logging.getLogger(__name__)
 # Define a global constant for Streamlit cache TTL (1 day by default)
 STREAMLIT_CACHE_TTL_DAYS = 1
 
-
-@st.cache_data(ttl=timedelta(days=STREAMLIT_CACHE_TTL_DAYS))
+VALID_PERIODS = [
+    "1d",
+    "5d",
+    "1mo",
+    "3mo",
+    "6mo",
+    "1y",
+    "2y",
+    "5y",
+    "10y",
+    "ytd",
+    "max",
+]
+
+VALID_INTERVALS = [
+    "1m",
+    "2m",
+    "5m",
+    "15m",
+    "30m",
+    "60m",
+    "90m",
+    "1h",
+    "1d",
+    "5d",
+    "1wk",
+    "1mo",
+    "3mo",
+]
+
+# Length of each yfinance period ('ytd' and 'max' are handled separately)
+PERIOD_OFFSETS = {
+    "1d": pd.DateOffset(days=1),
+    "5d": pd.DateOffset(days=5),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
+
+
+@streamlit_cache_data(ttl=timedelta(days=STREAMLIT_CACHE_TTL_DAYS))
 def fetch_stock_data(
     ticker_symbol,
     period="max",
@@ -30,6 +89,7 @@ def fetch_stock_data(
     save_to_csv=True,
     cache_dir="data",
     cache_expiry_days=1,
+    cache_format=DEFAULT_CACHE_FORMAT,
 ):
     """
     Fetch historical stock data using yfinance.
@@ -38,9 +98,13 @@ def fetch_stock_data(
         ticker_symbol (str): Stock ticker symbol (e.g., 'RELIANCE.NS' for Reliance NSE)
         period (str): Valid periods: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max
         interval (str): Valid intervals: 1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo
-        save_to_csv (bool): Whether to save the data to a CSV file
-        cache_dir (str): Directory to save the CSV file
-        cache_expiry_days (int): Number of days before cached data expires (for file-based cache)
+        save_to_csv (bool): Whether to cache the data on disk (the name is kept
+            for backward compatibility; the format is set by cache_format)
+        cache_dir (str): Directory to save the cache file
+        cache_expiry_days (int): Number of days before cached data expires (for file-based cache).
+            An expired cache is refreshed by downloading only the bars after its last bar.
+        cache_format (str): On-disk cache format: 'parquet' (default), 'feather' or 'csv'.
+            CSV caches written by earlier versions are converted on first use.
 
     Returns:
         pd.DataFrame: DataFrame containing the historical stock data or None if data fetching fails
@@ -50,54 +114,10 @@ def fetch_stock_data(
         logger.error("No ticker symbol provided")
         return None
 
-    valid_periods = [
-        "1d",
-        "5d",
-        "1mo",
-        "3mo",
-        "6mo",
-        "1y",
-        "2y",
-        "5y",
-        "10y",
-        "ytd",
-        "max",
-    ]
-    if period not in valid_periods:
-        logger.error(
-            f"Invalid period: {period}. Valid options are: {valid_periods}"
-        )
-        return None
-
-    valid_intervals = [
-        "1m",
-        "2m",
-        "5m",
-        "15m",
-        "30m",
-        "60m",
-        "90m",
-        "1h",
-        "1d",
-        "5d",
-        "1wk",
-        "1mo",
-        "3mo",
-    ]
-    if interval not in valid_intervals:
-        logger.error(
-            f"Invalid interval: {interval}. Valid options are: {valid_intervals}"
-        )
-        return None
-
-    # Check for incompatible period/interval combinations
-    if period == "1d" and interval in ["1d", "5d", "1wk", "1mo", "3mo"]:
-        logger.error(
-            f"Incompatible period/interval combination: period={period}, interval={interval}"
-        )
-        logger.error(
-            "For 1d period, interval must be 1m, 2m, 5m, 15m, 30m, 60m, 90m, or 1h"
-        )
+    try:
+        _validate_fetch_args(period, interval, cache_format)
+    except ValueError as e:
+        logger.error(str(e))
         return None
 
     logger.info(
@@ -105,92 +125,71 @@ def fetch_stock_data(
     )
 
     # Create cache directory if it doesn't exist
-    if save_to_csv and not os.path.exists(cache_dir):
-        try:
-            os.makedirs(cache_dir)
-            logger.info(f"Created cache directory: {cache_dir}")
-        except Exception as e:
-            logger.error(
-                f"Failed to create cache directory {cache_dir}: {str(e)}"
-            )
-            logger.warning(
-                "Will attempt to fetch data but won't be able to cache it"
-            )
-            save_to_csv = False
+    if save_to_csv:
+        save_to_csv = _ensure_cache_dir(cache_dir)
 
-    # Define cache file path
-    cache_file = None
+    # The cache for a ticker and interval holds the widest history
+    # downloaded so far and serves every period. When it has expired, only
+    # the bars since its last bar are downloaded.
+    cached = None
+    refresh_from = None
     if save_to_csv:
-        cache_file = os.path.join(
-            cache_dir,
-            f"{ticker_symbol.replace('.', '_')}_{interval}_{period}.csv",
+        backend = get_cache_backend(cache_format)
+        cache_key = _cache_key(ticker_symbol, interval)
+        cached, metadata = _load_cache(backend, cache_dir, cache_key)
+        data, refresh_from = _use_cache(
+            backend.path(cache_dir, cache_key),
+            cached,
+            metadata,
+            period,
+            cache_expiry_days,
         )
+        if data is not None:
+            return data
 
-    # Check if cache file exists and is recent
-    cache_is_valid = False
-    if save_to_csv and cache_file and os.path.exists(cache_file):
-        try:
-            file_age = datetime.now() - datetime.fromtimestamp(
-                os.path.getmtime(cache_file)
-            )
-            if file_age < timedelta(days=cache_expiry_days):
-                logger.info(
-                    f"Loading cached data from {cache_file} (age: {file_age.total_seconds()/3600:.1f} hours)"
-                )
-                try:
-                    data = pd.read_csv(
-                        cache_file, index_col=0, parse_dates=True
-                    )
-                    if not data.empty:
-                        return data
-                    logger.warning(
-                        f"Cached file exists but is empty or invalid, fetching fresh data"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load cached data: {str(e)}, fetching fresh data"
-                    )
-            else:
-                logger.info(
-                    f"Cached data is too old ({file_age.days} days), fetching fresh data"
-                )
-        except Exception as e:
-            logger.warning(f"Error checking cache file {cache_file}: {str(e)}")
+    # If a refresh fails, the stale cache is better than no data
+    fallback = None
+    if refresh_from is not None:
+        fallback = _slice_period(cached, period)
 
     # Fetch data using yfinance
     try:
-        logger.info(f"Downloading data from Yahoo Finance for {ticker_symbol}")
         ticker = yf.Ticker(ticker_symbol)
-        data = ticker.history(period=period, interval=interval)
+        if refresh_from is not None:
+            logger.info(
+                f"Downloading {ticker_symbol} data since {refresh_from} from Yahoo Finance"
+            )
+            data = ticker.history(start=refresh_from, interval=interval)
+        else:
+            logger.info(
+                f"Downloading data from Yahoo Finance for {ticker_symbol}"
+            )
+            data = ticker.history(period=period, interval=interval)
 
         # Check if data was retrieved successfully
-        if data.empty:
+        if data.empty and refresh_from is None:
             logger.error(f"No data retrieved for {ticker_symbol}")
             return None
 
-        # Check if data contains NaN values in OHLCV columns
-        ohlcv_nan_counts = (
-            data[["Open", "High", "Low", "Close", "Volume"]].isna().sum()
-        )
-        if ohlcv_nan_counts.sum() > 0:
-            logger.warning(
-                f"Retrieved data contains NaN values in OHLCV columns: {ohlcv_nan_counts[ohlcv_nan_counts > 0].to_dict()}"
-            )
-            logger.warning(
-                "NaN values may cause issues in downstream analysis. Consider dropping or filling NaN values."
-            )
-
+        _warn_nan_values(data)
         logger.info(
             f"Successfully fetched {len(data)} rows of {ticker_symbol} data"
         )
 
-        # Save to CSV if requested
-        if save_to_csv and cache_file:
-            try:
-                data.to_csv(cache_file)
-                logger.info(f"Saved data to {cache_file}")
-            except Exception as e:
-                logger.error(f"Failed to save data to {cache_file}: {str(e)}")
+        # Save to the cache if requested, merged with the cached bars
+        if save_to_csv:
+            stored = _update_cache(
+                backend,
+                cache_dir,
+                cache_key,
+                cached,
+                metadata,
+                data,
+                period,
+                refreshed=refresh_from is not None,
+            )
+            if refresh_from is not None:
+                return _slice_period(stored, period)
 
         return data
 
@@ -198,22 +197,516 @@ def fetch_stock_data(
         logger.exception(
             f"Network error when fetching data for {ticker_symbol}: {str(e)}"
         )
-        return None
+        return fallback
     except ValueError as e:
         logger.exception(
             f"Invalid parameter when fetching {ticker_symbol}: {str(e)}"
         )
-        return None
+        return fallback
     except Exception as e:
         # Fallback for unexpected errors
         logger.exception(
             f"Unexpected error fetching data for {ticker_symbol}: {str(e)}"
         )
+        return fallback
+
+
+def _validate_fetch_args(period, interval, cache_format):
+    """
+    Check the period, interval and cache format of a request.
+
+    Raises:
+        ValueError: If any of them is invalid, or the period and interval
+            cannot be combined
+    """
+    if period not in VALID_PERIODS:
+        raise ValueError(
+            f"Invalid period: {period}. Valid options are: {VALID_PERIODS}"
+        )
+    if interval not in VALID_INTERVALS:
+        raise ValueError(
+            f"Invalid interval: {interval}. Valid options are: {VALID_INTERVALS}"
+        )
+
+    # Check for incompatible period/interval combinations
+    if period == "1d" and interval in ["1d", "5d", "1wk", "1mo", "3mo"]:
+        raise ValueError(
+            f"Incompatible period/interval combination: period={period}, interval={interval}. "
+            "For 1d period, interval must be 1m, 2m, 5m, 15m, 30m, 60m, 90m, or 1h"
+        )
+
+    if cache_format not in CACHE_BACKENDS:
+        raise ValueError(
+            f"Invalid cache format: {cache_format}. Valid options are: {list(CACHE_BACKENDS)}"
+        )
+
+
+def _ensure_cache_dir(cache_dir):
+    """Create the cache directory if needed; return False if that fails."""
+    if os.path.exists(cache_dir):
+        return True
+    try:
+        os.makedirs(cache_dir)
+        logger.info(f"Created cache directory: {cache_dir}")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to create cache directory {cache_dir}: {str(e)}")
+        logger.warning(
+            "Will attempt to fetch data but won't be able to cache it"
+        )
+        return False
+
+
+def _cache_key(ticker_symbol, interval):
+    """Return the cache key of a ticker and interval."""
+    return f"{ticker_symbol.replace('.', '_')}_{interval}"
+
+
+def _load_cache(backend, cache_dir, cache_key):
+    """
+    Load the cached bars and metadata for `cache_key`.
+
+    Returns:
+        tuple: (cached bars or None if there are none, metadata dict)
+    """
+    cache_file = backend.path(cache_dir, cache_key)
+    if not os.path.exists(cache_file):
+        _adopt_legacy_cache(backend, cache_dir, cache_key)
+    if not os.path.exists(cache_file):
+        return None, {}
+
+    try:
+        cached = backend.read(cache_file)
+        if cached.empty:
+            logger.warning(
+                f"Cached file exists but is empty or invalid, fetching fresh data"
+            )
+            return None, {}
+        return cached, read_cache_metadata(cache_dir, cache_key)
+    except Exception as e:
+        logger.warning(
+            f"Failed to load cached data: {str(e)}, fetching fresh data"
+        )
+        return None, {}
+
+
+def _use_cache(cache_file, cached, metadata, period, cache_expiry_days):
+    """
+    Decide how a request for `period` is served from the cache.
+
+    Returns:
+        tuple: (data, refresh_from). `data` is the cached data if the cache
+            is fresh and reaches back far enough for the period. Otherwise
+            `refresh_from` is the last cached bar if the cache only needs
+            the bars after it, or None if the whole period must be
+            downloaded.
+    """
+    if cached is None or not _cache_covers(metadata, _period_start(period)):
+        return None, None
+    try:
+        file_age = datetime.now() - datetime.fromtimestamp(
+            os.path.getmtime(cache_file)
+        )
+        if file_age < timedelta(days=cache_expiry_days):
+            logger.info(
+                f"Loading cached data from {cache_file} (age: {file_age.total_seconds()/3600:.1f} hours)"
+            )
+            return _slice_period(cached, period), None
+        logger.info(
+            f"Cached data is too old ({file_age.days} days), fetching bars since {cached.index[-1]}"
+        )
+        return None, cached.index[-1]
+    except Exception as e:
+        logger.warning(f"Error checking cache file {cache_file}: {str(e)}")
+        return None, None
+
+
+def _update_cache(
+    backend,
+    cache_dir,
+    cache_key,
+    cached,
+    metadata,
+    data,
+    period,
+    refreshed=False,
+):
+    """
+    Merge downloaded bars into the cache and save it.
+
+    Args:
+        refreshed (bool): True if `data` holds the bars since the last
+            cached bar; False if it is a download of the whole `period`
+
+    Returns:
+        pd.DataFrame: The merged cached bars
+    """
+    if refreshed:
+        stored = _merge_bars(cached, data)
+    else:
+        stored = data if cached is None else _merge_bars(cached, data)
+        period_start = _period_start(period)
+        metadata = {
+            "period_start": (
+                None if period_start is None else period_start.isoformat()
+            )
+        }
+    metadata = {**metadata, "last_bar": stored.index[-1].isoformat()}
+
+    cache_file = backend.path(cache_dir, cache_key)
+    try:
+        backend.save(stored, cache_file)
+        write_cache_metadata(cache_dir, cache_key, metadata)
+        logger.info(f"Saved data to {cache_file}")
+    except Exception as e:
+        logger.error(f"Failed to save data to {cache_file}: {str(e)}")
+    return stored
+
+
+def _warn_nan_values(data):
+    """Log a warning if downloaded OHLCV columns contain NaN values."""
+    if data.empty:
+        return
+    ohlcv_nan_counts = (
+        data[["Open", "High", "Low", "Close", "Volume"]].isna().sum()
+    )
+    if ohlcv_nan_counts.sum() > 0:
+        logger.warning(
+            f"Retrieved data contains NaN values in OHLCV columns: {ohlcv_nan_counts[ohlcv_nan_counts > 0].to_dict()}"
+        )
+        logger.warning(
+            "NaN values may cause issues in downstream analysis. Consider dropping or filling NaN values."
+        )
+
+
+def _period_start(period, now=None):
+    """
+    Return the earliest timestamp a download of `period` covers.
+
+    Args:
+        period (str): yfinance period
+        now (pd.Timestamp): Reference time (UTC). Defaults to the current time.
+
+    Returns:
+        pd.Timestamp: Start of the period in UTC, or None for 'max'
+    """
+    if now is None:
+        now = pd.Timestamp.now(tz="UTC")
+    if period == "max":
         return None
+    if period == "ytd":
+        return pd.Timestamp(year=now.year, month=1, day=1, tz="UTC")
+    return now - PERIOD_OFFSETS[period]
+
+
+def _cache_covers(metadata, requested_start):
+    """Return True if a cache with `metadata` reaches back to `requested_start`."""
+    if "period_start" not in metadata:
+        return False
+    if metadata["period_start"] is None:
+        return True
+    if requested_start is None:
+        return False
+    return pd.Timestamp(metadata["period_start"]) <= requested_start
+
+
+def _slice_period(data, period):
+    """
+    Return the bars of `data` that a download of `period` would contain.
+
+    Day periods ('1d', '5d') count trading days, like yfinance; longer
+    periods count calendar time back from now.
+    """
+    if period == "max":
+        return data
+    if period in ("1d", "5d"):
+        days = data.index.normalize()
+        first_day = days.unique()[-int(period[:-1]) :][0]
+        return data[days >= first_day]
+
+    start = _period_start(period)
+    if data.index.tz is None:
+        start = start.tz_convert(None)
+    return data[data.index >= start]
+
+
+def _merge_bars(cached, new):
+    """
+    Merge downloaded bars into cached ones.
+
+    Bars downloaded again (e.g. the last bar of the cache, which may have
+    been incomplete) replace the cached version.
+    """
+    if new.empty:
+        return cached
+    if (cached.index.tz is None) != (new.index.tz is None):
+        logger.warning(
+            "Cached and downloaded data have different timezone handling; replacing the cache"
+        )
+        return new
+    if new.index.tz is not None:
+        new = new.tz_convert(cached.index.tz)
+    merged = pd.concat([cached, new])
+    merged = merged[~merged.index.duplicated(keep="last")]
+    return merged.sort_index()
+
+
+def _adopt_legacy_cache(backend, cache_dir, cache_key):
+    """
+    Convert cache files from earlier versions into the cache for `cache_key`.
+
+    Handles a CSV cache for the same key (when the cache format changed) and
+    the per-period files of earlier versions ({ticker}_{interval}_{period}).
+    Of those, the file with the longest period is kept, and how far back it
+    reaches is derived from its modification time; the others are removed.
+    """
+    csv_file = CSVCache().path(cache_dir, cache_key)
+    try:
+        if backend.name != "csv" and os.path.exists(csv_file):
+            migrate_csv_cache(csv_file, backend)
+            return
+
+        legacy_files = []
+        periods = ["max", "10y", "5y", "2y", "1y", "ytd", "6mo", "3mo"]
+        for period in periods + ["1mo", "5d", "1d"]:
+            for legacy_backend in (backend, CSVCache()):
+                legacy_file = legacy_backend.path(
+                    cache_dir, f"{cache_key}_{period}"
+                )
+                if os.path.exists(legacy_file):
+                    legacy_files.append((period, legacy_file))
+        if not legacy_files:
+            return
+
+        period, legacy_file = legacy_files[0]
+        data = read_cache_file(legacy_file)
+        modified = os.path.getmtime(legacy_file)
+        period_start = _period_start(
+            period, now=pd.Timestamp(modified, unit="s", tz="UTC")
+        )
+
+        cache_file = backend.path(cache_dir, cache_key)
+        backend.save(data, cache_file)
+        os.utime(cache_file, (modified, modified))
+        write_cache_metadata(
+            cache_dir,
+            cache_key,
+            {
+                "period_start": (
+                    None if period_start is None else period_start.isoformat()
+                ),
+                "last_bar": data.index[-1].isoformat(),
+            },
+        )
+        for _, path in legacy_files:
+            os.remove(path)
+        logger.info(f"Migrated cache file {legacy_file} to {cache_file}")
+    except Exception as e:
+        logger.warning(f"Failed to migrate legacy cache files: {str(e)}")
+
+
+def fetch_stocks_data(
+    tickers,
+    period="max",
+    interval="1d",
+    save_to_csv=True,
+    cache_dir="data",
+    cache_expiry_days=1,
+    cache_format=DEFAULT_CACHE_FORMAT,
+    source=None,
+    batch_size=50,
+    max_workers=4,
+    max_retries=3,
+    retry_delay=1.0,
+):
+    """
+    Fetch historical data for many tickers with grouped requests.
+
+    Tickers that the cache cannot serve are downloaded in groups of
+    `batch_size` per request, on up to `max_workers` concurrent requests.
+    Each download is split into per-ticker data and stored in the same cache
+    as fetch_stock_data, so the two functions share cached data.
+
+    Args:
+        tickers (list): Stock ticker symbols
+        period, interval, save_to_csv, cache_dir, cache_expiry_days,
+        cache_format: See fetch_stock_data
+        source (DataSource): Source of the downloads. Defaults to Yahoo
+            Finance.
+        batch_size (int): Maximum number of tickers per request
+        max_workers (int): Maximum number of concurrent requests
+        max_retries (int): Retries of a failed request
+        retry_delay (float): Seconds before the first retry, doubled for
+            each further retry
+
+    Returns:
+        dict: DataFrame for each ticker, or None if its data could not be
+            fetched
+
+    Raises:
+        ValueError: If any of the arguments is invalid
+    """
+    _validate_fetch_args(period, interval, cache_format)
+    if batch_size <= 0:
+        raise ValueError(f"Batch size must be positive. Got: {batch_size}")
+    if max_workers <= 0:
+        raise ValueError(f"Max workers must be positive. Got: {max_workers}")
+    if max_retries < 0:
+        raise ValueError(
+            f"Max retries must be non-negative. Got: {max_retries}"
+        )
+    if source is None:
+        source = YFinanceSource()
+
+    tickers = list(dict.fromkeys(tickers))
+    if save_to_csv:
+        save_to_csv = _ensure_cache_dir(cache_dir)
+        backend = get_cache_backend(cache_format)
+
+    # Serve what the cache can and collect the tickers to download
+    results = {}
+    caches = {}
+    to_download = []
+    to_refresh = {}
+    for ticker in tickers:
+        if not save_to_csv:
+            to_download.append(ticker)
+            continue
+        cache_key = _cache_key(ticker, interval)
+        cached, metadata = _load_cache(backend, cache_dir, cache_key)
+        data, refresh_from = _use_cache(
+            backend.path(cache_dir, cache_key),
+            cached,
+            metadata,
+            period,
+            cache_expiry_days,
+        )
+        if data is not None:
+            results[ticker] = data
+            continue
+        caches[ticker] = (cache_key, cached, metadata)
+        if refresh_from is not None:
+            to_refresh[ticker] = refresh_from
+        else:
+            to_download.append(ticker)
+
+    # Refreshes are grouped by the age of their caches, and each group
+    # downloads from its oldest last bar
+    batches = [
+        (batch, {"period": period})
+        for batch in _batches(to_download, batch_size)
+    ]
+    batches += [
+        (batch, {"start": min(to_refresh[ticker] for ticker in batch)})
+        for batch in _batches(
+            sorted(to_refresh, key=to_refresh.get), batch_size
+        )
+    ]
+    logger.info(
+        f"Fetching {len(tickers)} tickers: {len(results)} from the cache, "
+        f"{len(to_download) + len(to_refresh)} in {len(batches)} requests"
+    )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _download_with_retries,
+                source,
+                batch,
+                interval,
+                request,
+                max_retries,
+                retry_delay,
+            ): batch
+            for batch, request in batches
+        }
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                downloaded = future.result()
+            except Exception as e:
+                logger.error(
+                    f"Failed to fetch data for {len(batch)} tickers: {str(e)}"
+                )
+                downloaded = None
+
+            for ticker in batch:
+                cache_key, cached, metadata = caches.get(
+                    ticker, (None, None, {})
+                )
+                refreshed = ticker in to_refresh
+                if downloaded is None:
+                    # If a refresh fails, the stale cache is better than no data
+                    results[ticker] = (
+                        _slice_period(cached, period) if refreshed else None
+                    )
+                    continue
+
+                data = downloaded.get(ticker)
+                if data is None:
+                    if not refreshed:
+                        logger.error(f"No data retrieved for {ticker}")
+                        results[ticker] = None
+                        continue
+                    data = cached.iloc[:0]
+
+                _warn_nan_values(data)
+                if save_to_csv:
+                    stored = _update_cache(
+                        backend,
+                        cache_dir,
+                        cache_key,
+                        cached,
+                        metadata,
+                        data,
+                        period,
+                        refreshed=refreshed,
+                    )
+                    if refreshed:
+                        data = _slice_period(stored, period)
+                results[ticker] = data
+
+    return {ticker: results[ticker] for ticker in tickers}
+
+
+def _batches(items, batch_size):
+    """Split a list into consecutive groups of at most `batch_size` items."""
+    return [
+        items[i : i + batch_size] for i in range(0, len(items), batch_size)
+    ]
+
+
+def _download_with_retries(
+    source, tickers, interval, request, max_retries, retry_delay
+):
+    """
+    Download a group of tickers, retrying failed requests with backoff.
+
+    Returns:
+        dict: DataFrame for each ticker with data
+
+    Raises:
+        Exception: The error of the last attempt if every attempt fails
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return source.download(tickers, interval=interval, **request)
+        except Exception as e:
+            if attempt == max_retries:
+                raise
+            delay = retry_delay * 2**attempt
+            logger.warning(
+                f"Request for {len(tickers)} tickers failed ({str(e)}), retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
 
 
 def get_stock_data(
-    ticker_symbol, period="max", interval="1d", save_to_csv=True
+    ticker_symbol,
+    period="max",
+    interval="1d",
+    save_to_csv=True,
+    cache_format=DEFAULT_CACHE_FORMAT,
 ):
     """
     Get stock data for any ticker symbol.
@@ -224,7 +717,8 @@ def get_stock_data(
         ticker_symbol (str): Stock ticker symbol (e.g., 'RELIANCE.NS', 'AAPL')
         period (str): Data period
         interval (str): Data interval
-        save_to_csv (bool): Whether to save to CSV
+        save_to_csv (bool): Whether to cache the data on disk
+        cache_format (str): On-disk cache format ('parquet', 'feather' or 'csv')
 
     Returns:
         pd.DataFrame: DataFrame with stock data or None if fetching failed
@@ -236,7 +730,13 @@ def get_stock_data(
         >>> # Get Apple data with custom period and interval
         >>> apple_data = get_stock_data("AAPL", period="1y", interval="1d")
     """
-    return fetch_stock_data(ticker_symbol, period, interval, save_to_csv)
+    return fetch_stock_data(
+        ticker_symbol,
+        period,
+        interval,
+        save_to_csv,
+        cache_format=cache_format,
+    )
 
 
 def get_reliance_data(period="max", interval="1d", save_to_csv=True):
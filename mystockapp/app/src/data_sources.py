@@ -0,0 +1,106 @@
+"""
+Network sources for bulk downloads of OHLCV data.
+
+fetch_stocks_data requests whole groups of tickers from a DataSource at
+once. The default source is Yahoo Finance; tests and offline runs can pass
+any object with the same download method instead.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+
+import pandas as pd
+
+from src.lazy_imports import lazy_import
+
+# Imported on first download, so that importing this module stays fast
+yf = lazy_import("yfinance")
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class DataSource(ABC):
+    """Base class for sources that download several tickers per request."""
+
+    name = None
+
+    @abstractmethod
+    def download(self, tickers, interval="1d", period=None, start=None):
+        """
+        Download bars for a group of tickers.
+
+        Either `period` or `start` is given.
+
+        Args:
+            tickers (list): Ticker symbols
+            interval (str): Bar interval
+            period (str): yfinance period to download
+            start (pd.Timestamp): Download the bars from this time onward
+
+        Returns:
+            dict: DataFrame of bars for each ticker that has data. Tickers
+                without data are left out.
+
+        Raises:
+            Exception: If the request fails; it is retried by the caller
+        """
+        pass
+
+
+class YFinanceSource(DataSource):
+    """Yahoo Finance, with one multi-ticker request per download."""
+
+    name = "yfinance"
+
+    def download(self, tickers, interval="1d", period=None, start=None):
+        request = {"start": start} if start is not None else {"period": period}
+        data = yf.download(
+            list(tickers),
+            interval=interval,
+            group_by="ticker",
+            auto_adjust=True,
+            actions=True,
+            ignore_tz=False,
+            threads=False,
+            progress=False,
+            **request,
+        )
+        return split_download(data, tickers)
+
+
+def split_download(data, tickers):
+    """
+    Split a multi-ticker download into a DataFrame per ticker.
+
+    Args:
+        data (pd.DataFrame): Download with (ticker, field) columns, or plain
+            field columns for a single ticker
+        tickers (list): Requested ticker symbols
+
+    Returns:
+        dict: DataFrame for each ticker with at least one bar
+    """
+    if data is None or data.empty:
+        return {}
+
+    frames = {}
+    if isinstance(data.columns, pd.MultiIndex):
+        downloaded = data.columns.get_level_values(0)
+        for ticker in tickers:
+            if ticker in downloaded:
+                frames[ticker] = data[ticker]
+    elif len(tickers) == 1:
+        frames[tickers[0]] = data
+    else:
+        raise ValueError(
+            "Cannot split a download without ticker columns between several tickers."
+        )
+
+    result = {}
+    for ticker, frame in frames.items():
+        # Rows where the ticker did not trade are all NaN in a joint download
+        frame = frame.dropna(how="all").rename_axis(columns=None)
+        if not frame.empty:
+            result[ticker] = frame
+    return result
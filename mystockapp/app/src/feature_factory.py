@@ -15,6 +15,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _like(like, data):
+    """Wrap `data` in a Series or DataFrame with the labels of `like`."""
+    if like.ndim == 2:
+        return pd.DataFrame(data, index=like.index, columns=like.columns)
+    return pd.Series(data, index=like.index, name=like.name)
+
+
 class FeatureFactory:
     """
     Feature factory for generating technical indicators from OHLCV data.
@@ -28,6 +35,16 @@ class FeatureFactory:
     - Volume Indicators
 
     All calculations are vectorized for efficiency using NumPy/Pandas.
+
+    After generate_features, update() computes the features of newly
+    appended bars from a short tail of history and the carried state of the
+    recursive indicators (EMAs, Wilder RSI, OBV, PVT).
+
+    Panel mode: given several tickers at once, either as a wide frame with
+    (field, ticker) columns or as a long frame with a (ticker, date)
+    MultiIndex, each indicator is computed for all tickers in one pass over
+    a (time x ticker) frame. The result is a long frame indexed by
+    (ticker, date) with the same values as one factory per ticker.
     """
 
     # Default parameter sets for each indicator
@@ -41,6 +58,51 @@ class FeatureFactory:
         "volume": {"windows": [5, 10, 20, 50]},
     }
 
+    # Intermediate series shared between feature families. Each entry maps a
+    # name to (inputs, function): the function receives the factory, the
+    # OHLCV frame, the values of its inputs and any parameters of the
+    # intermediate, so that e.g. ("close_ema", 12) is the 12-span EMA of the
+    # close.
+    INTERMEDIATES = {
+        "close_diff": ((), lambda self, df: df["Close"].diff()),
+        "prev_close": ((), lambda self, df: df["Close"].shift(1)),
+        "true_range": (
+            ("prev_close",),
+            # fmax skips NaN like DataFrame.max and also works on panels
+            lambda self, df, prev_close: np.fmax(
+                np.fmax(df["High"] - df["Low"], abs(df["High"] - prev_close)),
+                abs(df["Low"] - prev_close),
+            ),
+        ),
+        "close_sma": (
+            (),
+            lambda self, df, window: df["Close"].rolling(window=window).mean(),
+        ),
+        "close_ema": (
+            (),
+            lambda self, df, span: self._carry_ewm(
+                df["Close"], ("close_ema", span), span=span
+            ),
+        ),
+    }
+
+    # Intermediates read by each feature family, given its parameters
+    FAMILY_INTERMEDIATES = {
+        "sma": lambda p: [("close_sma", w) for w in p["windows"]],
+        "ema": lambda p: [("close_ema", w) for w in p["windows"]],
+        "rsi": lambda p: [("close_diff",)],
+        "macd": lambda p: [
+            ("close_ema", span)
+            for fast in p["fast"]
+            for slow in p["slow"]
+            if fast < slow
+            for span in (fast, slow)
+        ],
+        "bollinger_bands": lambda p: [("close_sma", w) for w in p["window"]],
+        "atr": lambda p: [("true_range",)],
+        "volume": lambda p: [("close_diff",), ("prev_close",)],
+    }
+
     def __init__(
         self,
         ohlcv_data,
@@ -55,6 +117,8 @@ class FeatureFactory:
         Args:
             ohlcv_data (pd.DataFrame): DataFrame with OHLCV data
                 Required columns: ['Open', 'High', 'Low', 'Close', 'Volume']
+                For several tickers, either (field, ticker) MultiIndex
+                columns or a (ticker, date) MultiIndex with the OHLCV columns
             feature_families (list): List of feature families to generate
                 If None, generates all available feature families
             params (dict): Custom parameters for feature generation (deprecated, use indicator_params)
@@ -65,11 +129,22 @@ class FeatureFactory:
         """
         self.ohlcv = ohlcv_data.copy()
 
+        # Panel data is converted to a (field, ticker) frame
+        self.panel = isinstance(self.ohlcv.index, pd.MultiIndex) or isinstance(
+            self.ohlcv.columns, pd.MultiIndex
+        )
+        self.tickers = None
+        if self.panel:
+            self._init_panel()
+
         # Verify required columns
         required_cols = ["Open", "High", "Low", "Close", "Volume"]
-        missing_cols = [
-            col for col in required_cols if col not in self.ohlcv.columns
-        ]
+        fields = (
+            self.ohlcv.columns.get_level_values(0)
+            if self.panel
+            else self.ohlcv.columns
+        )
+        missing_cols = [col for col in required_cols if col not in fields]
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
 
@@ -94,8 +169,12 @@ class FeatureFactory:
         if invalid_families:
             raise ValueError(f"Invalid feature families: {invalid_families}")
 
-        # Set parameters
-        self.params = self.DEFAULT_PARAMS.copy()
+        # Set parameters (copy each family so updates don't leak into the
+        # class defaults)
+        self.params = {
+            family: dict(family_params)
+            for family, family_params in self.DEFAULT_PARAMS.items()
+        }
 
         # Handle both params (deprecated) and indicator_params for backward compatibility
         if indicator_params:
@@ -116,30 +195,44 @@ class FeatureFactory:
         self.dtype = np.float32 if use_float32 else np.float64
 
         # Convert numeric columns to specified dtype
-        for col in ["Open", "High", "Low", "Close"]:
-            self.ohlcv[col] = self.ohlcv[col].astype(self.dtype)
+        if self.panel:
+            # Whole fields at a time, so each field stays one 2-D block
+            self.ohlcv = pd.concat(
+                {
+                    field: (
+                        self.ohlcv[field].astype(self.dtype)
+                        if field in ["Open", "High", "Low", "Close"]
+                        else self.ohlcv[field]
+                    )
+                    for field in dict.fromkeys(
+                        self.ohlcv.columns.get_level_values(0)
+                    )
+                },
+                axis=1,
+            )
+        else:
+            for col in ["Open", "High", "Low", "Close"]:
+                self.ohlcv[col] = self.ohlcv[col].astype(self.dtype)
 
-    def generate_features(self, drop_na=True, drop_na_threshold=None):
+        # Shared intermediates of the current generate_features run
+        self._intermediates = {}
+        self.intermediate_stats = {"requested": 0, "computed": 0}
+
+        # State carried from generate_features to update(): the last bars
+        # of OHLCV data and the last values of the recursive indicators
+        self._state = {}
+        self._update_start = None
+
+    def min_rows_needed(self):
         """
-        Generate all specified feature families.
+        Return the number of bars generate_features needs at least.
 
-        Args:
-            drop_na (bool): Whether to drop rows with NaN values. Default is True for safer downstream processing.
-            drop_na_threshold (float or int): If provided, drops rows where more than this
-                   fraction (if < 1) or number (if >= 1) of columns are NaN.
-                   If None, any row with a NaN is dropped when drop_na is True.
+        This is one more than the longest lookback window of the selected
+        feature families.
 
         Returns:
-            pd.DataFrame: DataFrame with original data and generated features
+            int: Minimum number of rows of OHLCV data
         """
-        logger.info(
-            f"Generating features for families: {self.feature_families}"
-        )
-        if self.ohlcv.empty:
-            raise ValueError(
-                "Input DataFrame is empty. Cannot generate features from empty data."
-            )
-        min_rows_needed = 1  # Base case
         lookback_requirements = {
             "sma": lambda p: max(p.get("windows", [0])),
             "ema": lambda p: max(p.get("windows", [0])),
@@ -165,10 +258,32 @@ class FeatureFactory:
                 )
         if "volume" in self.feature_families:
             max_lookback = max(max_lookback, mfi_window)
-        min_rows_needed = max_lookback + 1
+        return max_lookback + 1
+
+    def generate_features(self, drop_na=True, drop_na_threshold=None):
+        """
+        Generate all specified feature families.
+
+        Args:
+            drop_na (bool): Whether to drop rows with NaN values. Default is True for safer downstream processing.
+            drop_na_threshold (float or int): If provided, drops rows where more than this
+                   fraction (if < 1) or number (if >= 1) of columns are NaN.
+                   If None, any row with a NaN is dropped when drop_na is True.
+
+        Returns:
+            pd.DataFrame: DataFrame with original data and generated features
+        """
+        logger.info(
+            f"Generating features for families: {self.feature_families}"
+        )
+        if self.ohlcv.empty:
+            raise ValueError(
+                "Input DataFrame is empty. Cannot generate features from empty data."
+            )
+        min_rows_needed = self.min_rows_needed()
         if len(self.ohlcv) < min_rows_needed:
             raise ValueError(
-                f"Input DataFrame has {len(self.ohlcv)} rows, but at least {min_rows_needed} rows are needed for the selected feature calculations (max lookback: {max_lookback})."
+                f"Input DataFrame has {len(self.ohlcv)} rows, but at least {min_rows_needed} rows are needed for the selected feature calculations (max lookback: {min_rows_needed - 1})."
             )
 
         # Check for NaN values in critical OHLCV columns before generating features
@@ -177,6 +292,12 @@ class FeatureFactory:
         ohlcv_nan_counts = (
             self.ohlcv[["Open", "High", "Low", "Close", "Volume"]].isna().sum()
         )
+        if self.panel:
+            # Per field, without the padding after each ticker's last bar
+            padding = len(self.ohlcv) - self._panel_lengths
+            ohlcv_nan_counts = (
+                ohlcv_nan_counts.unstack().sub(padding, axis=1).sum(axis=1)
+            )
         ohlcv_with_nans = ohlcv_nan_counts[ohlcv_nan_counts > 0]
         if not ohlcv_with_nans.empty:
             logger.warning(
@@ -187,27 +308,9 @@ class FeatureFactory:
                 "Rows with resulting NaNs will be dropped if drop_na is True."
             )
 
-        # Create a copy of the original DataFrame to add features to
-        df = self.ohlcv.copy()
-
-        # Generate features for each specified family
-        for family in self.feature_families:
-            logger.info(f"Generating {family} features")
-
-            if family == "sma":
-                df = self._add_sma_features(df)
-            elif family == "ema":
-                df = self._add_ema_features(df)
-            elif family == "rsi":
-                df = self._add_rsi_features(df)
-            elif family == "macd":
-                df = self._add_macd_features(df)
-            elif family == "bollinger_bands":
-                df = self._add_bollinger_bands_features(df)
-            elif family == "atr":
-                df = self._add_atr_features(df)
-            elif family == "volume":
-                df = self._add_volume_features(df)
+        self._state = {}
+        df = self._compute_features(self.ohlcv)
+        self._state["tail"] = self.ohlcv.iloc[-self._tail_length() :]
 
         # Handle NaN values based on the drop_na parameter
         original_row_count = len(df)
@@ -266,94 +369,489 @@ class FeatureFactory:
 
         return df
 
+    def update(self, new_rows):
+        """
+        Compute features for bars appended after the data seen so far.
+
+        Only a tail of the previous bars (the longest window) and the last
+        values of the recursive indicators are used, so the work per new bar
+        does not depend on the length of the history. generate_features must
+        have been called first; the factory's own OHLCV data is not extended.
+
+        Args:
+            new_rows (pd.DataFrame): OHLCV rows that follow the last bar seen
+                by generate_features or the previous update
+
+        Returns:
+            pd.DataFrame: The new rows with the same columns as
+                generate_features(drop_na=False)
+        """
+        if self.panel:
+            raise ValueError("update is not supported for panel data.")
+        if "tail" not in self._state:
+            raise ValueError("generate_features must be called before update.")
+        required_cols = ["Open", "High", "Low", "Close", "Volume"]
+        missing_cols = [
+            col for col in required_cols if col not in new_rows.columns
+        ]
+        if missing_cols:
+            raise ValueError(f"Missing required columns: {missing_cols}")
+
+        tail = self._state["tail"]
+        if new_rows.empty:
+            return self._compute_features(tail).iloc[:0]
+        if not (
+            new_rows.index.is_monotonic_increasing
+            and new_rows.index[0] > tail.index[-1]
+        ):
+            raise ValueError(
+                "New rows must be in increasing order and after the last bar seen."
+            )
+
+        new_rows = new_rows.reindex(columns=tail.columns)
+        for col in ["Open", "High", "Low", "Close"]:
+            new_rows[col] = new_rows[col].astype(self.dtype)
+        frame = pd.concat([tail, new_rows])
+
+        self._update_start = len(tail)
+        try:
+            features = self._compute_features(frame)
+        finally:
+            self._update_start = None
+        self._state["tail"] = frame.iloc[-self._tail_length() :]
+
+        return features.iloc[len(tail) :]
+
+    def _compute_features(self, df):
+        """Run the selected feature families over `df` and assemble them."""
+        # Preallocate one 2-D block for every feature column; the families
+        # write into it and it becomes a single DataFrame at the end
+        self._start_feature_block(
+            len(df) * (len(self.tickers) if self.panel else 1)
+        )
+
+        # Plan the shared intermediates so each is computed once and released
+        # after the last family that reads it
+        remaining_uses = self._plan_intermediates()
+        self._intermediates = {}
+        self.intermediate_stats = {"requested": 0, "computed": 0}
+
+        # Generate features for each specified family
+        for family in self.feature_families:
+            if self._update_start is None:
+                logger.info(f"Generating {family} features")
+
+            if family == "sma":
+                self._add_sma_features(df)
+            elif family == "ema":
+                self._add_ema_features(df)
+            elif family == "rsi":
+                self._add_rsi_features(df)
+            elif family == "macd":
+                self._add_macd_features(df)
+            elif family == "bollinger_bands":
+                self._add_bollinger_bands_features(df)
+            elif family == "atr":
+                self._add_atr_features(df)
+            elif family == "volume":
+                self._add_volume_features(df)
+
+            for key in self._intermediate_closure(family):
+                remaining_uses[key] -= 1
+                if remaining_uses[key] == 0:
+                    self._intermediates.pop(key, None)
+        self._intermediates = {}
+        return self._assemble_feature_block(df)
+
+    def _init_panel(self):
+        """
+        Convert panel data to a (field, ticker) frame of packed histories.
+
+        Each ticker's bars are moved to the top of its columns (in date
+        order), so that every ticker's history starts at the first row and
+        windowed and recursive indicators see exactly that ticker's bars,
+        even when the tickers trade on different dates. The dates are kept
+        in the (ticker, date) index of the output.
+        """
+        ohlcv = self.ohlcv
+        if isinstance(ohlcv.index, pd.MultiIndex):
+            int_dtypes = {
+                field: dtype
+                for field, dtype in ohlcv.dtypes.items()
+                if dtype.kind in "iu"
+            }
+            # Long frame: unstack the ticker level, which is the first
+            # level unless only the first level holds dates
+            ticker_level = int(
+                isinstance(ohlcv.index.levels[0], pd.DatetimeIndex)
+                and not isinstance(ohlcv.index.levels[1], pd.DatetimeIndex)
+            )
+            ohlcv = ohlcv.unstack(ticker_level)
+        elif "Close" not in ohlcv.columns.get_level_values(0):
+            # Columns grouped by ticker, e.g. yfinance's group_by="ticker"
+            ohlcv = ohlcv.swaplevel(axis=1)
+        if not isinstance(self.ohlcv.index, pd.MultiIndex):
+            int_dtypes = {
+                field: dtypes.iloc[0]
+                for field, dtypes in ohlcv.dtypes.groupby(level=0)
+                if all(dtype.kind in "iu" for dtype in dtypes)
+            }
+        ohlcv = ohlcv.sort_index()
+
+        fields = list(dict.fromkeys(ohlcv.columns.get_level_values(0)))
+        self.tickers = list(dict.fromkeys(ohlcv.columns.get_level_values(1)))
+        ohlcv = ohlcv.reindex(
+            columns=pd.MultiIndex.from_product([fields, self.tickers])
+        )
+
+        # A ticker has a bar on a date if any of its OHLCV values is set
+        present = np.zeros((len(ohlcv), len(self.tickers)), dtype=bool)
+        for field in ["Open", "High", "Low", "Close", "Volume"]:
+            if field in fields:
+                present |= ohlcv[field].notna().to_numpy()
+        lengths = present.sum(axis=0)
+
+        dates = ohlcv.index
+        if present.all():
+            packed = ohlcv.reset_index(drop=True)
+            ticker_dates = [dates] * len(self.tickers)
+            self._panel_rows = None
+        else:
+            # Stable sort puts each ticker's bars first, in date order
+            order = np.argsort(~present, axis=0, kind="stable")
+            packed = pd.concat(
+                {
+                    field: pd.DataFrame(
+                        np.take_along_axis(
+                            ohlcv[field].to_numpy(), order, axis=0
+                        ),
+                        columns=self.tickers,
+                    )
+                    for field in fields
+                },
+                axis=1,
+            )
+            # Integer fields (e.g. Volume) only got NaN as padding
+            for field, dtype in int_dtypes.items():
+                packed[field] = packed[field].fillna(0).astype(dtype)
+            ticker_dates = [
+                dates[order[:length, i]] for i, length in enumerate(lengths)
+            ]
+            # Rows of the (ticker-major) output that hold a bar
+            self._panel_rows = (
+                np.arange(len(ohlcv))[None, :] < lengths[:, None]
+            ).ravel()
+
+        self._panel_index = pd.MultiIndex.from_arrays(
+            [
+                np.repeat(self.tickers, lengths),
+                dates[:0].append(ticker_dates),
+            ],
+            names=["ticker", dates.name or "Date"],
+        )
+        self._panel_lengths = pd.Series(lengths, index=self.tickers)
+        self.ohlcv = packed
+
+    def _to_long(self, values):
+        """Flatten (time x ticker) values to the ticker-major output rows."""
+        return np.asarray(values).T.reshape(-1)
+
+    def _tail_length(self):
+        """Number of previous bars update() needs for the windowed features."""
+        # MFI compares each typical price with the previous one
+        windows = [14 + 1]
+        for family in self.feature_families:
+            family_params = self.params[family]
+            windows += list(family_params.get("windows", []))
+            windows += list(family_params.get("window", []))
+        # One more bar for the price change into the first new bar
+        return max(windows) + 1
+
+    def _carry_ewm(self, values, key, start=0, seed=None, **ewm_params):
+        """
+        Exponentially weighted mean (adjust=False) that update() continues.
+
+        The recursion starts at position `start`, optionally with its first
+        value replaced by `seed`. In update mode it instead continues from
+        the last value stored under `key` by the previous run.
+
+        Returns:
+            pd.Series or pd.DataFrame: Same shape as `values`, NaN before the
+                start of the recursion
+        """
+        if self._update_start is not None:
+            start, seed = self._update_start - 1, self._state[key]
+        # Rows are set on NumPy arrays; row assignment through .iloc goes
+        # column by column, which is slow for panels with many tickers
+        recursive = values.iloc[start:]
+        if seed is not None:
+            seeded = recursive.to_numpy(dtype=np.float64, copy=True)
+            seeded[0] = np.asarray(seed)
+            recursive = _like(recursive, seeded)
+        recursive = recursive.ewm(adjust=False, **ewm_params).mean()
+        self._state[key] = recursive.iloc[-1]
+        if start == 0:
+            return recursive
+
+        result = np.full(values.shape, np.nan)
+        result[start:] = recursive.to_numpy()
+        return _like(values, result)
+
+    def _carry_cumsum(self, values, key):
+        """
+        Cumulative sum (skipping NaN like Series.cumsum) that update() continues.
+
+        In update mode the sum continues from the running total of the
+        previous run, and the tail bars get their previously computed values
+        so that windows over the cumulative sum can span both runs.
+        """
+        if self._update_start is None:
+            result = values.cumsum()
+            total = 0
+        else:
+            previous, total = self._state[key]
+            start = self._update_start
+            new = values.iloc[start:].cumsum() + total
+            result = pd.concat(
+                [pd.Series(previous[-start:], index=values.index[:start]), new]
+            )
+        valid = result.iloc[self._update_start or 0 :].dropna()
+        if not valid.empty:
+            total = valid.iloc[-1]
+        self._state[key] = (
+            result.iloc[-self._tail_length() :].to_numpy(),
+            total,
+        )
+        return result
+
+    def _intermediate_closure(self, family):
+        """Return the intermediates a family reads, including their inputs."""
+        keys = []
+        pending = list(
+            self.FAMILY_INTERMEDIATES[family](self.params.get(family, {}))
+        )
+        while pending:
+            key = pending.pop()
+            if key not in keys:
+                keys.append(key)
+                pending.extend(
+                    (name,) for name in self.INTERMEDIATES[key[0]][0]
+                )
+        return keys
+
+    def _plan_intermediates(self):
+        """Count how many of the selected families read each intermediate."""
+        remaining_uses = {}
+        for family in self.feature_families:
+            for key in self._intermediate_closure(family):
+                remaining_uses[key] = remaining_uses.get(key, 0) + 1
+        return remaining_uses
+
+    def _intermediate(self, df, name, *args):
+        """
+        Return a shared intermediate series, computing it on first use.
+
+        Args:
+            df (pd.DataFrame): Frame holding the OHLCV columns
+            name (str): Intermediate name, one of INTERMEDIATES
+            *args: Parameters of the intermediate (e.g. a window length)
+
+        Returns:
+            pd.Series: The intermediate values
+        """
+        key = (name,) + args
+        self.intermediate_stats["requested"] += 1
+        if key not in self._intermediates:
+            inputs, compute = self.INTERMEDIATES[name]
+            values = [self._intermediate(df, dep) for dep in inputs]
+            self._intermediates[key] = compute(self, df, *values, *args)
+            self.intermediate_stats["computed"] += 1
+        return self._intermediates[key]
+
+    def _family_columns(self, family):
+        """Return the names of the columns a feature family produces."""
+        p = self.params[family]
+        if family in ("sma", "ema"):
+            return [
+                name
+                for w in p["windows"]
+                for name in (f"{family}_{w}", f"{family}_{w}_rel")
+            ]
+        if family == "rsi":
+            return [f"rsi_{w}" for w in p["windows"]]
+        if family == "macd":
+            return [
+                f"macd_{fast}_{slow}_{signal}_{part}"
+                for fast in p["fast"]
+                for slow in p["slow"]
+                if fast < slow
+                for signal in p["signal"]
+                for part in ("line", "signal", "histogram")
+            ]
+        if family == "bollinger_bands":
+            return [
+                f"bb_{window}_{std_dev}_{part}"
+                for window in p["window"]
+                for std_dev in p["std_devs"]
+                for part in (
+                    "upper",
+                    "middle",
+                    "lower",
+                    "percent_b",
+                    "bandwidth",
+                )
+            ]
+        if family == "atr":
+            return [
+                name
+                for w in p["windows"]
+                for name in (f"atr_{w}", f"atr_{w}_pct")
+            ]
+        return [
+            name
+            for w in p["windows"]
+            for name in (f"volume_sma_{w}", f"volume_sma_{w}_ratio")
+        ] + ["obv", "obv_sma_10", "pvt", "mfi_14"]
+
+    def _start_feature_block(self, n_rows):
+        """Preallocate the feature block for the selected families."""
+        self._feature_columns = {}
+        for family in self.feature_families:
+            for name in self._family_columns(family):
+                self._feature_columns.setdefault(
+                    name, len(self._feature_columns)
+                )
+        # Column-major so that each feature column is contiguous
+        self._feature_block = np.full(
+            (n_rows, len(self._feature_columns)),
+            np.nan,
+            dtype=self.dtype,
+            order="F",
+        )
+        # Columns that keep their own dtype (e.g. integer OBV)
+        self._typed_features = {}
+
+    def _set_feature(self, name, values):
+        """Write one feature column into the block."""
+        values = values.to_numpy() if hasattr(values, "to_numpy") else values
+        if self.panel:
+            values = self._to_long(values)
+        if values.dtype.kind in "iub":
+            self._typed_features[name] = values
+        else:
+            self._feature_block[:, self._feature_columns[name]] = values
+
+    def _assemble_feature_block(self, df):
+        """Join the OHLCV columns and the feature block into one DataFrame."""
+        block, index, rows = self._feature_block, df.index, slice(None)
+        if self.panel:
+            index = self._panel_index
+            if self._panel_rows is not None:
+                rows = self._panel_rows
+                block = block[rows]
+            fields = list(dict.fromkeys(df.columns.get_level_values(0)))
+            df = pd.DataFrame(
+                {
+                    field: self._to_long(df[field].to_numpy())[rows]
+                    for field in fields
+                },
+                index=index,
+            )
+        features = pd.DataFrame(
+            block,
+            index=index,
+            columns=list(self._feature_columns),
+            copy=False,
+        )
+        for name, values in self._typed_features.items():
+            features[name] = values[rows]
+        self._feature_block = None
+        self._typed_features = {}
+
+        base = df.drop(columns=features.columns.intersection(df.columns))
+        return pd.concat([base, features], axis=1)
+
     def _add_sma_features(self, df):
         """Add Simple Moving Average features."""
         windows = self.params["sma"]["windows"]
         for window in windows:
             col_name = f"sma_{window}"
-            df[col_name] = (
-                df["Close"].rolling(window=window).mean().astype(self.dtype)
+            sma = self._intermediate(df, "close_sma", window).astype(
+                self.dtype
             )
+            self._set_feature(col_name, sma)
             # Add SMA relative to close price (normalized) as a percentage
-            df[f"{col_name}_rel"] = (
-                (df["Close"] / df[col_name]) - 1.0
-            ).astype(self.dtype)
-        return df
+            self._set_feature(
+                f"{col_name}_rel",
+                ((df["Close"] / sma) - 1.0).astype(self.dtype),
+            )
 
     def _add_ema_features(self, df):
         """Add Exponential Moving Average features."""
         windows = self.params["ema"]["windows"]
         for window in windows:
             col_name = f"ema_{window}"
-            df[col_name] = (
-                df["Close"]
-                .ewm(span=window, adjust=False)
-                .mean()
-                .astype(self.dtype)
+            ema = self._intermediate(df, "close_ema", window).astype(
+                self.dtype
             )
+            self._set_feature(col_name, ema)
             # Add EMA relative to close price (normalized) as a percentage
-            df[f"{col_name}_rel"] = (
-                (df["Close"] / df[col_name]) - 1.0
-            ).astype(self.dtype)
-        return df
+            self._set_feature(
+                f"{col_name}_rel",
+                ((df["Close"] / ema) - 1.0).astype(self.dtype),
+            )
 
     def _add_rsi_features(self, df):
-        """Add Relative Strength Index features."""
+        """
+        Add Relative Strength Index features.
+
+        Price changes, gains and losses are computed once and shared by all
+        windows. Wilder's smoothing is the recursive filter
+        avg[i] = (avg[i - 1] * (window - 1) + value[i]) / window, seeded with
+        the simple average of the first `window` changes; it is evaluated with
+        pandas' compiled exponentially weighted mean (alpha = 1 / window) on
+        gains and losses together.
+        """
         windows = self.params["rsi"]["windows"]
-        for window in windows:
-            # Calculate daily price changes
-            delta = df["Close"].diff()
-
-            # Separate gains and losses
-            gain = delta.where(delta > 0, 0).astype(self.dtype)
-            loss = -delta.where(delta < 0, 0).astype(self.dtype)
-
-            # Calculate average gain and loss using Wilder's smoothing
-            # First values are simple averages
-            avg_gain = gain.rolling(window=window).mean()
-            avg_loss = loss.rolling(window=window).mean()
-
-            # Get the first valid (non-NaN) values as seed values
-            first_valid_idx = window
-            if len(avg_gain.dropna()) > 0 and len(avg_loss.dropna()) > 0:
-                seed_avg_gain = avg_gain.iloc[first_valid_idx]
-                seed_avg_loss = avg_loss.iloc[first_valid_idx]
-
-                # Create series for Wilder's smoothing
-                rsi_gain = pd.Series(index=df.index, dtype=self.dtype)
-                rsi_loss = pd.Series(index=df.index, dtype=self.dtype)
-
-                # Set seed values
-                rsi_gain.iloc[first_valid_idx] = np.float32(seed_avg_gain)
-                rsi_loss.iloc[first_valid_idx] = np.float32(seed_avg_loss)
-
-                # Calculate the EMA of the gain and loss
-                for i in range(window, len(df)):
-                    rsi_gain.iloc[i] = np.float32(
-                        (rsi_gain.iloc[i - 1] * (window - 1) + gain.iloc[i])
-                        / window
-                    )
-                    rsi_loss.iloc[i] = np.float32(
-                        (rsi_loss.iloc[i - 1] * (window - 1) + loss.iloc[i])
-                        / window
-                    )
 
-                # Calculate RS and RSI using Wilder's smoothed values
-                rs = rsi_gain / rsi_loss
-                rsi = 100 - (100 / (1 + rs))
+        # Separate gains and losses of the shared price changes once
+        delta = self._intermediate(df, "close_diff")
+        gain = delta.where(delta > 0, 0).astype(self.dtype)
+        loss = -delta.where(delta < 0, 0).astype(self.dtype)
+        gains_losses = pd.concat(
+            [gain, loss], axis=1, keys=["gain", "loss"]
+        ).astype(np.float64)
 
-                df[f"rsi_{window}"] = rsi.astype(self.dtype)
-            else:
-                # Fallback to original method if we don't have enough data
+        for window in windows:
+            if len(df) <= window:
+                # Fallback to the simple method if we don't have enough data
                 logger.warning(
                     f"Not enough data to calculate RSI with window={window} using Wilder's method. Falling back to simple method."
                 )
+                avg_gain = gain.rolling(window=window).mean()
+                avg_loss = loss.rolling(window=window).mean()
                 rs = avg_gain / avg_loss
-                df[f"rsi_{window}"] = (100 - (100 / (1 + rs))).astype(
-                    self.dtype
+                self._set_feature(
+                    f"rsi_{window}",
+                    (100 - (100 / (1 + rs))).astype(self.dtype),
                 )
+                continue
+
+            # Seed with the simple average of the first `window` changes,
+            # then apply Wilder's smoothing from the seed bar onwards
+            smoothed = self._carry_ewm(
+                gains_losses,
+                ("rsi", window),
+                start=window,
+                seed=gains_losses.iloc[1 : window + 1].mean(),
+                alpha=1.0 / window,
+            )
 
-        return df
+            # Calculate RS and RSI using Wilder's smoothed values
+            rs = smoothed["gain"] / smoothed["loss"]
+            rsi = 100 - (100 / (1 + rs))
+
+            self._set_feature(f"rsi_{window}", rsi.astype(self.dtype))
 
     def _add_macd_features(self, df):
         """Add Moving Average Convergence Divergence features."""
@@ -364,35 +862,34 @@ class FeatureFactory:
 
                 for signal in self.params["macd"]["signal"]:
                     # Calculate MACD components
-                    fast_ema = df["Close"].ewm(span=fast, adjust=False).mean()
-                    slow_ema = df["Close"].ewm(span=slow, adjust=False).mean()
+                    fast_ema = self._intermediate(df, "close_ema", fast)
+                    slow_ema = self._intermediate(df, "close_ema", slow)
 
                     # MACD Line
                     macd_line = (fast_ema - slow_ema).astype(self.dtype)
 
                     # Signal Line
-                    signal_line = (
-                        macd_line.ewm(span=signal, adjust=False)
-                        .mean()
-                        .astype(self.dtype)
-                    )
+                    signal_line = self._carry_ewm(
+                        macd_line,
+                        ("macd_signal", fast, slow, signal),
+                        span=signal,
+                    ).astype(self.dtype)
 
                     # MACD Histogram
                     histogram = (macd_line - signal_line).astype(self.dtype)
 
-                    # Add to dataframe
+                    # Add to the feature block
                     prefix = f"macd_{fast}_{slow}_{signal}"
-                    df[f"{prefix}_line"] = macd_line
-                    df[f"{prefix}_signal"] = signal_line
-                    df[f"{prefix}_histogram"] = histogram
-        return df
+                    self._set_feature(f"{prefix}_line", macd_line)
+                    self._set_feature(f"{prefix}_signal", signal_line)
+                    self._set_feature(f"{prefix}_histogram", histogram)
 
     def _add_bollinger_bands_features(self, df):
         """Add Bollinger Bands features."""
         for window in self.params["bollinger_bands"]["window"]:
             for std_dev in self.params["bollinger_bands"]["std_devs"]:
                 # Calculate middle band (SMA)
-                middle_band = df["Close"].rolling(window=window).mean()
+                middle_band = self._intermediate(df, "close_sma", window)
 
                 # Calculate standard deviation
                 std = df["Close"].rolling(window=window).std()
@@ -401,81 +898,84 @@ class FeatureFactory:
                 upper_band = (middle_band + (std * std_dev)).astype(self.dtype)
                 lower_band = (middle_band - (std * std_dev)).astype(self.dtype)
 
-                # Add bands to dataframe
+                # Add bands to the feature block
                 prefix = f"bb_{window}_{std_dev}"
-                df[f"{prefix}_upper"] = upper_band
-                df[f"{prefix}_middle"] = middle_band.astype(self.dtype)
-                df[f"{prefix}_lower"] = lower_band
+                self._set_feature(f"{prefix}_upper", upper_band)
+                self._set_feature(
+                    f"{prefix}_middle", middle_band.astype(self.dtype)
+                )
+                self._set_feature(f"{prefix}_lower", lower_band)
 
                 # Add %B indicator: (Price - Lower) / (Upper - Lower)
-                df[f"{prefix}_percent_b"] = (
-                    (df["Close"] - lower_band) / (upper_band - lower_band)
-                ).astype(self.dtype)
+                self._set_feature(
+                    f"{prefix}_percent_b",
+                    (
+                        (df["Close"] - lower_band) / (upper_band - lower_band)
+                    ).astype(self.dtype),
+                )
 
                 # Add bandwidth indicator: (Upper - Lower) / Middle
-                df[f"{prefix}_bandwidth"] = (
-                    (upper_band - lower_band) / middle_band
-                ).astype(self.dtype)
-        return df
+                self._set_feature(
+                    f"{prefix}_bandwidth",
+                    ((upper_band - lower_band) / middle_band).astype(
+                        self.dtype
+                    ),
+                )
 
     def _add_atr_features(self, df):
         """Add Average True Range features."""
-        for window in self.params["atr"]["windows"]:
-            # Calculate True Range
-            high_low = df["High"] - df["Low"]
-            high_close_prev = abs(df["High"] - df["Close"].shift(1))
-            low_close_prev = abs(df["Low"] - df["Close"].shift(1))
-
-            # True Range is the maximum of the three
-            tr = pd.concat(
-                [high_low, high_close_prev, low_close_prev], axis=1
-            ).max(axis=1)
+        # True Range is the maximum of high-low, |high - previous close| and
+        # |low - previous close|; it is shared by all windows
+        tr = self._intermediate(df, "true_range")
 
+        for window in self.params["atr"]["windows"]:
             # Calculate ATR
             atr = tr.rolling(window=window).mean().astype(self.dtype)
 
-            # Add to dataframe
-            df[f"atr_{window}"] = atr
+            # Add to the feature block
+            self._set_feature(f"atr_{window}", atr)
 
             # Add ATR as percentage of close price
-            df[f"atr_{window}_pct"] = (atr / df["Close"]).astype(self.dtype)
-        return df
+            self._set_feature(
+                f"atr_{window}_pct", (atr / df["Close"]).astype(self.dtype)
+            )
 
     def _add_volume_features(self, df):
         """Add Volume-based features."""
         # Volume moving averages
         for window in self.params["volume"]["windows"]:
-            df[f"volume_sma_{window}"] = (
+            volume_sma = (
                 df["Volume"].rolling(window=window).mean().astype(self.dtype)
             )
+            self._set_feature(f"volume_sma_{window}", volume_sma)
 
             # Volume relative to its moving average
-            df[f"volume_sma_{window}_ratio"] = (
-                df["Volume"] / df[f"volume_sma_{window}"]
-            ).astype(self.dtype)
-
-        # On-Balance Volume (OBV)
-        obv = pd.Series(0, index=df.index).astype(np.int64)
-
-        for i in range(1, len(df)):
-            if df["Close"].iloc[i] > df["Close"].iloc[i - 1]:
-                obv.iloc[i] = obv.iloc[i - 1] + df["Volume"].iloc[i]
-            elif df["Close"].iloc[i] < df["Close"].iloc[i - 1]:
-                obv.iloc[i] = obv.iloc[i - 1] - df["Volume"].iloc[i]
-            else:
-                obv.iloc[i] = obv.iloc[i - 1]
+            self._set_feature(
+                f"volume_sma_{window}_ratio",
+                (df["Volume"] / volume_sma).astype(self.dtype),
+            )
 
-        df["obv"] = obv
+        # On-Balance Volume (OBV): cumulative volume signed by the direction
+        # of the close-to-close move (unchanged closes contribute nothing)
+        direction = np.sign(self._intermediate(df, "close_diff"))
+        direction = direction.fillna(0).astype(np.int64)
+        obv = self._carry_cumsum(direction * df["Volume"], "obv")
+        self._set_feature("obv", obv)
 
         # OBV moving average
-        df["obv_sma_10"] = (
-            df["obv"].rolling(window=10).mean().astype(self.dtype)
+        self._set_feature(
+            "obv_sma_10", obv.rolling(window=10).mean().astype(self.dtype)
         )
 
         # Price-Volume Trend (PVT)
-        price_change_pct = df["Close"].pct_change(fill_method=None)
-        df["pvt"] = (
-            (price_change_pct * df["Volume"]).cumsum().astype(self.dtype)
+        price_change_pct = (
+            df["Close"] / self._intermediate(df, "prev_close") - 1
+        )
+        self._set_feature(
+            "pvt",
+            self._carry_cumsum(price_change_pct * df["Volume"], "pvt").astype(
+                self.dtype
+            ),
         )
 
         # Money Flow Index components
@@ -496,9 +996,9 @@ class FeatureFactory:
         negative_mf = negative_flow.rolling(window=period).sum()
 
         money_ratio = positive_mf / negative_mf
-        df["mfi_14"] = (100 - (100 / (1 + money_ratio))).astype(self.dtype)
-
-        return df
+        self._set_feature(
+            "mfi_14", (100 - (100 / (1 + money_ratio))).astype(self.dtype)
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""
+Deferred imports of heavy optional libraries.
+
+Streamlit, yfinance and the plotting libraries each take a large part of a
+second to import. The command-line tools only need them for some commands
+(e.g. a download or --plot), so modules import them through these helpers
+and the import happens the first time they are actually used.
+"""
+
+import functools
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """
+    Return a module that is imported on first attribute access.
+
+    The module is registered in sys.modules right away, so later imports of
+    it (and mock.patch targets through it) see the same module object.
+
+    Args:
+        name (str): Module name, e.g. "yfinance"
+
+    Returns:
+        module: The module, or its lazily loading placeholder
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def streamlit_cache_data(**cache_kwargs):
+    """
+    Decorator that applies st.cache_data only inside a Streamlit app.
+
+    Streamlit is not imported for this: Streamlit apps have imported it
+    before they call the function, and elsewhere (e.g. on the command line)
+    the function runs without the in-memory cache. The undecorated function
+    is available as `__wrapped__`.
+
+    Args:
+        **cache_kwargs: Arguments for st.cache_data (e.g. ttl)
+    """
+
+    def decorator(func):
+        cached = None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal cached
+            if cached is None:
+                if "streamlit" not in sys.modules:
+                    return func(*args, **kwargs)
+                cached = sys.modules["streamlit"].cache_data(**cache_kwargs)(
+                    func
+                )
+            return cached(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
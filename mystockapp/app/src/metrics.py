@@ -0,0 +1,241 @@
+"""
+Risk metrics of an equity curve.
+
+run_backtest, the portfolio backtest, the report printed by
+generate_backtest_report and the Streamlit app all describe a result with
+the same tear sheet, computed by risk_metrics from the bar-by-bar equity
+(and, for exposure, the positions held):
+- Return: total and annualized return
+- Risk: annualized volatility, max drawdown and its duration, ulcer index
+- Risk-adjusted return: Sharpe, Sortino and Calmar ratios
+- Exposure: share of the bars spent in the market
+
+The bar returns and the drawdown curve are computed once as NumPy arrays
+and every metric is a reduction over them, so a tear sheet of a million
+bars takes milliseconds. rolling_volatility gives the volatility over time
+for charts.
+
+tapp vendors this module as tapp/code/2025/simpler_st/tech_analysis/
+metrics.py, so that both projects report the same metrics. Its
+tests/test_metrics.py fails when the code of the two copies differs, so
+change both together.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Bars per year of daily data, used to annualize returns and volatility
+TRADING_DAYS_PER_YEAR = 252
+
+# Metrics returned by risk_metrics
+RISK_METRICS = (
+    "total_return_pct",
+    "annual_return_pct",
+    "annual_volatility_pct",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "calmar_ratio",
+    "max_drawdown",
+    "max_drawdown_duration",
+    "ulcer_index",
+    "exposure_pct",
+)
+
+
+def infer_periods_per_year(dates):
+    """
+    Estimate the number of bars per year from their timestamps.
+
+    Daily bars give TRADING_DAYS_PER_YEAR; intraday bars that many times
+    the usual number of bars per day; weekly or monthly bars the number of
+    such periods in a calendar year.
+
+    Args:
+        dates (pd.Index): Timestamps of the bars
+
+    Returns:
+        float: Bars per year
+    """
+    dates = pd.DatetimeIndex(dates)
+    if len(dates) < 2:
+        return float(TRADING_DAYS_PER_YEAR)
+    step_days = (dates[1:] - dates[:-1]).median() / pd.Timedelta(days=1)
+    if step_days < 1:
+        bars_per_day = np.median(dates.normalize().value_counts().to_numpy())
+        return float(TRADING_DAYS_PER_YEAR * bars_per_day)
+    if step_days <= 4:
+        # Daily bars, with weekends and holidays in between
+        return float(TRADING_DAYS_PER_YEAR)
+    return 365.25 / step_days
+
+
+def bar_returns(equity, initial_value=None):
+    """
+    Simple returns from one bar's equity to the next.
+
+    A bar that starts from zero or negative equity has no meaningful
+    return and counts as 0.
+
+    Args:
+        equity (array-like): Equity at the end of each bar
+        initial_value (float, optional): Equity before the first bar; if
+            given, the first return is measured from it
+
+    Returns:
+        np.ndarray: One return per bar (per bar after the first without
+            `initial_value`)
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    if initial_value is not None:
+        equity = np.concatenate(([initial_value], equity))
+    previous = equity[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.where(previous > 0, np.diff(equity) / previous, 0.0)
+    return returns
+
+
+def drawdown_pct(equity):
+    """
+    Fall of the equity from its running peak, in percent (0 or negative).
+
+    Missing values are skipped when tracking the peak and stay missing.
+
+    Args:
+        equity (array-like): Equity at the end of each bar
+
+    Returns:
+        np.ndarray: Drawdown of each bar
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    running_max = np.fmax.accumulate(equity)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return ((equity - running_max) / running_max) * 100
+
+
+def rolling_volatility(
+    equity, window=21, periods_per_year=TRADING_DAYS_PER_YEAR
+):
+    """
+    Annualized volatility of the bar returns over a trailing window.
+
+    Args:
+        equity (array-like): Equity at the end of each bar
+        window (int): Number of returns in each window
+        periods_per_year (float): Bars per year
+
+    Returns:
+        np.ndarray: Volatility in percent for each bar, NaN until the first
+            full window
+
+    Raises:
+        ValueError: If the window is shorter than 2 returns
+    """
+    if window < 2:
+        raise ValueError("window must be at least 2")
+    returns = bar_returns(equity)
+    volatility = np.full(len(returns) + 1, np.nan)
+    if len(returns) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(returns, window)
+        volatility[window:] = (
+            windows.std(axis=1, ddof=1) * np.sqrt(periods_per_year) * 100
+        )
+    return volatility
+
+
+def risk_metrics(
+    equity,
+    positions=None,
+    periods_per_year=TRADING_DAYS_PER_YEAR,
+    risk_free_rate=0.0,
+    initial_value=None,
+):
+    """
+    Compute the tear sheet of an equity curve.
+
+    Returns are measured from `initial_value` (or the first bar) to each
+    bar, drawdowns over the bars themselves. Ratios without any risk to
+    divide by (constant equity, no losing bar, no drawdown) are 0.0.
+
+    Args:
+        equity (array-like): Equity at the end of each bar
+        positions (array-like, optional): Position held at the end of each
+            bar; exposure is the share of bars with a non-zero position. NaN
+            without positions.
+        periods_per_year (float): Bars per year, used to annualize (see
+            infer_periods_per_year)
+        risk_free_rate (float): Annual risk-free rate, e.g. 0.05 for 5%,
+            subtracted from the returns of the Sharpe and Sortino ratios
+        initial_value (float, optional): Equity before the first bar
+
+    Returns:
+        dict: Metric name (see RISK_METRICS) -> float
+
+    Raises:
+        ValueError: If the equity curve is empty
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    if len(equity) == 0:
+        raise ValueError(
+            "Cannot compute risk metrics of an empty equity curve"
+        )
+    start = equity[0] if initial_value is None else float(initial_value)
+    returns = bar_returns(equity, initial_value)
+    drawdown = drawdown_pct(equity)
+
+    growth = equity[-1] / start if start > 0 else 1.0
+    total_return_pct = (growth - 1) * 100
+    if growth <= 0:
+        annual_return_pct = -100.0
+    elif len(returns):
+        with np.errstate(over="ignore"):
+            annual_return_pct = (
+                growth ** (periods_per_year / len(returns)) - 1
+            ) * 100
+    else:
+        annual_return_pct = 0.0
+
+    excess = returns - ((1 + risk_free_rate) ** (1 / periods_per_year) - 1)
+    volatility = returns.std(ddof=1) if len(returns) > 1 else 0.0
+    downside = (
+        np.sqrt(np.mean(np.minimum(excess, 0) ** 2)) if len(returns) else 0.0
+    )
+    annualizer = np.sqrt(periods_per_year)
+    sharpe_ratio = (
+        excess.mean() / volatility * annualizer if volatility > 0 else 0.0
+    )
+    sortino_ratio = (
+        excess.mean() / downside * annualizer if downside > 0 else 0.0
+    )
+
+    # Without any drawdown value (e.g. no equity at all) both are NaN
+    if np.isnan(drawdown).all():
+        max_drawdown = ulcer_index = np.nan
+    else:
+        max_drawdown = float(np.nanmin(drawdown))
+        ulcer_index = float(np.sqrt(np.nanmean(drawdown**2)))
+    calmar_ratio = (
+        annual_return_pct / abs(max_drawdown) if max_drawdown < 0 else 0.0
+    )
+    # Bars since the last peak; the longest such run is the duration
+    bars = np.arange(len(equity))
+    last_peak = np.maximum.accumulate(np.where(drawdown < 0, 0, bars))
+    max_drawdown_duration = int((bars - last_peak).max())
+
+    exposure_pct = (
+        np.count_nonzero(np.asarray(positions)) / len(positions) * 100
+        if positions is not None and len(positions)
+        else np.nan
+    )
+
+    return {
+        "total_return_pct": float(total_return_pct),
+        "annual_return_pct": float(annual_return_pct),
+        "annual_volatility_pct": float(volatility * annualizer * 100),
+        "sharpe_ratio": float(sharpe_ratio),
+        "sortino_ratio": float(sortino_ratio),
+        "calmar_ratio": float(calmar_ratio),
+        "max_drawdown": max_drawdown,
+        "max_drawdown_duration": max_drawdown_duration,
+        "ulcer_index": ulcer_index,
+        "exposure_pct": float(exposure_pct),
+    }
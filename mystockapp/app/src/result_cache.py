@@ -0,0 +1,230 @@
+"""
+Content-addressed cache for computed results (e.g. backtests).
+
+Results are stored under a key derived from the content of their inputs: a
+fingerprint of the input arrays and parameters, so identical inputs hit the
+cache wherever they come from (the CLI, the scanner or the Streamlit app).
+Unlike st.cache_data, the cache works without a Streamlit runtime and only
+hashes the arrays the computation reads rather than a whole DataFrame.
+
+- In memory, results are kept in a least-recently-used cache limited by the
+  number of entries and their total pickled size
+- Optionally, results are also written to a directory on disk (one pickle
+  file per key), which is shared between processes and runs. Only point it
+  at directories you trust, since loading a pickle can run code.
+
+Results are stored pickled, so every hit returns a fresh copy that callers
+may modify.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Default limits of the in-memory cache
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def fingerprint(*values):
+    """
+    Compute a key from the content of arrays and parameters.
+
+    Arrays are hashed by their dtype, shape and raw bytes. DatetimeIndexes
+    are hashed by their nanosecond timestamps and timezone, other pandas
+    objects by their values. Any other value (e.g. numbers and strings) is
+    hashed by its repr.
+
+    Args:
+        *values: NumPy arrays, pandas objects or parameters
+
+    Returns:
+        str: Hex digest identifying the values
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        if isinstance(value, pd.DatetimeIndex):
+            digest.update(str(value.tz).encode())
+            value = value.asi8
+        elif isinstance(value, (pd.Index, pd.Series)):
+            value = pd.util.hash_pandas_object(value, index=False).to_numpy()
+
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind == "O":
+                value = pd.util.hash_pandas_object(
+                    pd.Series(value), index=False
+                ).to_numpy()
+            value = np.ascontiguousarray(value)
+            digest.update(f"{value.dtype.str}{value.shape}".encode())
+            digest.update(memoryview(value).cast("B"))
+        else:
+            digest.update(repr(value).encode())
+        # Separate values so that ("ab", "c") and ("a", "bc") differ
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Least-recently-used result cache with an optional on-disk store."""
+
+    def __init__(
+        self,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        max_bytes=DEFAULT_MAX_BYTES,
+        cache_dir=None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of results kept in memory
+            max_bytes (int): Maximum total pickled size of the results kept
+                in memory; larger results are only stored on disk
+            cache_dir (str): Directory of the on-disk store, or None to keep
+                results in memory only
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError("Result cache limits must be positive.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _path(self, key):
+        """Return the path of the on-disk entry for `key`."""
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key, default=None):
+        """
+        Look up a result.
+
+        Args:
+            key (str): Key of the result, e.g. from fingerprint()
+            default: Value returned when the key is not cached
+
+        Returns:
+            A copy of the cached result, or `default`
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+
+        if payload is None and self.cache_dir is not None:
+            try:
+                with open(self._path(key), "rb") as f:
+                    payload = f.read()
+                self._remember(key, payload)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to read cached result {key}: {str(e)}")
+
+        if payload is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return pickle.loads(payload)
+
+    def put(self, key, value):
+        """
+        Store a result.
+
+        Args:
+            key (str): Key of the result, e.g. from fingerprint()
+            value: Picklable result
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, payload)
+
+        if self.cache_dir is not None:
+            # Write atomically, so other processes never read a partial file
+            path = self._path(key)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Failed to store result {key}: {str(e)}")
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def _remember(self, key, payload):
+        """Keep a pickled result in memory, evicting the least recently used."""
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = payload
+            self._size += len(payload)
+            while (
+                len(self._entries) > self.max_entries
+                or self._size > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self):
+        """Remove every result from memory and from the on-disk store."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.cache_dir is not None:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+
+# Cache shared by everything in this process
+_result_cache = ResultCache()
+
+
+def get_result_cache():
+    """Return the process-wide result cache."""
+    return _result_cache
+
+
+def configure_result_cache(
+    max_entries=DEFAULT_MAX_ENTRIES,
+    max_bytes=DEFAULT_MAX_BYTES,
+    cache_dir=None,
+):
+    """
+    Replace the process-wide result cache.
+
+    Takes the same arguments as ResultCache.
+
+    Returns:
+        ResultCache: The new cache
+    """
+    global _result_cache
+    _result_cache = ResultCache(
+        max_entries=max_entries, max_bytes=max_bytes, cache_dir=cache_dir
+    )
+    return _result_cache
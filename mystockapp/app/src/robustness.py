@@ -0,0 +1,293 @@
+"""
+Bootstrap robustness analysis of backtest results.
+
+A backtest is a single path through history, so its headline metrics say
+nothing about how much of the result is luck. This module resamples the
+result into thousands of alternative paths:
+1. Trade bootstrap: draw the net profit/loss of the completed trades with
+   replacement, in random order
+2. Block bootstrap: draw blocks of consecutive bar returns of the equity
+   curve, which keeps short-range dependence such as volatility clustering
+and reports confidence intervals of total return, max drawdown and profit
+factor over the simulated paths.
+
+Paths are simulated in batches as (paths x steps) NumPy matrices, and the
+batches are fanned out over a ProcessPoolExecutor. Every batch has its own
+seed spawned from the run's seed, so results only depend on the seed, not
+on the number of workers.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Resampling methods: name -> data the paths are built from
+BOOTSTRAP_METHODS = {
+    "trades": "net profit/loss of the completed trades",
+    "blocks": "blocks of bar returns of the equity curve",
+}
+
+# Metrics reported for every simulated path
+ROBUSTNESS_METRICS = ("total_return_pct", "max_drawdown", "profit_factor")
+
+
+def _path_metrics(equity):
+    """
+    Calculate the robustness metrics of a batch of equity paths.
+
+    Uses the same definitions as ``run_backtest``: max drawdown is the
+    largest fall from a running peak in percent, and profit factor is gross
+    profit over gross loss of the steps (1.0 without losses, 0.0 without
+    either).
+
+    Args:
+        equity (np.ndarray): Equity of shape (paths, steps + 1), starting
+            with the initial capital
+
+    Returns:
+        dict: Metric name -> np.ndarray with one value per path
+    """
+    running_max = np.maximum.accumulate(equity, axis=1)
+    max_drawdown = ((equity - running_max) / running_max).min(axis=1) * 100
+
+    pnl = np.diff(equity, axis=1)
+    gross_profit = np.where(pnl > 0, pnl, 0.0).sum(axis=1)
+    gross_loss = -np.where(pnl < 0, pnl, 0.0).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        profit_factor = np.where(
+            gross_loss > 0,
+            gross_profit / gross_loss,
+            np.where(gross_profit > 0, 1.0, 0.0),
+        )
+
+    return {
+        "total_return_pct": (equity[:, -1] / equity[:, 0] - 1) * 100,
+        "max_drawdown": max_drawdown,
+        "profit_factor": profit_factor,
+    }
+
+
+def _trade_paths(net_profit_loss, initial_capital, n_paths, rng):
+    """Equity paths of trades drawn with replacement from the trade P&L."""
+    draws = rng.integers(
+        0, len(net_profit_loss), (n_paths, len(net_profit_loss))
+    )
+    equity = np.empty((n_paths, len(net_profit_loss) + 1))
+    equity[:, 0] = initial_capital
+    np.cumsum(net_profit_loss[draws], axis=1, out=equity[:, 1:])
+    equity[:, 1:] += initial_capital
+    return equity
+
+
+def _block_paths(returns, initial_capital, n_paths, rng, block_size):
+    """Equity paths of blocks of consecutive returns (moving block bootstrap)."""
+    n_returns = len(returns)
+    block_size = min(block_size, n_returns)
+    n_blocks = -(-n_returns // block_size)
+    starts = rng.integers(0, n_returns - block_size + 1, (n_paths, n_blocks))
+    draws = (starts[:, :, np.newaxis] + np.arange(block_size)).reshape(
+        n_paths, -1
+    )[:, :n_returns]
+    equity = np.empty((n_paths, n_returns + 1))
+    equity[:, 0] = initial_capital
+    np.cumprod(1 + returns[draws], axis=1, out=equity[:, 1:])
+    equity[:, 1:] *= initial_capital
+    return equity
+
+
+def _simulate_batch(
+    method, values, initial_capital, n_paths, seed, block_size
+):
+    """
+    Simulate one batch of paths and return their metrics.
+
+    Runs in a worker process, so it only takes and returns arrays.
+    """
+    rng = np.random.default_rng(seed)
+    if method == "trades":
+        equity = _trade_paths(values, initial_capital, n_paths, rng)
+    else:
+        equity = _block_paths(
+            values, initial_capital, n_paths, rng, block_size
+        )
+    return _path_metrics(equity)
+
+
+def run_bootstrap(
+    results,
+    method="blocks",
+    n_simulations=10000,
+    block_size=20,
+    confidence=0.95,
+    seed=None,
+    batch_size=1000,
+    max_workers=None,
+):
+    """
+    Bootstrap the results of a backtest.
+
+    Args:
+        results (dict): Backtest results from run_backtest
+        method (str): Resampling method, one of BOOTSTRAP_METHODS:
+            'trades' resamples the net profit/loss of the completed trades,
+            'blocks' resamples blocks of bar returns of the portfolio values
+        n_simulations (int): Number of simulated paths
+        block_size (int): Bars per block for the 'blocks' method
+        confidence (float): Confidence level of the intervals (0-1)
+        seed (int): Seed of the random generator, for reproducible results
+        batch_size (int): Paths simulated per batch (one matrix per batch)
+        max_workers (int): Worker processes for the batches. None uses every
+            core; 1 runs the batches serially in this process.
+
+    Returns:
+        dict: Bootstrap results with the 'observed' metrics of the backtest,
+            a 'summary' DataFrame (one row per metric with the observed
+            value, mean, median and the confidence interval) and the metrics
+            of every path ('simulations')
+
+    Raises:
+        ValueError: If a parameter is invalid or there is too little data
+            to resample
+    """
+    if method not in BOOTSTRAP_METHODS:
+        raise ValueError(
+            f"Unknown bootstrap method: {method}. Valid options are: {list(BOOTSTRAP_METHODS)}"
+        )
+    if n_simulations <= 0:
+        raise ValueError("n_simulations must be positive")
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+
+    initial_capital = results["initial_capital"]
+    if initial_capital <= 0:
+        raise ValueError("initial_capital must be positive to bootstrap")
+
+    if method == "trades":
+        values = np.array(
+            [t["net_profit_loss"] for t in results["completed_trades"]],
+            dtype=np.float64,
+        )
+        if len(values) == 0:
+            raise ValueError("No completed trades to resample")
+        observed_equity = initial_capital + np.concatenate(
+            ([0.0], np.cumsum(values))
+        )
+    else:
+        if len(results["portfolio_values"]) == 0:
+            raise ValueError("No portfolio values to resample")
+        # The equity curve starts from the initial capital, so the first
+        # bar's trading costs are part of the resampled returns
+        observed_equity = np.concatenate(
+            ([initial_capital], results["portfolio_values"])
+        ).astype(np.float64)
+        values = observed_equity[1:] / observed_equity[:-1] - 1
+    observed = {
+        name: metric[0]
+        for name, metric in _path_metrics(observed_equity[np.newaxis]).items()
+    }
+
+    batch_sizes = [batch_size] * (n_simulations // batch_size)
+    if n_simulations % batch_size:
+        batch_sizes.append(n_simulations % batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(batch_sizes))
+    batch_args = [
+        (method, values, initial_capital, n_paths, batch_seed, block_size)
+        for n_paths, batch_seed in zip(batch_sizes, seeds)
+    ]
+
+    logger.info(
+        f"Running {n_simulations} bootstrap simulations of the "
+        f"{BOOTSTRAP_METHODS[method]} in {len(batch_args)} batches"
+    )
+
+    if max_workers == 1 or len(batch_args) == 1:
+        batch_metrics = [_simulate_batch(*args) for args in batch_args]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_simulate_batch, *args) for args in batch_args
+            ]
+            batch_metrics = [future.result() for future in futures]
+
+    simulations = pd.DataFrame(
+        {
+            name: np.concatenate([batch[name] for batch in batch_metrics])
+            for name in ROBUSTNESS_METRICS
+        }
+    )
+    tail = (1 - confidence) / 2 * 100
+    lower, median, upper = np.percentile(
+        simulations.to_numpy(), [tail, 50, 100 - tail], axis=0
+    )
+    summary = pd.DataFrame(
+        {
+            "observed": [observed[name] for name in ROBUSTNESS_METRICS],
+            "mean": simulations.mean().to_numpy(),
+            "median": median,
+            "lower": lower,
+            "upper": upper,
+        },
+        index=pd.Index(ROBUSTNESS_METRICS, name="metric"),
+    )
+
+    return {
+        "method": method,
+        "n_simulations": n_simulations,
+        "confidence": confidence,
+        "observed": observed,
+        "summary": summary,
+        "probability_of_loss": float(
+            (simulations["total_return_pct"] < 0).mean()
+        ),
+        "simulations": simulations,
+    }
+
+
+def generate_robustness_report(bootstrap_results, period_name):
+    """
+    Generate a human-readable report from bootstrap results.
+
+    Args:
+        bootstrap_results (dict): Results from run_bootstrap
+        period_name (str): Name of the period (e.g., 'In-Sample', 'Out-of-Sample')
+    """
+    if not bootstrap_results:
+        logger.error(
+            f"No bootstrap results to generate report for {period_name}"
+        )
+        return
+
+    summary = bootstrap_results["summary"]
+    confidence_pct = bootstrap_results["confidence"] * 100
+    labels = {
+        "total_return_pct": "Total Return (%)",
+        "max_drawdown": "Max Drawdown (%)",
+        "profit_factor": "Profit Factor",
+    }
+
+    print(f"\n{'=' * 50}")
+    print(f"--- {period_name} Bootstrap Report ---")
+    print(f"{'=' * 50}")
+    print(
+        f"Method: {BOOTSTRAP_METHODS[bootstrap_results['method']]} "
+        f"({bootstrap_results['n_simulations']} simulations)"
+    )
+    for name, label in labels.items():
+        row = summary.loc[name]
+        print(
+            f"{label}: observed {row['observed']:.2f}, median {row['median']:.2f}, "
+            f"{confidence_pct:g}% interval [{row['lower']:.2f}, {row['upper']:.2f}]"
+        )
+    print(
+        f"Probability of Loss: {bootstrap_results['probability_of_loss'] * 100:.1f}%"
+    )
+    print(f"{'=' * 50}")
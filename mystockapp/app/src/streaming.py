@@ -0,0 +1,172 @@
+"""
+Chunked feature generation and backtesting for long intraday histories.
+
+Years of minute bars with 60+ feature columns per bar do not fit in memory
+as one feature frame. run_chunked_backtest streams fixed-size blocks of bars
+through the pipeline of main.py instead:
+1. FeatureFactory: the first block goes through generate_features and every
+   later one through update, which carries the rolling windows and the
+   recursive indicators across block boundaries
+2. The strategy's generate_signals, with the last bars of the previous block
+   in front so that crossovers at a block boundary are seen
+3. StreamingBacktest, which carries cash, the open position and lots, and
+   the trade ledger from block to block
+
+Only one block of features is in memory at a time; what grows with the
+history is one portfolio value and timestamp per bar and the trade ledger.
+The results match a full in-memory run (see run_chunked_backtest).
+"""
+
+import logging
+
+import pandas as pd
+
+from src.backtester import StreamingBacktest
+from src.feature_factory import FeatureFactory
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Default number of bars per chunk (about a year of 1m bars)
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def iter_chunks(ohlcv, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Split OHLCV data into consecutive blocks of bars.
+
+    Args:
+        ohlcv (pd.DataFrame or iterable): One DataFrame, or an iterable of
+            consecutive DataFrames (e.g. from pd.read_csv(..., chunksize=N)),
+            which is passed through as it is
+        chunk_size (int): Bars per block when splitting a DataFrame
+
+    Yields:
+        pd.DataFrame: Consecutive blocks of bars
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive. Got: {chunk_size}")
+    if not isinstance(ohlcv, pd.DataFrame):
+        yield from ohlcv
+        return
+    for start in range(0, len(ohlcv), chunk_size):
+        yield ohlcv.iloc[start : start + chunk_size]
+
+
+def run_chunked_backtest(
+    ohlcv,
+    strategy,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    feature_families=None,
+    indicator_params=None,
+    use_float32=True,
+    initial_capital=100000.0,
+    commission_fixed=20.0,
+    commission_pct=0.0003,
+    slippage_pct=0.001,
+    position_size_pct=0.25,
+):
+    """
+    Generate features and signals and backtest them one chunk at a time.
+
+    The results are those of the full in-memory run
+
+        features = FeatureFactory(ohlcv, ...).generate_features(drop_na=False)
+        features = features.dropna(subset=["Close"] + required_features)
+        run_backtest(strategy.generate_signals(features), engine="array")
+
+    up to the rounding of the windowed features in FeatureFactory.update.
+    As in run_parameter_sweep, bars where the strategy's features have not
+    warmed up yet are dropped.
+
+    Args:
+        ohlcv (pd.DataFrame or iterable): OHLCV bars, as one DataFrame or as
+            consecutive DataFrames (see iter_chunks). Passing an iterable
+            keeps the raw bars out of memory too.
+        strategy (Strategy): Strategy generating the buy/sell signals
+        chunk_size (int): Bars per chunk when ohlcv is one DataFrame
+        feature_families (list): Feature families to generate, see
+            FeatureFactory. None generates all of them; passing only the
+            families the strategy needs saves time and memory.
+        indicator_params (dict): Indicator parameters, see FeatureFactory
+        use_float32 (bool): Whether to use float32 features
+        initial_capital, commission_fixed, commission_pct, slippage_pct,
+        position_size_pct: Backtest parameters, see ``run_backtest``
+
+    Returns:
+        dict: Backtest results and metrics as returned by run_backtest, plus
+            the number of chunks processed ('chunk_count')
+
+    Raises:
+        ValueError: If a parameter is invalid, a strategy feature is
+            missing or there are not enough bars for the features
+    """
+    backtest = StreamingBacktest(
+        initial_capital=initial_capital,
+        commission_fixed=commission_fixed,
+        commission_pct=commission_pct,
+        slippage_pct=slippage_pct,
+        position_size_pct=position_size_pct,
+    )
+    signal_columns = list(
+        dict.fromkeys(["Close"] + strategy.required_features())
+    )
+
+    factory = None
+    # Chunks held back until there are enough bars for generate_features
+    pending = []
+    # Last bars of the previous chunk that signals are compared with
+    previous = None
+    chunk_count = 0
+
+    for chunk in iter_chunks(ohlcv, chunk_size):
+        if chunk.empty:
+            continue
+        chunk_count += 1
+        if factory is None:
+            pending.append(chunk)
+            bars = pd.concat(pending) if len(pending) > 1 else chunk
+            candidate = FeatureFactory(
+                bars,
+                feature_families=feature_families,
+                indicator_params=indicator_params,
+                use_float32=use_float32,
+            )
+            if len(bars) < candidate.min_rows_needed():
+                continue
+            factory, pending = candidate, []
+            features = factory.generate_features(drop_na=False)
+        else:
+            features = factory.update(chunk)
+
+        missing = [col for col in signal_columns if col not in features]
+        if missing:
+            raise ValueError(
+                f"Missing required features for {strategy.name} strategy: {missing}"
+            )
+        features = features[signal_columns].dropna()
+        if features.empty:
+            continue
+
+        frame = (
+            features if previous is None else pd.concat([previous, features])
+        )
+        previous = frame.iloc[-strategy.signal_lookback :]
+        signals = strategy.generate_signals(frame)
+        backtest.update(signals.iloc[len(frame) - len(features) :])
+
+    if factory is None:
+        raise ValueError(
+            "Not enough bars for the selected feature calculations."
+        )
+    if backtest.n_bars == 0:
+        raise ValueError(
+            "No bars left after indicator warm-up. Not enough data for the strategy."
+        )
+
+    logger.info(
+        f"Chunked backtest processed {backtest.n_bars} bars in {chunk_count} chunks"
+    )
+    results = backtest.results()
+    results["chunk_count"] = chunk_count
+    return results
@@ -0,0 +1,350 @@
+"""
+Walk-forward optimization for trading strategies.
+
+This module extends the single in-sample/out-of-sample split used by main.py
+into a rolling analysis:
+1. Split the history into consecutive folds (anchored or sliding windows)
+2. Optimize strategy parameters on each in-sample slice with a parameter sweep
+3. Evaluate the best parameters on the following out-of-sample slice
+4. Stitch the out-of-sample equity curves into a single result
+
+Folds are independent of each other and are fanned out over a
+ProcessPoolExecutor.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.feature_factory import FeatureFactory
+from src.backtester import (
+    STRATEGY_REGISTRY,
+    run_backtest,
+    run_parameter_sweep,
+    _max_drawdown_pct,
+)
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Valid walk-forward window modes
+WALK_FORWARD_MODES = ("anchored", "sliding")
+
+
+def make_walk_forward_folds(
+    index, n_folds=5, mode="anchored", train_bars=None, test_bars=None
+):
+    """
+    Split a time index into walk-forward folds.
+
+    The last ``n_folds * test_bars`` bars are divided into consecutive
+    out-of-sample windows. Each fold trains on the bars before its split
+    point: all of them in 'anchored' mode, or the most recent ``train_bars``
+    in 'sliding' mode.
+
+    Args:
+        index (pd.Index): Time index of the data
+        n_folds (int): Number of out-of-sample windows
+        mode (str): 'anchored' or 'sliding'
+        train_bars (int): In-sample length for 'sliding' mode. Defaults to
+            the length of the first in-sample window.
+        test_bars (int): Out-of-sample length. Defaults to
+            ``len(index) // (n_folds + 1)``.
+
+    Returns:
+        list: One dict per fold with positional bounds ('train_start',
+            'split', 'test_end') and the matching dates
+
+    Raises:
+        ValueError: If the parameters do not leave room for the folds
+    """
+    if mode not in WALK_FORWARD_MODES:
+        raise ValueError(
+            f"Invalid walk-forward mode: {mode}. Valid options are: {WALK_FORWARD_MODES}"
+        )
+    if not isinstance(n_folds, int) or n_folds <= 0:
+        raise ValueError("n_folds must be a positive integer.")
+
+    n_bars = len(index)
+    if test_bars is None:
+        test_bars = n_bars // (n_folds + 1)
+    first_split = n_bars - n_folds * test_bars
+    if test_bars <= 0 or first_split <= 0:
+        raise ValueError(
+            f"Not enough data ({n_bars} bars) for {n_folds} walk-forward folds of {test_bars} bars."
+        )
+    if train_bars is None:
+        train_bars = first_split
+    if train_bars <= 0:
+        raise ValueError("train_bars must be positive.")
+
+    folds = []
+    for fold in range(n_folds):
+        split = first_split + fold * test_bars
+        test_end = split + test_bars
+        train_start = 0 if mode == "anchored" else max(0, split - train_bars)
+        folds.append(
+            {
+                "fold": fold,
+                "train_start": train_start,
+                "split": split,
+                "test_end": test_end,
+                "train_start_date": index[train_start],
+                "split_date": index[split],
+                "test_end_date": index[test_end - 1],
+            }
+        )
+    return folds
+
+
+def _run_walk_forward_fold(
+    data, fold, strategy, param_grid, backtest_params, rank_by
+):
+    """
+    Optimize on one in-sample slice and evaluate on its out-of-sample slice.
+
+    Runs in a worker process, so it only receives the rows the fold needs.
+
+    Args:
+        data (pd.DataFrame): OHLCV rows from the fold's train start to its
+            test end
+        fold (dict): Fold description from make_walk_forward_folds
+        strategy (str): Strategy name, one of STRATEGY_REGISTRY
+        param_grid (dict): Parameter grid for the in-sample sweep
+        backtest_params (dict): Keyword arguments for run_backtest
+        rank_by (str): Metric used to choose the best parameters
+
+    Returns:
+        dict: Fold description, chosen parameters, in-sample metrics of the
+            chosen parameters and the out-of-sample backtest results
+    """
+    split = fold["split"] - fold["train_start"]
+    in_sample = data.iloc[:split]
+
+    sweep = run_parameter_sweep(
+        in_sample,
+        strategy=strategy,
+        param_grid=param_grid,
+        rank_by=rank_by,
+        **backtest_params,
+    )
+    best = sweep.iloc[0]
+    best_params = {name: best[name] for name in param_grid}
+    best_params = {
+        name: value.item() if isinstance(value, np.generic) else value
+        for name, value in best_params.items()
+    }
+
+    # Indicators for the out-of-sample slice are computed over the whole
+    # fold so they are warmed up on its first bar. They only look backward,
+    # so no out-of-sample information leaks into earlier bars.
+    strat = STRATEGY_REGISTRY[strategy](**best_params)
+    indicator_params = strat.indicator_params()
+    features = FeatureFactory(
+        data,
+        feature_families=list(indicator_params),
+        indicator_params=indicator_params,
+    ).generate_features(drop_na=False)
+    signals = strat.generate_signals(features)
+    out_of_sample = signals.iloc[split:]
+
+    oos_results = run_backtest(
+        out_of_sample, engine="array", **backtest_params
+    )
+
+    return {
+        **fold,
+        "params": best_params,
+        "strategy_name": strat.name,
+        "in_sample_metrics": best.drop(["rank", "strategy"]).to_dict(),
+        "oos_results": oos_results,
+        "oos_equity": pd.Series(
+            oos_results["portfolio_values"], index=out_of_sample.index
+        ),
+    }
+
+
+def _stitch_equity_curves(fold_results, initial_capital):
+    """
+    Chain the out-of-sample equity curves of consecutive folds.
+
+    Each fold is backtested from ``initial_capital``; its curve is rescaled so
+    that it starts from the value the previous fold ended on.
+
+    Returns:
+        pd.Series: Stitched equity curve indexed by date
+    """
+    pieces = []
+    capital = initial_capital
+    for result in fold_results:
+        equity = result["oos_equity"].astype(np.float64)
+        scaled = equity / result["oos_results"]["initial_capital"] * capital
+        pieces.append(scaled)
+        capital = scaled.iloc[-1]
+    return pd.concat(pieces)
+
+
+def run_walk_forward(
+    ohlcv_data,
+    strategy="sma_crossover",
+    param_grid=None,
+    n_folds=5,
+    mode="anchored",
+    train_bars=None,
+    test_bars=None,
+    rank_by="total_return_pct",
+    max_workers=None,
+    initial_capital=100000.0,
+    commission_fixed=20.0,
+    commission_pct=0.0003,
+    slippage_pct=0.001,
+    position_size_pct=0.25,
+):
+    """
+    Run a walk-forward optimization over the whole history.
+
+    Args:
+        ohlcv_data (pd.DataFrame): DataFrame with OHLCV data
+        strategy (str): Strategy to optimize, one of STRATEGY_REGISTRY
+        param_grid (dict): Parameter grid for the in-sample sweeps. If None,
+            uses the strategy's default sweep grid.
+        n_folds (int): Number of out-of-sample windows
+        mode (str): 'anchored' (in-sample grows from the first bar) or
+            'sliding' (in-sample is a fixed-length window)
+        train_bars (int): In-sample length for 'sliding' mode
+        test_bars (int): Out-of-sample length
+        rank_by (str): Metric used to choose the best in-sample parameters
+        max_workers (int): Worker processes for the folds. None uses every
+            core; 1 runs the folds serially in this process.
+        initial_capital, commission_fixed, commission_pct, slippage_pct,
+        position_size_pct: Backtest parameters, see ``run_backtest``
+
+    Returns:
+        dict: Walk-forward results with the per-fold results ('folds'), the
+            chosen parameters per fold ('parameters'), the stitched
+            out-of-sample equity curve ('equity_curve') and its headline
+            metrics
+    """
+    if ohlcv_data is None or ohlcv_data.empty:
+        raise ValueError("Input DataFrame is None or empty.")
+    if strategy not in STRATEGY_REGISTRY:
+        raise ValueError(
+            f"Unknown strategy for walk-forward optimization: {strategy}. Valid options are: {list(STRATEGY_REGISTRY)}"
+        )
+    if param_grid is None:
+        param_grid = STRATEGY_REGISTRY[strategy].default_grid
+
+    folds = make_walk_forward_folds(
+        ohlcv_data.index,
+        n_folds=n_folds,
+        mode=mode,
+        train_bars=train_bars,
+        test_bars=test_bars,
+    )
+    backtest_params = {
+        "initial_capital": initial_capital,
+        "commission_fixed": commission_fixed,
+        "commission_pct": commission_pct,
+        "slippage_pct": slippage_pct,
+        "position_size_pct": position_size_pct,
+    }
+
+    logger.info(
+        f"Running {mode} walk-forward optimization for {strategy} with {n_folds} folds"
+    )
+
+    fold_args = [
+        (
+            ohlcv_data.iloc[fold["train_start"] : fold["test_end"]],
+            fold,
+            strategy,
+            param_grid,
+            backtest_params,
+            rank_by,
+        )
+        for fold in folds
+    ]
+    if max_workers == 1:
+        fold_results = [_run_walk_forward_fold(*args) for args in fold_args]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_run_walk_forward_fold, *args)
+                for args in fold_args
+            ]
+            fold_results = [future.result() for future in futures]
+
+    equity_curve = _stitch_equity_curves(fold_results, initial_capital)
+    final_value = equity_curve.iloc[-1]
+    parameters = pd.DataFrame(
+        [
+            {
+                "fold": r["fold"],
+                "split_date": r["split_date"],
+                "test_end_date": r["test_end_date"],
+                **r["params"],
+                "oos_return_pct": r["oos_results"]["total_return_pct"],
+            }
+            for r in fold_results
+        ]
+    )
+
+    results = {
+        "strategy": strategy,
+        "mode": mode,
+        "initial_capital": initial_capital,
+        "final_value": final_value,
+        "total_return_pct": ((final_value / initial_capital) - 1) * 100,
+        "max_drawdown": _max_drawdown_pct(equity_curve.to_numpy()),
+        "num_trades": sum(
+            r["oos_results"]["num_trades"] for r in fold_results
+        ),
+        "start_date": fold_results[0]["oos_results"]["start_date"],
+        "end_date": fold_results[-1]["oos_results"]["end_date"],
+        "equity_curve": equity_curve,
+        "parameters": parameters,
+        "folds": fold_results,
+    }
+
+    logger.info(
+        f"Walk-forward completed. Stitched out-of-sample return: {results['total_return_pct']:.2f}%"
+    )
+    return results
+
+
+def generate_walk_forward_report(results):
+    """
+    Generate a human-readable report from walk-forward results.
+
+    Args:
+        results (dict): Results from run_walk_forward
+    """
+    if not results:
+        logger.error("No walk-forward results to generate report for")
+        return
+
+    print(f"\n{'=' * 50}")
+    print(
+        f"--- Walk-Forward Report ({results['mode']}, {len(results['folds'])} folds) ---"
+    )
+    print(f"{'=' * 50}")
+    for fold in results["folds"]:
+        oos = fold["oos_results"]
+        print(
+            f"Fold {fold['fold'] + 1}: {oos['start_date'].date()} to {oos['end_date'].date()} | "
+            f"{fold['strategy_name']} | "
+            f"In-Sample Return: {fold['in_sample_metrics']['total_return_pct']:.2f}% | "
+            f"Out-of-Sample Return: {oos['total_return_pct']:.2f}%"
+        )
+    print(f"{'-' * 50}")
+    print(
+        f"Out-of-Sample Period: {results['start_date'].date()} to {results['end_date'].date()}"
+    )
+    print(f"Initial Capital: ${results['initial_capital']:,.2f}")
+    print(f"Final Portfolio Value: ${results['final_value']:,.2f}")
+    print(f"Total Return: {results['total_return_pct']:.2f}%")
+    print(f"Max Drawdown: {results['max_drawdown']:.2f}%")
+    print(f"Number of Trades (Buy Txns): {results['num_trades']}")
+    print(f"{'=' * 50}")
@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import patch
 
+from src.result_cache import get_result_cache
+
 
 def passthrough_decorator(func=None, **kwargs):
     """A decorator that does nothing but return the original function."""
@@ -13,11 +15,14 @@ def passthrough_decorator(func=None, **kwargs):
 def mock_streamlit_cache():
     """Mocks streamlit.cache_data to be a pass-through decorator for all tests."""
     try:
-        with patch("src.backtester.st.cache_data", passthrough_decorator):
-            yield
-    except (AttributeError, ImportError):
-        try:
-            with patch("streamlit.cache_data", passthrough_decorator):
-                yield
-        except ImportError:
+        with patch("streamlit.cache_data", passthrough_decorator):
             yield
+    except ImportError:
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    """Start every test with an empty result cache (see src.result_cache)."""
+    get_result_cache().clear()
+    yield
@@ -0,0 +1,122 @@
+"""
+Test scenario: Array Engine Equivalence
+
+This test verifies that run_backtest(engine="array") returns exactly the same
+results as the reference row-by-row loop (engine="loop") across a range of
+signal patterns, price dtypes and cost settings.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import run_backtest
+
+
+def make_signal_data(n=500, seed=0, dtype=np.float64, signal_prob=0.05):
+    """Generate random prices with randomly placed buy/sell signals."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2020-01-01", periods=n, freq="B", tz="UTC")
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Close": close.astype(dtype),
+            "buy_signal": rng.random(n) < signal_prob,
+            "sell_signal": rng.random(n) < signal_prob,
+        },
+        index=dates,
+    )
+
+
+def assert_results_equal(expected, actual):
+    """Assert that two results dictionaries from run_backtest are identical."""
+    assert expected.keys() == actual.keys()
+    for key in expected:
+        if key in ("trades", "completed_trades"):
+            assert len(expected[key]) == len(actual[key]), key
+            for exp_trade, act_trade in zip(expected[key], actual[key]):
+                assert exp_trade == act_trade, key
+        elif key == "portfolio_values":
+            np.testing.assert_array_equal(
+                np.asarray(expected[key], dtype=np.float64),
+                np.asarray(actual[key], dtype=np.float64),
+            )
+        else:
+            assert expected[key] == actual[key], key
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_array_engine_matches_loop(dtype, seed):
+    """Both engines should produce identical results on random signals."""
+    df = make_signal_data(seed=seed, dtype=dtype)
+
+    expected = run_backtest(df, engine="loop")
+    actual = run_backtest(df, engine="array")
+
+    assert expected["num_trades"] > 0
+    assert_results_equal(expected, actual)
+
+
+@pytest.mark.parametrize(
+    "costs",
+    [
+        dict(commission_fixed=0.0, commission_pct=0.0, slippage_pct=0.0),
+        dict(commission_fixed=50.0, commission_pct=0.001, slippage_pct=0.01),
+    ],
+)
+def test_array_engine_matches_loop_with_costs(costs):
+    """Equivalence should hold for zero and high transaction costs."""
+    df = make_signal_data(seed=3, signal_prob=0.1)
+
+    expected = run_backtest(
+        df, initial_capital=50000.0, position_size_pct=0.5, **costs
+    )
+    actual = run_backtest(
+        df,
+        initial_capital=50000.0,
+        position_size_pct=0.5,
+        engine="array",
+        **costs,
+    )
+
+    assert_results_equal(expected, actual)
+
+
+def test_array_engine_matches_loop_with_skipped_trades():
+    """Skipped trades leave a gap in portfolio values; both engines must agree."""
+    df = make_signal_data(n=50, seed=4, signal_prob=0.3)
+
+    # A fixed commission larger than a sell's gross value skips that sell
+    expected = run_backtest(
+        df, initial_capital=1000.0, commission_fixed=200.0, engine="loop"
+    )
+    actual = run_backtest(
+        df, initial_capital=1000.0, commission_fixed=200.0, engine="array"
+    )
+
+    assert_results_equal(expected, actual)
+
+
+def test_array_engine_no_signals():
+    """With no signals the portfolio stays in cash for both engines."""
+    df = make_signal_data(n=100, signal_prob=0.0)
+
+    expected = run_backtest(df, engine="loop")
+    actual = run_backtest(df, engine="array")
+
+    assert actual["num_trades"] == 0
+    assert actual["portfolio_values"] == [100000.0] * len(df)
+    assert_results_equal(expected, actual)
+
+
+def test_unknown_engine_raises():
+    """An unknown engine name should be rejected like other invalid parameters."""
+    df = make_signal_data(n=20)
+
+    with pytest.raises(ValueError, match="Unknown backtest engine"):
+        run_backtest(df, engine="gpu")
@@ -0,0 +1,187 @@
+"""
+Test scenario: Batch Backtests Across Tickers, Strategies and Costs
+
+This test verifies that:
+- make_batch_jobs expands every ticker, strategy and cost setting
+- run_batch gives the results of backtesting each job on its own, the same
+  on a process pool as serially
+- Tickers without data are reported in the table instead of failing the batch
+- The results table is written as Parquet or CSV
+- main.py --batch runs a batch file end to end and validates --max-workers
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+import yaml
+from unittest.mock import patch
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import SMACrossoverStrategy, run_backtest
+from src.batch import make_batch_jobs, run_batch, write_batch_results
+from src.feature_factory import FeatureFactory
+from tests.test_bulk_fetch import FakeSource, make_ohlcv
+
+
+@pytest.fixture
+def split_date():
+    """A date in the middle of the generated history."""
+    return make_ohlcv("AAA.NS").index[400].strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def batch_config(tmp_path, split_date):
+    return {
+        "tickers": ["AAA.NS", "BBB.NS", "MISSING"],
+        "data": {"period": "2y", "cache_dir": str(tmp_path)},
+        "strategies": [
+            {"name": "sma_crossover", "fast_window": 10, "slow_window": 50},
+            {"name": "rsi", "rsi_window": 14},
+        ],
+        "costs": [
+            {"commission_fixed": 20.0},
+            {"commission_fixed": 0.0, "slippage_pct": 0.0},
+        ],
+        "backtest": {"split_date": split_date, "position_size_pct": 0.5},
+    }
+
+
+def test_make_batch_jobs(batch_config):
+    """One job per combination, with costs filled in from the defaults."""
+    jobs = make_batch_jobs(batch_config)
+
+    assert len(jobs) == 3 * 2 * 2
+    assert jobs[1] == {
+        "ticker": "AAA.NS",
+        "name": "sma_crossover",
+        "params": {"fast_window": 10, "slow_window": 50},
+        "costs": {
+            "commission_fixed": 0.0,
+            "commission_pct": 0.0003,
+            "slippage_pct": 0.0,
+            "position_size_pct": 0.5,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "change, message",
+    [
+        ({"tickers": []}, "no tickers"),
+        ({"strategies": [{"name": "momentum"}]}, "Unknown strategy"),
+        ({"strategies": [{"name": "rsi", "window": 3}]}, "Invalid parameters"),
+        ({"costs": [{"commission": 1.0}]}, "Unknown cost parameters"),
+    ],
+)
+def test_invalid_batch_config(batch_config, change, message):
+    with pytest.raises(ValueError, match=message):
+        make_batch_jobs({**batch_config, **change})
+
+
+def test_batch_matches_single_backtests(batch_config, split_date):
+    """Shared features give the results of each job run on its own."""
+    results = run_batch(
+        batch_config, max_workers=1, source=FakeSource(missing=["MISSING"])
+    )
+
+    assert len(results) == 3 * 2 * 2 * 2
+    ok = results[results["error"].isna()]
+    assert len(ok) == 2 * 2 * 2 * 2
+    assert (results.loc[results["ticker"] == "MISSING", "error"].notna()).all()
+
+    # One job, computed the way main.py computes a single run
+    data = make_ohlcv("AAA.NS")
+    strategy = SMACrossoverStrategy(fast_window=10, slow_window=50)
+    features = FeatureFactory(
+        data,
+        feature_families=["sma"],
+        indicator_params={"sma": {"windows": [10, 50]}},
+    ).generate_features(drop_na=False)
+    features = features.dropna(subset=["Close", "sma_10", "sma_50"])
+    out_of_sample = features[
+        features.index >= pd.Timestamp(split_date, tz="UTC")
+    ]
+    expected = run_backtest(
+        strategy.generate_signals(out_of_sample),
+        commission_fixed=20.0,
+        position_size_pct=0.5,
+    )
+
+    row = ok[
+        (ok["ticker"] == "AAA.NS")
+        & (ok["strategy"] == strategy.name)
+        & (ok["commission_fixed"] == 20.0)
+        & (ok["period"] == "out_of_sample")
+    ].iloc[0]
+    assert row["start_date"] == expected["start_date"]
+    assert row["num_trades"] == expected["num_trades"]
+    np.testing.assert_allclose(
+        row["total_return_pct"], expected["total_return_pct"]
+    )
+
+
+def test_process_pool_matches_serial(batch_config):
+    """Where the tickers run does not change the table."""
+    serial = run_batch(batch_config, max_workers=1, source=FakeSource())
+    parallel = run_batch(batch_config, max_workers=2, source=FakeSource())
+
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet"])
+def test_write_batch_results(batch_config, tmp_path, extension):
+    if extension == "parquet":
+        pytest.importorskip("pyarrow")
+    results = run_batch(batch_config, max_workers=1, source=FakeSource())
+
+    path = write_batch_results(
+        results, str(tmp_path / "out" / f"results.{extension}")
+    )
+
+    assert path.endswith(extension)
+    loaded = pd.read_csv(path) if extension == "csv" else pd.read_parquet(path)
+    assert len(loaded) == len(results)
+    np.testing.assert_allclose(
+        loaded["total_return_pct"], results["total_return_pct"]
+    )
+    with pytest.raises(ValueError, match="Unsupported batch output format"):
+        write_batch_results(results, str(tmp_path / "results.xlsx"))
+
+
+def test_main_batch_mode(batch_config, tmp_path):
+    """main.py --batch writes the results table of a batch file."""
+    import main
+
+    output = tmp_path / "batch.csv"
+    config_file = tmp_path / "batch.yaml"
+    config_file.write_text(
+        yaml.safe_dump({**batch_config, "output": {"path": str(output)}})
+    )
+
+    with patch("src.data_fetcher.YFinanceSource", FakeSource), patch(
+        "sys.argv",
+        ["main.py", "--batch", str(config_file), "--max-workers", "1"],
+    ):
+        results = main.main()
+
+    assert results is not None
+    assert len(pd.read_csv(output)) == len(results)
+
+
+def test_main_batch_mode_rejects_invalid_max_workers(batch_config, tmp_path):
+    """--max-workers is validated in batch mode too."""
+    import main
+
+    config_file = tmp_path / "batch.yaml"
+    config_file.write_text(yaml.safe_dump(batch_config))
+
+    with patch("main.run_batch") as mock_run_batch, patch(
+        "sys.argv",
+        ["main.py", "--batch", str(config_file), "--max-workers", "0"],
+    ):
+        assert main.main() is None
+
+    mock_run_batch.assert_not_called()
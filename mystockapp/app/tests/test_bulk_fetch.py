@@ -0,0 +1,189 @@
+"""
+Test scenario: Bulk Download of Ticker Universes
+
+This test verifies that fetch_stocks_data:
+- Downloads the tickers the cache cannot serve in grouped requests
+- Stores each ticker in the same cache as fetch_stock_data
+- Refreshes expired caches with requests for the missing bars only
+- Retries failed requests and reports tickers that have no data
+and that split_download separates a multi-ticker download per ticker.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+import threading
+from unittest.mock import patch
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.data_fetcher import fetch_stock_data, fetch_stocks_data
+from src.data_sources import DataSource, split_download
+
+TICKERS = ["AAA.NS", "BBB.NS", "CCC.NS", "DDD.NS", "EEE.NS", "FFF.NS", "GGG"]
+
+
+def make_ohlcv(ticker, end=None):
+    """Two years of daily bars for a ticker, ending today."""
+    if end is None:
+        end = pd.Timestamp.now(tz="Asia/Kolkata").normalize()
+    dates = pd.date_range(end=end, periods=730, freq="D", name="Date")
+    rng = np.random.default_rng(sum(map(ord, ticker)))
+    close = 100 + rng.normal(0, 1, len(dates)).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, len(dates)),
+        },
+        index=dates,
+    )
+
+
+class FakeSource(DataSource):
+    """Serves generated data and records every request."""
+
+    name = "fake"
+
+    def __init__(self, failures=0, missing=(), lag=0):
+        self.requests = []
+        self.failures = failures
+        self.missing = set(missing)
+        self.lag = lag
+        self.lock = threading.Lock()
+
+    def download(self, tickers, interval="1d", period=None, start=None):
+        with self.lock:
+            self.requests.append(
+                {"tickers": list(tickers), "period": period, "start": start}
+            )
+            if self.failures > 0:
+                self.failures -= 1
+                raise ConnectionError("Too many requests")
+        result = {}
+        for ticker in tickers:
+            if ticker in self.missing:
+                continue
+            data = make_ohlcv(ticker)
+            data = data.iloc[: len(data) - self.lag]
+            if start is not None:
+                data = data[data.index >= start]
+            result[ticker] = data
+        return result
+
+
+def test_grouped_requests_fill_cache(tmp_path):
+    """Tickers are downloaded in groups and then served from the cache."""
+    source = FakeSource()
+    results = fetch_stocks_data(
+        TICKERS, cache_dir=str(tmp_path), source=source, batch_size=3
+    )
+
+    assert list(results) == TICKERS
+    assert sorted(len(r["tickers"]) for r in source.requests) == [1, 3, 3]
+    assert all(r["period"] == "max" for r in source.requests)
+    for ticker in TICKERS:
+        pd.testing.assert_frame_equal(results[ticker], make_ohlcv(ticker))
+    assert len(os.listdir(tmp_path)) == 2 * len(TICKERS)
+
+    # The second call and fetch_stock_data are served by the cache
+    again = fetch_stocks_data(
+        TICKERS, period="1y", cache_dir=str(tmp_path), source=source
+    )
+    with patch("src.data_fetcher.yf.Ticker") as mock_ticker:
+        single = fetch_stock_data.__wrapped__(
+            "AAA.NS", period="1y", cache_dir=str(tmp_path)
+        )
+        mock_ticker.assert_not_called()
+
+    assert len(source.requests) == 3
+    pd.testing.assert_frame_equal(single, again["AAA.NS"], check_freq=False)
+
+
+def test_expired_caches_refreshed_from_last_bar(tmp_path):
+    """Expired caches download only the bars after their last bar."""
+    fetch_stocks_data(
+        TICKERS[:4], cache_dir=str(tmp_path), source=FakeSource(lag=2)
+    )
+    two_days_ago = pd.Timestamp.now().timestamp() - 2 * 86400
+    for name in os.listdir(tmp_path):
+        os.utime(tmp_path / name, (two_days_ago, two_days_ago))
+
+    source = FakeSource()
+    results = fetch_stocks_data(
+        TICKERS[:4], cache_dir=str(tmp_path), source=source
+    )
+
+    assert len(source.requests) == 1
+    request = source.requests[0]
+    assert sorted(request["tickers"]) == sorted(TICKERS[:4])
+    assert request["start"] == make_ohlcv("AAA.NS").index[-3]
+    for ticker in TICKERS[:4]:
+        pd.testing.assert_frame_equal(
+            results[ticker], make_ohlcv(ticker), check_freq=False
+        )
+
+
+def test_failed_requests_retried(tmp_path):
+    """Failed requests are retried; tickers without data map to None."""
+    source = FakeSource(failures=2, missing=["BBB.NS"])
+    results = fetch_stocks_data(
+        TICKERS[:3],
+        save_to_csv=False,
+        source=source,
+        retry_delay=0,
+    )
+
+    assert len(source.requests) == 3
+    assert results["BBB.NS"] is None
+    pd.testing.assert_frame_equal(results["AAA.NS"], make_ohlcv("AAA.NS"))
+
+
+def test_failed_refresh_returns_cached_data(tmp_path):
+    """When every attempt fails, expired caches are still returned."""
+    fetch_stocks_data(["AAA.NS"], cache_dir=str(tmp_path), source=FakeSource())
+    two_days_ago = pd.Timestamp.now().timestamp() - 2 * 86400
+    for name in os.listdir(tmp_path):
+        os.utime(tmp_path / name, (two_days_ago, two_days_ago))
+
+    results = fetch_stocks_data(
+        ["AAA.NS", "BBB.NS"],
+        cache_dir=str(tmp_path),
+        source=FakeSource(failures=10),
+        max_retries=1,
+        retry_delay=0,
+    )
+
+    pd.testing.assert_frame_equal(
+        results["AAA.NS"], make_ohlcv("AAA.NS"), check_freq=False
+    )
+    assert results["BBB.NS"] is None
+
+
+def test_invalid_arguments():
+    """Invalid arguments and sources without download are rejected."""
+    with pytest.raises(ValueError, match="Invalid period"):
+        fetch_stocks_data(TICKERS, period="1w", source=FakeSource())
+    with pytest.raises(ValueError, match="Batch size must be positive"):
+        fetch_stocks_data(TICKERS, batch_size=0, source=FakeSource())
+    with pytest.raises(TypeError, match="download"):
+        DataSource()
+
+
+def test_split_download():
+    """A joint download is split per ticker without non-trading rows."""
+    aaa = make_ohlcv("AAA.NS").iloc[-5:]
+    bbb = make_ohlcv("BBB.NS").iloc[-5:].copy()
+    bbb.iloc[2] = np.nan
+    joint = pd.concat({"AAA.NS": aaa, "BBB.NS": bbb}, axis=1)
+
+    frames = split_download(joint, ["AAA.NS", "BBB.NS", "CCC.NS"])
+
+    assert list(frames) == ["AAA.NS", "BBB.NS"]
+    pd.testing.assert_frame_equal(frames["AAA.NS"], aaa, check_dtype=False)
+    assert frames["BBB.NS"].index.equals(bbb.index.delete(2))
+    assert split_download(aaa, ["AAA.NS"])["AAA.NS"] is not None
@@ -0,0 +1,164 @@
+"""
+Test scenario: On-Disk Data Cache Formats
+
+This test verifies that:
+- Every cache format round-trips OHLCV data with its dtypes and its
+  timezone-aware DatetimeIndex
+- Legacy CSV caches are converted once, keeping their modification time
+- Only files named like caches are converted when migrating a directory
+- fetch_stock_data writes and re-reads the configured cache format
+- A format whose libraries are missing falls back to CSV
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.data_cache import (
+    CACHE_BACKENDS,
+    get_cache_backend,
+    migrate_cache_dir,
+    migrate_csv_cache,
+)
+from src.data_fetcher import fetch_stock_data
+
+# Call the undecorated function so that the second call below reads the file
+# cache instead of Streamlit's in-memory cache
+fetch_uncached = fetch_stock_data.__wrapped__
+
+
+@pytest.fixture
+def ohlcv_data():
+    """OHLCV data with a timezone-aware index spanning a DST change."""
+    dates = pd.date_range(
+        "2023-03-01", periods=40, freq="B", tz="America/New_York", name="Date"
+    )
+    rng = np.random.default_rng(0)
+    close = 100 + rng.normal(0, 1, len(dates)).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, len(dates)),
+        },
+        index=dates,
+    )
+
+
+@pytest.mark.parametrize("cache_format", ["parquet", "feather"])
+def test_columnar_formats_round_trip(tmp_path, ohlcv_data, cache_format):
+    """Columnar formats return exactly the stored DataFrame."""
+    backend = get_cache_backend(cache_format)
+    path = backend.path(tmp_path, "TEST_1d_max")
+    backend.save(ohlcv_data, path)
+
+    assert path.endswith(f".{cache_format}")
+    pd.testing.assert_frame_equal(
+        backend.read(path), ohlcv_data, check_freq=False
+    )
+
+
+def test_feather_round_trip_unnamed_index(tmp_path, ohlcv_data):
+    """An unnamed index stays unnamed in the Feather format."""
+    data = ohlcv_data.rename_axis(None)
+    backend = get_cache_backend("feather")
+    path = backend.path(tmp_path, "TEST_1d_max")
+    backend.save(data, path)
+
+    pd.testing.assert_frame_equal(backend.read(path), data, check_freq=False)
+
+
+def test_invalid_cache_format():
+    """Unknown cache formats raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid cache format"):
+        get_cache_backend("xlsx")
+
+
+def test_missing_dependencies_fall_back_to_csv(caplog):
+    """Without pyarrow or fastparquet the Parquet format falls back to CSV."""
+    with patch("importlib.util.find_spec", return_value=None):
+        backend = get_cache_backend("parquet")
+
+    assert backend.name == "csv"
+    assert "needs pyarrow or fastparquet" in caplog.text
+
+
+def test_migrate_csv_cache(tmp_path, ohlcv_data):
+    """A CSV cache is converted to Parquet with its modification time."""
+    csv_path = os.path.join(tmp_path, "TEST_1d_max.csv")
+    ohlcv_data.to_csv(csv_path)
+    os.utime(csv_path, (1_600_000_000, 1_600_000_000))
+
+    new_path = migrate_csv_cache(csv_path, get_cache_backend("parquet"))
+
+    assert not os.path.exists(csv_path)
+    assert os.path.getmtime(new_path) == 1_600_000_000
+    migrated = pd.read_parquet(new_path)
+    # Mixed UTC offsets (EST/EDT) in the CSV are normalized to UTC
+    assert isinstance(migrated.index, pd.DatetimeIndex)
+    assert migrated.index.equals(ohlcv_data.index.tz_convert("UTC"))
+    assert migrated["Volume"].dtype == np.int64
+    np.testing.assert_allclose(migrated["Close"], ohlcv_data["Close"])
+
+
+def test_migrate_cache_dir_only_converts_caches(tmp_path, ohlcv_data):
+    """Exported CSV files in the cache directory are left alone."""
+    ohlcv_data.to_csv(os.path.join(tmp_path, "AAPL_1d_max.csv"))
+    ohlcv_data.to_csv(os.path.join(tmp_path, "RELIANCE_NS_1wk_5y.csv"))
+    ohlcv_data.to_csv(os.path.join(tmp_path, "stock_features.csv"))
+
+    migrated = migrate_cache_dir(tmp_path, "feather")
+
+    assert sorted(os.path.basename(p) for p in migrated) == [
+        "AAPL_1d_max.feather",
+        "RELIANCE_NS_1wk_5y.feather",
+    ]
+    assert sorted(os.listdir(tmp_path)) == [
+        "AAPL_1d_max.feather",
+        "RELIANCE_NS_1wk_5y.feather",
+        "stock_features.csv",
+    ]
+
+
+@pytest.mark.parametrize("cache_format", list(CACHE_BACKENDS))
+def test_fetch_stock_data_uses_cache_format(
+    tmp_path, ohlcv_data, cache_format
+):
+    """The first call downloads and caches, the second reads the cache."""
+    with patch("src.data_fetcher.yf.Ticker") as mock_ticker:
+        mock_ticker_instance = MagicMock()
+        mock_ticker_instance.history.return_value = ohlcv_data
+        mock_ticker.return_value = mock_ticker_instance
+
+        first = fetch_uncached(
+            "TEST.NS", cache_dir=str(tmp_path), cache_format=cache_format
+        )
+        second = fetch_uncached(
+            "TEST.NS", cache_dir=str(tmp_path), cache_format=cache_format
+        )
+
+    assert mock_ticker_instance.history.call_count == 1
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        ["TEST_NS_1d.json", f"TEST_NS_1d.{cache_format}"]
+    )
+    pd.testing.assert_frame_equal(first, ohlcv_data)
+    assert len(second) == len(ohlcv_data)
+    if cache_format != "csv":
+        pd.testing.assert_frame_equal(second, ohlcv_data, check_freq=False)
+
+
+def test_fetch_stock_data_invalid_cache_format(tmp_path):
+    """An invalid cache format is reported like other invalid arguments."""
+    assert (
+        fetch_stock_data(
+            "TEST.NS", cache_dir=str(tmp_path), cache_format="xml"
+        )
+        is None
+    )
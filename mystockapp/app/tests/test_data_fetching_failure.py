@@ -262,6 +262,12 @@ def test_main_handles_none_result():
                     mock_args.no_cache = False
                     mock_args.debug = False
                     mock_args.verbose = False
+                    mock_args.cache_format = "parquet"
+                    mock_args.walk_forward = False
+                    mock_args.bootstrap = None
+                    mock_args.max_workers = None
+                    mock_args.batch = None
+                    mock_args.result_cache_dir = None
 
                     mock_parse_args.return_value = mock_args
 
@@ -0,0 +1,185 @@
+"""
+Test scenario: Incremental Refresh of the Data Cache
+
+This test verifies that fetch_stock_data:
+- Downloads only the bars after the last cached bar once the cache expires
+- Merges the new bars into the cache, replacing re-downloaded bars
+- Serves shorter periods from a longer cached history without downloading
+- Downloads the full period when the cache does not reach back far enough
+- Adopts per-period cache files written by earlier versions
+- Reads back CSV caches whose index crosses a daylight-saving change
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+import time
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.data_cache import get_cache_backend, read_cache_metadata
+from src.data_fetcher import fetch_stock_data
+
+# Call the undecorated function so that every call reaches the file cache
+fetch_uncached = fetch_stock_data.__wrapped__
+
+
+def make_ohlcv(start, periods, seed=0):
+    """Generate daily OHLCV data with a timezone-aware index."""
+    dates = pd.date_range(
+        start, periods=periods, freq="D", tz="Asia/Kolkata", name="Date"
+    )
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, periods).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, periods),
+        },
+        index=dates,
+    )
+
+
+@pytest.fixture
+def history():
+    """Two years of daily bars ending today."""
+    today = pd.Timestamp.now(tz="Asia/Kolkata").normalize()
+    return make_ohlcv(today - pd.Timedelta(days=729), 730)
+
+
+@pytest.fixture
+def mock_history():
+    """Patch yfinance and return the mocked Ticker.history."""
+    with patch("src.data_fetcher.yf.Ticker") as mock_ticker:
+        mock_ticker_instance = MagicMock()
+        mock_ticker.return_value = mock_ticker_instance
+        yield mock_ticker_instance.history
+
+
+def expire(tmp_path, key="TEST_NS_1d.parquet"):
+    """Make a cache file two days old."""
+    old = time.time() - 2 * 86400
+    os.utime(os.path.join(tmp_path, key), (old, old))
+
+
+def test_expired_cache_downloads_only_new_bars(
+    tmp_path, history, mock_history
+):
+    """An expired cache requests the bars since its last bar and merges them."""
+    cached, new = history.iloc[:-5], history.iloc[-6:].copy()
+    # The last cached bar was incomplete when it was downloaded
+    new.iloc[0, new.columns.get_loc("Close")] += 10
+
+    mock_history.return_value = cached
+    fetch_uncached("TEST.NS", period="max", cache_dir=str(tmp_path))
+    expire(tmp_path)
+
+    mock_history.return_value = new
+    result = fetch_uncached("TEST.NS", period="max", cache_dir=str(tmp_path))
+
+    mock_history.assert_called_with(start=cached.index[-1], interval="1d")
+    assert result.index.equals(history.index)
+    assert not result.index.has_duplicates
+    assert result["Close"].iloc[-6] == new["Close"].iloc[0]
+    assert read_cache_metadata(str(tmp_path), "TEST_NS_1d")["last_bar"] == (
+        history.index[-1].isoformat()
+    )
+
+    # The refreshed cache is fresh again
+    fetch_uncached("TEST.NS", period="max", cache_dir=str(tmp_path))
+    assert mock_history.call_count == 2
+
+
+def test_shorter_period_served_from_cache(tmp_path, history, mock_history):
+    """'1y' and 'max' share the same cached history."""
+    mock_history.return_value = history
+    fetch_uncached("TEST.NS", period="max", cache_dir=str(tmp_path))
+
+    result = fetch_uncached("TEST.NS", period="1y", cache_dir=str(tmp_path))
+
+    assert mock_history.call_count == 1
+    assert 364 <= len(result) <= 366
+    assert result.index[-1] == history.index[-1]
+    recent = fetch_uncached("TEST.NS", period="5d", cache_dir=str(tmp_path))
+    assert recent.index.equals(history.index[-5:])
+
+
+def test_longer_period_downloads_full_history(tmp_path, history, mock_history):
+    """A cache holding one year cannot serve 'max'."""
+    mock_history.return_value = history.iloc[-365:]
+    fetch_uncached("TEST.NS", period="1y", cache_dir=str(tmp_path))
+
+    mock_history.return_value = history
+    result = fetch_uncached("TEST.NS", period="max", cache_dir=str(tmp_path))
+
+    mock_history.assert_called_with(period="max", interval="1d")
+    pd.testing.assert_frame_equal(result, history)
+    assert (
+        read_cache_metadata(str(tmp_path), "TEST_NS_1d")["period_start"]
+        is None
+    )
+
+
+def test_legacy_period_cache_adopted(tmp_path, history, mock_history):
+    """A {ticker}_{interval}_{period} file becomes the ticker's cache."""
+    legacy_path = os.path.join(tmp_path, "TEST_NS_1d_max.parquet")
+    get_cache_backend("parquet").save(history, legacy_path)
+
+    result = fetch_uncached("TEST.NS", period="1y", cache_dir=str(tmp_path))
+
+    mock_history.assert_not_called()
+    assert not os.path.exists(legacy_path)
+    assert sorted(os.listdir(tmp_path)) == [
+        "TEST_NS_1d.json",
+        "TEST_NS_1d.parquet",
+    ]
+    assert result.index[-1] == history.index[-1]
+
+
+def test_failed_refresh_returns_cached_data(tmp_path, history, mock_history):
+    """The stale cache is returned when the refresh download fails."""
+    mock_history.return_value = history
+    fetch_uncached("TEST.NS", period="max", cache_dir=str(tmp_path))
+    expire(tmp_path)
+
+    mock_history.side_effect = ValueError("Invalid request")
+    result = fetch_uncached("TEST.NS", period="max", cache_dir=str(tmp_path))
+
+    pd.testing.assert_frame_equal(result, history, check_freq=False)
+
+
+def test_csv_cache_across_dst_change(tmp_path, mock_history):
+    """A New York index has two UTC offsets, which CSV stores as strings."""
+    today = pd.Timestamp.now().normalize()
+    history = make_ohlcv(today - pd.Timedelta(days=299), 300)
+    history.index = history.index.tz_localize(None).tz_localize(
+        "America/New_York"
+    )
+    cached, new = history.iloc[:-5], history.iloc[-6:]
+
+    mock_history.return_value = cached
+    fetch_uncached(
+        "TEST.NS", period="max", cache_dir=str(tmp_path), cache_format="csv"
+    )
+    hit = fetch_uncached(
+        "TEST.NS", period="max", cache_dir=str(tmp_path), cache_format="csv"
+    )
+    assert isinstance(hit.index, pd.DatetimeIndex)
+    # The mixed offsets come back as the same instants in UTC
+    assert hit.index.equals(cached.index.tz_convert("UTC"))
+
+    expire(tmp_path, "TEST_NS_1d.csv")
+    mock_history.return_value = new
+    result = fetch_uncached(
+        "TEST.NS", period="1y", cache_dir=str(tmp_path), cache_format="csv"
+    )
+
+    assert mock_history.call_count == 2
+    assert result is not None
+    assert result.index.equals(history.index.tz_convert("UTC"))
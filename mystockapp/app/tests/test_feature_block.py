@@ -0,0 +1,80 @@
+"""
+Test scenario: Feature Block Assembly
+
+This test verifies that the DataFrame returned by generate_features:
+- Keeps the OHLCV columns first, followed by the feature columns in family
+  order
+- Stores every float feature in the requested dtype (float32 by default)
+  while OBV stays an integer running total
+- Replaces feature columns that are already present in the input
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.feature_factory import FeatureFactory
+
+
+@pytest.fixture
+def ohlcv_data():
+    """Generate random-walk OHLCV data."""
+    rng = np.random.default_rng(1)
+    n = 300
+    dates = pd.date_range(start="2021-01-01", periods=n, freq="B")
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, n),
+        },
+        index=dates,
+    )
+
+
+@pytest.mark.parametrize("use_float32", [True, False])
+def test_feature_columns_and_dtypes(ohlcv_data, use_float32):
+    """Every family's columns are present, in order, with the right dtype."""
+    features = FeatureFactory(
+        ohlcv_data, use_float32=use_float32
+    ).generate_features(drop_na=False)
+
+    expected_dtype = np.float32 if use_float32 else np.float64
+    feature_columns = list(features.columns[5:])
+    assert list(features.columns[:5]) == list(ohlcv_data.columns)
+    assert feature_columns[:2] == ["sma_5", "sma_5_rel"]
+    assert feature_columns[-4:] == ["obv", "obv_sma_10", "pvt", "mfi_14"]
+    assert not features.columns.has_duplicates
+
+    for column in feature_columns:
+        if column == "obv":
+            assert features[column].dtype == np.int64
+        else:
+            assert features[column].dtype == expected_dtype, column
+
+
+def test_existing_feature_columns_are_replaced(ohlcv_data):
+    """Generating features on a frame that already has them replaces them."""
+    factory_kwargs = dict(
+        feature_families=["sma", "rsi"],
+        indicator_params={"sma": {"windows": [10]}, "rsi": {"windows": [14]}},
+    )
+    first = FeatureFactory(ohlcv_data, **factory_kwargs).generate_features(
+        drop_na=False
+    )
+    stale = first.copy()
+    stale["sma_10"] = 0.0
+
+    second = FeatureFactory(stale, **factory_kwargs).generate_features(
+        drop_na=False
+    )
+
+    assert not second.columns.has_duplicates
+    pd.testing.assert_frame_equal(first, second)
@@ -0,0 +1,108 @@
+"""
+Test scenario: Shared Feature Intermediates
+
+This test verifies that FeatureFactory:
+- Computes each shared intermediate (price changes, true range, moving
+  averages) once per generate_features run
+- Produces the same columns as computing every indicator from scratch
+- Releases the intermediates when the run is finished
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.feature_factory import FeatureFactory
+
+
+@pytest.fixture
+def ohlcv_data():
+    """Generate random-walk OHLCV data."""
+    rng = np.random.default_rng(3)
+    n = 400
+    dates = pd.date_range(start="2021-01-01", periods=n, freq="B")
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, n),
+        },
+        index=dates,
+    )
+
+
+def test_each_intermediate_is_computed_once(ohlcv_data):
+    """All families together compute every distinct intermediate once."""
+    factory = FeatureFactory(ohlcv_data)
+    factory.generate_features(drop_na=False)
+
+    params = FeatureFactory.DEFAULT_PARAMS
+    distinct = (
+        len(
+            set(params["sma"]["windows"])
+            | set(params["bollinger_bands"]["window"])
+        )
+        + len(
+            set(params["ema"]["windows"])
+            | set(params["macd"]["fast"])
+            | set(params["macd"]["slow"])
+        )
+        + 3  # close_diff, prev_close, true_range
+    )
+    assert factory.intermediate_stats["computed"] == distinct
+    assert (
+        factory.intermediate_stats["requested"]
+        > factory.intermediate_stats["computed"]
+    )
+    assert factory._intermediates == {}
+
+
+def test_shared_columns_match_direct_computation(ohlcv_data):
+    """Columns built from shared intermediates match direct pandas code."""
+    features = FeatureFactory(
+        ohlcv_data,
+        feature_families=["macd", "ema", "atr", "bollinger_bands"],
+        indicator_params={
+            "ema": {"windows": [12, 26]},
+            "macd": {"fast": [12], "slow": [26], "signal": [9]},
+            "atr": {"windows": [7, 14]},
+        },
+        use_float32=False,
+    ).generate_features(drop_na=False)
+
+    close = ohlcv_data["Close"]
+    fast = close.ewm(span=12, adjust=False).mean()
+    slow = close.ewm(span=26, adjust=False).mean()
+    pd.testing.assert_series_equal(features["ema_12"], fast, check_names=False)
+    pd.testing.assert_series_equal(
+        features["macd_12_26_9_line"], fast - slow, check_names=False
+    )
+
+    prev_close = close.shift(1)
+    tr = pd.concat(
+        [
+            ohlcv_data["High"] - ohlcv_data["Low"],
+            (ohlcv_data["High"] - prev_close).abs(),
+            (ohlcv_data["Low"] - prev_close).abs(),
+        ],
+        axis=1,
+    ).max(axis=1)
+    for window in (7, 14):
+        pd.testing.assert_series_equal(
+            features[f"atr_{window}"],
+            tr.rolling(window=window).mean(),
+            check_names=False,
+        )
+
+    pd.testing.assert_series_equal(
+        features["bb_20_2.0_middle"],
+        close.rolling(window=20).mean(),
+        check_names=False,
+    )
@@ -117,6 +117,12 @@ def test_main_timezone_handling_in_split(sample_timezone_naive_data):
             mock_args.position_size_pct = 0.25
             mock_args.drop_na_threshold = None
             mock_args.config = None
+            mock_args.cache_format = "parquet"
+            mock_args.walk_forward = False
+            mock_args.bootstrap = None
+            mock_args.max_workers = None
+            mock_args.batch = None
+            mock_args.result_cache_dir = None
             mock_parse_args.return_value = mock_args
 
             in_sample_data_captured_for_assertion = None
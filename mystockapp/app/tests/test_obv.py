@@ -0,0 +1,73 @@
+"""
+Test scenario: On-Balance Volume
+
+This test verifies that the OBV features produced by FeatureFactory:
+- Add volume on up closes, subtract it on down closes and carry the previous
+  value on unchanged closes
+- Keep integer volume as an exact int64 running total
+- Feed the 10-bar OBV moving average
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.feature_factory import FeatureFactory
+
+
+@pytest.fixture
+def ohlcv_data():
+    """Generate whole-number prices so that many closes are unchanged."""
+    rng = np.random.default_rng(9)
+    n = 300
+    dates = pd.date_range(start="2022-01-01", periods=n, freq="B")
+    close = np.round(100 + rng.normal(0, 1, n).cumsum())
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, n),
+        },
+        index=dates,
+    )
+
+
+def reference_obv(close, volume):
+    """Bar-by-bar On-Balance Volume."""
+    obv = [0]
+    for i in range(1, len(close)):
+        if close[i] > close[i - 1]:
+            obv.append(obv[-1] + volume[i])
+        elif close[i] < close[i - 1]:
+            obv.append(obv[-1] - volume[i])
+        else:
+            obv.append(obv[-1])
+    return np.array(obv, dtype=np.int64)
+
+
+def test_obv_matches_reference(ohlcv_data):
+    """OBV should equal the bar-by-bar running total exactly."""
+    features = FeatureFactory(
+        ohlcv_data, feature_families=["volume"]
+    ).generate_features(drop_na=False)
+
+    expected = reference_obv(
+        ohlcv_data["Close"].to_numpy(), ohlcv_data["Volume"].to_numpy()
+    )
+    assert (np.diff(ohlcv_data["Close"].to_numpy()) == 0).any()
+    assert features["obv"].dtype == np.int64
+    np.testing.assert_array_equal(features["obv"].to_numpy(), expected)
+
+    expected_sma = pd.Series(expected).rolling(window=10).mean()
+    np.testing.assert_allclose(
+        features["obv_sma_10"].to_numpy(dtype=np.float64),
+        expected_sma.to_numpy(),
+        rtol=1e-6,
+        equal_nan=True,
+    )
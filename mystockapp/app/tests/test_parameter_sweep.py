@@ -0,0 +1,138 @@
+"""
+Test scenario: Parameter Sweep
+
+This test verifies that run_parameter_sweep:
+- Produces the same metrics as running each combination through the
+  strategy classes and run_backtest individually
+- Skips invalid parameter combinations
+- Returns a table ranked by the requested metric
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import (
+    SMACrossoverStrategy,
+    RSIStrategy,
+    run_backtest,
+    run_parameter_sweep,
+)
+from src.feature_factory import FeatureFactory
+
+
+@pytest.fixture
+def ohlcv_data():
+    """Generate two years of random-walk OHLCV data."""
+    rng = np.random.default_rng(7)
+    n = 500
+    dates = pd.date_range(start="2020-01-01", periods=n, freq="B", tz="UTC")
+    close = 100 + rng.normal(0, 1.5, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close * (1 + rng.uniform(-0.01, 0.01, n)),
+            "High": close * (1 + rng.uniform(0, 0.02, n)),
+            "Low": close * (1 - rng.uniform(0, 0.02, n)),
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, n),
+        },
+        index=dates,
+    )
+
+
+def reference_result(ohlcv_data, strategy, family, windows, warmup):
+    """Run one strategy through FeatureFactory, generate_signals and run_backtest."""
+    features = FeatureFactory(
+        ohlcv_data,
+        feature_families=[family],
+        indicator_params={family: {"windows": windows}},
+    ).generate_features(drop_na=False)
+    features = features.iloc[warmup:].copy()
+    return run_backtest(strategy.generate_signals(features))
+
+
+def test_sma_sweep_matches_individual_backtests(ohlcv_data):
+    """Every row of the sweep should match an individual backtest."""
+    grid = {"fast_window": [5, 10, 20], "slow_window": [30, 50]}
+    results = run_parameter_sweep(
+        ohlcv_data, strategy="sma_crossover", param_grid=grid
+    )
+
+    assert len(results) == 6
+    for _, row in results.iterrows():
+        strategy = SMACrossoverStrategy(
+            fast_window=int(row["fast_window"]),
+            slow_window=int(row["slow_window"]),
+        )
+        # The sweep drops the warm-up of the longest window in the grid
+        expected = reference_result(
+            ohlcv_data, strategy, "sma", [5, 10, 20, 30, 50], warmup=49
+        )
+        assert row["num_trades"] == expected["num_trades"]
+        assert row["closed_trade_count"] == expected["closed_trade_count"]
+        assert row["total_return_pct"] == pytest.approx(
+            expected["total_return_pct"]
+        )
+        assert row["win_rate"] == pytest.approx(expected["win_rate"])
+        assert row["profit_factor"] == pytest.approx(expected["profit_factor"])
+        assert row["max_drawdown"] == pytest.approx(expected["max_drawdown"])
+
+
+def test_rsi_sweep_matches_individual_backtests(ohlcv_data):
+    """RSI sweeps should match individual backtests as well."""
+    grid = {
+        "rsi_window": [6, 14],
+        "oversold_threshold": [30, 40],
+        "overbought_threshold": [60, 70],
+    }
+    results = run_parameter_sweep(ohlcv_data, strategy="rsi", param_grid=grid)
+
+    assert len(results) == 8
+    for _, row in results.iterrows():
+        strategy = RSIStrategy(
+            rsi_window=int(row["rsi_window"]),
+            oversold_threshold=int(row["oversold_threshold"]),
+            overbought_threshold=int(row["overbought_threshold"]),
+        )
+        expected = reference_result(
+            ohlcv_data, strategy, "rsi", [6, 14], warmup=14
+        )
+        assert row["num_trades"] == expected["num_trades"]
+        assert row["total_return_pct"] == pytest.approx(
+            expected["total_return_pct"]
+        )
+
+
+def test_sweep_skips_invalid_combinations_and_ranks(ohlcv_data):
+    """Combinations with fast >= slow are skipped and rows are ranked."""
+    grid = {"fast_window": [10, 50], "slow_window": [20, 50]}
+    results = run_parameter_sweep(ohlcv_data, param_grid=grid)
+
+    # (50, 20) and (50, 50) are invalid
+    assert len(results) == 2
+    assert list(results["rank"]) == [1, 2]
+    assert results["total_return_pct"].is_monotonic_decreasing
+
+
+def test_sweep_rank_by_drawdown(ohlcv_data):
+    """Ranking can use any metric column, in either direction."""
+    grid = {"fast_window": [5, 10, 20], "slow_window": [30, 50]}
+    results = run_parameter_sweep(
+        ohlcv_data, param_grid=grid, rank_by="max_drawdown", ascending=False
+    )
+    assert results["max_drawdown"].is_monotonic_decreasing
+
+
+def test_sweep_invalid_inputs(ohlcv_data):
+    """Unknown strategies and grids with no valid combination raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        run_parameter_sweep(ohlcv_data, strategy="momentum")
+
+    with pytest.raises(ValueError, match="None of the"):
+        run_parameter_sweep(
+            ohlcv_data, param_grid={"fast_window": [50], "slow_window": [20]}
+        )
@@ -0,0 +1,223 @@
+"""
+Test scenario: Shared-Capital Portfolio Backtest
+
+This test verifies that run_portfolio_backtest:
+- Matches run_backtest for a single ticker whose buys never run out of cash
+- Draws every ticker's buys from one cash pool, splitting the cash pro rata
+  when the buys of a bar ask for more than is available
+- Lets the sells of a bar fund the buys of the same bar
+- Attributes the whole profit/loss to the tickers
+- Does not trade a ticker on bars without a price
+and that align_portfolio_signals aligns per-ticker signal DataFrames.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import (
+    align_portfolio_signals,
+    run_backtest,
+    run_portfolio_backtest,
+)
+
+# No commission or slippage, so cash flows are easy to check by hand
+NO_COSTS = {
+    "commission_fixed": 0.0,
+    "commission_pct": 0.0,
+    "slippage_pct": 0.0,
+}
+
+
+def make_signal_data(n=400, seed=0):
+    """Generate random prices with randomly placed buy/sell signals."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2020-01-01", periods=n, freq="B", tz="UTC")
+    close = 200 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Close": close,
+            "buy_signal": rng.random(n) < 0.08,
+            "sell_signal": rng.random(n) < 0.03,
+        },
+        index=dates,
+    )
+
+
+def frames(**columns):
+    """Build (close, buy, sell) frames from ticker=(close, buys, sells)."""
+    dates = pd.date_range(start="2023-01-02", periods=4, freq="B")
+    return tuple(
+        pd.DataFrame(
+            {ticker: values[k] for ticker, values in columns.items()},
+            index=dates,
+        )
+        for k in range(3)
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_single_ticker_matches_run_backtest(seed):
+    """One ticker that never runs out of cash trades exactly as run_backtest."""
+    df = make_signal_data(seed=seed)
+    expected = run_backtest(df, engine="array", position_size_pct=0.01)
+    close, buy_signals, sell_signals = align_portfolio_signals({"X": df})
+    actual = run_portfolio_backtest(
+        close, buy_signals, sell_signals, position_size_pct=0.01
+    )
+
+    assert actual["final_value"] == expected["final_value"]
+    assert actual["num_trades"] == expected["num_trades"]
+    assert actual["total_commission"] == expected["total_commission"]
+    assert actual["total_slippage_cost"] == expected["total_slippage_cost"]
+    assert actual["max_drawdown"] == expected["max_drawdown"]
+    np.testing.assert_array_equal(
+        actual["equity_curve"].to_numpy(), expected["portfolio_values"]
+    )
+
+
+def test_buys_share_the_cash_pool():
+    """Buys asking for more than the cash split it pro rata."""
+    close, buys, sells = frames(
+        A=([10.0, 10.0, 10.0, 12.0], [True, False, False, False], [False] * 4),
+        B=([20.0, 20.0, 20.0, 20.0], [True, False, False, False], [False] * 4),
+    )
+    results = run_portfolio_backtest(
+        close,
+        buys,
+        sells,
+        initial_capital=1000.0,
+        position_size_pct={"A": 0.6, "B": 0.9},
+        **NO_COSTS,
+    )
+
+    attribution = results["attribution"]
+    np.testing.assert_allclose(attribution["invested"], [400.0, 600.0])
+    np.testing.assert_allclose(attribution["position"], [40.0, 30.0])
+    assert results["cash"].iloc[0] == 0.0
+    np.testing.assert_allclose(
+        results["equity_curve"], [1000.0, 1000.0, 1000.0, 1080.0]
+    )
+
+
+def test_sells_fund_buys_on_the_same_bar():
+    """Proceeds of a sell are available to a buy on the same bar."""
+    close, buys, sells = frames(
+        A=(
+            [10.0, 15.0, 15.0, 15.0],
+            [True, False, False, False],
+            [False, True, False, False],
+        ),
+        B=([5.0, 5.0, 6.0, 6.0], [False, True, False, False], [False] * 4),
+    )
+    results = run_portfolio_backtest(
+        close,
+        buys,
+        sells,
+        initial_capital=100.0,
+        position_size_pct=1.0,
+        **NO_COSTS,
+    )
+
+    attribution = results["attribution"]
+    assert list(attribution["num_buys"]) == [1, 1]
+    assert list(attribution["num_sells"]) == [1, 0]
+    # B was bought with the 100 left of A's 150 after the full allocation
+    np.testing.assert_allclose(attribution["position"], [0.0, 20.0])
+    np.testing.assert_allclose(results["cash"], [0.0, 50.0, 50.0, 50.0])
+    np.testing.assert_allclose(attribution["pnl"], [50.0, 20.0])
+
+
+def test_attribution_adds_up():
+    """The per-ticker profit/loss adds up to the portfolio's."""
+    signal_data = {
+        f"T{i}": make_signal_data(seed=i).iloc[i * 10 :] for i in range(5)
+    }
+    close, buy_signals, sell_signals = align_portfolio_signals(signal_data)
+    results = run_portfolio_backtest(
+        close, buy_signals, sell_signals, position_size_pct=0.1
+    )
+
+    attribution = results["attribution"]
+    assert list(attribution.index) == list(signal_data)
+    np.testing.assert_allclose(
+        attribution["pnl"].sum(),
+        results["final_value"] - results["initial_capital"],
+    )
+    np.testing.assert_allclose(
+        results["equity_curve"].iloc[-1], results["final_value"]
+    )
+    assert results["num_trades"] == attribution["num_buys"].sum()
+    np.testing.assert_allclose(
+        results["total_commission"], attribution["commission"].sum()
+    )
+    assert (results["cash"] >= 0).all()
+
+
+def test_no_trades_without_price():
+    """A ticker does not trade on bars without a close price."""
+    close, buys, sells = frames(
+        A=(
+            [np.nan, 10.0, np.nan, 12.0],
+            [True, True, False, False],
+            [False, False, True, False],
+        ),
+    )
+    results = run_portfolio_backtest(
+        close,
+        buys,
+        sells,
+        initial_capital=100.0,
+        position_size_pct=1.0,
+        **NO_COSTS,
+    )
+
+    attribution = results["attribution"]
+    assert list(attribution[["num_buys", "num_sells"]].iloc[0]) == [1, 0]
+    # Valued at the last close while the price is missing
+    np.testing.assert_allclose(
+        results["equity_curve"], [100.0, 100.0, 100.0, 120.0]
+    )
+
+
+def test_align_portfolio_signals():
+    """Signals are aligned on the union of the dates."""
+    a = make_signal_data(n=5, seed=0)
+    b = make_signal_data(n=5, seed=1).iloc[2:]
+    b.iloc[0, b.columns.get_loc("buy_signal")] = True
+
+    close, buy_signals, sell_signals = align_portfolio_signals(
+        {"A": a, "B": b}
+    )
+
+    assert list(close.columns) == ["A", "B"]
+    assert close.index.equals(a.index)
+    assert close["B"].isna().sum() == 2
+    assert buy_signals.dtypes.eq(bool).all()
+    assert not buy_signals["B"].iloc[:2].any() and buy_signals["B"].iloc[2]
+
+
+def test_invalid_inputs():
+    """Misaligned signals, bad position sizes and costs are rejected."""
+    close, buys, sells = frames(A=([10.0] * 4, [False] * 4, [False] * 4))
+
+    with pytest.raises(ValueError, match="same dates and tickers"):
+        run_portfolio_backtest(close, buys.iloc[1:], sells)
+    with pytest.raises(ValueError, match="missing for"):
+        run_portfolio_backtest(
+            close, buys, sells, position_size_pct={"B": 0.1}
+        )
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        run_portfolio_backtest(close, buys, sells, position_size_pct=1.5)
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        run_portfolio_backtest(
+            close, buys, sells, position_size_pct={"A": -0.1}
+        )
+    with pytest.raises(ValueError, match="commission_pct cannot be negative"):
+        run_portfolio_backtest(close, buys, sells, commission_pct=-0.01)
+    with pytest.raises(ValueError, match="Missing required columns"):
+        align_portfolio_signals({"A": close})
@@ -0,0 +1,140 @@
+"""
+Test scenario: Content-Addressed Result Cache
+
+This test verifies that:
+- Fingerprints change with any input value, dtype, date or parameter
+- The in-memory cache evicts the least recently used results when it
+  exceeds its entry or size limit
+- Results stored on disk are found by a new cache (e.g. another process)
+- run_backtest serves repeated backtests from the cache, returns copies,
+  and ignores columns it does not read
+- The backtester imports without Streamlit
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import subprocess
+import sys
+import os
+from unittest.mock import patch
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src import backtester
+from src.backtester import run_backtest
+from src.result_cache import ResultCache, fingerprint
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def make_signal_data(n=300, seed=0):
+    """Generate random prices with randomly placed buy/sell signals."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2020-01-01", periods=n, freq="B", tz="UTC")
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Close": close,
+            "buy_signal": rng.random(n) < 0.05,
+            "sell_signal": rng.random(n) < 0.05,
+        },
+        index=dates,
+    )
+
+
+def test_fingerprint_changes_with_content():
+    """Any change to the arrays, dates or parameters changes the key."""
+    df = make_signal_data()
+    close, dates = df["Close"].to_numpy(), df.index
+    key = fingerprint(close, dates, 0.001)
+
+    changed = close.copy()
+    changed[100] += 1e-9
+    assert fingerprint(close.copy(), dates.copy(), 0.001) == key
+    assert fingerprint(changed, dates, 0.001) != key
+    assert fingerprint(close.astype(np.float32), dates, 0.001) != key
+    assert fingerprint(close, dates.tz_convert("Asia/Kolkata"), 0.001) != key
+    assert fingerprint(close, dates.shift(1), 0.001) != key
+    assert fingerprint(close, dates, 0.002) != key
+    assert fingerprint("ab", "c") != fingerprint("a", "bc")
+
+
+def test_lru_eviction():
+    """The least recently used results are evicted first."""
+    cache = ResultCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    sized = ResultCache(max_bytes=3000)
+    sized.put("small", np.zeros(100))
+    sized.put("large", np.zeros(300))
+    assert sized.get("small") is None
+    sized.put("too large", np.zeros(1000))
+    assert sized.get("too large") is None
+    assert sized.get("large") is not None
+
+
+def test_disk_store_shared(tmp_path):
+    """Results on disk are found by another cache with the same directory."""
+    ResultCache(cache_dir=str(tmp_path)).put("key", {"value": 1})
+
+    other = ResultCache(cache_dir=str(tmp_path))
+    assert other.get("key") == {"value": 1}
+    assert os.listdir(tmp_path) == ["key.pkl"]
+
+    other.clear()
+    assert other.get("key") is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_invalid_limits():
+    """Limits must be positive."""
+    with pytest.raises(ValueError, match="must be positive"):
+        ResultCache(max_entries=0)
+
+
+def test_run_backtest_served_from_cache():
+    """A repeated backtest is not simulated again and returns a copy."""
+    df = make_signal_data()
+    with patch.object(
+        backtester,
+        "_simulate_arrays",
+        wraps=backtester._simulate_arrays,
+    ) as simulate:
+        first = run_backtest(df, engine="array")
+        first["trades"].clear()
+        # Features are not part of the key
+        second = run_backtest(df.assign(sma_5=1.0), engine="array")
+        uncached = run_backtest(df, engine="array", use_cache=False)
+
+    assert simulate.call_count == 2
+    assert second["trades"] and second["trades"] == uncached["trades"]
+    assert second["final_value"] == uncached["final_value"]
+
+    # Different costs are a different backtest
+    other = run_backtest(df, engine="array", slippage_pct=0.002)
+    assert other["final_value"] != second["final_value"]
+
+
+def test_backtester_imports_without_streamlit():
+    """The backtester and result cache do not import Streamlit."""
+    code = (
+        "import sys; import src.backtester; "
+        "print('streamlit' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert output.strip() == "False"
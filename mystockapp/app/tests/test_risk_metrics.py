@@ -0,0 +1,197 @@
+"""
+Test scenario: Risk Metrics of an Equity Curve
+
+This test verifies that:
+- risk_metrics gives the textbook Sharpe, Sortino, Calmar, ulcer index,
+  volatility, drawdown duration and exposure of an equity curve
+- Its max drawdown is the one run_backtest has always reported
+- rolling_volatility matches a pandas rolling standard deviation
+- The number of bars per year is inferred from daily, intraday and weekly
+  timestamps
+- run_backtest and run_portfolio_backtest include the metrics, and
+  generate_backtest_report prints them
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import (
+    generate_backtest_report,
+    run_backtest,
+    run_portfolio_backtest,
+)
+from src.metrics import (
+    RISK_METRICS,
+    TRADING_DAYS_PER_YEAR,
+    drawdown_pct,
+    infer_periods_per_year,
+    risk_metrics,
+    rolling_volatility,
+)
+from tests.test_backtest_engine_equivalence import make_signal_data
+
+
+@pytest.fixture
+def equity():
+    """A random-walk equity curve with drawdowns."""
+    rng = np.random.default_rng(3)
+    return 100000 * np.exp(rng.normal(0.0005, 0.01, 500).cumsum())
+
+
+def test_metrics_match_textbook_definitions(equity):
+    positions = np.arange(len(equity)) % 4 != 0
+
+    metrics = risk_metrics(equity, positions, risk_free_rate=0.02)
+
+    returns = pd.Series(equity).pct_change().dropna()
+    excess = returns - (1.02 ** (1 / 252) - 1)
+    sharpe = excess.mean() / returns.std() * np.sqrt(252)
+    sortino = excess.mean() / np.sqrt((excess.clip(upper=0) ** 2).mean())
+    drawdown = equity / np.maximum.accumulate(equity) - 1
+    annual_return = (equity[-1] / equity[0]) ** (252 / len(returns)) - 1
+
+    assert set(metrics) == set(RISK_METRICS)
+    assert metrics["sharpe_ratio"] == pytest.approx(sharpe)
+    assert metrics["sortino_ratio"] == pytest.approx(sortino * np.sqrt(252))
+    assert metrics["annual_volatility_pct"] == pytest.approx(
+        returns.std() * np.sqrt(252) * 100
+    )
+    assert metrics["annual_return_pct"] == pytest.approx(annual_return * 100)
+    assert metrics["max_drawdown"] == pytest.approx(drawdown.min() * 100)
+    assert metrics["calmar_ratio"] == pytest.approx(
+        annual_return / -drawdown.min()
+    )
+    assert metrics["ulcer_index"] == pytest.approx(
+        np.sqrt(np.mean((drawdown * 100) ** 2))
+    )
+    assert metrics["exposure_pct"] == pytest.approx(75.0)
+
+
+def test_drawdown_duration_and_initial_value():
+    equity = [100, 120, 90, 100, 110, 125, 120, 124]
+
+    metrics = risk_metrics(equity, initial_value=80)
+
+    # Below the peak of 120 for three bars, then below 125 for two
+    assert metrics["max_drawdown_duration"] == 3
+    assert metrics["max_drawdown"] == pytest.approx(-25.0)
+    assert metrics["total_return_pct"] == pytest.approx(55.0)
+    assert np.isnan(metrics["exposure_pct"])
+
+
+def test_flat_equity_has_no_risk_ratios():
+    metrics = risk_metrics([1000.0] * 10, positions=np.zeros(10))
+
+    assert metrics["sharpe_ratio"] == 0.0
+    assert metrics["sortino_ratio"] == 0.0
+    assert metrics["calmar_ratio"] == 0.0
+    assert metrics["max_drawdown"] == 0.0
+    assert metrics["exposure_pct"] == 0.0
+    with pytest.raises(ValueError, match="empty"):
+        risk_metrics([])
+
+
+def test_drawdown_skips_missing_values():
+    """NaN bars are skipped like a pandas cummax would."""
+    equity = [100.0, np.nan, 80.0, 120.0, 90.0]
+    series = pd.Series(equity)
+    expected = (series - series.cummax()) / series.cummax() * 100
+
+    np.testing.assert_allclose(drawdown_pct(equity), expected)
+
+
+def test_rolling_volatility(equity):
+    volatility = rolling_volatility(equity, window=21)
+
+    expected = (
+        pd.Series(equity).pct_change().rolling(21).std() * np.sqrt(252) * 100
+    )
+    np.testing.assert_allclose(volatility, expected)
+    with pytest.raises(ValueError, match="at least 2"):
+        rolling_volatility(equity, window=1)
+
+
+@pytest.mark.parametrize(
+    "dates, expected",
+    [
+        (pd.bdate_range("2023-01-02", periods=300), TRADING_DAYS_PER_YEAR),
+        (
+            # Three sessions of 375 one-minute bars
+            pd.DatetimeIndex(
+                np.concatenate(
+                    [
+                        pd.date_range(f"{day} 09:15", periods=375, freq="min")
+                        for day in ("2023-01-02", "2023-01-03", "2023-01-04")
+                    ]
+                )
+            ),
+            TRADING_DAYS_PER_YEAR * 375,
+        ),
+        (pd.date_range("2020-01-05", periods=100, freq="W"), 365.25 / 7),
+    ],
+)
+def test_infer_periods_per_year(dates, expected):
+    assert infer_periods_per_year(dates) == pytest.approx(expected, rel=0.01)
+
+
+def test_run_backtest_includes_risk_metrics():
+    df = make_signal_data(n=1000, seed=0)
+    df["Close"] += 100
+
+    results = run_backtest(df, use_cache=False)
+
+    expected = risk_metrics(
+        results["portfolio_values"], initial_value=results["initial_capital"]
+    )
+    for name in RISK_METRICS:
+        if name != "exposure_pct":
+            assert results[name] == pytest.approx(expected[name]), name
+    assert 0 < results["exposure_pct"] < 100
+
+
+def test_exposure_of_one_round_trip():
+    dates = pd.date_range(start="2023-01-02", periods=10, freq="B")
+    df = pd.DataFrame(
+        {
+            "Close": np.linspace(100, 109, 10),
+            "buy_signal": [False, True] + [False] * 8,
+            "sell_signal": [False] * 5 + [True] + [False] * 4,
+        },
+        index=dates,
+    )
+
+    for engine in ("loop", "array", "vectorized"):
+        results = run_backtest(df, engine=engine, use_cache=False)
+        # Holding at the close of bars 1 to 4
+        assert results["exposure_pct"] == pytest.approx(40.0), engine
+
+
+def test_portfolio_backtest_matches_single_ticker():
+    df = make_signal_data(n=500, seed=1)
+    df["Close"] += 100
+
+    expected = run_backtest(df, use_cache=False)
+    portfolio = run_portfolio_backtest(
+        df[["Close"]].rename(columns={"Close": "AAA"}),
+        df[["buy_signal"]].rename(columns={"buy_signal": "AAA"}),
+        df[["sell_signal"]].rename(columns={"sell_signal": "AAA"}),
+    )
+
+    for name in RISK_METRICS:
+        assert portfolio[name] == pytest.approx(expected[name]), name
+
+
+def test_report_prints_risk_metrics(capsys):
+    df = make_signal_data(n=300, seed=2)
+    df["Close"] += 100
+
+    generate_backtest_report(run_backtest(df, use_cache=False), "Test")
+
+    output = capsys.readouterr().out
+    for label in ("Sharpe Ratio", "Sortino Ratio", "Calmar Ratio", "Exposure"):
+        assert label in output
@@ -0,0 +1,148 @@
+"""
+Test scenario: Bootstrap Robustness Analysis
+
+This test verifies that run_bootstrap:
+- Reports the backtest's own metrics as the observed values
+- Brackets them with confidence intervals from the simulated paths
+- Resamples only the given trades and keeps blocks of returns together
+- Is reproducible with a seed, also when batches run on a process pool
+- Rejects invalid parameters and results it cannot resample
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import run_backtest
+from src.robustness import _block_paths, _path_metrics, run_bootstrap
+
+
+@pytest.fixture
+def backtest_results():
+    """Backtest random signals on two years of random-walk prices."""
+    rng = np.random.default_rng(5)
+    n = 500
+    dates = pd.date_range(start="2020-01-01", periods=n, freq="B", tz="UTC")
+    df = pd.DataFrame(
+        {
+            "Close": 200 + rng.normal(0, 1, n).cumsum(),
+            "buy_signal": rng.random(n) < 0.05,
+            "sell_signal": rng.random(n) < 0.05,
+        },
+        index=dates,
+    )
+    return run_backtest(df)
+
+
+@pytest.mark.parametrize("method", ["trades", "blocks"])
+def test_bootstrap_summary(backtest_results, method):
+    """Intervals are ordered and the observed metrics match the backtest."""
+    results = run_bootstrap(
+        backtest_results,
+        method=method,
+        n_simulations=2000,
+        seed=1,
+        batch_size=300,
+        max_workers=1,
+    )
+
+    summary = results["summary"]
+    assert len(results["simulations"]) == 2000
+    assert (summary["lower"] <= summary["median"]).all()
+    assert (summary["median"] <= summary["upper"]).all()
+    assert 0 <= results["probability_of_loss"] <= 1
+    if method == "blocks":
+        np.testing.assert_allclose(
+            results["observed"]["total_return_pct"],
+            backtest_results["total_return_pct"],
+        )
+    else:
+        np.testing.assert_allclose(
+            results["observed"]["profit_factor"],
+            backtest_results["profit_factor"],
+        )
+    # Resampling the same steps keeps the typical path near the observed one
+    observed_return = summary.loc["total_return_pct", "observed"]
+    assert (
+        summary.loc["total_return_pct", "lower"]
+        < observed_return
+        < summary.loc["total_return_pct", "upper"]
+    )
+
+
+def test_trade_bootstrap_resamples_trades():
+    """Every simulated path is built from the given trades only."""
+    results = {
+        "initial_capital": 1000.0,
+        "completed_trades": [
+            {"net_profit_loss": 100.0},
+            {"net_profit_loss": -50.0},
+        ],
+    }
+    simulations = run_bootstrap(
+        results, method="trades", n_simulations=500, seed=0, max_workers=1
+    )["simulations"]
+
+    # Two draws of +100 and/or -50 on 1000
+    assert set(simulations["total_return_pct"].round(6)) == {
+        20.0,
+        5.0,
+        -10.0,
+    }
+    assert set(simulations["profit_factor"]) == {1.0, 2.0, 0.0}
+
+
+def test_block_paths_keep_blocks_together():
+    """Blocks are runs of consecutive returns."""
+    returns = np.arange(1, 11) / 1000
+    equity = _block_paths(
+        returns, 1.0, n_paths=50, rng=np.random.default_rng(0), block_size=4
+    )
+    drawn = np.round(equity[:, 1:] / equity[:, :-1] - 1, 9) * 1000
+
+    assert equity.shape == (50, 11)
+    for block_start in (0, 4, 8):
+        block = drawn[:, block_start : block_start + 4]
+        np.testing.assert_allclose(np.diff(block, axis=1), 1.0)
+
+
+def test_path_metrics():
+    """Metrics of known equity paths."""
+    metrics = _path_metrics(
+        np.array([[100.0, 120.0, 90.0, 110.0], [100.0, 100.0, 105.0, 110.0]])
+    )
+
+    np.testing.assert_allclose(metrics["total_return_pct"], [10.0, 10.0])
+    np.testing.assert_allclose(metrics["max_drawdown"], [-25.0, 0.0])
+    np.testing.assert_allclose(metrics["profit_factor"], [40 / 30, 1.0])
+
+
+def test_process_pool_matches_serial(backtest_results):
+    """Results depend on the seed only, not on where the batches run."""
+    kwargs = {"n_simulations": 1000, "seed": 42, "batch_size": 250}
+    serial = run_bootstrap(backtest_results, max_workers=1, **kwargs)
+    parallel = run_bootstrap(backtest_results, max_workers=2, **kwargs)
+    other_seed = run_bootstrap(
+        backtest_results, max_workers=1, **{**kwargs, "seed": 43}
+    )
+
+    pd.testing.assert_frame_equal(serial["summary"], parallel["summary"])
+    assert not serial["summary"].equals(other_seed["summary"])
+
+
+def test_invalid_inputs(backtest_results):
+    """Invalid parameters and results without data are rejected."""
+    with pytest.raises(ValueError, match="Unknown bootstrap method"):
+        run_bootstrap(backtest_results, method="jackknife")
+    with pytest.raises(ValueError, match="confidence"):
+        run_bootstrap(backtest_results, confidence=1.0)
+    with pytest.raises(ValueError, match="n_simulations"):
+        run_bootstrap(backtest_results, n_simulations=0)
+    with pytest.raises(ValueError, match="No completed trades"):
+        run_bootstrap(
+            {**backtest_results, "completed_trades": []}, method="trades"
+        )
@@ -0,0 +1,61 @@
+"""
+Test scenario: RSI Reference Values
+
+This test verifies that the rsi_14 feature of FeatureFactory reproduces the
+published worked example of Wilder's RSI (the 14-day RSI of the StockCharts
+"Relative Strength Index" ChartSchool article):
+- The first value is computed from the simple averages of the first 14
+  gains and losses
+- Every later value follows Wilder's smoothing of those averages
+- The bars before the first value have no RSI
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.feature_factory import FeatureFactory
+
+# Closing prices of the worked example
+CLOSE = [
+    44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84, 46.08,
+    45.89, 46.03, 45.61, 46.28, 46.28, 46.00, 46.03, 46.41, 46.22, 45.64,
+    46.21, 46.25, 45.71, 46.45, 45.78, 45.35, 44.03, 44.18, 44.22, 44.57,
+    43.42, 42.66, 43.13,
+]  # fmt: skip
+
+# Its 14-day RSI, from the 15th close onward
+EXPECTED_RSI = [
+    70.46, 66.25, 66.48, 69.35, 66.29, 57.92, 62.88, 63.21, 56.01, 62.34,
+    54.67, 50.39, 40.02, 41.49, 41.90, 45.50, 37.32, 33.09, 37.79,
+]  # fmt: skip
+
+
+@pytest.mark.parametrize("use_float32", [False, True])
+def test_rsi_matches_published_example(use_float32):
+    dates = pd.date_range(start="2023-01-02", periods=len(CLOSE), freq="B")
+    df = pd.DataFrame(
+        {
+            "Open": CLOSE,
+            "High": CLOSE,
+            "Low": CLOSE,
+            "Close": CLOSE,
+            "Volume": 1000,
+        },
+        index=dates,
+    )
+
+    features = FeatureFactory(
+        df,
+        feature_families=["rsi"],
+        indicator_params={"rsi": {"windows": [14]}},
+        use_float32=use_float32,
+    ).generate_features(drop_na=False)
+
+    rsi = features["rsi_14"].to_numpy(dtype=np.float64)
+    assert np.isnan(rsi[:14]).all()
+    np.testing.assert_allclose(rsi[14:], EXPECTED_RSI, atol=0.01)
@@ -0,0 +1,99 @@
+"""
+Test scenario: Wilder RSI Smoothing
+
+This test verifies that the RSI features produced by FeatureFactory:
+- Match a straightforward bar-by-bar implementation of Wilder's smoothing
+  (simple-average seed, then avg = (prev * (window - 1) + value) / window)
+- Are computed for every requested window in one call
+- Respect the float32/float64 output dtype
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.feature_factory import FeatureFactory
+
+
+@pytest.fixture
+def ohlcv_data():
+    """Generate random-walk OHLCV data with a flat stretch (zero changes)."""
+    rng = np.random.default_rng(5)
+    n = 400
+    dates = pd.date_range(start="2021-01-01", periods=n, freq="B")
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    close[150:160] = close[150]
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, n),
+        },
+        index=dates,
+    )
+
+
+def reference_rsi(close, window):
+    """Bar-by-bar Wilder RSI in float64."""
+    delta = np.diff(close.astype(np.float64), prepend=np.nan)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+
+    avg_gain = np.full(len(close), np.nan)
+    avg_loss = np.full(len(close), np.nan)
+    avg_gain[window] = gain[1 : window + 1].mean()
+    avg_loss[window] = loss[1 : window + 1].mean()
+    for i in range(window + 1, len(close)):
+        avg_gain[i] = (avg_gain[i - 1] * (window - 1) + gain[i]) / window
+        avg_loss[i] = (avg_loss[i - 1] * (window - 1) + loss[i]) / window
+
+    with np.errstate(divide="ignore"):
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+@pytest.mark.parametrize("use_float32, atol", [(False, 1e-9), (True, 1e-4)])
+def test_rsi_matches_reference(ohlcv_data, use_float32, atol):
+    """All requested windows should match the bar-by-bar recursion."""
+    windows = [2, 6, 14, 21]
+    features = FeatureFactory(
+        ohlcv_data,
+        feature_families=["rsi"],
+        indicator_params={"rsi": {"windows": windows}},
+        use_float32=use_float32,
+    ).generate_features(drop_na=False)
+
+    expected_dtype = np.float32 if use_float32 else np.float64
+    close = ohlcv_data["Close"].to_numpy()
+    if use_float32:
+        close = close.astype(np.float32)
+    for window in windows:
+        column = features[f"rsi_{window}"]
+        assert column.dtype == expected_dtype
+        # The first `window` bars have no smoothed value yet
+        assert column.iloc[:window].isna().all()
+        assert column.iloc[window:].notna().all()
+        np.testing.assert_allclose(
+            column.to_numpy(dtype=np.float64),
+            reference_rsi(close, window),
+            atol=atol,
+            equal_nan=True,
+        )
+
+
+def test_rsi_all_gains_is_100(ohlcv_data):
+    """A monotonically rising series has no losses, so RSI is 100."""
+    data = ohlcv_data.copy()
+    data["Close"] = np.linspace(50, 150, len(data))
+    features = FeatureFactory(
+        data,
+        feature_families=["rsi"],
+        indicator_params={"rsi": {"windows": [14]}},
+    ).generate_features(drop_na=False)
+
+    assert (features["rsi_14"].iloc[14:] == 100).all()
@@ -0,0 +1,100 @@
+"""
+Test scenario: Concurrent Stock Scanning
+
+This test verifies that:
+- A concurrent scan gives the same results as a serial scan, in the order
+  of the tickers
+- Results stream back as each ticker finishes, so a slow download does not
+  hold back the others
+- A failed download is reported for its ticker without stopping the scan
+- Strategy parameters can be passed as a dict or as keyword arguments
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+import time
+from unittest.mock import patch
+
+# Add the app directory to path so we can import the scanner
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from scanner import iter_scan_results, scan_stocks
+
+TICKERS = ["AAA", "BBB", "CCC", "DDD", "EEE", "FFF"]
+
+
+def make_ohlcv(seed):
+    """Generate random-walk OHLCV data."""
+    rng = np.random.default_rng(seed)
+    n = 260
+    dates = pd.date_range(start="2023-01-02", periods=n, freq="B")
+    close = 100 + rng.normal(0, 2, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, n),
+        },
+        index=dates,
+    )
+
+
+def fake_get_stock_data(ticker, period, interval):
+    """Return deterministic data per ticker; 'BAD' fails, 'SLOW' lags."""
+    if ticker == "BAD":
+        raise ConnectionError("Download failed")
+    if ticker == "SLOW":
+        time.sleep(1.0)
+    return make_ohlcv(sum(map(ord, ticker)))
+
+
+@pytest.fixture(autouse=True)
+def mock_downloads():
+    with patch("scanner.get_stock_data", side_effect=fake_get_stock_data):
+        yield
+
+
+def test_concurrent_scan_matches_serial():
+    """Thread and process pools do not change the results or their order."""
+    params = {"fast_sma": 5, "slow_sma": 20}
+    serial = scan_stocks(TICKERS, strategy_params=params, max_workers=1)
+    concurrent = scan_stocks(TICKERS, strategy_params=params, max_workers=4)
+
+    assert list(concurrent["ticker"]) == TICKERS
+    assert (concurrent["status"] == "success").all()
+    pd.testing.assert_frame_equal(concurrent, serial)
+
+
+def test_results_stream_as_completed():
+    """A slow download does not delay the results of the other tickers."""
+    results = iter_scan_results(
+        ["SLOW"] + TICKERS, fast_sma=5, slow_sma=20, max_workers=4
+    )
+    tickers = [result["ticker"] for result in results]
+
+    assert sorted(tickers) == sorted(["SLOW"] + TICKERS)
+    assert tickers[-1] == "SLOW"
+
+
+def test_failed_download_reported():
+    """A failing ticker gets an error row; the rest are scanned."""
+    results = scan_stocks(
+        ["AAA", "BAD", "CCC"],
+        strategy_name="RSI Strategy",
+        rsi_period=14,
+        max_workers=2,
+    )
+
+    assert list(results["ticker"]) == ["AAA", "BAD", "CCC"]
+    assert list(results["status"]) == ["success", "error", "success"]
+    assert results.loc[1, "message"] == "Download failed"
+
+
+def test_invalid_max_workers():
+    """max_workers must be positive."""
+    with pytest.raises(ValueError, match="Max workers must be positive"):
+        scan_stocks(TICKERS, max_workers=0)
@@ -0,0 +1,96 @@
+"""
+Test scenario: Features Computed Once and Split by Date
+
+This test verifies that generate_split_features:
+- Gives the in-sample rows that FeatureFactory gives on in-sample data alone
+- Does not let bars after the split date change in-sample features
+- Keeps every out-of-sample bar, warmed up on the in-sample history
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from main import generate_split_features
+from src.feature_factory import FeatureFactory
+
+FEATURE_FAMILIES = ["sma", "ema", "rsi", "macd"]
+INDICATOR_PARAMS = {"sma": {"windows": [10, 50]}}
+
+
+@pytest.fixture
+def ohlcv():
+    """Two years of random-walk daily bars."""
+    rng = np.random.default_rng(11)
+    n = 500
+    dates = pd.date_range(start="2022-01-03", periods=n, freq="B", tz="UTC")
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close + rng.normal(0, 0.2, n),
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(1000, 10000, n),
+        },
+        index=dates,
+    )
+
+
+@pytest.fixture
+def split_date(ohlcv):
+    return ohlcv.index[350]
+
+
+def test_in_sample_matches_in_sample_only_features(ohlcv, split_date):
+    """Computing on the full history changes no in-sample feature."""
+    in_sample, _ = generate_split_features(
+        ohlcv, split_date, FEATURE_FAMILIES, INDICATOR_PARAMS
+    )
+    expected = FeatureFactory(
+        ohlcv[ohlcv.index < split_date],
+        feature_families=FEATURE_FAMILIES,
+        indicator_params=INDICATOR_PARAMS,
+    ).generate_features(drop_na=True)
+
+    pd.testing.assert_frame_equal(in_sample, expected)
+
+
+def test_no_look_ahead(ohlcv, split_date):
+    """Bars after the split date do not reach the in-sample rows."""
+    changed = ohlcv.copy()
+    changed.loc[changed.index >= split_date, ["Close", "High"]] *= 2
+
+    in_sample, _ = generate_split_features(
+        ohlcv, split_date, FEATURE_FAMILIES, INDICATOR_PARAMS
+    )
+    changed_in_sample, _ = generate_split_features(
+        changed, split_date, FEATURE_FAMILIES, INDICATOR_PARAMS
+    )
+
+    pd.testing.assert_frame_equal(in_sample, changed_in_sample)
+
+
+def test_out_of_sample_usable_from_first_bar(ohlcv, split_date):
+    """Every out-of-sample bar has all of its features."""
+    in_sample, out_of_sample = generate_split_features(
+        ohlcv, split_date, FEATURE_FAMILIES, INDICATOR_PARAMS
+    )
+
+    assert in_sample.index.max() < split_date
+    assert out_of_sample.index.equals(ohlcv.index[ohlcv.index >= split_date])
+    assert not out_of_sample.isna().any().any()
+
+
+def test_without_split_date(ohlcv):
+    """Without a split date all rows are in-sample."""
+    in_sample, out_of_sample = generate_split_features(
+        ohlcv, None, ["sma"], INDICATOR_PARAMS
+    )
+
+    assert in_sample.index[-1] == ohlcv.index[-1]
+    assert out_of_sample.empty
@@ -0,0 +1,71 @@
+"""
+Test scenario: Command-Line Startup Time
+
+This test verifies, with `python -X importtime`, that a cold start of
+`main.py --help`:
+- Does not import Streamlit, matplotlib, plotly or yfinance, which are only
+  needed by the apps, --plot and downloads
+- Stays within the import time budget
+and that importing the backtester creates no log files.
+"""
+
+import os
+import subprocess
+import sys
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Import time budget of `main.py --help` in seconds (about 0.5s at the time
+# of writing, 2s before heavy imports were deferred); slow machines can
+# raise it with the STARTUP_BUDGET_SECONDS environment variable
+STARTUP_BUDGET_SECONDS = float(os.environ.get("STARTUP_BUDGET_SECONDS", 1.5))
+
+DEFERRED_MODULES = ["streamlit", "matplotlib", "plotly", "yfinance"]
+
+
+def import_times(args, cwd=APP_DIR):
+    """
+    Run Python with -X importtime.
+
+    Returns:
+        dict: Cumulative import time in seconds of each top-level module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def test_main_help_startup():
+    """`main.py --help` imports no heavy optional library and starts fast."""
+    times = import_times(["main.py", "--help"])
+
+    imported = sorted(
+        name for name in times if name.split(".")[0] in DEFERRED_MODULES
+    )
+    assert imported == []
+    assert sum(times.values()) < STARTUP_BUDGET_SECONDS, times
+
+
+def test_backtester_import_creates_no_files(tmp_path):
+    """Log files are only created when something is logged."""
+    import_times(
+        [
+            "-c",
+            f"import sys; sys.path.insert(0, {APP_DIR!r}); "
+            "import src.backtester",
+        ],
+        cwd=tmp_path,
+    )
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,290 @@
+"""
+Test scenario: Array Signal Kernels and the Strategy Registry
+
+This test verifies that:
+- The SMA crossover and RSI kernels give the signals of the original
+  pandas rules
+- compute_signals returns an int8 vector and generate_signals leaves its
+  input unchanged
+- One signal_matrix call gives the signals of each strategy on its own
+- Every registered strategy works in parameter sweeps, batch runs and the
+  scanner
+- A strategy without a signal_kernel cannot be instantiated
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import (
+    SIGNAL_BUY,
+    SIGNAL_SELL,
+    STRATEGY_REGISTRY,
+    ATRBreakoutStrategy,
+    BollingerBandStrategy,
+    MACDStrategy,
+    RSIStrategy,
+    SMACrossoverStrategy,
+    Strategy,
+    get_strategy,
+    register_strategy,
+    run_backtest,
+    run_parameter_sweep,
+)
+from src.batch import run_batch
+from src.feature_factory import FeatureFactory
+from tests.test_bulk_fetch import FakeSource
+
+STRATEGIES = [
+    SMACrossoverStrategy(fast_window=10, slow_window=50),
+    RSIStrategy(rsi_window=14, oversold_threshold=30, overbought_threshold=70),
+    BollingerBandStrategy(window=20, std_dev=2),
+    MACDStrategy(fast_period=12, slow_period=26, signal_period=9),
+    ATRBreakoutStrategy(window=20, multiplier=1.5),
+]
+
+
+@pytest.fixture
+def ohlcv():
+    """Two years of random-walk daily bars."""
+    rng = np.random.default_rng(5)
+    n = 500
+    dates = pd.date_range(start="2022-01-03", periods=n, freq="B", tz="UTC")
+    close = 100 + rng.normal(0, 1.5, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close + rng.normal(0, 0.3, n),
+            "High": close + rng.uniform(0, 2, n),
+            "Low": close - rng.uniform(0, 2, n),
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, n),
+        },
+        index=dates,
+    )
+
+
+def strategy_features(ohlcv, strategy):
+    """Features of one strategy, after its indicators have warmed up."""
+    indicator_params = strategy.indicator_params()
+    features = FeatureFactory(
+        ohlcv,
+        feature_families=list(indicator_params),
+        indicator_params=indicator_params,
+    ).generate_features(drop_na=False)
+    return features.dropna(subset=["Close"] + strategy.required_features())
+
+
+def test_sma_kernel_matches_pandas_rules(ohlcv):
+    strategy = SMACrossoverStrategy(fast_window=10, slow_window=50)
+    features = strategy_features(ohlcv, strategy)
+    fast, slow = features["sma_10"], features["sma_50"]
+
+    signals = strategy.compute_signals(features)
+
+    buy = (fast > slow) & (fast.shift(1) <= slow.shift(1))
+    sell = (fast < slow) & (fast.shift(1) >= slow.shift(1))
+    assert buy.any() and sell.any()
+    np.testing.assert_array_equal(signals == SIGNAL_BUY, buy)
+    np.testing.assert_array_equal(signals == SIGNAL_SELL, sell)
+
+
+def test_rsi_kernel_matches_pandas_rules(ohlcv):
+    strategy = RSIStrategy(
+        rsi_window=6, oversold_threshold=30, overbought_threshold=70
+    )
+    rsi = strategy_features(ohlcv, strategy)["rsi_6"]
+
+    signals = strategy.compute_signals({"rsi_6": rsi.to_numpy()})
+
+    buy = (rsi > 30) & (rsi.shift(1) <= 30)
+    sell = (rsi < 70) & (rsi.shift(1) >= 70)
+    assert buy.any() and sell.any()
+    np.testing.assert_array_equal(signals == SIGNAL_BUY, buy)
+    np.testing.assert_array_equal(signals == SIGNAL_SELL, sell)
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES, ids=lambda s: s.registry_name)
+def test_generate_signals_does_not_mutate(ohlcv, strategy):
+    """Signals are int8 codes; the frame passed in is left unchanged."""
+    features = strategy_features(ohlcv, strategy)
+    before = features.copy()
+
+    signals = strategy.compute_signals(features)
+    result = strategy.generate_signals(features)
+
+    assert signals.dtype == np.int8
+    assert set(np.unique(signals)) <= {SIGNAL_SELL, 0, SIGNAL_BUY}
+    assert (signals == SIGNAL_BUY).any()
+    pd.testing.assert_frame_equal(features, before)
+    np.testing.assert_array_equal(result["buy_signal"], signals == SIGNAL_BUY)
+    np.testing.assert_array_equal(
+        result["sell_signal"], signals == SIGNAL_SELL
+    )
+
+
+@pytest.mark.parametrize("name", list(STRATEGY_REGISTRY))
+def test_signal_matrix_matches_single_strategies(ohlcv, name):
+    """A grid evaluated in one call gives each strategy's own signals."""
+    strategy_class = STRATEGY_REGISTRY[name]
+    strategies = []
+    for values in zip(*strategy_class.default_grid.values()):
+        try:
+            strategies.append(
+                strategy_class(
+                    **dict(zip(strategy_class.default_grid, values))
+                )
+            )
+        except ValueError:
+            continue
+    indicator_params = {}
+    for strategy in strategies:
+        for family, params in strategy.indicator_params().items():
+            for key, values in params.items():
+                indicator_params.setdefault(family, {}).setdefault(
+                    key, []
+                ).extend(values)
+    features = FeatureFactory(
+        ohlcv,
+        feature_families=list(indicator_params),
+        indicator_params=indicator_params,
+    ).generate_features(drop_na=False)
+
+    matrix = strategy_class.signal_matrix(features, strategies)
+
+    assert matrix.shape == (len(features), len(strategies))
+    assert matrix.dtype == np.int8
+    for j, strategy in enumerate(strategies):
+        np.testing.assert_array_equal(
+            matrix[:, j], strategy.compute_signals(features)
+        )
+
+
+def test_registry():
+    assert {"sma_crossover", "rsi", "bollinger", "macd", "atr_breakout"} <= (
+        set(STRATEGY_REGISTRY)
+    )
+    strategy = get_strategy("macd", fast_period=8, slow_period=21)
+    assert isinstance(strategy, MACDStrategy)
+    assert strategy.registry_name == "macd"
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        get_strategy("momentum")
+    with pytest.raises(ValueError, match="less than"):
+        get_strategy("macd", fast_period=26, slow_period=12)
+
+
+def test_registered_strategy_plugs_into_sweeps(ohlcv):
+    """A new strategy only needs its columns, parameters and kernel."""
+
+    @register_strategy("close_above_sma")
+    class CloseAboveSMAStrategy(Strategy):
+        default_grid = {"window": [10, 20]}
+
+        def __init__(self, window=20):
+            super().__init__(name=f"Close Above SMA ({window})")
+            self.window = window
+
+        def required_features(self):
+            return ["Close", f"sma_{self.window}"]
+
+        def indicator_params(self):
+            return {"sma": {"windows": [self.window]}}
+
+        @staticmethod
+        def signal_kernel(close, sma):
+            above = (close > sma).astype(np.int8)
+            return np.diff(above, axis=0, prepend=above[:1]).astype(np.int8)
+
+    try:
+        sweep = run_parameter_sweep(ohlcv, strategy="close_above_sma")
+    finally:
+        del STRATEGY_REGISTRY["close_above_sma"]
+
+    assert sorted(sweep["window"]) == [10, 20]
+    assert (sweep["num_trades"] > 0).all()
+
+
+def test_strategy_without_kernel_is_rejected():
+    """Overriding only generate_signals no longer makes a strategy."""
+
+    class SignalsOnlyStrategy(Strategy):
+        def required_features(self):
+            return ["Close"]
+
+        def generate_signals(self, df):
+            return df.assign(buy_signal=False, sell_signal=False)
+
+    with pytest.raises(TypeError, match="signal_kernel"):
+        SignalsOnlyStrategy()
+
+
+@pytest.mark.parametrize("name", ["bollinger", "macd", "atr_breakout"])
+def test_sweep_matches_individual_backtests(ohlcv, name):
+    """Sweeps of the new strategies match backtests of each combination."""
+    sweep = run_parameter_sweep(ohlcv, strategy=name)
+    grid = STRATEGY_REGISTRY[name].default_grid
+    # All combinations are evaluated on the bars every combination can use
+    strategies = [
+        get_strategy(
+            name,
+            **{
+                key: value.item() if isinstance(value, np.generic) else value
+                for key, value in row[list(grid)].items()
+            },
+        )
+        for _, row in sweep.iterrows()
+    ]
+    first_bar = max(
+        strategy_features(ohlcv, strategy).index[0] for strategy in strategies
+    )
+
+    for strategy, (_, row) in zip(strategies, sweep.iterrows()):
+        features = strategy_features(ohlcv, strategy)
+        expected = run_backtest(
+            strategy.generate_signals(features[features.index >= first_bar]),
+            use_cache=False,
+        )
+        assert row["strategy"] == strategy.name
+        assert row["num_trades"] == expected["num_trades"]
+        np.testing.assert_allclose(
+            row["total_return_pct"], expected["total_return_pct"]
+        )
+
+
+def test_batch_with_new_strategies(tmp_path):
+    config = {
+        "tickers": ["AAA.NS"],
+        "data": {"period": "2y", "cache_dir": str(tmp_path)},
+        "strategies": [
+            {"name": "bollinger", "window": 20, "std_dev": 2.0},
+            {"name": "macd"},
+            {"name": "atr_breakout", "window": 14},
+        ],
+    }
+
+    results = run_batch(config, max_workers=1, source=FakeSource())
+
+    assert results["error"].isna().all()
+    assert list(results["strategy"]) == [
+        "Bollinger Bands (20, 2.0)",
+        "MACD (12/26/9)",
+        "ATR Breakout (14, 2.0)",
+    ]
+
+
+def test_scanner_with_new_strategies(ohlcv):
+    from scanner import analyze_stock, screen_stocks
+
+    result = analyze_stock(
+        "AAA", ohlcv, "bollinger", {"window": 20, "std_dev": 2.0}
+    )
+    assert result["status"] == "success"
+    assert "bb_20_2.0_lower" in result["signal_details"]
+
+    screen = screen_stocks({"AAA": ohlcv, "BBB": None}, "macd")
+    assert list(screen["status"]) == ["success", "error"]
+    with pytest.raises(ValueError, match="positive"):
+        screen_stocks({"AAA": ohlcv}, "atr_breakout", {"multiplier": -1})
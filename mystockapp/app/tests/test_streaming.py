@@ -0,0 +1,152 @@
+"""
+Test scenario: Chunked Feature Generation and Backtesting
+
+This test verifies that:
+- StreamingBacktest fed chunk by chunk gives the results of run_backtest
+- run_chunked_backtest gives the results of the full in-memory pipeline,
+  for DataFrames and for iterables of chunks
+- Chunks that are out of order or contain NaN are rejected
+- There must be enough bars for the features
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import (
+    RSIStrategy,
+    SMACrossoverStrategy,
+    StreamingBacktest,
+    run_backtest,
+)
+from src.feature_factory import FeatureFactory
+from src.streaming import iter_chunks, run_chunked_backtest
+from tests.test_backtest_engine_equivalence import (
+    assert_results_equal,
+    make_signal_data,
+)
+
+
+def make_ohlcv(n=3000, seed=0):
+    """Generate random minute bars."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2023-01-02", periods=n, freq="min", tz="UTC")
+    close = 100 + rng.normal(0, 0.05, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close + rng.normal(0, 0.01, n),
+            "High": close + 0.03,
+            "Low": close - 0.03,
+            "Close": close,
+            "Volume": rng.integers(100, 1000, n),
+        },
+        index=dates,
+    )
+
+
+def full_run(ohlcv, strategy, feature_families):
+    """The in-memory pipeline that run_chunked_backtest streams."""
+    features = FeatureFactory(
+        ohlcv, feature_families=feature_families
+    ).generate_features(drop_na=False)
+    features = features.dropna(subset=["Close"] + strategy.required_features())
+    return run_backtest(
+        strategy.generate_signals(features), engine="array", use_cache=False
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 500])
+def test_streaming_backtest_matches_run_backtest(chunk_size):
+    """Carrying cash, position and ledger across chunks changes nothing."""
+    df = make_signal_data(n=500, seed=3, signal_prob=0.1)
+    expected = run_backtest(df, engine="array", use_cache=False)
+
+    backtest = StreamingBacktest()
+    for chunk in iter_chunks(df, chunk_size):
+        backtest.update(chunk)
+
+    assert expected["num_trades"] > 0
+    assert backtest.n_bars == len(df)
+    assert_results_equal(expected, backtest.results())
+
+
+@pytest.mark.parametrize(
+    "strategy, feature_families",
+    [
+        (SMACrossoverStrategy(fast_window=10, slow_window=50), ["sma"]),
+        (
+            RSIStrategy(
+                rsi_window=14, oversold_threshold=30, overbought_threshold=70
+            ),
+            ["rsi"],
+        ),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [30, 250, 1000])
+def test_chunked_backtest_matches_full_run(
+    strategy, feature_families, chunk_size
+):
+    """Features, signals and trades are those of the full run."""
+    ohlcv = make_ohlcv()
+    expected = full_run(ohlcv, strategy, feature_families)
+
+    results = run_chunked_backtest(
+        ohlcv,
+        strategy,
+        chunk_size=chunk_size,
+        feature_families=feature_families,
+    )
+
+    assert expected["num_trades"] > 0
+    assert results.pop("chunk_count") == -(-len(ohlcv) // chunk_size)
+    assert_results_equal(expected, results)
+
+
+def test_chunked_backtest_accepts_iterable_of_chunks():
+    """Chunks can come from a generator, e.g. pd.read_csv(chunksize=N)."""
+    ohlcv = make_ohlcv()
+    strategy = SMACrossoverStrategy(fast_window=10, slow_window=50)
+    expected = full_run(ohlcv, strategy, ["sma"])
+
+    chunks = (ohlcv.iloc[i : i + 400] for i in range(0, len(ohlcv), 400))
+    results = run_chunked_backtest(chunks, strategy, feature_families=["sma"])
+
+    results.pop("chunk_count")
+    assert_results_equal(expected, results)
+
+
+def test_streaming_backtest_rejects_invalid_chunks():
+    """Chunks must continue the series and have no missing values."""
+    df = make_signal_data(n=100)
+    backtest = StreamingBacktest()
+    backtest.update(df.iloc[:50])
+
+    with pytest.raises(ValueError, match="increasing"):
+        backtest.update(df.iloc[40:60])
+    with pytest.raises(ValueError, match="NaN"):
+        chunk = df.iloc[50:60].copy()
+        chunk.iloc[3, 0] = np.nan
+        backtest.update(chunk)
+    with pytest.raises(ValueError, match="Missing required columns"):
+        backtest.update(df.iloc[50:60].drop(columns="sell_signal"))
+    with pytest.raises(ValueError, match="No bars"):
+        StreamingBacktest().results()
+
+
+def test_chunked_backtest_not_enough_bars():
+    """Too few bars for the features or the strategy raise ValueError."""
+    strategy = SMACrossoverStrategy(fast_window=10, slow_window=50)
+    ohlcv = make_ohlcv(n=40)
+
+    assert (
+        FeatureFactory(ohlcv, feature_families=["sma"]).min_rows_needed()
+        == 201
+    )
+    with pytest.raises(ValueError, match="Not enough bars"):
+        run_chunked_backtest(ohlcv, strategy, feature_families=["sma"])
+    with pytest.raises(ValueError, match="chunk_size"):
+        run_chunked_backtest(make_ohlcv(), strategy, chunk_size=0)
@@ -42,13 +42,13 @@ def test_streamlit_cache_decorator_configuration():
 
     # 2. Verify the decorator uses the constant
     assert (
-        "@st.cache_data(ttl=timedelta(days=STREAMLIT_CACHE_TTL_DAYS))"
+        "@streamlit_cache_data(ttl=timedelta(days=STREAMLIT_CACHE_TTL_DAYS))"
         in content
     ), "Decorator should use STREAMLIT_CACHE_TTL_DAYS constant"
 
     # 3. Verify the problematic code is not present
     assert (
-        "@st.cache_data(ttl=timedelta(days=cache_expiry_days))" not in content
+        "cache_data(ttl=timedelta(days=cache_expiry_days))" not in content
     ), "Decorator should not use cache_expiry_days parameter"
 
     # 4. Verify the function parameter still exists (for file cache)
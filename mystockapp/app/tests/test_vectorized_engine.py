@@ -0,0 +1,214 @@
+"""
+Test scenario: Vectorized Target-Position Engine
+
+This test verifies that run_backtest(engine="vectorized"):
+- Turns buy/sell signals into a forward-filled long/flat position
+- Matches the exact engines, up to floating-point rounding, when every buy
+  arrives while flat
+- Charges commission and slippage as the exact engines do
+- Invests the remaining cash when it falls below the stake
+- Ignores buy signals while long, where the exact engines add to the
+  position
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.backtester import (
+    SMACrossoverStrategy,
+    run_backtest,
+    target_positions,
+)
+from src.feature_factory import FeatureFactory
+from tests.test_backtest_engine_equivalence import make_signal_data
+
+# Relative tolerance of the vectorized engine against the exact engines,
+# by price dtype
+RTOL = {np.float64: 1e-9, np.float32: 1e-5}
+
+
+def long_flat_signals(df):
+    """Keep only the signals that change a long/flat position."""
+    positions = target_positions(df["buy_signal"], df["sell_signal"])
+    previous = np.concatenate(([0], positions[:-1]))
+    return df.assign(
+        buy_signal=positions > previous, sell_signal=positions < previous
+    )
+
+
+def assert_results_close(expected, actual, rtol=RTOL[np.float64]):
+    """Assert that two results dictionaries agree within `rtol`."""
+    assert expected.keys() == actual.keys()
+    for key in expected:
+        if key in ("trades", "completed_trades"):
+            assert len(expected[key]) == len(actual[key]), key
+            for exp_trade, act_trade in zip(expected[key], actual[key]):
+                assert exp_trade.keys() == act_trade.keys()
+                for field, value in exp_trade.items():
+                    if isinstance(value, float):
+                        np.testing.assert_allclose(
+                            act_trade[field], value, rtol=rtol
+                        )
+                    else:
+                        assert act_trade[field] == value, (key, field)
+        elif key in ("start_date", "end_date"):
+            assert expected[key] == actual[key], key
+        else:
+            np.testing.assert_allclose(
+                np.asarray(actual[key], dtype=np.float64),
+                np.asarray(expected[key], dtype=np.float64),
+                rtol=rtol,
+                err_msg=key,
+            )
+
+
+def test_target_positions():
+    buy = np.array([0, 1, 0, 1, 0, 0, 1, 0], dtype=bool)
+    sell = np.array([1, 0, 0, 0, 1, 1, 1, 0], dtype=bool)
+
+    positions = target_positions(buy, sell)
+
+    assert positions.dtype == np.int8
+    # A bar with both signals counts as a buy
+    np.testing.assert_array_equal(positions, [0, 1, 1, 1, 0, 0, 1, 1])
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("position_size_pct", [0.25, 0.5])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_matches_exact_engines_when_long_or_flat(
+    dtype, position_size_pct, seed
+):
+    df = long_flat_signals(make_signal_data(n=1000, seed=seed, dtype=dtype))
+    params = {"position_size_pct": position_size_pct, "use_cache": False}
+
+    expected = run_backtest(df, engine="array", **params)
+    actual = run_backtest(df, engine="vectorized", **params)
+
+    assert expected["num_trades"] > 10
+    assert_results_close(expected, actual, RTOL[dtype])
+    assert_results_close(
+        run_backtest(df, engine="loop", **params), actual, RTOL[dtype]
+    )
+
+
+def test_matches_exact_engines_on_strategy_signals():
+    """A crossover strategy is always long or flat."""
+    df = make_signal_data(n=2000, seed=4).drop(
+        columns=["buy_signal", "sell_signal"]
+    )
+    df["Close"] += 100
+    for column in ("Open", "High", "Low"):
+        df[column] = df["Close"]
+    df["Volume"] = 1000
+    features = FeatureFactory(
+        df,
+        feature_families=["sma"],
+        indicator_params={"sma": {"windows": [10, 50]}},
+        use_float32=False,
+    ).generate_features(drop_na=True)
+    signals = SMACrossoverStrategy(
+        fast_window=10, slow_window=50
+    ).generate_signals(features)
+
+    expected = run_backtest(signals, engine="array", use_cache=False)
+    actual = run_backtest(signals, engine="vectorized", use_cache=False)
+
+    assert expected["num_trades"] > 10
+    assert_results_close(expected, actual)
+
+
+def test_costs_of_one_round_trip():
+    dates = pd.date_range(start="2023-01-02", periods=4, freq="B")
+    df = pd.DataFrame(
+        {
+            "Close": [100.0, 100.0, 110.0, 120.0],
+            "buy_signal": [True, False, False, False],
+            "sell_signal": [False, False, True, False],
+        },
+        index=dates,
+    )
+
+    results = run_backtest(
+        df,
+        initial_capital=10000.0,
+        commission_fixed=10.0,
+        commission_pct=0.001,
+        slippage_pct=0.01,
+        position_size_pct=1.0,
+        engine="vectorized",
+        use_cache=False,
+    )
+
+    shares = (10000.0 - 10.0) / (101.0 * 1.001)
+    buy_commission = 10.0 + shares * 101.0 * 0.001
+    sale_value = shares * 108.9
+    sell_commission = 10.0 + sale_value * 0.001
+    final_value = sale_value - sell_commission
+    np.testing.assert_allclose(results["final_value"], final_value)
+    np.testing.assert_allclose(
+        results["total_commission"], buy_commission + sell_commission
+    )
+    np.testing.assert_allclose(
+        results["total_slippage_cost"], shares * (100.0 + 110.0) * 0.01
+    )
+    np.testing.assert_allclose(
+        results["portfolio_values"],
+        [shares * 100.0, shares * 100.0, final_value, final_value],
+    )
+    assert results["num_trades"] == results["closed_trade_count"] == 1
+
+
+def test_buys_while_long_are_ignored():
+    """The exact engines add to the position; the vectorized one does not."""
+    df = make_signal_data(n=1000, seed=0, signal_prob=0.1)
+    positions = target_positions(df["buy_signal"], df["sell_signal"])
+
+    exact = run_backtest(df, engine="array", use_cache=False)
+    vectorized = run_backtest(df, engine="vectorized", use_cache=False)
+
+    entries = np.count_nonzero(np.diff(positions, prepend=0) == 1)
+    assert vectorized["num_trades"] == entries
+    assert exact["num_trades"] > entries
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_invests_remaining_cash_below_stake(dtype):
+    """Losing round trips leave less cash than the stake to invest."""
+    df = long_flat_signals(make_signal_data(n=3000, seed=2, dtype=dtype))
+    rng = np.random.default_rng(2)
+    df["Close"] = (100 * np.exp(rng.normal(0, 0.02, 3000).cumsum())).astype(
+        dtype
+    )
+    params = {
+        "position_size_pct": 1.0,
+        "commission_fixed": 50.0,
+        "use_cache": False,
+    }
+
+    expected = run_backtest(df, engine="array", **params)
+    actual = run_backtest(df, engine="vectorized", **params)
+
+    assert expected["final_value"] < 0.9 * expected["initial_capital"]
+    assert_results_close(expected, actual, RTOL[dtype])
+
+
+def test_stake_below_fixed_commission():
+    df = make_signal_data(n=200, seed=1)
+
+    results = run_backtest(
+        df,
+        initial_capital=1000.0,
+        commission_fixed=300.0,
+        engine="vectorized",
+        use_cache=False,
+    )
+
+    assert results["num_trades"] == 0
+    assert results["final_value"] == 1000.0
+    assert set(results["portfolio_values"]) == {1000.0}
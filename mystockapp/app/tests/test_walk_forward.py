@@ -0,0 +1,163 @@
+"""
+Test scenario: Walk-Forward Optimization
+
+This test verifies that:
+- make_walk_forward_folds builds contiguous anchored and sliding folds
+- run_walk_forward optimizes each fold and stitches the out-of-sample equity
+  curves into one continuous result
+- Running the folds on a process pool gives the same result as running them
+  serially
+- main.py --walk-forward writes its tables next to the --output path, whatever
+  its extension
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+from unittest.mock import patch
+
+# Add the src directory to path so we can import modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.walk_forward import make_walk_forward_folds, run_walk_forward
+
+
+@pytest.fixture
+def ohlcv_data():
+    """Generate four years of random-walk OHLCV data."""
+    rng = np.random.default_rng(11)
+    n = 1000
+    dates = pd.date_range(start="2018-01-01", periods=n, freq="B", tz="UTC")
+    close = 200 + rng.normal(0, 2, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1000, 100000, n),
+        },
+        index=dates,
+    )
+
+
+SMALL_GRID = {"fast_window": [5, 10, 20], "slow_window": [30, 50]}
+
+
+def test_anchored_folds_cover_the_tail_contiguously():
+    """Anchored folds all start at bar 0 and their test windows tile the tail."""
+    index = pd.date_range("2020-01-01", periods=600, freq="B")
+    folds = make_walk_forward_folds(index, n_folds=5)
+
+    assert [f["train_start"] for f in folds] == [0] * 5
+    assert [f["split"] for f in folds] == [100, 200, 300, 400, 500]
+    assert folds[-1]["test_end"] == 600
+    for prev, nxt in zip(folds, folds[1:]):
+        assert prev["test_end"] == nxt["split"]
+
+
+def test_sliding_folds_have_fixed_train_length():
+    """Sliding folds keep a fixed in-sample length."""
+    index = pd.date_range("2020-01-01", periods=600, freq="B")
+    folds = make_walk_forward_folds(
+        index, n_folds=4, mode="sliding", train_bars=150, test_bars=100
+    )
+
+    for fold in folds:
+        assert fold["split"] - fold["train_start"] == 150
+        assert fold["test_end"] - fold["split"] == 100
+
+
+def test_invalid_fold_parameters():
+    """Invalid modes and oversized folds raise ValueError."""
+    index = pd.date_range("2020-01-01", periods=100, freq="B")
+    with pytest.raises(ValueError, match="Invalid walk-forward mode"):
+        make_walk_forward_folds(index, mode="expanding")
+    with pytest.raises(ValueError, match="Not enough data"):
+        make_walk_forward_folds(index, n_folds=5, test_bars=20)
+
+
+def test_walk_forward_stitches_out_of_sample_equity(ohlcv_data):
+    """The stitched equity curve covers every out-of-sample bar exactly once."""
+    results = run_walk_forward(
+        ohlcv_data, param_grid=SMALL_GRID, n_folds=4, max_workers=1
+    )
+
+    equity = results["equity_curve"]
+    assert len(results["folds"]) == 4
+    assert len(results["parameters"]) == 4
+    assert equity.index.is_monotonic_increasing
+    assert not equity.index.has_duplicates
+    assert equity.index[0] == results["folds"][0]["split_date"]
+    assert equity.index[-1] == ohlcv_data.index[-1]
+    assert len(equity) == 4 * 200
+
+    # Each fold's curve continues from where the previous fold ended
+    capital = results["initial_capital"]
+    for fold in results["folds"]:
+        oos = fold["oos_results"]
+        capital *= oos["final_value"] / oos["initial_capital"]
+    assert results["final_value"] == pytest.approx(capital)
+
+    # The chosen parameters come from the grid
+    for params in results["parameters"][["fast_window", "slow_window"]].values:
+        assert params[0] in SMALL_GRID["fast_window"]
+        assert params[1] in SMALL_GRID["slow_window"]
+
+
+def test_process_pool_matches_serial_run(ohlcv_data):
+    """Folds run on a process pool give the same result as a serial run."""
+    serial = run_walk_forward(
+        ohlcv_data,
+        param_grid=SMALL_GRID,
+        n_folds=3,
+        mode="sliding",
+        train_bars=300,
+        max_workers=1,
+    )
+    parallel = run_walk_forward(
+        ohlcv_data,
+        param_grid=SMALL_GRID,
+        n_folds=3,
+        mode="sliding",
+        train_bars=300,
+        max_workers=2,
+    )
+
+    pd.testing.assert_series_equal(
+        serial["equity_curve"], parallel["equity_curve"]
+    )
+    pd.testing.assert_frame_equal(serial["parameters"], parallel["parameters"])
+
+
+@pytest.mark.parametrize("output", ["results.parquet", "results"])
+def test_main_walk_forward_outputs(ohlcv_data, tmp_path, output):
+    """The parameters and equity curve get their own files."""
+    import main
+
+    output_dir = tmp_path / "run.csv"
+    output_dir.mkdir()
+    argv = [
+        "main.py",
+        "--walk-forward",
+        "--wf-folds",
+        "2",
+        "--max-workers",
+        "1",
+        "--no-cache",
+        "--output",
+        str(output_dir / output),
+    ]
+    with patch("main.get_stock_data", return_value=ohlcv_data), patch(
+        "sys.argv", argv
+    ):
+        results = main.main()
+
+    assert results is not None
+    assert sorted(os.listdir(output_dir)) == [
+        "results_walk_forward.csv",
+        "results_walk_forward_equity.csv",
+    ]
+    parameters = pd.read_csv(output_dir / "results_walk_forward.csv")
+    assert len(parameters) == 2
@@ -248,14 +248,22 @@ def generate_markdown_report(stats, bt, parameter_sensitivity_results=None, outp
     metrics = [
         f"- **Strategy Return:** {100 * strat_metrics.get('total_return', 0.0):.2f}%",
         f"- **Strategy Sharpe Ratio:** {strat_metrics.get('sharpe_ratio', 0.0):.2f}",
+        f"- **Strategy Sortino Ratio:** {strat_metrics.get('sortino_ratio', 0.0):.2f}",
+        f"- **Strategy Calmar Ratio:** {strat_metrics.get('calmar_ratio', 0.0):.2f}",
+        f"- **Strategy Annualized Volatility:** {100 * strat_metrics.get('annual_volatility', 0.0):.2f}%",
         f"- **Strategy Max Drawdown:** {100 * strat_metrics.get('max_drawdown', 0.0):.2f}%",
+        f"- **Strategy Ulcer Index:** {strat_metrics.get('ulcer_index', 0.0):.2f}",
         f"- **Strategy Win Rate:** {100 * strat_metrics.get('win_rate', 0.0):.2f}%"
     ]
     if bench_metrics:
         metrics.extend([
             f"- **Benchmark Return:** {100 * bench_metrics.get('total_return', 0.0):.2f}%",
             f"- **Benchmark Sharpe Ratio:** {bench_metrics.get('sharpe_ratio', 0.0):.2f}",
+            f"- **Benchmark Sortino Ratio:** {bench_metrics.get('sortino_ratio', 0.0):.2f}",
+            f"- **Benchmark Calmar Ratio:** {bench_metrics.get('calmar_ratio', 0.0):.2f}",
+            f"- **Benchmark Annualized Volatility:** {100 * bench_metrics.get('annual_volatility', 0.0):.2f}%",
             f"- **Benchmark Max Drawdown:** {100 * bench_metrics.get('max_drawdown', 0.0):.2f}%",
+            f"- **Benchmark Ulcer Index:** {bench_metrics.get('ulcer_index', 0.0):.2f}",
             f"- **Benchmark Win Rate:** {100 * bench_metrics.get('win_rate', 0.0):.2f}%"
         ])
     md_lines.extend(metrics)
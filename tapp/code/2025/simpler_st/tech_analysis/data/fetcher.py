@@ -1,3 +1,5 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 import yfinance as yf
 import numpy as np
 import pandas as pd
@@ -15,23 +17,95 @@ def fetch_stock_data(ticker, period=None, start_date=None, end_date=None, freque
         period = period if period else '10y'
         return stock.history(period=period)
 
-# Fetch data for all stocks in STOCKS_LIST
-def fetch_all_stocks_data(period=None, start_date=None, end_date=None, frequency=None):
-    data = {}
-    for ticker in STOCKS_LIST:
+# Download a group of tickers with one yfinance request
+def yfinance_download(tickers, period=None, start_date=None, end_date=None, frequency=None):
+    """
+    Downloads several tickers in a single request and returns {ticker: DataFrame}.
+    Tickers without data are left out. Uses the same date arguments as fetch_stock_data.
+    Raises ValueError if a download of several tickers comes back without ticker columns.
+    """
+    tickers = list(tickers)
+    if start_date and end_date:
+        request = dict(start=start_date, end=end_date, interval=frequency if frequency else '1d')
+    else:
+        request = dict(period=period if period else '10y')
+    data = yf.download(
+        tickers, group_by='ticker', auto_adjust=True, actions=True,
+        ignore_tz=False, threads=False, progress=False, **request
+    )
+    if data is None or data.empty:
+        return {}
+    if isinstance(data.columns, pd.MultiIndex):
+        downloaded = data.columns.get_level_values(0)
+        split = {t: data[t] for t in tickers if t in downloaded}
+    elif len(tickers) == 1:
+        split = {tickers[0]: data}
+    else:
+        raise ValueError('Cannot split a download without ticker columns between several tickers')
+    frames = {}
+    for ticker, df in split.items():
+        # Rows where this ticker did not trade are all NaN in a joint download
+        df = df.dropna(how='all').rename_axis(columns=None)
+        if not df.empty:
+            frames[ticker] = df
+    return frames
+
+# Download one group, retrying failed requests with exponential backoff
+def _download_with_retries(download, tickers, kwargs, max_retries, retry_delay):
+    for attempt in range(max_retries + 1):
         try:
-            data[ticker] = fetch_stock_data(
-                ticker,
-                period=period,
-                start_date=start_date,
-                end_date=end_date,
-                frequency=frequency
-            )
+            return download(tickers, **kwargs)
         except Exception as e:
-            print (f"Error fetching data for {ticker}: {e}")
-            data[ticker] = f"Error: {e}"
+            if attempt == max_retries:
+                raise
+            delay = retry_delay * 2 ** attempt
+            print(f"Request for {len(tickers)} tickers failed ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+# Fetch data for many tickers in grouped requests
+def fetch_stocks_data_bulk(tickers, period=None, start_date=None, end_date=None, frequency=None,
+                           batch_size=50, max_workers=4, max_retries=3, retry_delay=1.0, download=None):
+    """
+    Fetches tickers in groups of batch_size per request, with up to max_workers requests
+    at a time. Failed requests are retried with backoff.
+    download(tickers, period, start_date, end_date, frequency) -> {ticker: DataFrame} does
+    the network requests; it defaults to yfinance_download and can be replaced, e.g. in tests.
+    Returns {ticker: DataFrame}, with an "Error: ..." string for tickers that could not be fetched.
+    """
+    download = download or yfinance_download
+    kwargs = dict(period=period, start_date=start_date, end_date=end_date, frequency=frequency)
+    tickers = list(dict.fromkeys(tickers))
+    batches = [tickers[i:i + batch_size] for i in range(0, len(tickers), batch_size)]
+    data = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_download_with_retries, download, batch, kwargs, max_retries, retry_delay)
+            for batch in batches
+        ]
+        for batch, future in zip(batches, futures):
+            try:
+                frames = future.result()
+            except Exception as e:
+                print(f"Error fetching data for {len(batch)} tickers: {e}")
+                frames = {}
+                error = f"Error: {e}"
+            else:
+                error = "Error: No data found"
+            for ticker in batch:
+                data[ticker] = frames[ticker] if ticker in frames else error
     return data
 
+# Fetch data for all stocks in STOCKS_LIST
+def fetch_all_stocks_data(period=None, start_date=None, end_date=None, frequency=None, **bulk_options):
+    return fetch_stocks_data_bulk(
+        STOCKS_LIST,
+        period=period,
+        start_date=start_date,
+        end_date=end_date,
+        frequency=frequency,
+        **bulk_options
+    )
+
 def clean_and_validate_data(df):
     """
     Cleans and validates raw stock data by handling missing values and capping outliers.
@@ -0,0 +1,131 @@
+"""
+Risk metrics of an equity curve: total and annualized return, annualized volatility, Sharpe, Sortino
+and Calmar ratios, max drawdown and its duration, ulcer index and exposure.
+Vendored from mystockapp/app/src/metrics.py so that both projects report the same tear sheet.
+tests/test_metrics.py fails when the code of the two copies differs; only docstrings, comments
+and formatting may differ.
+"""
+import numpy as np
+import pandas as pd
+
+# Bars per year of daily data, used to annualize returns and volatility
+TRADING_DAYS_PER_YEAR = 252
+
+# Metrics returned by risk_metrics
+RISK_METRICS = (
+    'total_return_pct', 'annual_return_pct', 'annual_volatility_pct', 'sharpe_ratio', 'sortino_ratio',
+    'calmar_ratio', 'max_drawdown', 'max_drawdown_duration', 'ulcer_index', 'exposure_pct',
+)
+
+def infer_periods_per_year(dates):
+    """
+    Estimates the number of bars per year from their timestamps (daily, intraday, weekly or monthly bars).
+    """
+    dates = pd.DatetimeIndex(dates)
+    if len(dates) < 2:
+        return float(TRADING_DAYS_PER_YEAR)
+    step_days = (dates[1:] - dates[:-1]).median() / pd.Timedelta(days=1)
+    if step_days < 1:
+        bars_per_day = np.median(dates.normalize().value_counts().to_numpy())
+        return float(TRADING_DAYS_PER_YEAR * bars_per_day)
+    if step_days <= 4:
+        # Daily bars, with weekends and holidays in between
+        return float(TRADING_DAYS_PER_YEAR)
+    return 365.25 / step_days
+
+def bar_returns(equity, initial_value=None):
+    """
+    Simple returns from one bar's equity to the next (from initial_value to the first bar if given).
+    A bar that starts from zero or negative equity counts as 0.
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    if initial_value is not None:
+        equity = np.concatenate(([initial_value], equity))
+    previous = equity[:-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = np.where(previous > 0, np.diff(equity) / previous, 0.0)
+    return returns
+
+def drawdown_pct(equity):
+    """
+    Fall of the equity from its running peak, in percent (0 or negative). NaN bars stay NaN.
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    running_max = np.fmax.accumulate(equity)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return ((equity - running_max) / running_max) * 100
+
+def rolling_volatility(equity, window=21, periods_per_year=TRADING_DAYS_PER_YEAR):
+    """
+    Annualized volatility in percent of the bar returns over a trailing window, NaN until the first full window.
+    Raises ValueError if the window is shorter than 2 returns.
+    """
+    if window < 2:
+        raise ValueError('window must be at least 2')
+    returns = bar_returns(equity)
+    volatility = np.full(len(returns) + 1, np.nan)
+    if len(returns) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(returns, window)
+        volatility[window:] = windows.std(axis=1, ddof=1) * np.sqrt(periods_per_year) * 100
+    return volatility
+
+def risk_metrics(equity, positions=None, periods_per_year=TRADING_DAYS_PER_YEAR, risk_free_rate=0.0, initial_value=None):
+    """
+    Computes the tear sheet of an equity curve as a dict keyed by RISK_METRICS, in percent where the name says so.
+    Volatility uses the sample standard deviation (ddof=1). Ratios without any risk to divide by are 0.0;
+    exposure (share of bars with a non-zero position) is NaN without positions.
+    Raises ValueError if the equity curve is empty.
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    if len(equity) == 0:
+        raise ValueError('Cannot compute risk metrics of an empty equity curve')
+    start = equity[0] if initial_value is None else float(initial_value)
+    returns = bar_returns(equity, initial_value)
+    drawdown = drawdown_pct(equity)
+
+    growth = equity[-1] / start if start > 0 else 1.0
+    total_return_pct = (growth - 1) * 100
+    if growth <= 0:
+        annual_return_pct = -100.0
+    elif len(returns):
+        with np.errstate(over='ignore'):
+            annual_return_pct = (growth ** (periods_per_year / len(returns)) - 1) * 100
+    else:
+        annual_return_pct = 0.0
+
+    excess = returns - ((1 + risk_free_rate) ** (1 / periods_per_year) - 1)
+    volatility = returns.std(ddof=1) if len(returns) > 1 else 0.0
+    downside = np.sqrt(np.mean(np.minimum(excess, 0) ** 2)) if len(returns) else 0.0
+    annualizer = np.sqrt(periods_per_year)
+    sharpe_ratio = excess.mean() / volatility * annualizer if volatility > 0 else 0.0
+    sortino_ratio = excess.mean() / downside * annualizer if downside > 0 else 0.0
+
+    # Without any drawdown value (e.g. no equity at all) both are NaN
+    if np.isnan(drawdown).all():
+        max_drawdown = ulcer_index = np.nan
+    else:
+        max_drawdown = float(np.nanmin(drawdown))
+        ulcer_index = float(np.sqrt(np.nanmean(drawdown**2)))
+    calmar_ratio = annual_return_pct / abs(max_drawdown) if max_drawdown < 0 else 0.0
+    # Bars since the last peak; the longest such run is the duration
+    bars = np.arange(len(equity))
+    last_peak = np.maximum.accumulate(np.where(drawdown < 0, 0, bars))
+    max_drawdown_duration = int((bars - last_peak).max())
+
+    exposure_pct = (
+        np.count_nonzero(np.asarray(positions)) / len(positions) * 100
+        if positions is not None and len(positions) else np.nan
+    )
+
+    return {
+        'total_return_pct': float(total_return_pct),
+        'annual_return_pct': float(annual_return_pct),
+        'annual_volatility_pct': float(volatility * annualizer * 100),
+        'sharpe_ratio': float(sharpe_ratio),
+        'sortino_ratio': float(sortino_ratio),
+        'calmar_ratio': float(calmar_ratio),
+        'max_drawdown': max_drawdown,
+        'max_drawdown_duration': max_drawdown_duration,
+        'ulcer_index': ulcer_index,
+        'exposure_pct': float(exposure_pct),
+    }
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 from collections import defaultdict
+from tech_analysis.metrics import RISK_METRICS, risk_metrics
 
 # --- ATR Calculation Utility ---
 def calculate_atr(data: pd.DataFrame, window: int = 14):
@@ -32,20 +33,20 @@ def apply_transaction_costs(entry_price, exit_price, commission=0.0, slippage=0.
     net_pnl = gross_pnl - commission_cost
     return adj_entry, adj_exit, net_pnl, commission_cost
 
-def calculate_performance_metrics(equity_curve, trade_log, benchmark_equity_curve=None):
+def calculate_performance_metrics(equity_curve, trade_log, benchmark_equity_curve=None, positions=None):
     """
     Compute return, Sharpe ratio, max drawdown, and other metrics for the given equity curve and trade log.
     Optionally compare to a benchmark equity curve.
+    The equity metrics come from tech_analysis.metrics.risk_metrics, the tear sheet mystockapp reports as well;
+    returns, drawdowns, volatility and exposure are fractions here. Exposure needs the position held on each
+    bar of the strategy (`positions`) and is NaN without it. The Sharpe ratio uses the sample standard deviation
+    of the bar returns (ddof=1); before the tear sheet it used the population one (ddof=0), which gave values
+    higher by a factor of sqrt(n / (n - 1)) for n returns.
     Returns a dict of metrics for report generation with 'strategy' and 'benchmark' keys.
     """
-    def _metrics(eq_curve, tlog):
-        eq = np.array(eq_curve)
-        ret = (eq[-1] - eq[0]) / eq[0] if len(eq) > 1 else 0
-        returns = np.diff(eq) / eq[:-1] if len(eq) > 1 else np.array([0])
-        sharpe = float(np.mean(returns) / np.std(returns) * np.sqrt(252)) if np.std(returns) > 0 else 0.0
-        running_max = np.maximum.accumulate(eq)
-        drawdowns = (eq - running_max) / running_max
-        max_drawdown = float(drawdowns.min()) if len(drawdowns) > 0 else 0.0
+    def _metrics(eq_curve, tlog, pos=None):
+        eq = np.asarray(eq_curve, dtype=float)
+        risk = risk_metrics(eq, positions=pos) if len(eq) > 0 else dict.fromkeys(RISK_METRICS, 0.0)
         pnls = [t['pnl'] for t in tlog if 'pnl' in t] if tlog else []
         avg_win = float(np.mean([p for p in pnls if p > 0])) if any(p > 0 for p in pnls) else 0.0
         avg_loss = float(np.mean([p for p in pnls if p < 0])) if any(p < 0 for p in pnls) else 0.0
@@ -55,9 +56,16 @@ def calculate_performance_metrics(equity_curve, trade_log, benchmark_equity_curv
         win_rate = float(sum(p > 0 for p in pnls) / len(pnls)) if pnls else 0.0
         expectancy = float(np.mean(pnls)) if pnls else 0.0
         return {
-            'total_return': ret,
-            'sharpe_ratio': sharpe,
-            'max_drawdown': max_drawdown,
+            'total_return': risk['total_return_pct'] / 100,
+            'annual_return': risk['annual_return_pct'] / 100,
+            'annual_volatility': risk['annual_volatility_pct'] / 100,
+            'sharpe_ratio': risk['sharpe_ratio'],
+            'sortino_ratio': risk['sortino_ratio'],
+            'calmar_ratio': risk['calmar_ratio'],
+            'max_drawdown': risk['max_drawdown'] / 100,
+            'max_drawdown_duration': risk['max_drawdown_duration'],
+            'ulcer_index': risk['ulcer_index'],
+            'exposure': risk['exposure_pct'] / 100,
             'win_rate': win_rate,
             'average_win': avg_win,
             'average_loss': avg_loss,
@@ -67,7 +75,7 @@ def calculate_performance_metrics(equity_curve, trade_log, benchmark_equity_curv
             'expectancy': expectancy,
         }
     metrics = {}
-    metrics['strategy'] = _metrics(equity_curve, trade_log)
+    metrics['strategy'] = _metrics(equity_curve, trade_log, positions)
     if benchmark_equity_curve is not None:
         metrics['benchmark'] = _metrics(benchmark_equity_curve, trade_log)
     return metrics
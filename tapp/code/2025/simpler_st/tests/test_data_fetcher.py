@@ -1,6 +1,7 @@
 import unittest
-from tech_analysis.data.fetcher import fetch_stock_data, clean_and_validate_data, cache_to_parquet, load_from_parquet
+from tech_analysis.data.fetcher import fetch_stock_data, clean_and_validate_data, cache_to_parquet, load_from_parquet, fetch_stocks_data_bulk, yfinance_download
 import pandas as pd
+from unittest.mock import patch
 
 class TestDataFetcher(unittest.TestCase):
     def test_fetch_reliance_daily(self):
@@ -56,6 +57,47 @@ class TestDataFetcher(unittest.TestCase):
         loaded = load_from_parquet(filename)
         pd.testing.assert_frame_equal(df, loaded)
         os.remove(filename)
+    def test_fetch_stocks_data_bulk_groups_requests(self):
+        # Local fake source: records each request, returns no data for 'MISSING'
+        requests = []
+        def fake_download(tickers, **kwargs):
+            requests.append(list(tickers))
+            index = pd.date_range('2024-01-01', periods=3)
+            return {t: pd.DataFrame({'Close': [1.0, 2.0, 3.0]}, index=index) for t in tickers if t != 'MISSING'}
+        tickers = ['A.NS', 'B.NS', 'C.NS', 'D.NS', 'MISSING']
+        data = fetch_stocks_data_bulk(tickers, period='1y', batch_size=2, download=fake_download)
+        self.assertEqual(sorted(len(r) for r in requests), [1, 2, 2])
+        self.assertEqual(list(data), tickers)
+        self.assertEqual(len(data['A.NS']), 3)
+        self.assertEqual(data['MISSING'], 'Error: No data found')
+
+    def test_fetch_stocks_data_bulk_retries(self):
+        # The first two requests fail, the third succeeds
+        attempts = []
+        def flaky_download(tickers, **kwargs):
+            attempts.append(tickers)
+            if len(attempts) < 3:
+                raise ConnectionError('Too many requests')
+            return {t: pd.DataFrame({'Close': [1.0]}) for t in tickers}
+        data = fetch_stocks_data_bulk(['A.NS'], retry_delay=0, download=flaky_download)
+        self.assertEqual(len(attempts), 3)
+        self.assertIsInstance(data['A.NS'], pd.DataFrame)
+        failed = fetch_stocks_data_bulk(['A.NS'], max_retries=0, download=lambda t, **k: 1 / 0)
+        self.assertTrue(failed['A.NS'].startswith('Error:'))
+
+    def test_yfinance_download_splits_by_ticker(self):
+        index = pd.date_range('2024-01-01', periods=3)
+        flat = pd.DataFrame({'Close': [1.0, 2.0, 3.0]}, index=index)
+        joint = pd.concat({'A.NS': flat, 'B.NS': flat * 2}, axis=1)
+        with patch('tech_analysis.data.fetcher.yf.download', return_value=joint):
+            data = yfinance_download(['A.NS', 'B.NS', 'MISSING'], period='1y')
+        self.assertEqual(list(data), ['A.NS', 'B.NS'])
+        self.assertEqual(data['B.NS']['Close'].iloc[-1], 6.0)
+        # Plain columns belong to a single ticker and cannot be split between several
+        with patch('tech_analysis.data.fetcher.yf.download', return_value=flat):
+            self.assertEqual(list(yfinance_download(['A.NS'], period='1y')), ['A.NS'])
+            with self.assertRaises(ValueError):
+                yfinance_download(['A.NS', 'B.NS'], period='1y')
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,36 @@
+import ast
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from pathlib import Path
+import numpy as np
+import pytest
+from tech_analysis import metrics
+from tech_analysis.metrics import risk_metrics
+
+# tech_analysis/metrics.py is vendored from mystockapp
+MYSTOCKAPP_METRICS = Path(__file__).resolve().parents[5] / 'mystockapp' / 'app' / 'src' / 'metrics.py'
+
+def _code_without_docstrings(path):
+    """
+    Dumps the syntax tree of a module without its docstrings, so formatting, comments and docstrings may differ.
+    """
+    tree = ast.parse(Path(path).read_text())
+    for node in ast.walk(tree):
+        body = getattr(node, 'body', None)
+        if isinstance(body, list) and body and isinstance(body[0], ast.Expr) \
+                and isinstance(body[0].value, ast.Constant) and isinstance(body[0].value.value, str):
+            node.body = body[1:] or [ast.Pass()]
+    return ast.dump(tree)
+
+@pytest.mark.skipif(not MYSTOCKAPP_METRICS.exists(), reason='mystockapp is not checked out next to tapp')
+def test_metrics_match_mystockapp_copy():
+    assert _code_without_docstrings(metrics.__file__) == _code_without_docstrings(MYSTOCKAPP_METRICS), \
+        'tech_analysis/metrics.py has drifted from mystockapp/app/src/metrics.py; apply the same change to both'
+
+def test_risk_metrics_sharpe_uses_sample_std():
+    equity = np.array([100, 110, 120, 115, 130, 120, 140], dtype=float)
+    returns = np.diff(equity) / equity[:-1]
+    risk = risk_metrics(equity)
+    assert risk['sharpe_ratio'] == pytest.approx(returns.mean() / returns.std(ddof=1) * np.sqrt(252))
+    assert risk['max_drawdown'] == pytest.approx(-1000 / 130)
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 import pytest
 from tech_analysis.utils import calculate_atr, apply_transaction_costs, calculate_performance_metrics, correlate_performance_with_regimes, calculate_indicator_summary_stats, extract_drawdown_periods
+from tech_analysis.metrics import risk_metrics
 
 def test_calculate_atr_basic():
     # Simple price data
@@ -45,6 +46,25 @@ def test_calculate_performance_metrics_basic():
     assert 'sharpe_ratio' in strat
     assert 'max_drawdown' in strat
 
+def test_calculate_performance_metrics_uses_risk_metrics():
+    equity_curve = [100, 110, 120, 115, 130, 120, 140]
+    positions = [0, 1, 1, 1, 0, 0, 1]
+    metrics = calculate_performance_metrics(equity_curve, [], benchmark_equity_curve=[100, 105, 110], positions=positions)
+    strat = metrics['strategy']
+    risk = risk_metrics(equity_curve, positions=positions)
+    assert strat['sharpe_ratio'] == pytest.approx(risk['sharpe_ratio'])
+    assert strat['sortino_ratio'] == pytest.approx(risk['sortino_ratio'])
+    assert strat['calmar_ratio'] == pytest.approx(risk['calmar_ratio'])
+    assert strat['ulcer_index'] == pytest.approx(risk['ulcer_index'])
+    # Sample standard deviation (ddof=1); the Sharpe ratio used ddof=0 before the tear sheet
+    returns = np.diff(equity_curve) / np.array(equity_curve[:-1])
+    assert strat['sharpe_ratio'] == pytest.approx(returns.mean() / returns.std(ddof=1) * np.sqrt(252))
+    assert strat['sharpe_ratio'] != pytest.approx(returns.mean() / returns.std() * np.sqrt(252))
+    # Fractions rather than percentages
+    assert strat['max_drawdown'] == pytest.approx(-10 / 130)
+    assert strat['exposure'] == pytest.approx(4 / 7)
+    assert np.isnan(metrics['benchmark']['exposure'])
+
 def test_correlate_performance_with_regimes_basic():
     trade_log = [
         {'regime': 'Trending', 'pnl': 10},